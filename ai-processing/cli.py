@@ -21,7 +21,7 @@ import click
 from src.cli.api_commands import api
 from src.cli.export_command import export
 from src.cli.git_utils import initialize_git_tracker, print_git_summary
-from src.cli.process_commands import process, rebuild_db, sync
+from src.cli.process_commands import process, rebuild_db, sync, watch
 from src.cli.processing_utils import process_directory
 from src.cli.query_commands import count, list_docs, search, stats
 from src.cli.taxonomy_commands import taxonomy
@@ -389,6 +389,7 @@ def rebuild_everything_cmd(
 # Add commands to the CLI group
 cli.add_command(process)
 cli.add_command(sync)
+cli.add_command(watch)
 cli.add_command(list_docs, name="list")
 cli.add_command(count)
 cli.add_command(search)
@@ -5,6 +5,7 @@ Handles document CRUD operations (Create, Read, Update, Delete) for the PrismWea
 document management system. Works with both captured documents and generated content.
 """
 
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -36,6 +37,7 @@ from prismweave_mcp.utils.path_utils import (
 )
 from src.core.config import Config
 from src.core.embedding_store import EmbeddingStore
+from src.core.frontmatter_scan import parse_frontmatter_files
 
 
 class DocumentManager:
@@ -210,8 +212,8 @@ class DocumentManager:
         # Get all markdown files from disk to ensure completeness
         all_disk_files = list_markdown_files(self.docs_root)
 
-        # Build document metadata list with filtering
-        documents = []
+        # Apply cheap path-based filters before reading any file
+        candidates = []
         for doc_path in all_disk_files:
             try:
                 # Verify file is safe
@@ -229,10 +231,22 @@ class DocumentManager:
                     doc_category = get_document_category(doc_path, self.docs_root)
                     if doc_category != category:
                         continue
+            except ValueError as e:
+                logging.getLogger(__name__).debug(f"Skipping file {doc_path}: {e}")
+                continue
+            candidates.append(doc_path)
+
+        # Read and parse frontmatter for the remaining files (in parallel for large trees)
+        documents = []
+        for record in parse_frontmatter_files(candidates):
+            doc_path = record.path
+            if record.read_error:
+                # Skip files that can't be read
+                logging.getLogger(__name__).debug(f"Skipping file {doc_path}: {record.read_error}")
+                continue
 
-                # Read file for metadata and content
-                file_content = doc_path.read_text(encoding="utf-8")
-                metadata, content = parse_frontmatter(file_content)
+            try:
+                metadata, content = record.metadata, record.content
 
                 # Apply tag filter
                 if tags:
@@ -246,10 +260,8 @@ class DocumentManager:
                 doc_metadata = self._build_document_metadata(doc_path, metadata, content)
                 documents.append(doc_metadata)
 
-            except (FileNotFoundError, PermissionError, UnicodeDecodeError, ValueError) as e:
+            except (FileNotFoundError, PermissionError, ValueError) as e:
                 # Skip files that can't be parsed
-                import logging
-
                 logging.getLogger(__name__).debug(f"Skipping file {doc_path}: {e}")
                 continue
 
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Measure the in-memory footprint of a loaded article index.
+
+Compares the previous representation (a regular dataclass with eagerly parsed
+datetimes and un-interned tag strings) with the slotted ``ArticleMetadata``
+produced by ``article_from_mapping``, for a synthetic library.
+
+Usage:
+    uv run python scripts/bench_article_index_memory.py [--articles 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.metadata_index import article_from_mapping  # noqa: E402
+
+
+@dataclass
+class LegacyArticleMetadata:
+    id: str
+    path: str
+    title: str
+    topic: Optional[str]
+    tags: List[str]
+    created_at: datetime
+    updated_at: datetime
+    word_count: int
+    excerpt: str
+    read_status: str
+    x: Optional[float] = None
+    y: Optional[float] = None
+    neighbors: Optional[List[str]] = None
+    file_size: Optional[int] = None
+
+
+def _legacy_from_mapping(value: dict) -> LegacyArticleMetadata:
+    return LegacyArticleMetadata(
+        id=value["id"],
+        path=value["path"],
+        title=value["title"],
+        topic=value.get("topic"),
+        tags=list(value.get("tags") or []),
+        created_at=datetime.fromisoformat(value["created_at"]),
+        updated_at=datetime.fromisoformat(value["updated_at"]),
+        word_count=int(value.get("word_count", 0)),
+        excerpt=value.get("excerpt", ""),
+        read_status=value.get("read_status", "unread"),
+        x=value.get("x"),
+        y=value.get("y"),
+        neighbors=value.get("neighbors"),
+        file_size=value.get("file_size"),
+    )
+
+
+def _synthetic_rows(count: int, seed: int = 7) -> List[str]:
+    """Serialized article records, decoded inside the measurement like a real load."""
+    rng = random.Random(seed)
+    topics = ["ai", "web", "databases", "devops", "design", None]
+    vocabulary = [f"tag-{i}" for i in range(300)]
+    base = datetime(2023, 1, 1)
+    ids = [f"documents/{i % 97}/article-{i}.md" for i in range(count)]
+    rows = []
+    for i, article_id in enumerate(ids):
+        stamp = base + timedelta(minutes=i)
+        topic = rng.choice(topics)
+        rows.append(
+            {
+                "id": article_id,
+                "path": article_id,
+                "title": f"Article {i}",
+                "topic": topic,
+                "tags": rng.sample(vocabulary, 4),
+                "created_at": stamp.isoformat(),
+                "updated_at": stamp.isoformat(),
+                "word_count": rng.randint(100, 5000),
+                "excerpt": "Lorem ipsum dolor sit amet " * 8,
+                "read_status": rng.choice(["read", "unread"]),
+                "x": rng.random(),
+                "y": rng.random(),
+                "neighbors": rng.sample(ids, 5),
+                "file_size": rng.randint(1_000, 50_000),
+            }
+        )
+    return [json.dumps(row) for row in rows]
+
+
+def _load(build: Callable[[dict], Any], rows: List[str]) -> Dict[str, Any]:
+    index = {}
+    for row in rows:
+        article = build(json.loads(row))
+        index[article.id] = article
+    return index
+
+
+def _measure(label: str, build: Callable[[dict], Any], rows: List[str]) -> float:
+    gc.collect()
+    started = time.perf_counter()
+    index = _load(build, rows)
+    elapsed = time.perf_counter() - started
+    del index
+
+    gc.collect()
+    tracemalloc.start()
+    index = _load(build, rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_article = current / len(rows)
+    print(f"{label:<10} {current / 1_048_576:8.1f} MiB  {per_article:7.0f} B/article  load {elapsed:6.2f}s")
+    del index
+    return per_article
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100_000, help="Number of synthetic articles")
+    args = parser.parse_args()
+
+    rows = _synthetic_rows(args.articles)
+    print(f"{args.articles} articles")
+    before = _measure("dataclass", _legacy_from_mapping, rows)
+    after = _measure("slotted", article_from_mapping, rows)
+    print(f"saving    {before - after:7.0f} B/article ({(1 - after / before) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
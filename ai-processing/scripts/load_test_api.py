@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Measure read latency of a running API while a rebuild is in progress.
+
+Samples ``/health`` and ``/articles`` from a few client threads, first on an
+idle server and then while a ``POST /visualization/rebuild`` job runs, and prints
+p50/p95/max for both phases. Blocking work in handlers shows up as the
+"during" latencies tracking the rebuild's duration.
+
+Usage:
+    uv run python scripts/load_test_api.py [--url http://localhost:8000] [--seconds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+from typing import Dict, List
+
+import requests
+
+
+def _sample(url: str, paths: List[str], stop: threading.Event, out: Dict[str, List[float]]) -> None:
+    session = requests.Session()
+    while not stop.is_set():
+        for path in paths:
+            started = time.perf_counter()
+            try:
+                session.get(f"{url}{path}", timeout=60)
+            except requests.RequestException:
+                continue
+            out.setdefault(path, []).append(time.perf_counter() - started)
+
+
+def _run_phase(url: str, paths: List[str], clients: int, until: threading.Event) -> Dict[str, List[float]]:
+    results: List[Dict[str, List[float]]] = [{} for _ in range(clients)]
+    threads = [threading.Thread(target=_sample, args=(url, paths, until, results[i])) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    merged: Dict[str, List[float]] = {}
+    for result in results:
+        for path, timings in result.items():
+            merged.setdefault(path, []).extend(timings)
+    return merged
+
+
+def _report(label: str, timings: Dict[str, List[float]]) -> None:
+    for path, values in sorted(timings.items()):
+        values.sort()
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(
+            f"{label:<7} {path:<10} n={len(values):<5} p50={statistics.median(values) * 1000:7.1f}ms "
+            f"p95={p95 * 1000:7.1f}ms max={values[-1] * 1000:7.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000", help="API base URL")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Idle sampling duration")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent client threads")
+    args = parser.parse_args()
+    paths = ["/health", "/articles?limit=50"]
+
+    idle_stop = threading.Event()
+    threading.Timer(args.seconds, idle_stop.set).start()
+    _report("idle", _run_phase(args.url, paths, args.clients, idle_stop))
+
+    rebuild_done = threading.Event()
+
+    def rebuild() -> None:
+        started = time.perf_counter()
+        job = requests.post(f"{args.url}/visualization/rebuild", timeout=60).json()
+        while job.get("status") in ("queued", "running"):
+            time.sleep(0.2)
+            job = requests.get(f"{args.url}/jobs/{job['id']}", timeout=60).json()
+        print(f"rebuild  {job.get('status')} in {time.perf_counter() - started:.1f}s")
+        rebuild_done.set()
+
+    threading.Thread(target=rebuild).start()
+    _report("during", _run_phase(args.url, paths, args.clients, rebuild_done))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,30 +2,73 @@
 FastAPI application for PrismWeave visualization layer
 """
 
+import base64
+import binascii
+import hashlib
 import logging
 import os
-from contextlib import asynccontextmanager
+import sqlite3
+import threading
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import frontmatter
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.core.article_index_store import (
+    ArticleIndexCache,
+    ArticleIndexStore,
+    default_article_index_sqlite_path,
+    open_article_index,
+)
 from src.core.config import Config, load_config
+from src.core.embedding_neighbors import open_embedding_neighbor_store, update_embedding_neighbors
 from src.core.embedding_store import EmbeddingStore
 from src.core.git_tracker import GitTracker
-from src.core.layout import compute_fallback_layout, compute_layout_from_embeddings, compute_nearest_neighbors
+from src.core.job_store import default_job_sqlite_path
+from src.core.layout import (
+    LAYOUT_METHODS,
+    compute_fallback_layout,
+    compute_layout_from_embeddings,
+    compute_nearest_neighbors,
+)
+from src.core.layout_store import open_layout_store, update_layout
 from src.core.metadata_index import (
     INDEX_RELATIVE_PATH,
     ArticleMetadata,
     build_metadata_index,
-    load_existing_index,
     save_index,
 )
+from src.core.watcher import DocumentWatcher, WatchBatch, index_watch_batch
 from src.taxonomy.store import TaxonomyStore, TaxonomyStoreConfig, default_taxonomy_sqlite_path
 
-from .models import ArticleDetail, ArticleSummary, RebuildResponse, TaxonomyTagAssignment, UpdateArticleRequest
+from .deps import get_document_processor, get_embedding_store
+from .jobs import (
+    JobCancelledError,
+    JobContext,
+    configure_job_manager,
+    get_job_manager,
+    job_accepted_response,
+    shutdown_job_manager,
+)
+from .models import (
+    ArticleDetail,
+    ArticleSummary,
+    JobStatusResponse,
+    RebuildResponse,
+    TaxonomyTagAssignment,
+    UpdateArticleRequest,
+)
+from .response_cache import (
+    bump_data_generation,
+    bumps_generation,
+    encode_json,
+    etag_matches,
+    get_response_cache,
+)
+from .workers import offload, shutdown_workers
 
 # Global state (initialized on startup)
 config: Optional[Config] = None
@@ -34,8 +77,30 @@ index_path: Optional[Path] = None
 legacy_index_path: Optional[Path] = None
 index_path_is_override: bool = False
 
+# Parsed article index shared across requests (see _get_index_cache).
+_index_cache: Optional[ArticleIndexCache] = None
+_index_cache_lock = threading.Lock()
+
+# Background layout refresh queued by reads (see _schedule_layout_refresh).
+_layout_refresh_lock = threading.Lock()
+_layout_refresh_thread: Optional[threading.Thread] = None
+_layout_refresh_pending = False
+
+# Background rewrite of the legacy articles.json after edits (see _schedule_legacy_index_export).
+_legacy_export_lock = threading.Lock()
+_legacy_export_thread: Optional[threading.Thread] = None
+_legacy_export_pending = False
+
+# Materialized taxonomy view keyed by article id, with the taxonomy database
+# signature it was read at (see _taxonomy_view).
+_taxonomy_view_lock = threading.Lock()
+_taxonomy_view_cache: Optional[tuple[tuple, dict[str, dict[str, object]]]] = None
+
 logger = logging.getLogger("prismweave.ai.api")
 
+# Upper bound for a single /articles page.
+MAX_ARTICLES_PAGE_SIZE = 5000
+
 
 def _initialize_state() -> None:
     """Initialize configuration and paths (used by FastAPI lifespan)."""
@@ -58,9 +123,47 @@ def _initialize_state() -> None:
         logger.warning("Documents root does not exist: %s", documents_root)
 
 
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _start_document_watcher() -> Optional[DocumentWatcher]:
+    """Start the background watcher when PRISMWEAVE_WATCH is enabled."""
+    if not _env_flag("PRISMWEAVE_WATCH") or documents_root is None or not documents_root.is_dir():
+        return None
+
+    def handle_batch(batch: WatchBatch) -> None:
+        # Use the store's own tracker so batch() buffers the writes it makes.
+        store = get_embedding_store()
+        try:
+            counts = index_watch_batch(batch, get_document_processor(), store, store.git_tracker)
+        finally:
+            bump_data_generation()
+        logger.info(
+            "Watcher indexed %d, removed %d, skipped %d, failed %d",
+            counts["processed"],
+            counts["removed"],
+            counts["skipped"],
+            counts["errors"],
+        )
+
+    watcher = DocumentWatcher(
+        documents_root,
+        handle_batch,
+        debounce_seconds=float(os.environ.get("PRISMWEAVE_WATCH_DEBOUNCE", "1.0")),
+        force_polling=_env_flag("PRISMWEAVE_WATCH_POLLING"),
+    )
+    watcher.start()
+    logger.info("Watching %s for document changes (%s)", documents_root, watcher.backend)
+    return watcher
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     _initialize_state()
+    configure_job_manager(default_job_sqlite_path(index_path))
+    get_job_manager()  # marks jobs interrupted by a previous run as failed
+    watcher = _start_document_watcher()
 
     # Emit a clear startup log so Docker logs show where this API is listening.
     api_port = int(os.environ.get("API_PORT", "8000"))
@@ -75,7 +178,13 @@ async def lifespan(_: FastAPI):
         api_port,
     )
     logger.info("Health: http://%s:%s/health", display_host, api_port)
-    yield
+    try:
+        yield
+    finally:
+        if watcher:
+            watcher.stop()
+        shutdown_workers()
+        shutdown_job_manager()
 
 
 # Initialize FastAPI app with comprehensive OpenAPI documentation
@@ -141,6 +250,10 @@ app = FastAPI(
             "name": "rebuild",
             "description": "Full or partial rebuild of embeddings and taxonomy pipelines",
         },
+        {
+            "name": "jobs",
+            "description": "Status, progress and cancellation of background rebuild and processing jobs",
+        },
         {
             "name": "articles",
             "description": "Article management operations (CRUD)",
@@ -159,11 +272,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Link", "X-Next-Cursor", "X-Total-Count"],
 )
 
 # Register API routers (CLI-equivalent endpoints)
 from src.api.routers.documents import router as documents_router
 from src.api.routers.health import router as health_router
+from src.api.routers.jobs import router as jobs_router
 from src.api.routers.processing import router as processing_router
 from src.api.routers.rebuild import router as rebuild_router
 from src.api.routers.search import router as search_router
@@ -175,6 +290,7 @@ app.include_router(processing_router)
 app.include_router(taxonomy_router)
 app.include_router(health_router)
 app.include_router(rebuild_router)
+app.include_router(jobs_router)
 
 
 def _path_status(path: Path) -> str:
@@ -203,21 +319,32 @@ def _index_candidates() -> List[Path]:
     return candidates
 
 
-def _select_readable_index_path() -> Path:
+def _open_index_store() -> ArticleIndexStore:
+    """Open the SQLite article index, importing a legacy JSON index on first use."""
     for candidate in _index_candidates():
-        path_state = _path_status(candidate)
-        if path_state == "ok":
-            return candidate
-        if path_state == "denied":
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=(
-                    "Permission denied reading article index. "
-                    f"Index path: {candidate}. "
-                    "Fix file ownership/permissions on the host (e.g. chown/chmod) "
-                    "or set INDEX_PATH/ARTICLE_INDEX_PATH to a writable location inside the container."
-                ),
-            )
+        for path in (default_article_index_sqlite_path(candidate), candidate):
+            path_state = _path_status(path)
+            if path_state == "ok":
+                try:
+                    return open_article_index(candidate)
+                except (OSError, sqlite3.Error) as e:
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=(
+                            f"Failed to open article index at {path}: {e}. "
+                            "Set INDEX_PATH/ARTICLE_INDEX_PATH to a writable location."
+                        ),
+                    )
+            if path_state == "denied":
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=(
+                        "Permission denied reading article index. "
+                        f"Index path: {path}. "
+                        "Fix file ownership/permissions on the host (e.g. chown/chmod) "
+                        "or set INDEX_PATH/ARTICLE_INDEX_PATH to a writable location inside the container."
+                    ),
+                )
 
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -225,6 +352,22 @@ def _select_readable_index_path() -> Path:
     )
 
 
+def _get_index_cache() -> ArticleIndexCache:
+    """Return the process-wide in-memory article index, (re)opening it when needed."""
+    global _index_cache
+
+    cache = _index_cache
+    if cache is not None and cache.store.sqlite_path.exists():
+        candidates = _index_candidates()
+        if candidates and cache.store.sqlite_path == default_article_index_sqlite_path(candidates[0]):
+            return cache
+
+    with _index_cache_lock:
+        if _index_cache is None or _index_cache is cache:
+            _index_cache = ArticleIndexCache(_open_index_store())
+        return _index_cache
+
+
 def _ensure_writable_index_path(target: Path) -> None:
     try:
         target.parent.mkdir(parents=True, exist_ok=True)
@@ -244,179 +387,207 @@ def _ensure_writable_index_path(target: Path) -> None:
         )
 
 
-def _article_metadata_to_summary(article: ArticleMetadata) -> ArticleSummary:
-    """Convert ArticleMetadata to ArticleSummary Pydantic model"""
-    return ArticleSummary(
-        id=article.id,
-        title=article.title,
-        path=article.path,
-        topic=article.topic,
-        tags=article.tags,
-        created_at=article.created_at,
-        updated_at=article.updated_at,
-        word_count=article.word_count,
-        excerpt=article.excerpt,
-        read_status=article.read_status,
-        x=article.x,
-        y=article.y,
-        neighbors=article.neighbors,
+def _article_summary_payload(article: ArticleMetadata, enrich: Optional[dict[str, object]] = None) -> dict[str, object]:
+    """Build the JSON body of an ArticleSummary without constructing the model.
+
+    /articles can return the whole library, so this skips per-item Pydantic
+    validation and never decodes timestamps that are still ISO strings.
+    """
+    enrich = enrich or {}
+    assignments = enrich.get("taxonomy_tag_assignments") or []
+    return {
+        "id": article.id,
+        "title": article.title,
+        "path": article.path,
+        "topic": article.topic,
+        "tags": list(article.tags),
+        "created_at": article.created_at_iso,
+        "updated_at": article.updated_at_iso,
+        "word_count": article.word_count,
+        "excerpt": article.excerpt,
+        "read_status": article.read_status,
+        "x": article.x,
+        "y": article.y,
+        "neighbors": article.neighbors,
+        "taxonomy_cluster_id": enrich.get("taxonomy_cluster_id"),
+        "taxonomy_category_id": enrich.get("taxonomy_category_id"),
+        "taxonomy_category": enrich.get("taxonomy_category"),
+        "taxonomy_subcategory_id": enrich.get("taxonomy_subcategory_id"),
+        "taxonomy_subcategory": enrich.get("taxonomy_subcategory"),
+        "taxonomy_tag_assignments": [assignment.model_dump() for assignment in assignments],  # type: ignore[union-attr]
+        "taxonomy_tags": list(enrich.get("taxonomy_tags") or []),  # type: ignore[call-overload]
+    }
+
+
+def _resolve_taxonomy_sqlite_path(docs_root: Path) -> Path:
+    """Locate taxonomy.sqlite for a documents root.
+
+    The API may be configured with DOCUMENTS_PATH pointing at the content folder
+    (e.g. PrismWeaveDocs/documents), while taxonomy artifacts live at the repo root
+    (e.g. PrismWeaveDocs/.prismweave). Prefer the nearest directory that actually
+    contains the taxonomy sqlite.
+    """
+    try:
+        for candidate in (docs_root, docs_root.parent):
+            candidate_sqlite = default_taxonomy_sqlite_path(candidate)
+            if candidate_sqlite.exists():
+                return candidate_sqlite
+    except Exception:
+        pass
+    return default_taxonomy_sqlite_path(docs_root)
+
+
+def _taxonomy_signature(sqlite_path: Path, docs_root: Path) -> tuple:
+    return (
+        str(sqlite_path),
+        str(docs_root),
+        _file_signature(sqlite_path),
+        _file_signature(Path(f"{sqlite_path}-wal")),
     )
 
 
-def _load_taxonomy_enrichment(
-    *,
-    docs_root: Path,
-    article_ids: List[str],
-) -> dict[str, dict[str, object]]:
-    """Best-effort taxonomy enrichment for a set of articles.
+def _taxonomy_view(docs_root: Path) -> dict[str, dict[str, object]]:
+    """Enrichment for every article, read from ``article_taxonomy_view``.
 
-    Returns a mapping: article_id -> enrichment dict containing taxonomy fields.
-    Never raises; failures degrade to an empty mapping.
+    The view is materialized by each taxonomy pipeline stage; it is loaded
+    once into memory and reloaded when the taxonomy database changes, so
+    enriching a response is a dict lookup per article. Rows are keyed by
+    their canonical id and, when their absolute path lies under
+    ``docs_root``, by the path relative to it (the id the article index
+    uses when the pipeline ran against a different root).
     """
 
-    try:
-        # The API may be configured with DOCUMENTS_PATH pointing at the content folder
-        # (e.g. PrismWeaveDocs/documents), while taxonomy artifacts live at the repo root
-        # (e.g. PrismWeaveDocs/.prismweave). Resolve the taxonomy root by preferring the
-        # nearest directory that actually contains the taxonomy sqlite.
-        content_root = docs_root
-        taxonomy_root = docs_root
-        try:
-            for candidate in (docs_root, docs_root.parent):
-                candidate_sqlite = default_taxonomy_sqlite_path(candidate)
-                if candidate_sqlite.exists():
-                    taxonomy_root = candidate
-                    break
-        except Exception:
-            taxonomy_root = docs_root
-
-        sqlite_path = default_taxonomy_sqlite_path(taxonomy_root)
-        if not sqlite_path.exists():
-            return {}
+    global _taxonomy_view_cache
+    sqlite_path = _resolve_taxonomy_sqlite_path(docs_root)
+    if not sqlite_path.exists():
+        return {}
+    signature = _taxonomy_signature(sqlite_path, docs_root)
+    cached = _taxonomy_view_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _taxonomy_view_lock:
+        cached = _taxonomy_view_cache
+        if cached is not None and cached[0] == _taxonomy_signature(sqlite_path, docs_root):
+            return cached[1]
 
         store = TaxonomyStore(TaxonomyStoreConfig(sqlite_path=sqlite_path))
         # Initialize is safe/cheap; ensures tables exist if the file is present.
         store.initialize()
+        if not store.article_taxonomy_view_built():
+            # Databases written before the view existed.
+            store.rebuild_article_taxonomy_view(docs_root)
+        signature = _taxonomy_signature(sqlite_path, docs_root)
+        rows = store.list_article_taxonomy()
+
+        view: dict[str, dict[str, object]] = {}
+        aliases: list[tuple[str, dict[str, object]]] = []
+        root = docs_root.resolve()
+        for row in rows:
+            entry: dict[str, object] = {
+                "taxonomy_cluster_id": row.cluster_id,
+                "taxonomy_category_id": row.category_id,
+                "taxonomy_category": row.category_name,
+                "taxonomy_subcategory_id": row.subcategory_id,
+                "taxonomy_subcategory": row.subcategory_name,
+                "taxonomy_tag_assignments": [
+                    TaxonomyTagAssignment(id=tag.id, name=tag.name, confidence=tag.confidence) for tag in row.tags
+                ],
+                "taxonomy_tags": [tag.name for tag in row.tags],
+            }
+            view[row.article_id] = entry
+            if row.absolute_path:
+                with suppress(ValueError):
+                    aliases.append((Path(row.absolute_path).relative_to(root).as_posix(), entry))
+        for alias, entry in aliases:
+            view.setdefault(alias, entry)
 
-        # Cluster membership comes from taxonomy.sqlite snapshots.
-        article_to_cluster: dict[str, str] = {}
-        try:
-            article_to_cluster = store.get_article_to_cluster_map()
+        _taxonomy_view_cache = (signature, view)
+        return view
 
-            # Also map absolute paths back to repo-relative paths when possible.
-            # The taxonomy pipeline historically used absolute file paths as ids,
-            # but the visualization index uses docs-root-relative paths.
-            remapped: dict[str, str] = {}
-            for raw_id, cluster_id in article_to_cluster.items():
-                try:
-                    p = Path(str(raw_id))
-                    if p.is_absolute():
-                        rel = p.resolve().relative_to(content_root.resolve()).as_posix()
-                        remapped[rel] = cluster_id
-                except Exception:
-                    continue
-            article_to_cluster.update(remapped)
-        except Exception:
-            article_to_cluster = {}
-
-        # Cluster -> category/subcategory mapping and category names from SQLite.
-        cluster_category_map = store.get_cluster_category_map()
-        category_map = store.get_category_map()
-
-        # Tag assignments and tag name lookup from SQLite.
-        # Be resilient to article_id format differences between systems (relative vs absolute).
-        expanded_article_ids: list[str] = []
-        absolute_by_canonical: dict[str, str] = {}
-        for canonical_id in article_ids:
-            expanded_article_ids.append(canonical_id)
-            try:
-                abs_id = (content_root / canonical_id).resolve()
-                absolute_by_canonical[canonical_id] = str(abs_id)
-                expanded_article_ids.append(str(abs_id))
-            except Exception:
-                continue
-
-        # Deduplicate while keeping order.
-        seen: set[str] = set()
-        expanded_article_ids = [x for x in expanded_article_ids if not (x in seen or seen.add(x))]
-
-        assignments_by_article = store.get_article_tags_for_articles(expanded_article_ids)
-        tag_map = store.get_tag_map()
-
-        enrichment: dict[str, dict[str, object]] = {}
-        for article_id in article_ids:
-            cluster_id = article_to_cluster.get(article_id)
-            category_id = None
-            subcategory_id = None
-            if cluster_id and cluster_id in cluster_category_map:
-                category_id, subcategory_id = cluster_category_map.get(cluster_id, (None, None))
-
-            category_name = category_map.get(category_id).name if category_id and category_id in category_map else None
-            subcategory_name = (
-                category_map.get(subcategory_id).name if subcategory_id and subcategory_id in category_map else None
-            )
 
-            raw_assignments = assignments_by_article.get(article_id, [])
-            if not raw_assignments:
-                alt = absolute_by_canonical.get(article_id)
-                if alt:
-                    raw_assignments = assignments_by_article.get(alt, [])
-            tag_assignments: list[TaxonomyTagAssignment] = []
-            tag_names: list[str] = []
-            for a in raw_assignments:
-                tag = tag_map.get(a.tag_id)
-                name = tag.name if tag else a.tag_id
-                tag_assignments.append(TaxonomyTagAssignment(id=a.tag_id, name=name, confidence=float(a.confidence)))
-                tag_names.append(name)
-
-            enrichment[article_id] = {
-                "taxonomy_cluster_id": cluster_id,
-                "taxonomy_category_id": category_id,
-                "taxonomy_category": category_name,
-                "taxonomy_subcategory_id": subcategory_id,
-                "taxonomy_subcategory": subcategory_name,
-                "taxonomy_tag_assignments": tag_assignments,
-                "taxonomy_tags": tag_names,
-            }
+def _load_taxonomy_enrichment(
+    *,
+    docs_root: Path,
+    article_ids: List[str],
+) -> dict[str, dict[str, object]]:
+    """Best-effort taxonomy enrichment for a set of articles.
+
+    Returns a mapping: article_id -> enrichment dict containing taxonomy fields,
+    for the articles the taxonomy knows about. Never raises; failures degrade
+    to an empty mapping.
+    """
 
-        return enrichment
+    try:
+        view = _taxonomy_view(docs_root)
     except Exception:
         return {}
+    return {article_id: view[article_id] for article_id in article_ids if article_id in view}
 
 
-def _apply_layout_to_index(index: dict[str, ArticleMetadata], docs_root: Path) -> int:
+def _apply_layout_to_index(
+    index: dict[str, ArticleMetadata],
+    docs_root: Path,
+    *,
+    index_file: Optional[Path] = None,
+    refit_layout: bool = False,
+    layout_method: str = "auto",
+) -> int:
     """Populate x/y and neighbors for the given index.
 
     Prefers embeddings when available; otherwise falls back to a deterministic
     grid layout. Always returns a coordinate mapping for every index entry.
+
+    With ``index_file`` (the article index path), the embedding layout and
+    embedding-space neighbors are maintained incrementally in the layout and
+    neighbor stores next to it: only new or changed articles are placed,
+    and the projector is refitted on drift, when ``refit_layout`` is set or
+    when ``layout_method`` changes.
+    Articles without embeddings use the nearest points of the 2D layout.
     """
 
     # Base layout is always available.
     layout_coords = compute_fallback_layout(index.keys())
 
     # Overlay embedding-derived layout when possible.
+    article_embeddings: dict[str, Any] = {}
     try:
         if config is not None:
-            git_tracker = GitTracker(docs_root, config)
-            store = EmbeddingStore(config, git_tracker)
+            store = EmbeddingStore(config)
 
-            article_embeddings: dict[str, list[float]] = {}
-            for article in index.values():
-                try:
-                    vector = store.get_article_embedding(docs_root / article.path)
-                    if vector is not None:
-                        article_embeddings[article.id] = list(vector)
-                except Exception:
-                    continue
+            # One streamed scan of the collection instead of a query per article.
+            sources = {docs_root / article.path: article.id for article in index.values()}
+            vectors = store.get_article_embeddings(sources)
+            article_embeddings = {
+                article_id: vectors[str(path)] for path, article_id in sources.items() if str(path) in vectors
+            }
 
             if article_embeddings:
-                embedding_coords = compute_layout_from_embeddings(article_embeddings)
+                if index_file is not None:
+                    layout_update = update_layout(
+                        open_layout_store(index_file),
+                        article_embeddings,
+                        refit=refit_layout,
+                        method=layout_method,
+                    )
+                    embedding_coords = layout_update.coords
+                else:
+                    embedding_coords = compute_layout_from_embeddings(article_embeddings, method=layout_method)
                 layout_coords.update(embedding_coords)
     except Exception:
         # Embeddings are an enhancement; visualization should still work.
         pass
 
-    neighbors_map = compute_nearest_neighbors(layout_coords, k=5)
+    neighbors_map: dict[str, list[str]] = {}
+    if article_embeddings and index_file is not None:
+        try:
+            update = update_embedding_neighbors(open_embedding_neighbor_store(index_file), article_embeddings)
+            neighbors_map.update(update.neighbors)
+        except Exception as exc:
+            logger.warning("Embedding neighbors unavailable, using layout neighbors: %s", exc)
+    if any(article_id not in neighbors_map for article_id in layout_coords):
+        for article_id, neighbors in compute_nearest_neighbors(layout_coords, k=5).items():
+            neighbors_map.setdefault(article_id, neighbors)
 
     updated = 0
     for article_id, article in index.items():
@@ -431,6 +602,113 @@ def _apply_layout_to_index(index: dict[str, ArticleMetadata], docs_root: Path) -
     return updated
 
 
+def _cached_layout_positions(
+    index: dict[str, ArticleMetadata], index_file: Path
+) -> dict[str, tuple[float, float, list[str]]]:
+    """Positions for articles without x/y, from stored results only.
+
+    Uses the persisted layout and embedding neighbors when they cover an
+    article and the deterministic grid otherwise; never computes a layout.
+    """
+
+    missing = [article_id for article_id, article in index.items() if article.x is None or article.y is None]
+    if not missing:
+        return {}
+
+    coords: dict[str, tuple[float, float]] = compute_fallback_layout(index.keys())
+    neighbors: dict[str, list[str]] = {}
+    try:
+        coords.update({a: xy for a, xy in open_layout_store(index_file).load_coords().items() if a in index})
+        neighbors = open_embedding_neighbor_store(index_file).load_neighbors()
+    except Exception as exc:
+        logger.warning("Stored layout unavailable, serving grid positions: %s", exc)
+    return {article_id: (*coords[article_id], neighbors.get(article_id, [])) for article_id in missing}
+
+
+def _refresh_layout(cache: ArticleIndexCache, docs_root: Path) -> None:
+    """Recompute the layout off the request path and write x/y/neighbors back."""
+
+    global _layout_refresh_thread, _layout_refresh_pending
+
+    while True:
+        try:
+            _, index = cache.snapshot()
+            working = {article_id: article.copy() for article_id, article in index.items()}
+            _apply_layout_to_index(working, docs_root, index_file=cache.store.sqlite_path)
+            cache.update_positions(
+                {
+                    article_id: (article.x, article.y, article.neighbors or [])
+                    for article_id, article in working.items()
+                    if article.x is not None and article.y is not None
+                }
+            )
+        except Exception as exc:
+            logger.warning("Background layout refresh failed: %s", exc)
+        with _layout_refresh_lock:
+            if not _layout_refresh_pending:
+                _layout_refresh_thread = None
+                return
+            _layout_refresh_pending = False
+
+
+def _schedule_layout_refresh(cache: ArticleIndexCache, docs_root: Path) -> None:
+    """Queue a background layout refresh; requests made while one runs coalesce into one rerun."""
+
+    global _layout_refresh_thread, _layout_refresh_pending
+
+    with _layout_refresh_lock:
+        if _layout_refresh_thread is not None:
+            _layout_refresh_pending = True
+            return
+        _layout_refresh_thread = threading.Thread(
+            target=_refresh_layout, args=(cache, docs_root), name="prismweave-layout-refresh", daemon=True
+        )
+        _layout_refresh_thread.start()
+
+
+def _legacy_index_json_path(store: ArticleIndexStore) -> Optional[Path]:
+    """Return the articles.json path the SQLite index was opened for, if any."""
+    for candidate in _index_candidates():
+        if default_article_index_sqlite_path(candidate) == store.sqlite_path:
+            return candidate
+    return None
+
+
+def _export_legacy_index(store: ArticleIndexStore, json_path: Path) -> None:
+    """Rewrite the legacy JSON snapshot from SQLite off the request path."""
+
+    global _legacy_export_thread, _legacy_export_pending
+
+    while True:
+        try:
+            store.export_json(json_path)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Failed to refresh legacy article index %s: %s", json_path, exc)
+        with _legacy_export_lock:
+            if not _legacy_export_pending:
+                _legacy_export_thread = None
+                return
+            _legacy_export_pending = False
+
+
+def _schedule_legacy_index_export(store: ArticleIndexStore) -> None:
+    """Queue a rewrite of articles.json; edits made while one runs coalesce into one rerun."""
+
+    global _legacy_export_thread, _legacy_export_pending
+
+    json_path = _legacy_index_json_path(store)
+    if json_path is None:
+        return
+    with _legacy_export_lock:
+        if _legacy_export_thread is not None:
+            _legacy_export_pending = True
+            return
+        _legacy_export_thread = threading.Thread(
+            target=_export_legacy_index, args=(store, json_path), name="prismweave-legacy-export", daemon=True
+        )
+        _legacy_export_thread.start()
+
+
 @app.get(
     "/",
     tags=["root"],
@@ -456,6 +734,7 @@ async def root():
             "health": "/health",
             "health_detailed": "/health/detailed",
             "health_ollama": "/health/ollama",
+            "metrics": "/metrics",
             "search": "POST /search",
             "documents_list": "/documents",
             "documents_count": "/documents/count",
@@ -471,6 +750,10 @@ async def root():
             "taxonomy_tag_new": "POST /taxonomy/tag-new",
             "rebuild_embeddings": "POST /rebuild/embeddings",
             "rebuild_everything": "POST /rebuild/everything",
+            "jobs_list": "/jobs",
+            "job_status": "/jobs/{id}",
+            "job_events": "/jobs/{id}/events",
+            "job_cancel": "POST /jobs/{id}/cancel",
             "articles_list": "/articles",
             "article_detail": "/articles/{id}",
             "article_update": "PUT /articles/{id}",
@@ -519,19 +802,106 @@ async def health():
     }
 
 
+def _encode_article_cursor(article_id: str) -> str:
+    return base64.urlsafe_b64encode(article_id.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_article_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.b64decode(padded, altchars=b"-_", validate=True).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _parse_article_fields(fields: Optional[str]) -> Optional[set[str]]:
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(ArticleSummary.model_fields))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown article fields: {', '.join(unknown)}",
+        )
+    # The id is what clients key on and what cursors are built from.
+    requested.add("id")
+    return requested
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _articles_etag(index_version: tuple, request: Request) -> str:
+    """Weak ETag for an /articles response.
+
+    Covers the article index (store path + generation), the taxonomy
+    database the response is enriched from, and the query string that shaped
+    the response. Only persisted state goes in, so the tag survives restarts
+    and matches across workers serving the same index.
+    """
+    parts: list[object] = [index_version]
+    if documents_root is not None:
+        parts.append(_taxonomy_signature(_resolve_taxonomy_sqlite_path(documents_root), documents_root))
+    parts.append(sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _matches_category(enrich: Optional[dict[str, object]], category: str) -> bool:
+    if not enrich:
+        return False
+    wanted = category.casefold()
+    for id_key, name_key in (
+        ("taxonomy_category_id", "taxonomy_category"),
+        ("taxonomy_subcategory_id", "taxonomy_subcategory"),
+    ):
+        if enrich.get(id_key) == category:
+            return True
+        name = enrich.get(name_key)
+        if isinstance(name, str) and name.casefold() == wanted:
+            return True
+    return False
+
+
 @app.get(
     "/articles",
     response_model=List[ArticleSummary],
     tags=["articles"],
     summary="List All Articles",
-    description="Get a list of all articles with metadata and visualization coordinates",
+    description="Get a list of articles with metadata and visualization coordinates",
     response_description="List of article summaries with metadata and coordinates",
+    responses={
+        304: {"description": "Index unchanged since the ETag sent in If-None-Match"},
+        400: {"description": "Invalid cursor or unknown field name"},
+    },
 )
-async def get_articles():
+@offload("articles")
+def get_articles(
+    request: Request,
+    limit: Optional[int] = Query(
+        None, ge=1, le=MAX_ARTICLES_PAGE_SIZE, description="Maximum articles to return (default: all)"
+    ),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    topic: Optional[str] = Query(None, description="Only articles with this topic"),
+    tag: Optional[str] = Query(None, description="Only articles carrying this tag"),
+    read_status: Optional[str] = Query(None, description="Only articles with this read status (read/unread)"),
+    category: Optional[str] = Query(
+        None, description="Only articles in this taxonomy category or subcategory (id or name)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated list of fields to return (id is always included)"
+    ),
+):
     """
-    Get list of all articles with metadata and visualization coordinates.
+    Get list of articles with metadata and visualization coordinates.
 
-    Returns a comprehensive list of all articles in the system, each containing:
+    Returns a list of articles in the system, each containing:
 
     **Metadata:**
     - Article ID (typically file path)
@@ -546,7 +916,23 @@ async def get_articles():
     - Neighbor IDs for drawing edges between related articles
 
     The coordinates are computed from semantic embeddings when available,
-    falling back to a deterministic grid layout otherwise.
+    falling back to a deterministic grid layout otherwise. Articles that
+    have not been laid out yet get their stored or grid position while the
+    layout is refreshed in the background; the ETag changes once it lands.
+
+    **Paging and filtering:**
+    Articles are ordered by id. With `limit`, the response carries an
+    `X-Next-Cursor` header (and a `Link: rel="next"` header) while more
+    articles remain; pass it back as `cursor` to fetch the next page.
+    `X-Total-Count` is the number of articles matching the filters.
+    `fields=id,title,x,y` trims each item to the listed fields.
+
+    **Caching:**
+    Responses carry an `ETag` derived from the index version, the taxonomy
+    database and the query. Sending it back in `If-None-Match` returns
+    `304 Not Modified` while nothing has changed; other repeats of the same
+    query are served from the shared response cache (gzip-encoded when the
+    client accepts it).
 
     **Example Response:**
     ```json
@@ -563,43 +949,77 @@ async def get_articles():
     ]
     ```
     """
-    selected_index_path = _select_readable_index_path()
+    include = _parse_article_fields(fields)
+    after_id = _decode_article_cursor(cursor) if cursor else None
+
+    # Load the metadata index (served from memory unless the index changed)
+    cache = _get_index_cache()
+    version, index = cache.snapshot()
+
+    etag = _articles_etag((str(cache.store.sqlite_path), version), request)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    responses = get_response_cache()
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        responses.record_not_modified("articles")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # The ETag already covers everything the body depends on except the host
+    # the Link header points at.
+    cache_key = (etag, str(request.base_url))
+    cached = responses.get("articles", cache_key)
+    if cached is not None:
+        return cached.to_response(request)
+
+    # Ensure we always have a usable layout for visualization. Older indexes
+    # (or metadata-only rebuilds) can have null x/y/neighbors: serve stored or
+    # grid positions now and compute the real layout in the background.
+    if documents_root is not None and any(a.x is None or a.y is None for a in index.values()):
+        positions = _cached_layout_positions(index, cache.store.sqlite_path)
+        # The cached entries are shared; patch copies.
+        index = dict(index)
+        for article_id, (x, y, neighbors) in positions.items():
+            index[article_id] = index[article_id].copy(x=x, y=y, neighbors=neighbors)
+        _schedule_layout_refresh(cache, documents_root)
+
+    # Cheap metadata filters first, so taxonomy lookups only cover survivors.
+    candidates = [
+        article
+        for article in index.values()
+        if (topic is None or article.topic == topic)
+        and (tag is None or tag in article.tags)
+        and (read_status is None or article.read_status == read_status)
+    ]
+    candidates.sort(key=lambda article: article.id)
 
-    # Load the metadata index
-    index = load_existing_index(selected_index_path)
+    def enrichment_for(batch: List[ArticleMetadata]) -> dict[str, dict[str, object]]:
+        if documents_root is None or not batch:
+            return {}
+        return _load_taxonomy_enrichment(docs_root=documents_root, article_ids=[a.id for a in batch])
 
-    if not index:
-        return []
+    if category is not None:
+        taxonomy = enrichment_for(candidates)
+        candidates = [a for a in candidates if _matches_category(taxonomy.get(a.id), category)]
 
-    # Ensure we always have a usable layout for visualization.
-    # Older indexes (or metadata-only rebuilds) can have null x/y/neighbors.
-    if documents_root is not None and any(a.x is None or a.y is None for a in index.values()):
-        try:
-            _apply_layout_to_index(index, documents_root)
-        except Exception:
-            # Fall back to returning whatever we have.
-            pass
-
-    # Convert to response models
-    index_values = list(index.values())
-    article_ids = [a.id for a in index_values]
-    taxonomy = _load_taxonomy_enrichment(docs_root=documents_root, article_ids=article_ids) if documents_root else {}
-
-    articles: List[ArticleSummary] = []
-    for article in index_values:
-        summary = _article_metadata_to_summary(article)
-        enrich = taxonomy.get(article.id)
-        if enrich:
-            summary.taxonomy_cluster_id = enrich.get("taxonomy_cluster_id")  # type: ignore[assignment]
-            summary.taxonomy_category_id = enrich.get("taxonomy_category_id")  # type: ignore[assignment]
-            summary.taxonomy_category = enrich.get("taxonomy_category")  # type: ignore[assignment]
-            summary.taxonomy_subcategory_id = enrich.get("taxonomy_subcategory_id")  # type: ignore[assignment]
-            summary.taxonomy_subcategory = enrich.get("taxonomy_subcategory")  # type: ignore[assignment]
-            summary.taxonomy_tag_assignments = enrich.get("taxonomy_tag_assignments") or []  # type: ignore[assignment]
-            summary.taxonomy_tags = enrich.get("taxonomy_tags") or []  # type: ignore[assignment]
-        articles.append(summary)
-
-    return articles
+    total = len(candidates)
+    if after_id is not None:
+        candidates = [a for a in candidates if a.id > after_id]
+
+    page = candidates[:limit] if limit is not None else candidates
+    if category is None:
+        taxonomy = enrichment_for(page)
+
+    items = []
+    for article in page:
+        payload = _article_summary_payload(article, taxonomy.get(article.id))
+        items.append({key: payload[key] for key in include} if include is not None else payload)
+
+    headers["X-Total-Count"] = str(total)
+    if limit is not None and len(candidates) > limit:
+        next_cursor = _encode_article_cursor(page[-1].id)
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+
+    entry = responses.put("articles", cache_key, encode_json(items), etag=etag, headers=headers)
+    return entry.to_response(request)
 
 
 @app.get(
@@ -627,7 +1047,8 @@ async def get_articles():
         500: {"description": "Server error reading article"},
     },
 )
-async def get_article(article_id: str):
+@offload("articles")
+def get_article(article_id: str):
     """
     Get detailed information for a specific article including full content.
 
@@ -647,13 +1068,8 @@ async def get_article(article_id: str):
     - 404: Article not found in index or file missing
     - 500: Permission denied or file read error
     """
-    selected_index_path = _select_readable_index_path()
-
-    # Load the metadata index
-    index = load_existing_index(selected_index_path)
-
     # Find the article
-    article = index.get(article_id)
+    article = _get_index_cache().get(article_id)
     if not article:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -734,7 +1150,9 @@ async def get_article(article_id: str):
         500: {"description": "Server error updating article"},
     },
 )
-async def update_article(article_id: str, update_request: UpdateArticleRequest):
+@offload("articles")
+@bumps_generation
+def update_article(article_id: str, update_request: UpdateArticleRequest):
     """
     Update an article's metadata and/or content.
 
@@ -769,13 +1187,10 @@ async def update_article(article_id: str, update_request: UpdateArticleRequest):
     }
     ```
     """
-    selected_index_path = _select_readable_index_path()
-
-    # Load the metadata index
-    index = load_existing_index(selected_index_path)
+    store = _get_index_cache()
 
     # Find the article
-    article = index.get(article_id)
+    article = store.get(article_id)
     if not article:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -844,15 +1259,22 @@ async def update_article(article_id: str, update_request: UpdateArticleRequest):
             detail=f"Failed to write article: {e}",
         )
 
-    # Update the index
-    index[article_id] = article
-    if index_path is None:
+    # Update just this article's row in the index
+    try:
+        store.update_fields(
+            article_id,
+            title=article.title,
+            topic=article.topic,
+            tags=article.tags,
+            read_status=article.read_status,
+            word_count=article.word_count,
+        )
+    except sqlite3.Error as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="API not properly initialized",
+            detail=f"Failed to update article index: {e}",
         )
-    _ensure_writable_index_path(index_path)
-    save_index(index, index_path)
+    _schedule_legacy_index_export(store.store)
 
     taxonomy = _load_taxonomy_enrichment(docs_root=documents_root, article_ids=[article.id]) if documents_root else {}
     enrich = taxonomy.get(article.id)
@@ -900,7 +1322,9 @@ async def update_article(article_id: str, update_request: UpdateArticleRequest):
         500: {"description": "Server error deleting article"},
     },
 )
-async def delete_article(article_id: str):
+@offload("articles")
+@bumps_generation
+def delete_article(article_id: str):
     """
     Permanently delete an article and all associated data.
 
@@ -925,13 +1349,10 @@ async def delete_article(article_id: str):
     - 404: Article not found in index
     - 500: File system or database error
     """
-    selected_index_path = _select_readable_index_path()
-
-    # Load the metadata index
-    index = load_existing_index(selected_index_path)
+    index_cache = _get_index_cache()
 
     # Find the article
-    article = index.get(article_id)
+    article = index_cache.get(article_id)
     if not article:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -951,62 +1372,78 @@ async def delete_article(article_id: str):
 
     # Remove from Chroma
     try:
-        git_tracker = GitTracker(documents_root, config)
+        git_tracker: Optional[GitTracker] = None
+        if (documents_root / ".git").exists():
+            try:
+                git_tracker = GitTracker(documents_root)
+            except (OSError, ValueError, RuntimeError) as exc:
+                logger.warning("Removing chunks without git tracking: %s", exc)
         store = EmbeddingStore(config, git_tracker)
-        store.remove_file_documents(article_path)
+        store.remove_file_documents(article_path, deleted=True)
     except Exception as e:
         # Log but don't fail if Chroma removal fails
         logger.warning("Failed to remove from Chroma: %s", e)
 
     # Remove from index
-    del index[article_id]
-    if index_path is None:
+    try:
+        index_cache.delete(article_id)
+    except sqlite3.Error as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="API not properly initialized",
+            detail=f"Failed to update article index: {e}",
         )
-    _ensure_writable_index_path(index_path)
-    save_index(index, index_path)
+    _schedule_legacy_index_export(index_cache.store)
 
     return None
 
 
 @app.post(
     "/visualization/rebuild",
-    response_model=RebuildResponse,
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     tags=["visualization"],
     summary="Rebuild Visualization Index",
-    description="Rebuild the entire visualization index with metadata and layout",
-    response_description="Rebuild status with article count",
+    description="Start a background rebuild of the visualization index with metadata and layout",
+    response_description="The rebuild job; poll GET /jobs/{id} for progress and result",
     responses={
-        200: {
-            "description": "Index rebuilt successfully",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "success",
-                        "article_count": 42,
-                        "message": "Successfully rebuilt visualization index with 42 articles",
-                    }
-                }
-            },
-        },
+        202: {"description": "Rebuild job queued (or an identical queued/running job returned)"},
         404: {"description": "Documents directory not found"},
-        500: {"description": "Server error during rebuild"},
+        500: {"description": "API not properly initialized"},
     },
 )
-async def rebuild_visualization():
+@offload("rebuild")
+def rebuild_visualization(
+    refit_layout: bool = Query(
+        False, description="Refit the layout projection on all articles instead of placing only new ones"
+    ),
+    layout_method: str = Query(
+        "auto",
+        pattern="^(" + "|".join(LAYOUT_METHODS) + ")$",
+        description=(
+            "Projection engine: auto (UMAP if installed, else PCA), umap, pca (fast preview) "
+            "or relaxed (PCA plus force relaxation)"
+        ),
+    ),
+):
     """
     Rebuild the entire visualization index with metadata and layout.
 
     Performs a complete rebuild of the visualization index, equivalent to
-    running the `visualize build-index` CLI command.
+    running the `visualize build-index` CLI command, as a background job.
+    Returns `202 Accepted` with the job at once; `GET /jobs/{id}` reports
+    the current phase and, once finished, the result (status, article
+    count, message). Submitting the same rebuild while one is queued or
+    running returns that job (`deduplicated: true`).
 
     **Rebuild Process:**
     1. Scans documents directory for all markdown files
     2. Extracts metadata from frontmatter
     3. Computes 2D layout coordinates:
        - Uses semantic embeddings when available
+       - Keeps existing positions and places only new or changed articles,
+         refitting the projection on drift or with `refit_layout=true`
+       - `layout_method=pca` gives a sub-second preview; without UMAP
+         installed PCA is the default projection
        - Falls back to deterministic grid layout
     4. Computes nearest neighbors for each article
     5. Saves updated index to disk
@@ -1021,11 +1458,6 @@ async def rebuild_visualization():
     - Processing time scales with document count
     - Embedding generation (if needed) is the slowest step
     - Typically takes 1-5 seconds for 100 documents
-
-    **Returns:**
-    - Status (success/error)
-    - Number of articles processed
-    - Human-readable status message
     """
     if documents_root is None or index_path is None:
         raise HTTPException(
@@ -1039,27 +1471,47 @@ async def rebuild_visualization():
             detail=f"Documents root not found: {documents_root}",
         )
 
-    try:
-        _ensure_writable_index_path(index_path)
-        # Rebuild the metadata index.
-        index = build_metadata_index(documents_root, index_path)
+    docs_root, index_file = documents_root, index_path
 
-        # Always compute a layout (embeddings if available; deterministic fallback otherwise)
-        _apply_layout_to_index(index, documents_root)
+    def run(ctx: JobContext) -> dict:
+        try:
+            _ensure_writable_index_path(index_file)
+            ctx.progress("metadata")
+            # Rebuild the metadata index.
+            index = build_metadata_index(docs_root, index_file)
+            ctx.check_cancelled()
+
+            # Always compute a layout (embeddings if available; deterministic fallback otherwise)
+            ctx.progress("layout", articles=len(index))
+            _apply_layout_to_index(
+                index,
+                docs_root,
+                index_file=index_file,
+                refit_layout=refit_layout,
+                layout_method=layout_method,
+            )
+            ctx.check_cancelled()
 
-        save_index(index, index_path)
+            ctx.progress("save", articles=len(index))
+            save_index(index, index_file)
+        except (HTTPException, JobCancelledError):
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to rebuild visualization: {e}") from e
 
         return RebuildResponse(
             status="success",
             article_count=len(index),
             message=f"Successfully rebuilt visualization index with {len(index)} articles",
-        )
+        ).model_dump()
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to rebuild visualization: {e}",
-        )
+    params = {
+        "documents_root": str(docs_root),
+        "index_path": str(index_file),
+        "refit_layout": refit_layout,
+        "layout_method": layout_method,
+    }
+    return job_accepted_response(*get_job_manager().submit("visualization.rebuild", params, run))
 
 
 # Entry point for running with uvicorn
@@ -1,8 +1,8 @@
 """Shared dependencies for API routers.
 
-Provides lazy-initialized singletons for config, embedding store, and document
-processor so that each router can import what it needs without circular imports
-or duplicated initialization logic.
+Provides lazy-initialized singletons for config, git tracker, embedding store,
+and document processor so that each router can import what it needs without
+circular imports or duplicated initialization logic.
 """
 
 from __future__ import annotations
@@ -20,6 +20,8 @@ logger = logging.getLogger("prismweave.api.deps")
 
 # Lazy singletons — populated on first access via ``get_*`` helpers.
 _config: Optional[Config] = None
+_git_tracker: Optional[GitTracker] = None
+_git_tracker_checked = False
 _store: Optional[EmbeddingStore] = None
 _processor: Optional[DocumentProcessor] = None
 
@@ -32,19 +34,29 @@ def get_config() -> Config:
     return _config
 
 
-def get_embedding_store() -> EmbeddingStore:
-    """Return a shared EmbeddingStore singleton."""
-    global _store
-    if _store is None:
-        cfg = get_config()
-        docs_root = Path(cfg.mcp.paths.documents_root).expanduser().resolve()
-        git_tracker: Optional[GitTracker] = None
+def get_git_tracker() -> Optional[GitTracker]:
+    """Return the shared GitTracker, or None when the documents root is not a git repository.
+
+    The embedding store, document processor and document watcher all use this
+    one tracker, so its ``batch()`` buffers the store's writes.
+    """
+    global _git_tracker, _git_tracker_checked
+    if not _git_tracker_checked:
+        _git_tracker_checked = True
+        docs_root = Path(get_config().mcp.paths.documents_root).expanduser().resolve()
         if (docs_root / ".git").exists():
             try:
-                git_tracker = GitTracker(docs_root, cfg)
+                _git_tracker = GitTracker(docs_root)
             except Exception:
                 logger.warning("Failed to initialize GitTracker; proceeding without git tracking")
-        _store = EmbeddingStore(cfg, git_tracker)
+    return _git_tracker
+
+
+def get_embedding_store() -> EmbeddingStore:
+    """Return a shared EmbeddingStore singleton."""
+    global _store
+    if _store is None:
+        _store = EmbeddingStore(get_config(), get_git_tracker())
     return _store
 
 
@@ -52,15 +64,7 @@ def get_document_processor() -> DocumentProcessor:
     """Return a shared DocumentProcessor singleton."""
     global _processor
     if _processor is None:
-        cfg = get_config()
-        docs_root = Path(cfg.mcp.paths.documents_root).expanduser().resolve()
-        git_tracker: Optional[GitTracker] = None
-        if (docs_root / ".git").exists():
-            try:
-                git_tracker = GitTracker(docs_root, cfg)
-            except Exception:
-                logger.warning("Failed to initialize GitTracker; proceeding without git tracking")
-        _processor = DocumentProcessor(cfg, git_tracker)
+        _processor = DocumentProcessor(get_config(), get_git_tracker())
     return _processor
 
 
@@ -0,0 +1,226 @@
+"""Background jobs for long-running endpoints.
+
+``/rebuild/*``, ``/processing/directory`` and ``/visualization/rebuild``
+validate their input in the request, then ``submit`` the actual work as a
+job and answer ``202 Accepted`` with the job's status. Jobs run one at a
+time on a dedicated worker thread (``PRISMWEAVE_JOB_WORKERS`` to change),
+report phases, progress and events (``ctx.emit``) through a ``JobContext``
+and persist everything in ``JobStore``. Submitting work identical to an already queued or running
+job returns that job instead of starting another. Cancellation is
+cooperative: job functions call ``ctx.check_cancelled()`` between steps.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+
+from src.api.response_cache import bumps_generation
+from src.core.job_store import (
+    CANCELLED,
+    FAILED,
+    SUCCEEDED,
+    JobRecord,
+    JobStore,
+    JobStoreConfig,
+    default_job_sqlite_path,
+)
+from src.core.metadata_index import INDEX_RELATIVE_PATH
+
+logger = logging.getLogger("prismweave.api.jobs")
+
+# Minimum seconds between persisted progress updates (and event batches)
+# within one phase.
+PROGRESS_INTERVAL_SECONDS = 0.5
+
+
+class JobCancelledError(Exception):
+    """Raised inside a job function once cancellation was requested."""
+
+
+class JobContext:
+    """Handle a running job function uses to report progress and observe cancellation."""
+
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+        self.phase: Optional[str] = None
+        self.progress_details: Dict[str, Any] = {}
+        self._pending_events: List[Tuple[str, Dict[str, Any], float]] = []
+        self._last_write = 0.0
+
+    def progress(self, phase: str, **details: Any) -> None:
+        """Record the current phase and details (throttled within a phase)."""
+
+        changed_phase = phase != self.phase
+        self.phase = phase
+        self.progress_details = details
+        self._maybe_flush(force=changed_phase)
+
+    def emit(self, event: str, **data: Any) -> None:
+        """Append an event to the job's stream; written with the next progress update."""
+
+        self._pending_events.append((event, data, time.time()))
+        self._maybe_flush()
+
+    def _maybe_flush(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if force or now - self._last_write >= PROGRESS_INTERVAL_SECONDS:
+            self.flush()
+            self._last_write = now
+
+    def flush(self) -> None:
+        events, self._pending_events = self._pending_events, []
+        self.store.update_progress(self.job_id, self.phase, self.progress_details, events)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.store.is_cancel_requested(self.job_id)
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise JobCancelledError()
+
+
+JobFunction = Callable[[JobContext], Dict[str, Any]]
+
+
+def dedupe_key(kind: str, params: Dict[str, Any]) -> str:
+    """Key under which identical submissions are merged."""
+
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return f"{kind}:{hashlib.sha1(payload.encode('utf-8')).hexdigest()}"
+
+
+class JobManager:
+    def __init__(self, store: JobStore, *, workers: int = 1):
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="prismweave-job")
+        interrupted = store.fail_interrupted()
+        if interrupted:
+            logger.warning("Marked %d jobs interrupted by a restart as failed", interrupted)
+
+    def submit(self, kind: str, params: Dict[str, Any], func: JobFunction) -> Tuple[JobRecord, bool]:
+        """Queue ``func`` as a job; returns ``(job, created)``.
+
+        ``created`` is False when an identical job (same kind and params)
+        was already queued or running and is returned instead.
+        """
+
+        job, created = self.store.submit(kind, dedupe_key(kind, params))
+        if created:
+            self._executor.submit(self._run, job.id, func)
+        return job, created
+
+    def _run(self, job_id: str, func: JobFunction) -> None:
+        if not self.store.start(job_id):
+            return  # cancelled before it started
+        ctx = JobContext(self.store, job_id)
+        try:
+            # Jobs write the collection and indexes: invalidate cached
+            # responses before the job reports that it finished.
+            result = bumps_generation(func)(ctx)
+        except JobCancelledError:
+            ctx.flush()
+            self.store.finish(job_id, CANCELLED)
+        except HTTPException as exc:
+            ctx.flush()
+            self.store.finish(job_id, FAILED, error=str(exc.detail))
+        except Exception as exc:
+            logger.exception("Job %s failed", job_id)
+            ctx.flush()
+            self.store.finish(job_id, FAILED, error=str(exc))
+        else:
+            ctx.flush()
+            self.store.finish(job_id, SUCCEEDED, result=result)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[JobRecord]:
+        return self.store.request_cancel(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None, poll: float = 0.05) -> Optional[JobRecord]:
+        """Block until the job finishes (or ``timeout``); returns its latest state."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.store.get(job_id)
+            if job is None or job.done or (deadline is not None and time.monotonic() >= deadline):
+                return job
+            time.sleep(poll)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_manager: Optional[JobManager] = None
+_manager_path: Optional[Path] = None
+_manager_lock = threading.Lock()
+
+
+def configure_job_manager(sqlite_path: Optional[Path]) -> None:
+    """Choose where job status is stored (called at startup, next to the index)."""
+
+    global _manager_path
+    shutdown_job_manager()
+    _manager_path = sqlite_path
+
+
+def get_job_manager() -> JobManager:
+    """Return the shared JobManager, creating it on first use."""
+
+    global _manager
+    if _manager is not None:
+        return _manager
+    with _manager_lock:
+        if _manager is None:
+            path = _manager_path
+            if path is None:
+                from src.api.deps import get_config
+
+                docs_root = Path(get_config().mcp.paths.documents_root).expanduser().resolve()
+                path = default_job_sqlite_path(docs_root / INDEX_RELATIVE_PATH)
+            workers = int(os.environ.get("PRISMWEAVE_JOB_WORKERS", "1") or 1)
+            _manager = JobManager(JobStore(JobStoreConfig(sqlite_path=path)), workers=workers)
+        return _manager
+
+
+def shutdown_job_manager() -> None:
+    global _manager
+    with _manager_lock:
+        manager, _manager = _manager, None
+    if manager is not None:
+        manager.shutdown()
+
+
+def job_accepted_response(job: JobRecord, created: bool) -> JSONResponse:
+    """202 response describing a submitted (or merged) job."""
+
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={**job.to_dict(), "deduplicated": not created},
+        headers={"Location": f"/jobs/{job.id}"},
+    )
+
+
+__all__ = [
+    "JobCancelledError",
+    "JobContext",
+    "JobManager",
+    "configure_job_manager",
+    "dedupe_key",
+    "get_job_manager",
+    "job_accepted_response",
+    "shutdown_job_manager",
+]
@@ -130,3 +130,40 @@ class RebuildResponse(BaseModel):
                 "message": "Successfully rebuilt visualization index with 42 articles",
             }
         }
+
+
+class JobStatusResponse(BaseModel):
+    """Status of a background job (long-running rebuilds and processing)"""
+
+    id: str = Field(..., description="Job ID; poll GET /jobs/{id} for progress")
+    kind: str = Field(..., description="Operation the job runs, e.g. 'visualization.rebuild'")
+    status: str = Field(..., description="queued, running, succeeded, failed or cancelled")
+    phase: Optional[str] = Field(None, description="Current step of the job")
+    progress: dict = Field(default_factory=dict, description="Step details such as files done / total")
+    result: Optional[dict] = Field(None, description="The operation's response once it succeeded")
+    error: Optional[str] = Field(None, description="Failure reason for failed jobs")
+    cancel_requested: bool = Field(False, description="Whether cancellation was requested")
+    created_at: float = Field(..., description="Submission time (Unix seconds)")
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    deduplicated: Optional[bool] = Field(
+        None, description="On submission: true when an identical queued or running job was returned instead"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "5f0c9b1e2d7a4c55a0c3f0e4b1d2a9e8",
+                "kind": "visualization.rebuild",
+                "status": "running",
+                "phase": "layout",
+                "progress": {"articles": 42},
+                "result": None,
+                "error": None,
+                "cancel_requested": False,
+                "created_at": 1760000000.0,
+                "started_at": 1760000000.1,
+                "finished_at": None,
+                "deduplicated": False,
+            }
+        }
@@ -0,0 +1,307 @@
+"""Shared cache of serialized responses for read-heavy endpoints.
+
+``/documents``, ``/documents/count``, ``/documents/stats`` and ``/articles``
+(with its taxonomy enrichment) only change when something is written, yet
+were recomputed on every call. Their handlers now go through ``cached_json``
+(or ``get``/``put`` directly), which keeps the encoded JSON body keyed by
+endpoint, request parameters and a *data generation*:
+
+- ``data_generation()`` is a process-wide counter that every write path
+  bumps, via ``bump_data_generation()`` or the ``bumps_generation``
+  decorator (article edits, processing, taxonomy runs, finished jobs,
+  watcher batches);
+- endpoints add generations of their own where other processes may write
+  (the embedding store's persistent generation, the article index version).
+  ``/articles`` keys on persisted state only, so its ETags survive restarts.
+
+Each entry carries a weak ETag, so ``If-None-Match`` answers ``304`` before
+any work happens, and optionally a gzip body compressed once and reused for
+every client that accepts it. The cache is an LRU bounded in bytes
+(``PRISMWEAVE_RESPONSE_CACHE_MB``, 0 disables it);
+``PRISMWEAVE_RESPONSE_CACHE_GZIP=0`` turns precompression off. Hit, miss and
+``304`` counts per endpoint are reported by ``metrics()`` (``GET /metrics``).
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+
+T = TypeVar("T")
+
+DEFAULT_MAX_MB = 64.0
+# Bodies smaller than this are not worth compressing.
+MIN_COMPRESS_BYTES = 1024
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def data_generation() -> int:
+    return _generation
+
+
+def bump_data_generation() -> int:
+    """Mark cached responses as stale; call after any write to served data."""
+
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        return _generation
+
+
+def bumps_generation(func: Callable[..., T]) -> Callable[..., T]:
+    """Decorator for blocking write handlers: bump the generation once they return or fail."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            bump_data_generation()
+
+    return wrapper
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode like ``JSONResponse`` does."""
+
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def make_etag(endpoint: str, key: Hashable) -> str:
+    digest = hashlib.sha1(repr((endpoint, key)).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def accepts_gzip(request: Request) -> bool:
+    encodings = request.headers.get("accept-encoding", "")
+    for part in encodings.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    media_type: str = "application/json"
+    gzip_body: Optional[bytes] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzip_body or b"")
+
+    def to_response(self, request: Request) -> Response:
+        headers = {**self.headers, "ETag": self.etag, "Vary": "Accept-Encoding"}
+        headers.setdefault("Cache-Control", "no-cache")
+        if self.gzip_body is not None and accepts_gzip(request):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self.gzip_body, media_type=self.media_type, headers=headers)
+        return Response(content=self.body, media_type=self.media_type, headers=headers)
+
+
+@dataclass
+class _Counters:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        served = self.hits + self.not_modified
+        total = served + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": round(served / total, 4) if total else None,
+        }
+
+
+class ResponseCache:
+    """LRU of ``CachedResponse`` keyed by ``(endpoint, key)``, bounded in bytes."""
+
+    def __init__(self, max_bytes: int, *, precompress: bool = True, min_compress_bytes: int = MIN_COMPRESS_BYTES):
+        self.max_bytes = max_bytes
+        self.precompress = precompress
+        self.min_compress_bytes = min_compress_bytes
+        self._entries: OrderedDict[Tuple[str, Hashable], CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._counters: Dict[str, _Counters] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _count(self, endpoint: str) -> _Counters:
+        counters = self._counters.get(endpoint)
+        if counters is None:
+            counters = self._counters[endpoint] = _Counters()
+        return counters
+
+    def record_not_modified(self, endpoint: str) -> None:
+        with self._lock:
+            self._count(endpoint).not_modified += 1
+
+    def get(self, endpoint: str, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is None:
+                self._count(endpoint).misses += 1
+                return None
+            self._entries.move_to_end((endpoint, key))
+            self._count(endpoint).hits += 1
+            return entry
+
+    def put(
+        self,
+        endpoint: str,
+        key: Hashable,
+        body: bytes,
+        *,
+        etag: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: str = "application/json",
+    ) -> CachedResponse:
+        """Store a body (compressing it if enabled) and return the entry."""
+
+        entry = CachedResponse(
+            body=body,
+            etag=etag or make_etag(endpoint, key),
+            headers=dict(headers or {}),
+            media_type=media_type,
+        )
+        if self.precompress and len(body) >= self.min_compress_bytes:
+            entry.gzip_body = gzip.compress(body, compresslevel=6, mtime=0)
+        if not self.enabled or entry.size > self.max_bytes:
+            return entry
+        with self._lock:
+            previous = self._entries.pop((endpoint, key), None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[(endpoint, key)] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evictions += 1
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._counters.clear()
+            self._evictions = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {name: counters.as_dict() for name, counters in sorted(self._counters.items())}
+            overall = _Counters(
+                hits=sum(c.hits for c in self._counters.values()),
+                misses=sum(c.misses for c in self._counters.values()),
+                not_modified=sum(c.not_modified for c in self._counters.values()),
+            )
+            return {
+                "enabled": self.enabled,
+                "precompress": self.precompress,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "data_generation": data_generation(),
+                **overall.as_dict(),
+                "endpoints": endpoints,
+            }
+
+
+def _cache_from_env() -> ResponseCache:
+    try:
+        max_mb = float(os.environ.get("PRISMWEAVE_RESPONSE_CACHE_MB", DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = DEFAULT_MAX_MB
+    precompress = os.environ.get("PRISMWEAVE_RESPONSE_CACHE_GZIP", "1").strip().lower() not in {"0", "false", "no", "off"}
+    return ResponseCache(int(max(0.0, max_mb) * 1024 * 1024), precompress=precompress)
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the shared ResponseCache, creating it on first use."""
+
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = _cache_from_env()
+    return _cache
+
+
+def cached_json(
+    request: Request,
+    endpoint: str,
+    params: Hashable,
+    build: Callable[[], Any],
+    *,
+    generation: Hashable = None,
+) -> Response:
+    """Serve ``build()`` as JSON through the shared cache.
+
+    The entry is keyed by ``params`` and the data generation (plus the
+    endpoint's own ``generation`` if given). A matching ``If-None-Match``
+    returns ``304`` without calling ``build``.
+    """
+
+    cache = get_response_cache()
+    key = (params, data_generation(), generation)
+    etag = make_etag(endpoint, key)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        cache.record_not_modified(endpoint)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    entry = cache.get(endpoint, key)
+    if entry is None:
+        entry = cache.put(endpoint, key, encode_json(build()), etag=etag)
+    return entry.to_response(request)
+
+
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+    "accepts_gzip",
+    "bump_data_generation",
+    "bumps_generation",
+    "cached_json",
+    "data_generation",
+    "encode_json",
+    "etag_matches",
+    "get_response_cache",
+    "make_etag",
+]
@@ -1,19 +1,31 @@
-"""Documents router — collection listing, count, stats, and export."""
+"""Documents router — collection listing, count, stats, and streaming export.
+
+Listing, count and stats responses go through the shared response cache,
+keyed by their parameters and the collection's data generation, so repeated
+reads of an unchanged collection are served without touching Chroma.
+"""
 
 from __future__ import annotations
 
-import csv
-import io
 import logging
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.api.deps import get_config, get_embedding_store
+from src.api.response_cache import cached_json
+from src.api.workers import offload
+from src.core.document_export import (
+    EXPORT_FORMATS,
+    ExportOptions,
+    check_format,
+    export_filename,
+    media_type,
+    open_export,
+)
 
 logger = logging.getLogger("prismweave.api.documents")
 
@@ -82,53 +94,120 @@ class DocumentStatsResponse(BaseModel):
 class ExportRequest(BaseModel):
     """Export configuration."""
 
-    format: str = Field("json", pattern="^(json|csv)$", description="Export format: json or csv")
+    format: str = Field(
+        "json",
+        pattern="^(" + "|".join(EXPORT_FORMATS) + ")$",
+        description="Export format: json, csv, ndjson or parquet (parquet needs pyarrow)",
+    )
     filter_type: Optional[str] = Field(None, description="Filter by file extension")
-    include_content: bool = Field(False, description="Include full content in JSON export")
+    include_content: bool = Field(False, description="Include full chunk content instead of a preview")
+    include_embeddings: bool = Field(False, description="Include each chunk's embedding vector")
     max_docs: Optional[int] = Field(None, ge=1, description="Maximum documents to export")
 
 
+# ---------------------------------------------------------------------------
+# Response builders
+# ---------------------------------------------------------------------------
+
+
+def _build_document_list(store, max_results: int) -> DocumentListResponse:
+    documents = store.list_documents(max_results)
+    source_files = store.get_unique_source_files()
+
+    chunks = []
+    for doc in documents:
+        meta = doc["metadata"]
+        source_file = meta.get("source_file", "Unknown")
+        chunks.append(
+            DocumentChunk(
+                id=doc["id"],
+                source_file=source_file,
+                file_name=Path(source_file).name if source_file != "Unknown" else "Unknown",
+                chunk_index=meta.get("chunk_index"),
+                total_chunks=meta.get("total_chunks"),
+                tags=meta.get("tags"),
+                content_length=doc["content_length"],
+                content_preview=doc["content_preview"],
+            )
+        )
+
+    return DocumentListResponse(
+        total_chunks=store.get_document_count(),
+        total_source_files=len(source_files),
+        chunks=chunks,
+    )
+
+
+def _build_document_count(store) -> DocumentCountResponse:
+    stats = store.get_collection_stats()
+    return DocumentCountResponse(
+        total_chunks=stats.total_chunks,
+        unique_source_files=stats.source_files,
+        average_chunks_per_file=stats.average_chunks_per_file,
+    )
+
+
+def _build_document_stats(store, cfg) -> DocumentStatsResponse:
+    stats = store.get_collection_stats()
+    total_chunks = stats.total_chunks
+    total_content = stats.total_content_length
+
+    file_type_dist = sorted(
+        [
+            FileTypeDistribution(
+                extension=ext,
+                count=cnt,
+                percentage=round(cnt / total_chunks * 100, 1) if total_chunks else 0,
+            )
+            for ext, cnt in stats.file_types.items()
+        ],
+        key=lambda x: x.count,
+        reverse=True,
+    )
+
+    top_tags = [TagFrequency(tag=t, frequency=f) for t, f in stats.top_tags(10)]
+
+    return DocumentStatsResponse(
+        total_chunks=total_chunks,
+        unique_source_files=stats.source_files,
+        average_chunks_per_file=stats.average_chunks_per_file,
+        total_content_length=total_content if total_content else None,
+        average_chunk_size=round(total_content / total_chunks) if total_chunks else None,
+        collection_name=cfg.collection_name,
+        storage_path=str(cfg.chroma_db_path),
+        file_type_distribution=file_type_dist,
+        top_tags=top_tags,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 
+_NOT_MODIFIED = {304: {"description": "Collection unchanged since the ETag sent in If-None-Match"}}
+
 
 @router.get(
     "",
     response_model=DocumentListResponse,
     summary="List Documents",
     description="List document chunks stored in ChromaDB",
+    responses=_NOT_MODIFIED,
 )
-async def list_documents(
+@offload("documents")
+def list_documents(
+    request: Request,
     max_results: int = Query(50, ge=1, le=1000, description="Maximum chunks to return"),
-) -> DocumentListResponse:
+) -> Response:
     """List document chunks with metadata."""
     try:
         store = get_embedding_store()
-        documents = store.list_documents(max_results)
-        source_files = store.get_unique_source_files()
-
-        chunks = []
-        for doc in documents:
-            meta = doc["metadata"]
-            source_file = meta.get("source_file", "Unknown")
-            chunks.append(
-                DocumentChunk(
-                    id=doc["id"],
-                    source_file=source_file,
-                    file_name=Path(source_file).name if source_file != "Unknown" else "Unknown",
-                    chunk_index=meta.get("chunk_index"),
-                    total_chunks=meta.get("total_chunks"),
-                    tags=meta.get("tags"),
-                    content_length=doc["content_length"],
-                    content_preview=doc["content_preview"],
-                )
-            )
-
-        return DocumentListResponse(
-            total_chunks=store.get_document_count(),
-            total_source_files=len(source_files),
-            chunks=chunks,
+        return cached_json(
+            request,
+            "documents",
+            max_results,
+            lambda: _build_document_list(store, max_results),
+            generation=store.data_generation(),
         )
     except Exception as exc:
         logger.error("Failed to list documents: %s", exc)
@@ -140,19 +219,15 @@ async def list_documents(
     response_model=DocumentCountResponse,
     summary="Document Count",
     description="Get total document chunk and source file counts",
+    responses=_NOT_MODIFIED,
 )
-async def document_count() -> DocumentCountResponse:
+@offload("documents")
+def document_count(request: Request) -> Response:
     """Return total chunks and unique source file counts."""
     try:
         store = get_embedding_store()
-        total_chunks = store.get_document_count()
-        source_files = store.get_unique_source_files()
-        unique = len(source_files)
-        avg = total_chunks / unique if unique else None
-        return DocumentCountResponse(
-            total_chunks=total_chunks,
-            unique_source_files=unique,
-            average_chunks_per_file=avg,
+        return cached_json(
+            request, "documents.count", None, lambda: _build_document_count(store), generation=store.data_generation()
         )
     except Exception as exc:
         logger.error("Failed to get document count: %s", exc)
@@ -164,67 +239,24 @@ async def document_count() -> DocumentCountResponse:
     response_model=DocumentStatsResponse,
     summary="Collection Statistics",
     description="Get detailed collection statistics and analytics",
+    responses=_NOT_MODIFIED,
 )
-async def document_stats() -> DocumentStatsResponse:
-    """Return detailed collection statistics including file type distribution and top tags."""
+@offload("documents")
+def document_stats(request: Request) -> Response:
+    """Return detailed collection statistics including file type distribution and top tags.
+
+    Served from the aggregate statistics the embedding store maintains on
+    every add and remove; needs neither a collection scan nor Ollama.
+    """
     try:
         store = get_embedding_store()
         cfg = get_config()
-        total_chunks = store.get_document_count()
-        source_files = store.get_unique_source_files()
-        unique = len(source_files)
-        avg_chunks = total_chunks / unique if unique else None
-
-        verification = store.verify_embeddings()
-
-        # Compute detailed stats
-        documents = store.list_documents(None)
-        total_content = 0
-        file_types: Dict[str, int] = {}
-        tag_frequency: Dict[str, int] = {}
-
-        for doc in documents:
-            meta = doc["metadata"]
-            total_content += doc["content_length"]
-
-            source_file = meta.get("source_file", "")
-            if source_file:
-                ext = Path(source_file).suffix or "no extension"
-                file_types[ext] = file_types.get(ext, 0) + 1
-
-            tags_str = meta.get("tags", "")
-            for tag in (t.strip() for t in tags_str.split(",") if t.strip()):
-                tag_frequency[tag] = tag_frequency.get(tag, 0) + 1
-
-        file_type_dist = sorted(
-            [
-                FileTypeDistribution(
-                    extension=ext,
-                    count=cnt,
-                    percentage=round(cnt / total_chunks * 100, 1) if total_chunks else 0,
-                )
-                for ext, cnt in file_types.items()
-            ],
-            key=lambda x: x.count,
-            reverse=True,
-        )
-
-        top_tags = sorted(
-            [TagFrequency(tag=t, frequency=f) for t, f in tag_frequency.items()],
-            key=lambda x: x.frequency,
-            reverse=True,
-        )[:10]
-
-        return DocumentStatsResponse(
-            total_chunks=total_chunks,
-            unique_source_files=unique,
-            average_chunks_per_file=avg_chunks,
-            total_content_length=total_content if total_content else None,
-            average_chunk_size=round(total_content / total_chunks) if total_chunks else None,
-            collection_name=verification.get("collection_name", cfg.collection_name),
-            storage_path=verification.get("persist_directory", cfg.chroma_db_path),
-            file_type_distribution=file_type_dist,
-            top_tags=top_tags,
+        return cached_json(
+            request,
+            "documents.stats",
+            (cfg.collection_name, str(cfg.chroma_db_path)),
+            lambda: _build_document_stats(store, cfg),
+            generation=store.data_generation(),
         )
     except Exception as exc:
         logger.error("Failed to get stats: %s", exc)
@@ -234,94 +266,51 @@ async def document_stats() -> DocumentStatsResponse:
 @router.post(
     "/export",
     summary="Export Documents",
-    description="Export document metadata and content as JSON or CSV download",
+    description=(
+        "Stream document metadata (and optionally full content and embeddings) as a JSON, CSV, "
+        "NDJSON or Parquet download. Rows are read from the collection page by page and written as "
+        "they go, so exports of any size run in constant memory."
+    ),
     responses={
         200: {
             "description": "File download",
-            "content": {
-                "application/json": {},
-                "text/csv": {},
-            },
+            "content": {media_type(fmt): {} for fmt in EXPORT_FORMATS},
         },
+        404: {"description": "No documents match"},
+        501: {"description": "Parquet requested but pyarrow is not installed"},
     },
 )
-async def export_documents(request: ExportRequest) -> StreamingResponse:
-    """Export documents as a downloadable JSON or CSV file."""
+@offload("documents")
+def export_documents(request: ExportRequest) -> StreamingResponse:
+    """Export documents as a downloadable JSON, CSV, NDJSON or Parquet file."""
+    try:
+        check_format(request.format)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc))
     try:
         store = get_embedding_store()
         cfg = get_config()
-        documents = store.list_documents(request.max_docs)
-
-        if not documents:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No documents to export")
-
-        # Apply file-type filter
-        if request.filter_type:
-            suffix = f".{request.filter_type.lstrip('.')}"
-            documents = [d for d in documents if Path(d["metadata"].get("source_file", "")).suffix == suffix]
-            if not documents:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"No documents with file type '{request.filter_type}'",
-                )
-
-        if request.format == "json":
-            import json
-
-            export_data: Dict[str, Any] = {
-                "export_date": datetime.now().isoformat(),
-                "total_documents": len(documents),
-                "collection_name": cfg.collection_name,
-                "documents": [],
-            }
-            for doc in documents:
-                meta = doc["metadata"]
-                payload: Dict[str, Any] = {
-                    "id": doc["id"],
-                    "source_file": meta.get("source_file", "Unknown"),
-                    "chunk_index": meta.get("chunk_index"),
-                    "total_chunks": meta.get("total_chunks"),
-                    "tags": meta.get("tags", ""),
-                    "content_length": doc["content_length"],
-                    "content_preview": doc["content_preview"],
-                }
-                export_data["documents"].append(payload)
-
-            content = json.dumps(export_data, indent=2, ensure_ascii=False)
-            return StreamingResponse(
-                iter([content]),
-                media_type="application/json",
-                headers={"Content-Disposition": "attachment; filename=prismweave-export.json"},
-            )
-
-        # CSV
-        output = io.StringIO()
-        fieldnames = ["id", "source_file", "chunk_index", "total_chunks", "tags", "content_length", "content_preview"]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        for doc in documents:
-            meta = doc["metadata"]
-            writer.writerow(
-                {
-                    "id": doc["id"],
-                    "source_file": meta.get("source_file", ""),
-                    "chunk_index": meta.get("chunk_index", ""),
-                    "total_chunks": meta.get("total_chunks", ""),
-                    "tags": meta.get("tags", ""),
-                    "content_length": doc["content_length"],
-                    "content_preview": doc["content_preview"],
-                }
-            )
-
-        output.seek(0)
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=prismweave-export.csv"},
+        options = ExportOptions(
+            format=request.format,
+            filter_type=request.filter_type,
+            include_content=request.include_content,
+            include_embeddings=request.include_embeddings,
+            max_docs=request.max_docs,
+            collection_name=cfg.collection_name,
         )
-
-    except HTTPException:
-        raise
+        # Reads up to the first matching row, so an empty export is still a 404.
+        chunks = open_export(store.iter_documents(include_embeddings=request.include_embeddings), options)
     except Exception as exc:
         logger.error("Export failed: %s", exc)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc))
+
+    if chunks is None:
+        detail = (
+            f"No documents with file type '{request.filter_type}'" if request.filter_type else "No documents to export"
+        )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    return StreamingResponse(
+        chunks,
+        media_type=media_type(request.format),
+        headers={"Content-Disposition": f"attachment; filename={export_filename(request.format)}"},
+    )
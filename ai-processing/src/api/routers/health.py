@@ -1,16 +1,18 @@
-"""Health router — service health, Ollama status, and environment info."""
+"""Health router — service health, Ollama status, environment info and metrics."""
 
 from __future__ import annotations
 
 import logging
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from src.api.deps import check_ollama_available, get_config
+from src.api.response_cache import get_response_cache
+from src.api.workers import offload
 
 logger = logging.getLogger("prismweave.api.health")
 
@@ -41,6 +43,16 @@ class ServiceHealth(BaseModel):
     environment: Dict[str, Optional[str]] = Field(default_factory=dict, description="Relevant environment variables")
 
 
+class ServiceMetrics(BaseModel):
+    response_cache: Dict[str, Any] = Field(
+        ...,
+        description=(
+            "Shared response cache: size, evictions, data generation, and hits / misses / "
+            "304s with hit ratio, overall and per endpoint"
+        ),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -52,7 +64,8 @@ class ServiceHealth(BaseModel):
     summary="Detailed Health Check",
     description="Comprehensive health check including Ollama, ChromaDB, and documents root status",
 )
-async def detailed_health() -> ServiceHealth:
+@offload("health")
+def detailed_health() -> ServiceHealth:
     """Return comprehensive health information."""
     cfg = get_config()
 
@@ -97,7 +110,8 @@ async def detailed_health() -> ServiceHealth:
     summary="Ollama Health Check",
     description="Check Ollama connectivity and list available models",
 )
-async def ollama_health() -> OllamaStatus:
+@offload("health")
+def ollama_health() -> OllamaStatus:
     """Dedicated Ollama health check endpoint."""
     info = check_ollama_available()
     return OllamaStatus(
@@ -106,3 +120,14 @@ async def ollama_health() -> OllamaStatus:
         models=info.get("models", []),
         error=info.get("error"),
     )
+
+
+@router.get(
+    "/metrics",
+    response_model=ServiceMetrics,
+    summary="Service Metrics",
+    description="Response cache hit ratios and size",
+)
+async def metrics() -> ServiceMetrics:
+    """Return in-process counters (reset on restart)."""
+    return ServiceMetrics(response_cache=get_response_cache().metrics())
@@ -0,0 +1,151 @@
+"""Jobs router — status, progress stream and cancellation of background jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from src.api.jobs import get_job_manager
+from src.api.models import JobStatusResponse
+from src.api.workers import offload, run_blocking
+
+logger = logging.getLogger("prismweave.api.jobs")
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# How often the event stream checks for new events, and the idle interval
+# after which an SSE comment is sent to keep proxies from closing it.
+EVENT_POLL_SECONDS = 0.25
+EVENT_KEEPALIVE_SECONDS = 15.0
+EVENT_BATCH = 500
+
+
+def _job_or_404(job_id: str, job) -> dict:
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job not found: {job_id}")
+    return job.to_dict()
+
+
+@router.get(
+    "",
+    response_model=List[JobStatusResponse],
+    summary="List Jobs",
+    description="Most recent background jobs first",
+)
+@offload("jobs")
+def list_jobs(
+    kind: Optional[str] = Query(None, description="Only jobs of this kind, e.g. 'rebuild.embeddings'"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of jobs to return"),
+) -> List[dict]:
+    """List recent jobs and their status."""
+    return [job.to_dict() for job in get_job_manager().store.list(limit=limit, kind=kind)]
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobStatusResponse,
+    summary="Get Job Status",
+    description="Status, current phase, progress and (once finished) result or error of a job",
+    responses={404: {"description": "Job not found"}},
+)
+@offload("jobs")
+def get_job(job_id: str) -> dict:
+    """Poll a job started by a rebuild or processing endpoint."""
+    return _job_or_404(job_id, get_job_manager().get(job_id))
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=JobStatusResponse,
+    summary="Cancel Job",
+    description=(
+        "Request cancellation. A queued job is cancelled at once; a running job stops "
+        "at its next checkpoint (between files or phases). Finished jobs are returned unchanged."
+    ),
+    responses={404: {"description": "Job not found"}},
+)
+@offload("jobs")
+def cancel_job(job_id: str) -> dict:
+    """Cancel a queued or running job."""
+    return _job_or_404(job_id, get_job_manager().cancel(job_id))
+
+
+def _format_sse(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, default=str)}", "", ""]
+    return "\n".join(lines)
+
+
+def _format_ndjson(event: str, data: dict) -> str:
+    return json.dumps({"event": event, **data}, default=str) + "\n"
+
+
+@router.get(
+    "/{job_id}/events",
+    summary="Stream Job Events",
+    description=(
+        "Stream a job's events as they happen (e.g. converted / embedded / stored / skipped / error per "
+        "file, with stage timings), ending with a final `job` event carrying the job status and result. "
+        "Server-Sent Events by default; `format=ndjson` for one JSON object per line. Resume with "
+        "`after` or the `Last-Event-ID` header."
+    ),
+    responses={
+        200: {"description": "Event stream", "content": {"text/event-stream": {}, "application/x-ndjson": {}}},
+        404: {"description": "Job not found"},
+    },
+)
+async def stream_job_events(
+    job_id: str,
+    format: str = Query("sse", pattern="^(sse|ndjson)$", description="sse or ndjson"),
+    after: int = Query(0, ge=0, description="Only events with a sequence number above this"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """Follow a job's progress without polling GET /jobs/{id}."""
+    manager = get_job_manager()
+    if await run_blocking("jobs", manager.get, job_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job not found: {job_id}")
+    if last_event_id and last_event_id.isdigit():
+        after = max(after, int(last_event_id))
+    sse = format == "sse"
+
+    async def stream() -> AsyncIterator[str]:
+        cursor = after
+        idle_since = time.monotonic()
+        while True:
+            # Read the status before the events: a job flushes its last events
+            # before it finishes, so a finished status means nothing is missed.
+            try:
+                job = await run_blocking("jobs", manager.get, job_id)
+                events = await run_blocking("jobs", manager.store.events, job_id, after=cursor, limit=EVENT_BATCH)
+            except HTTPException:
+                # The jobs lane is saturated; keep the stream open and retry.
+                await asyncio.sleep(EVENT_POLL_SECONDS)
+                continue
+            for event in events:
+                payload = event.to_dict()
+                yield _format_sse(event.event, payload, event.seq) if sse else _format_ndjson(event.event, payload)
+                cursor = event.seq
+            if len(events) == EVENT_BATCH:
+                continue
+            if job is None or job.done:
+                final = job.to_dict() if job is not None else {"id": job_id, "status": "unknown"}
+                yield _format_sse("job", final) if sse else _format_ndjson("job", final)
+                return
+            if events:
+                idle_since = time.monotonic()
+            elif sse and time.monotonic() - idle_since >= EVENT_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                idle_since = time.monotonic()
+            await asyncio.sleep(EVENT_POLL_SECONDS)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -5,12 +5,17 @@ from __future__ import annotations
 import logging
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 from src.api.deps import get_config, get_document_processor, get_embedding_store
+from src.api.jobs import JobContext, get_job_manager, job_accepted_response
+from src.api.models import JobStatusResponse
+from src.api.response_cache import bumps_generation
+from src.api.workers import offload
 from src.cli_support import SUPPORTED_EXTENSIONS
 
 logger = logging.getLogger("prismweave.api.processing")
@@ -60,6 +65,9 @@ class ProcessingResponse(BaseModel):
     elapsed_seconds: Optional[float] = None
     results: List[ProcessFileResult] = []
     verification: Optional[dict] = None
+    stage_seconds: Optional[Dict[str, float]] = Field(
+        None, description="Seconds spent per stage (convert, embed, store) across all files"
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -78,7 +86,9 @@ class ProcessingResponse(BaseModel):
         500: {"description": "Processing error"},
     },
 )
-async def process_file(request: ProcessFileRequest) -> ProcessingResponse:
+@offload("processing")
+@bumps_generation
+def process_file(request: ProcessFileRequest) -> ProcessingResponse:
     """Process a single file: extract content, chunk, embed, and store."""
     cfg = get_config()
     processor = get_document_processor()
@@ -156,16 +166,23 @@ async def process_file(request: ProcessFileRequest) -> ProcessingResponse:
 
 @router.post(
     "/directory",
-    response_model=ProcessingResponse,
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Process Directory",
-    description="Process all supported documents in a directory",
+    description=(
+        "Process all supported documents in a directory as a background job. Poll GET /jobs/{id} "
+        "or follow GET /jobs/{id}/events for per-file progress; the job result is a ProcessingResponse "
+        "summary (counts and per-stage timings, without per-file results)"
+    ),
     responses={
-        200: {"description": "Directory processed successfully"},
+        200: {"description": "No supported files found; nothing to process", "model": ProcessingResponse},
+        202: {"description": "Processing job queued (or an identical queued/running job returned)"},
+        400: {"description": "Path is not a directory"},
         404: {"description": "Directory not found"},
-        500: {"description": "Processing error"},
     },
 )
-async def process_directory(request: ProcessDirectoryRequest) -> ProcessingResponse:
+@offload("processing")
+def process_directory(request: ProcessDirectoryRequest):
     """Process all supported files in a directory."""
     cfg = get_config()
     processor = get_document_processor()
@@ -187,45 +204,100 @@ async def process_directory(request: ProcessDirectoryRequest) -> ProcessingRespo
         files.extend(dir_path.rglob(f"*{ext}"))
 
     if not files:
-        return ProcessingResponse(
-            status="success",
-            message=f"No supported files found in {dir_path}",
+        return JSONResponse(
+            ProcessingResponse(
+                status="success",
+                message=f"No supported files found in {dir_path}",
+            ).model_dump()
         )
 
+    def run(ctx: JobContext) -> dict:
+        return _process_files(ctx, files, processor, store, request, dir_path).model_dump()
+
+    params = {"path": str(dir_path), "force": request.force, "incremental": request.incremental}
+    return job_accepted_response(*get_job_manager().submit("processing.directory", params, run))
+
+
+def _process_files(
+    ctx: JobContext,
+    files: List[Path],
+    processor,
+    store,
+    request: ProcessDirectoryRequest,
+    root: Path,
+) -> ProcessingResponse:
+    """Process ``files``, streaming one event per stage and file through ``ctx``.
+
+    Emits ``converted``, ``embedded`` and ``stored`` (with the seconds the
+    stage took), or ``skipped`` / ``error``, for each file; the returned
+    summary only carries counts and per-stage totals.
+    """
     start = time.time()
-    results: List[ProcessFileResult] = []
     processed = 0
     skipped = 0
     errored = 0
-
-    for file_path in files:
+    stage_seconds = {"convert": 0.0, "embed": 0.0, "store": 0.0}
+
+    for done, file_path in enumerate(files):
+        ctx.check_cancelled()
+        ctx.progress(
+            "processing",
+            files_done=done,
+            files_total=len(files),
+            processed=processed,
+            skipped=skipped,
+            errored=errored,
+        )
+        name = file_path.relative_to(root).as_posix()
+        stage = "convert"
         try:
             existing = store.get_file_document_count(file_path)
             if existing > 0 and not request.force and not request.incremental:
-                results.append(ProcessFileResult(file_name=file_path.name, chunks=existing, status="skipped"))
+                ctx.emit("skipped", file=name, chunks=existing)
                 skipped += 1
                 continue
 
             if existing > 0:
                 store.remove_file_documents(file_path)
 
+            file_start = time.perf_counter()
             chunks = processor.process_document(file_path)
+            convert_seconds = time.perf_counter() - file_start
+            stage_seconds["convert"] += convert_seconds
             if not chunks:
-                results.append(
-                    ProcessFileResult(file_name=file_path.name, chunks=0, status="error", error="No chunks generated")
-                )
+                ctx.emit("error", file=name, stage=stage, error="No chunks generated")
                 errored += 1
                 continue
-
-            store.add_document(file_path, chunks)
-            results.append(ProcessFileResult(file_name=file_path.name, chunks=len(chunks), status="success"))
+            ctx.emit("converted", file=name, chunks=len(chunks), seconds=round(convert_seconds, 4))
+
+            stage = "embed"
+            timings: Dict[str, float] = {}
+            store.add_document(file_path, chunks, timings=timings)
+            for key in ("embed", "store"):
+                stage_seconds[key] += timings.get(key, 0.0)
+            ctx.emit("embedded", file=name, seconds=round(timings.get("embed", 0.0), 4))
+            ctx.emit(
+                "stored",
+                file=name,
+                chunks=len(chunks),
+                seconds=round(timings.get("store", 0.0), 4),
+                total_seconds=round(time.perf_counter() - file_start, 4),
+            )
             processed += 1
 
         except Exception as exc:
             logger.error("Error processing %s: %s", file_path.name, exc)
-            results.append(ProcessFileResult(file_name=file_path.name, chunks=0, status="error", error=str(exc)))
+            ctx.emit("error", file=name, stage=stage, error=str(exc))
             errored += 1
 
+    ctx.progress(
+        "processing",
+        files_done=len(files),
+        files_total=len(files),
+        processed=processed,
+        skipped=skipped,
+        errored=errored,
+    )
     elapsed = time.time() - start
     return ProcessingResponse(
         status="success" if processed > 0 else ("error" if errored > 0 else "success"),
@@ -234,5 +306,5 @@ async def process_directory(request: ProcessDirectoryRequest) -> ProcessingRespo
         files_skipped=skipped,
         files_errored=errored,
         elapsed_seconds=round(elapsed, 2),
-        results=results,
+        stage_seconds={key: round(value, 3) for key, value in stage_seconds.items()},
     )
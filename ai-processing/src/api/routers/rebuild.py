@@ -1,4 +1,9 @@
-"""Rebuild router — embedding rebuild and full rebuild-everything endpoint."""
+"""Rebuild router — embedding rebuild and full rebuild-everything endpoint.
+
+Both endpoints check their preconditions in the request and then run as a
+background job (see ``src.api.jobs``): they answer ``202 Accepted`` with the
+job, whose result is the ``RebuildResponse`` once it finishes.
+"""
 
 from __future__ import annotations
 
@@ -6,12 +11,15 @@ import logging
 import shutil
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
 from src.api.deps import check_ollama_available, get_config
+from src.api.jobs import JobCancelledError, JobContext, get_job_manager, job_accepted_response
+from src.api.models import JobStatusResponse
+from src.api.workers import offload
 from src.cli_support import SUPPORTED_EXTENSIONS
 
 logger = logging.getLogger("prismweave.api.rebuild")
@@ -48,6 +56,52 @@ class RebuildResponse(BaseModel):
     phases: Dict = Field(default_factory=dict, description="Results for each phase of the rebuild")
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _collect_files(docs_root: Path) -> List[Path]:
+    files: List[Path] = []
+    for ext in SUPPORTED_EXTENSIONS:
+        files.extend(docs_root.rglob(f"*{ext}"))
+    return files
+
+
+def _embed_files(ctx: JobContext, processor, store, files: List[Path], root: Path) -> int:
+    """Chunk and embed ``files``, reporting progress; returns how many were stored.
+
+    Emits a ``stored`` event with per-stage seconds (or ``error``) per file.
+    """
+
+    processed = 0
+    for done, file_path in enumerate(files):
+        ctx.check_cancelled()
+        ctx.progress("embeddings", files_done=done, files_total=len(files), files_processed=processed)
+        name = file_path.relative_to(root).as_posix()
+        try:
+            started = time.perf_counter()
+            chunks = processor.process_document(file_path)
+            convert_seconds = time.perf_counter() - started
+            if chunks:
+                timings: Dict[str, float] = {}
+                store.add_document(file_path, chunks, timings=timings)
+                processed += 1
+                ctx.emit(
+                    "stored",
+                    file=name,
+                    chunks=len(chunks),
+                    convert_seconds=round(convert_seconds, 4),
+                    embed_seconds=round(timings.get("embed", 0.0), 4),
+                    store_seconds=round(timings.get("store", 0.0), 4),
+                )
+        except Exception as exc:
+            logger.warning("Failed to process %s: %s", file_path.name, exc)
+            ctx.emit("error", file=name, error=str(exc))
+    ctx.progress("embeddings", files_done=len(files), files_total=len(files), files_processed=processed)
+    return processed
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -55,16 +109,21 @@ class RebuildResponse(BaseModel):
 
 @router.post(
     "/embeddings",
-    response_model=RebuildResponse,
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Rebuild Embeddings",
-    description="Wipe and rebuild the ChromaDB embedding store from documents on disk",
+    description=(
+        "Wipe and rebuild the ChromaDB embedding store from documents on disk, as a background job "
+        "(poll GET /jobs/{id}; the result is a RebuildResponse)"
+    ),
     responses={
-        200: {"description": "Embeddings rebuilt successfully"},
+        202: {"description": "Rebuild job queued (or an identical queued/running job returned)"},
+        404: {"description": "Documents root not found"},
         503: {"description": "Ollama not available"},
-        500: {"description": "Rebuild failed"},
     },
 )
-async def rebuild_embeddings(request: RebuildEmbeddingsRequest) -> RebuildResponse:
+@offload("rebuild")
+def rebuild_embeddings(request: RebuildEmbeddingsRequest):
     """Rebuild the ChromaDB embedding store from scratch."""
     ollama_status = check_ollama_available()
     if not ollama_status["available"]:
@@ -80,85 +139,84 @@ async def rebuild_embeddings(request: RebuildEmbeddingsRequest) -> RebuildRespon
     if not docs_root.exists():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Documents root not found: {docs_root}")
 
-    start = time.time()
-    phases: Dict = {}
-
-    try:
-        from src.core.document_processor import DocumentProcessor
-        from src.core.embedding_store import EmbeddingStore
-        from src.core.git_tracker import GitTracker
-
-        # Wipe existing ChromaDB
-        if chroma_path.exists():
-            shutil.rmtree(chroma_path)
-            phases["wipe"] = "ChromaDB directory removed"
-        chroma_path.mkdir(parents=True, exist_ok=True)
-
-        # Also wipe processing state
-        processing_state = docs_root / ".prismweave" / "processing_state.sqlite"
-        if processing_state.exists():
-            processing_state.unlink()
-            phases["processing_state"] = "processing_state.sqlite removed"
-
-        git_tracker = None
-        if (docs_root / ".git").exists():
-            try:
-                git_tracker = GitTracker(docs_root, cfg)
-            except Exception:
-                pass
-
-        processor = DocumentProcessor(cfg, git_tracker)
-        store = EmbeddingStore(cfg, git_tracker)
-
-        # Collect and process all files
-        files = []
-        for ext in SUPPORTED_EXTENSIONS:
-            files.extend(docs_root.rglob(f"*{ext}"))
-
-        processed = 0
-        for file_path in files:
-            try:
-                chunks = processor.process_document(file_path)
-                if chunks:
-                    store.add_document(file_path, chunks)
-                    processed += 1
-            except Exception as exc:
-                logger.warning("Failed to process %s: %s", file_path.name, exc)
-
-        phases["processing"] = {"files_found": len(files), "files_processed": processed}
-
-        verification = None
-        if request.verify:
-            verification = store.verify_embeddings()
-            phases["verification"] = verification
-
-        elapsed = time.time() - start
-        return RebuildResponse(
-            status="success",
-            message=f"Rebuilt embeddings: {processed} files processed in {elapsed:.1f}s",
-            elapsed_seconds=round(elapsed, 2),
-            phases=phases,
-        )
+    def run(ctx: JobContext) -> dict:
+        start = time.time()
+        phases: Dict = {}
+
+        try:
+            from src.core.document_processor import DocumentProcessor
+            from src.core.embedding_store import EmbeddingStore
+            from src.core.git_tracker import GitTracker
+
+            ctx.progress("wipe")
+            # Wipe existing ChromaDB
+            if chroma_path.exists():
+                shutil.rmtree(chroma_path)
+                phases["wipe"] = "ChromaDB directory removed"
+            chroma_path.mkdir(parents=True, exist_ok=True)
+
+            # Also wipe processing state
+            processing_state = docs_root / ".prismweave" / "processing_state.sqlite"
+            if processing_state.exists():
+                processing_state.unlink()
+                phases["processing_state"] = "processing_state.sqlite removed"
+
+            git_tracker = None
+            if (docs_root / ".git").exists():
+                try:
+                    git_tracker = GitTracker(docs_root, cfg)
+                except Exception:
+                    pass
+
+            processor = DocumentProcessor(cfg, git_tracker)
+            store = EmbeddingStore(cfg, git_tracker)
+
+            # Collect and process all files
+            files = _collect_files(docs_root)
+            processed = _embed_files(ctx, processor, store, files, docs_root)
+            phases["processing"] = {"files_found": len(files), "files_processed": processed}
+
+            verification = None
+            if request.verify:
+                ctx.progress("verification")
+                verification = store.verify_embeddings()
+                phases["verification"] = verification
 
-    except HTTPException:
-        raise
-    except Exception as exc:
-        logger.error("Embeddings rebuild failed: %s", exc)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Rebuild failed: {exc}")
+            elapsed = time.time() - start
+            return RebuildResponse(
+                status="success",
+                message=f"Rebuilt embeddings: {processed} files processed in {elapsed:.1f}s",
+                elapsed_seconds=round(elapsed, 2),
+                phases=phases,
+            ).model_dump()
+
+        except JobCancelledError:
+            raise
+        except Exception as exc:
+            logger.error("Embeddings rebuild failed: %s", exc)
+            raise RuntimeError(f"Rebuild failed: {exc}") from exc
+
+    params = {"documents_root": str(docs_root), **request.model_dump()}
+    return job_accepted_response(*get_job_manager().submit("rebuild.embeddings", params, run))
 
 
 @router.post(
     "/everything",
-    response_model=RebuildResponse,
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Rebuild Everything",
-    description="Full rebuild: embeddings → clustering → proposals → taxonomy → tag assignment",
+    description=(
+        "Full rebuild: embeddings → clustering → proposals → taxonomy → tag assignment, as a background "
+        "job (poll GET /jobs/{id}; the result is a RebuildResponse)"
+    ),
     responses={
-        200: {"description": "Full rebuild completed"},
+        202: {"description": "Rebuild job queued (or an identical queued/running job returned)"},
+        404: {"description": "Documents root not found"},
         503: {"description": "Ollama not available"},
-        500: {"description": "Rebuild failed"},
     },
 )
-async def rebuild_everything(request: RebuildEverythingRequest) -> RebuildResponse:
+@offload("rebuild")
+def rebuild_everything(request: RebuildEverythingRequest):
     """Run the full rebuild-everything pipeline (equivalent to CLI rebuild-everything)."""
     ollama_status = check_ollama_available()
     if not ollama_status["available"]:
@@ -174,133 +232,139 @@ async def rebuild_everything(request: RebuildEverythingRequest) -> RebuildRespon
     if not docs_root.exists():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Documents root not found: {docs_root}")
 
-    start = time.time()
-    phases: Dict = {}
-
-    try:
-        from src.core.document_processor import DocumentProcessor
-        from src.core.embedding_store import EmbeddingStore
-        from src.core.git_tracker import GitTracker
-        from src.taxonomy.assignments import AssignmentOptions, run_article_tag_assignment
-        from src.taxonomy.pipeline import ClusterPipelineOptions, run_clustering_pipeline
-        from src.taxonomy.proposals import ProposalRunOptions, run_cluster_proposals
-        from src.taxonomy.store import default_taxonomy_sqlite_path
-        from src.taxonomy.tag_embeddings import TagEmbeddingOptions, embed_and_store_tags
-        from src.taxonomy.taxonomy_builder import run_taxonomy_normalize_and_store
-
-        taxonomy_sqlite = default_taxonomy_sqlite_path(docs_root)
-        taxonomy_artifacts_dir = docs_root / ".prismweave" / "taxonomy" / "artifacts"
-
-        if request.tags_only:
-            # Tags-only mode: re-embed tags + re-assign
+    def run(ctx: JobContext) -> dict:
+        start = time.time()
+        phases: Dict = {}
+
+        try:
+            from src.core.document_processor import DocumentProcessor
+            from src.core.embedding_store import EmbeddingStore
+            from src.core.git_tracker import GitTracker
+            from src.taxonomy.assignments import AssignmentOptions, run_article_tag_assignment
+            from src.taxonomy.pipeline import ClusterPipelineOptions, run_clustering_pipeline
+            from src.taxonomy.proposals import ProposalRunOptions, run_cluster_proposals
+            from src.taxonomy.store import default_taxonomy_sqlite_path
+            from src.taxonomy.tag_embeddings import TagEmbeddingOptions, embed_and_store_tags
+            from src.taxonomy.taxonomy_builder import run_taxonomy_normalize_and_store
+
+            taxonomy_sqlite = default_taxonomy_sqlite_path(docs_root)
+            taxonomy_artifacts_dir = docs_root / ".prismweave" / "taxonomy" / "artifacts"
+
+            if request.tags_only:
+                # Tags-only mode: re-embed tags + re-assign
+                ctx.progress("embed_tags")
+                embed_result = embed_and_store_tags(cfg, options=TagEmbeddingOptions(use_description=True))
+                phases["embed_tags"] = embed_result
+                ctx.check_cancelled()
+
+                ctx.progress("assign")
+                assign_result = run_article_tag_assignment(
+                    cfg, options=AssignmentOptions(top_n=request.top_n, min_confidence=request.min_confidence)
+                )
+                phases["assign"] = assign_result
+
+                elapsed = time.time() - start
+                return RebuildResponse(
+                    status="success",
+                    message=f"Tag rebuild completed: {assign_result.get('assignments', 0)} assignments in {elapsed:.1f}s",
+                    elapsed_seconds=round(elapsed, 2),
+                    phases=phases,
+                ).model_dump()
+
+            # Phase 1: Wipe + rebuild embeddings
             phase_start = time.time()
+            ctx.progress("wipe")
+
+            if chroma_path.exists():
+                shutil.rmtree(chroma_path)
+            chroma_path.mkdir(parents=True, exist_ok=True)
+
+            processing_state = docs_root / ".prismweave" / "processing_state.sqlite"
+            if processing_state.exists():
+                processing_state.unlink()
+
+            git_tracker = None
+            if (docs_root / ".git").exists():
+                try:
+                    git_tracker = GitTracker(docs_root, cfg)
+                except Exception:
+                    pass
+
+            processor = DocumentProcessor(cfg, git_tracker)
+            store = EmbeddingStore(cfg, git_tracker)
 
+            processed = _embed_files(ctx, processor, store, _collect_files(docs_root), docs_root)
+            phases["embeddings"] = {"files": processed, "elapsed": round(time.time() - phase_start, 2)}
+
+            # Phase 2: Wipe taxonomy
+            phase_start = time.time()
+            ctx.progress("taxonomy_wipe")
+            if taxonomy_sqlite.exists():
+                taxonomy_sqlite.unlink()
+            if taxonomy_artifacts_dir.exists():
+                shutil.rmtree(taxonomy_artifacts_dir)
+            phases["taxonomy_wipe"] = {"elapsed": round(time.time() - phase_start, 2)}
+
+            ctx.check_cancelled()
+
+            # Phase 3: Clustering
+            phase_start = time.time()
+            ctx.progress("clustering")
+            cluster_result = run_clustering_pipeline(
+                cfg,
+                options=ClusterPipelineOptions(
+                    max_articles=request.max_articles,
+                    algorithm=request.algorithm,
+                    k=request.k,
+                ),
+            )
+            phases["clustering"] = {**cluster_result, "elapsed": round(time.time() - phase_start, 2)}
+
+            ctx.check_cancelled()
+
+            # Phase 4: LLM proposals
+            phase_start = time.time()
+            ctx.progress("proposals")
+            proposals_result = run_cluster_proposals(cfg, options=ProposalRunOptions(sample_size=request.sample_size))
+            phases["proposals"] = {**proposals_result, "elapsed": round(time.time() - phase_start, 2)}
+
+            ctx.check_cancelled()
+
+            # Phase 5: Normalize + embed tags
+            phase_start = time.time()
+            ctx.progress("normalize_embed")
+            normalize_result = run_taxonomy_normalize_and_store(cfg)
             embed_result = embed_and_store_tags(cfg, options=TagEmbeddingOptions(use_description=True))
-            phases["embed_tags"] = embed_result
+            phases["normalize_embed"] = {
+                "categories": normalize_result.get("categories"),
+                "tags": normalize_result.get("tags"),
+                "embedded_tags": embed_result.get("tags"),
+                "elapsed": round(time.time() - phase_start, 2),
+            }
 
+            ctx.check_cancelled()
+
+            # Phase 6: Assign tags
+            phase_start = time.time()
+            ctx.progress("assign")
             assign_result = run_article_tag_assignment(
                 cfg, options=AssignmentOptions(top_n=request.top_n, min_confidence=request.min_confidence)
             )
-            phases["assign"] = assign_result
+            phases["assign"] = {**assign_result, "elapsed": round(time.time() - phase_start, 2)}
 
             elapsed = time.time() - start
             return RebuildResponse(
                 status="success",
-                message=f"Tag rebuild completed: {assign_result.get('assignments', 0)} assignments in {elapsed:.1f}s",
+                message=f"Full rebuild completed in {elapsed:.1f}s",
                 elapsed_seconds=round(elapsed, 2),
                 phases=phases,
-            )
+            ).model_dump()
 
-        # Phase 1: Wipe + rebuild embeddings
-        phase_start = time.time()
-
-        if chroma_path.exists():
-            shutil.rmtree(chroma_path)
-        chroma_path.mkdir(parents=True, exist_ok=True)
-
-        processing_state = docs_root / ".prismweave" / "processing_state.sqlite"
-        if processing_state.exists():
-            processing_state.unlink()
-
-        git_tracker = None
-        if (docs_root / ".git").exists():
-            try:
-                git_tracker = GitTracker(docs_root, cfg)
-            except Exception:
-                pass
-
-        processor = DocumentProcessor(cfg, git_tracker)
-        store = EmbeddingStore(cfg, git_tracker)
-
-        files = []
-        for ext in SUPPORTED_EXTENSIONS:
-            files.extend(docs_root.rglob(f"*{ext}"))
-
-        processed = 0
-        for f in files:
-            try:
-                chunks = processor.process_document(f)
-                if chunks:
-                    store.add_document(f, chunks)
-                    processed += 1
-            except Exception as exc:
-                logger.warning("Failed to process %s: %s", f.name, exc)
-
-        phases["embeddings"] = {"files": processed, "elapsed": round(time.time() - phase_start, 2)}
-
-        # Phase 2: Wipe taxonomy
-        phase_start = time.time()
-        if taxonomy_sqlite.exists():
-            taxonomy_sqlite.unlink()
-        if taxonomy_artifacts_dir.exists():
-            shutil.rmtree(taxonomy_artifacts_dir)
-        phases["taxonomy_wipe"] = {"elapsed": round(time.time() - phase_start, 2)}
-
-        # Phase 3: Clustering
-        phase_start = time.time()
-        cluster_result = run_clustering_pipeline(
-            cfg,
-            options=ClusterPipelineOptions(
-                max_articles=request.max_articles,
-                algorithm=request.algorithm,
-                k=request.k,
-            ),
-        )
-        phases["clustering"] = {**cluster_result, "elapsed": round(time.time() - phase_start, 2)}
-
-        # Phase 4: LLM proposals
-        phase_start = time.time()
-        proposals_result = run_cluster_proposals(cfg, options=ProposalRunOptions(sample_size=request.sample_size))
-        phases["proposals"] = {**proposals_result, "elapsed": round(time.time() - phase_start, 2)}
-
-        # Phase 5: Normalize + embed tags
-        phase_start = time.time()
-        normalize_result = run_taxonomy_normalize_and_store(cfg)
-        embed_result = embed_and_store_tags(cfg, options=TagEmbeddingOptions(use_description=True))
-        phases["normalize_embed"] = {
-            "categories": normalize_result.get("categories"),
-            "tags": normalize_result.get("tags"),
-            "embedded_tags": embed_result.get("tags"),
-            "elapsed": round(time.time() - phase_start, 2),
-        }
-
-        # Phase 6: Assign tags
-        phase_start = time.time()
-        assign_result = run_article_tag_assignment(
-            cfg, options=AssignmentOptions(top_n=request.top_n, min_confidence=request.min_confidence)
-        )
-        phases["assign"] = {**assign_result, "elapsed": round(time.time() - phase_start, 2)}
-
-        elapsed = time.time() - start
-        return RebuildResponse(
-            status="success",
-            message=f"Full rebuild completed in {elapsed:.1f}s",
-            elapsed_seconds=round(elapsed, 2),
-            phases=phases,
-        )
+        except JobCancelledError:
+            raise
+        except Exception as exc:
+            logger.error("Full rebuild failed: %s", exc)
+            raise RuntimeError(f"Rebuild failed: {exc}") from exc
 
-    except HTTPException:
-        raise
-    except Exception as exc:
-        logger.error("Full rebuild failed: %s", exc)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Rebuild failed: {exc}")
+    params = {"documents_root": str(docs_root), **request.model_dump()}
+    return job_accepted_response(*get_job_manager().submit("rebuild.everything", params, run))
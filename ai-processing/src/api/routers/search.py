@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from src.api.deps import get_embedding_store
+from src.api.workers import offload
 
 logger = logging.getLogger("prismweave.api.search")
 
@@ -66,7 +67,8 @@ class SearchResponse(BaseModel):
         500: {"description": "Search backend unavailable"},
     },
 )
-async def search_documents(request: SearchRequest) -> SearchResponse:
+@offload("search")
+def search_documents(request: SearchRequest) -> SearchResponse:
     """
     Perform a semantic similarity search across all stored document chunks.
 
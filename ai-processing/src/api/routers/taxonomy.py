@@ -10,6 +10,8 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
 from src.api.deps import check_ollama_available, get_config
+from src.api.response_cache import bumps_generation
+from src.api.workers import offload
 
 logger = logging.getLogger("prismweave.api.taxonomy")
 
@@ -65,7 +67,9 @@ class TaxonomyOperationResponse(BaseModel):
     summary="Build Clusters",
     description="Build clusters from existing article embeddings and store centroid vectors",
 )
-async def cluster(request: ClusterRequest) -> TaxonomyOperationResponse:
+@offload("taxonomy")
+@bumps_generation
+def cluster(request: ClusterRequest) -> TaxonomyOperationResponse:
     """Build clusters from article embeddings in ChromaDB."""
     try:
         from src.taxonomy.pipeline import ClusterPipelineOptions, run_clustering_pipeline
@@ -95,7 +99,9 @@ async def cluster(request: ClusterRequest) -> TaxonomyOperationResponse:
     summary="Generate Proposals",
     description="Use local LLM to propose category/subcategory/tags for each cluster",
 )
-async def propose(request: ProposeRequest) -> TaxonomyOperationResponse:
+@offload("taxonomy")
+@bumps_generation
+def propose(request: ProposeRequest) -> TaxonomyOperationResponse:
     """Generate LLM-based taxonomy proposals for each cluster."""
     ollama_status = check_ollama_available()
     if not ollama_status["available"]:
@@ -127,7 +133,9 @@ async def propose(request: ProposeRequest) -> TaxonomyOperationResponse:
     summary="Normalize Taxonomy",
     description="Normalize/dedupe cluster proposals into a stable taxonomy and persist to SQLite",
 )
-async def normalize() -> TaxonomyOperationResponse:
+@offload("taxonomy")
+@bumps_generation
+def normalize() -> TaxonomyOperationResponse:
     """Normalize cluster proposals into a stable taxonomy."""
     try:
         from src.taxonomy.taxonomy_builder import run_taxonomy_normalize_and_store
@@ -150,7 +158,9 @@ async def normalize() -> TaxonomyOperationResponse:
     summary="Embed Tags",
     description="Embed tag descriptions and store them in ChromaDB for fast tag assignment",
 )
-async def embed_tags(request: EmbedTagsRequest) -> TaxonomyOperationResponse:
+@offload("taxonomy")
+@bumps_generation
+def embed_tags(request: EmbedTagsRequest) -> TaxonomyOperationResponse:
     """Embed tag descriptions and store them in ChromaDB."""
     ollama_status = check_ollama_available()
     if not ollama_status["available"]:
@@ -180,7 +190,9 @@ async def embed_tags(request: EmbedTagsRequest) -> TaxonomyOperationResponse:
     summary="Assign Tags",
     description="Assign tags to articles using proposal + embedding-based refinement",
 )
-async def assign(request: AssignRequest) -> TaxonomyOperationResponse:
+@offload("taxonomy")
+@bumps_generation
+def assign(request: AssignRequest) -> TaxonomyOperationResponse:
     """Assign tags to articles and persist to SQLite."""
     try:
         from src.taxonomy.assignments import AssignmentOptions, run_article_tag_assignment
@@ -204,7 +216,9 @@ async def assign(request: AssignRequest) -> TaxonomyOperationResponse:
     summary="Tag New Article",
     description="Tag a new article file using existing cluster centroids and global tags",
 )
-async def tag_new(request: TagNewRequest) -> TaxonomyOperationResponse:
+@offload("taxonomy")
+@bumps_generation
+def tag_new(request: TagNewRequest) -> TaxonomyOperationResponse:
     """Tag a new article using existing cluster centroids and global tags."""
     ollama_status = check_ollama_available()
     if not ollama_status["available"]:
@@ -0,0 +1,176 @@
+"""Bounded worker pools for blocking work done by async endpoints.
+
+Handlers are ``async def`` but most of what they call blocks: Chroma,
+Ollama over ``requests``, git subprocesses, frontmatter parsing, SQLite.
+Running that on the event loop stalls every other request, ``/health``
+included. ``offload`` turns a blocking handler into an async endpoint that
+runs it on the worker pool of a named *lane*.
+
+Each lane has its own small thread pool (the lane's concurrency limit) and
+a bounded queue in front of it; a request that finds the queue full gets
+``429 Too Many Requests`` instead of piling up. Lanes isolate endpoints
+from each other, so a rebuild holding the ``rebuild`` lane cannot starve
+``/articles``. Limits can be overridden with ``PRISMWEAVE_WORKERS_<LANE>``
+(and ``PRISMWEAVE_QUEUE_<LANE>`` for the queue length).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, TypeVar
+
+from fastapi import HTTPException, status
+
+logger = logging.getLogger("prismweave.api.workers")
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class LaneLimits:
+    workers: int
+    queue: int
+
+
+# Concurrency per lane and how many further requests may wait for a worker.
+# Taxonomy work does not queue: a second request while one runs is rejected
+# rather than repeating the same work back to back. Rebuild endpoints only
+# validate and submit a background job (see ``jobs``), which merges
+# identical submissions, so they can admit several requests at once.
+DEFAULT_LANE_LIMITS: Dict[str, LaneLimits] = {
+    "articles": LaneLimits(workers=8, queue=64),
+    "documents": LaneLimits(workers=4, queue=16),
+    "search": LaneLimits(workers=4, queue=16),
+    "health": LaneLimits(workers=2, queue=8),
+    "jobs": LaneLimits(workers=2, queue=16),
+    "processing": LaneLimits(workers=2, queue=4),
+    "taxonomy": LaneLimits(workers=1, queue=0),
+    "rebuild": LaneLimits(workers=2, queue=8),
+}
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
+class WorkerLane:
+    """A thread pool plus an admission counter bounding in-flight + queued calls."""
+
+    def __init__(self, name: str, limits: LaneLimits):
+        self.name = name
+        self.limits = limits
+        self._executor = ThreadPoolExecutor(max_workers=limits.workers, thread_name_prefix=f"prismweave-{name}")
+        self._lock = threading.Lock()
+        self._admitted = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._admitted
+
+    def try_admit(self) -> bool:
+        with self._lock:
+            if self._admitted >= self.limits.workers + self.limits.queue:
+                return False
+            self._admitted += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._admitted -= 1
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self.try_admit():
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many concurrent {self.name} requests; retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        finally:
+            self.release()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_lanes: Dict[str, WorkerLane] = {}
+_lanes_lock = threading.Lock()
+
+
+def get_lane(name: str) -> WorkerLane:
+    """Return the lane called ``name``, creating its pool on first use."""
+
+    lane = _lanes.get(name)
+    if lane is not None:
+        return lane
+    with _lanes_lock:
+        lane = _lanes.get(name)
+        if lane is None:
+            default = DEFAULT_LANE_LIMITS.get(name, LaneLimits(workers=4, queue=16))
+            suffix = name.upper()
+            limits = LaneLimits(
+                workers=_env_int(f"PRISMWEAVE_WORKERS_{suffix}", default.workers, 1),
+                queue=_env_int(f"PRISMWEAVE_QUEUE_{suffix}", default.queue, 0),
+            )
+            lane = _lanes[name] = WorkerLane(name, limits)
+        return lane
+
+
+async def run_blocking(lane: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``func(*args, **kwargs)`` on the worker pool of ``lane``."""
+
+    return await get_lane(lane).run(func, *args, **kwargs)
+
+
+def offload(lane: str) -> Callable[[Callable[..., T]], Callable[..., Any]]:
+    """Decorator: serve a blocking (``def``) handler from the pool of ``lane``.
+
+    The wrapper keeps the handler's signature (FastAPI follows
+    ``__wrapped__``), so parameters, dependencies and docs are unchanged.
+    """
+
+    def decorate(func: Callable[..., T]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def endpoint(*args: Any, **kwargs: Any) -> T:
+            return await run_blocking(lane, func, *args, **kwargs)
+
+        return endpoint
+
+    return decorate
+
+
+def shutdown_workers() -> None:
+    """Stop all lane pools (queued calls are cancelled, running ones finish)."""
+
+    with _lanes_lock:
+        lanes = list(_lanes.values())
+        _lanes.clear()
+    for lane in lanes:
+        lane.shutdown()
+
+
+__all__ = [
+    "DEFAULT_LANE_LIMITS",
+    "LaneLimits",
+    "WorkerLane",
+    "get_lane",
+    "offload",
+    "run_blocking",
+    "shutdown_workers",
+]
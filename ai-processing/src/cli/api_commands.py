@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from typing import Any
 from urllib.parse import quote
 
@@ -60,14 +61,38 @@ def get_article(ctx: click.Context, article_id: str) -> None:
     click.echo(json.dumps(data, indent=2, sort_keys=True))
 
 
+def _wait_for_job(base_url: str, job: dict[str, Any], *, poll_seconds: float = 1.0) -> dict[str, Any]:
+    """Poll ``GET /jobs/{id}`` until the job finishes; returns its final state."""
+
+    phase = None
+    while job.get("status") in {"queued", "running"}:
+        if job.get("phase") != phase:
+            phase = job.get("phase")
+            click.echo(f"{job['kind']}: {job['status']} ({phase or 'waiting'})", err=True)
+        time.sleep(poll_seconds)
+        job = _request("GET", f"{base_url}/jobs/{job['id']}")
+    return job
+
+
 @api.command(name="rebuild")
+@click.option("--no-wait", is_flag=True, help="Return the job as soon as it is queued")
 @click.pass_context
-def rebuild(ctx: click.Context) -> None:
-    """Rebuild the visualization index (metadata/layout)."""
+def rebuild(ctx: click.Context, no_wait: bool) -> None:
+    """Rebuild the visualization index (metadata/layout).
+
+    The server runs the rebuild as a background job; this waits for it and
+    prints the result unless --no-wait is given.
+    """
 
     base_url: str = ctx.obj["base_url"]
-    data = _request("POST", f"{base_url}/visualization/rebuild")
-    click.echo(json.dumps(data, indent=2, sort_keys=True))
+    job = _request("POST", f"{base_url}/visualization/rebuild")
+    if no_wait:
+        click.echo(json.dumps(job, indent=2, sort_keys=True))
+        return
+    job = _wait_for_job(base_url, job)
+    if job["status"] != "succeeded":
+        raise click.ClickException(f"Rebuild {job['status']}: {job.get('error') or 'no result'}")
+    click.echo(json.dumps(job["result"], indent=2, sort_keys=True))
 
 
 @api.command(name="update")
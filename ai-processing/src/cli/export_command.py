@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
-import csv
-import json
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import click
 
 from src.cli_support import CliError, create_state
+from src.core.document_export import EXPORT_FORMATS, ExportOptions, ExportProgress, check_format, open_export
 from src.core.embedding_store import EmbeddingStore
 
 
@@ -33,12 +31,13 @@ def handle_cli_error(exc: CliError) -> None:
     "--format",
     "-f",
     "output_format",
-    type=click.Choice(["json", "csv"]),
+    type=click.Choice(list(EXPORT_FORMATS)),
     default="json",
-    help="Export format (default: json)",
+    help="Export format (default: json; parquet needs pyarrow)",
 )
 @click.option("--filter-type", type=str, help="Filter by file type (e.g., md, txt, pdf)")
-@click.option("--include-content", is_flag=True, help="Include full content in export (JSON only)")
+@click.option("--include-content", is_flag=True, help="Include full chunk content instead of a preview")
+@click.option("--include-embeddings", is_flag=True, help="Include each chunk's embedding vector")
 @click.option("--max", "-m", "max_docs", type=int, help="Maximum number of documents to export")
 def export(
     output_file: Path,
@@ -47,100 +46,56 @@ def export(
     *,
     filter_type: Optional[str],
     include_content: bool,
+    include_embeddings: bool,
     max_docs: Optional[int],
 ) -> None:
-    """Export documents and metadata to JSON or CSV."""
+    """Export documents and metadata to JSON, CSV, NDJSON or Parquet.
+
+    Documents are read from the collection page by page and written as they
+    go, so memory use does not grow with the size of the collection.
+    """
 
     print("💾 PrismWeave Document Export")
     print("=" * 40)
 
     try:
+        try:
+            check_format(output_format)
+        except RuntimeError as exc:
+            raise CliError(str(exc)) from exc
         state = create_state(config, verbose=False)
         store = EmbeddingStore(state.config)
-
-        state.write("\n📥 Retrieving documents...")
-        documents = store.list_documents(max_docs)
-        if not documents:
-            state.write("❌ No documents to export")
-            return
-
-        if filter_type:
-            suffix = f".{filter_type.lstrip('.')}"
-            documents = [doc for doc in documents if Path(doc["metadata"].get("source_file", "")).suffix == suffix]
-            if not documents:
+        options = ExportOptions(
+            format=output_format,
+            filter_type=filter_type,
+            include_content=include_content,
+            include_embeddings=include_embeddings,
+            max_docs=max_docs,
+            collection_name=state.config.collection_name,
+        )
+
+        state.write("\n📥 Streaming documents...")
+        progress = ExportProgress()
+        chunks = open_export(store.iter_documents(include_embeddings=include_embeddings), options, progress)
+        if chunks is None:
+            if filter_type:
                 state.write(f"❌ No documents found with file type: {filter_type}")
-                return
-            state.write(f"🔍 Filtered to {len(documents)} documents with type: {filter_type}")
-
-        export_data = {
-            "export_date": datetime.now().isoformat(),
-            "total_documents": len(documents),
-            "collection_name": state.config.collection_name,
-            "documents": [],
-        }
-
-        for doc in documents:
-            metadata = doc["metadata"]
-            payload = {
-                "id": doc["id"],
-                "source_file": metadata.get("source_file", "Unknown"),
-                "chunk_index": metadata.get("chunk_index"),
-                "total_chunks": metadata.get("total_chunks"),
-                "tags": metadata.get("tags", ""),
-                "content_length": doc["content_length"],
-            }
-
-            if include_content and output_format == "json":
-                try:
-                    full_docs = store.document_store.filter_documents(filters={"id": doc["id"]})
-                    if full_docs:
-                        payload["content"] = full_docs[0].content
-                    else:
-                        payload["content_preview"] = doc["content_preview"]
-                except (OSError, ValueError, RuntimeError) as exc:  # pragma: no cover - external dependency
-                    state.write(f"⚠️  Warning: Failed to fetch full content: {exc}")
-                    payload["content_preview"] = doc["content_preview"]
             else:
-                payload["content_preview"] = doc["content_preview"]
-
-            export_data["documents"].append(payload)
-
-        if output_format == "json":
-            state.write(f"\n💾 Exporting to JSON: {output_file}")
-            with output_file.open("w", encoding="utf-8") as handle:
-                json.dump(export_data, handle, indent=2, ensure_ascii=False)
-        else:
-            state.write(f"\n💾 Exporting to CSV: {output_file}")
-            with output_file.open("w", newline="", encoding="utf-8") as handle:
-                fieldnames = [
-                    "id",
-                    "source_file",
-                    "chunk_index",
-                    "total_chunks",
-                    "tags",
-                    "content_length",
-                    "content_preview",
-                ]
-                writer = csv.DictWriter(handle, fieldnames=fieldnames)
-                writer.writeheader()
-                for payload in export_data["documents"]:
-                    writer.writerow(
-                        {
-                            "id": payload["id"],
-                            "source_file": payload.get("source_file", ""),
-                            "chunk_index": payload.get("chunk_index", ""),
-                            "total_chunks": payload.get("total_chunks", ""),
-                            "tags": payload.get("tags", ""),
-                            "content_length": payload.get("content_length", 0),
-                            "content_preview": payload.get(
-                                "content_preview",
-                                payload.get("content", ""),
-                            ),
-                        }
-                    )
+                state.write("❌ No documents to export")
+            return
 
-        state.write(f"✅ Exported {len(documents)} documents to {output_file}")
-        state.write(f"   File size: {output_file.stat().st_size / 1024:.1f} KB")
+        state.write(f"\n💾 Exporting to {output_format.upper()}: {output_file}")
+        partial = output_file.with_name(output_file.name + ".partial")
+        try:
+            with partial.open("wb") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+            partial.replace(output_file)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        state.write(f"✅ Exported {progress.rows} documents to {output_file}")
+        state.write(f"   File size: {progress.bytes / 1024:.1f} KB")
 
     except CliError as exc:
         handle_cli_error(exc)
@@ -31,13 +31,14 @@ def initialize_git_tracker(
     *,
     verbose: bool,
     strict: bool,
+    paranoid: bool = False,
 ) -> Optional[GitTracker]:
     """Initialize git tracking for the repository."""
     if not repo_root:
         return None
 
     try:
-        tracker = GitTracker(repo_root)
+        tracker = GitTracker(repo_root, paranoid=paranoid)
     except (OSError, ValueError, RuntimeError) as exc:  # pragma: no cover - depends on git setup
         if strict:
             raise CliError(f"Failed to initialize git tracking: {exc}") from exc
@@ -12,6 +12,7 @@ import click
 from src.cli_support import CliError, create_state, ensure_ollama_available, resolve_repository
 from src.core.document_processor import DocumentProcessor
 from src.core.embedding_store import EmbeddingStore
+from src.core.watcher import DEFAULT_DEBOUNCE_SECONDS, DocumentWatcher, WatchBatch, index_watch_batch
 
 from .git_utils import auto_detect_repository, initialize_git_tracker, print_git_summary
 from .processing_utils import clear_embeddings, process_directory, process_single_file
@@ -41,6 +42,11 @@ def handle_cli_error(exc: CliError) -> None:
     help="Only process new or changed files (requires git repository)",
 )
 @click.option("--force", "-f", is_flag=True, help="Force reprocessing of all files")
+@click.option(
+    "--paranoid",
+    is_flag=True,
+    help="Hash every file when checking for changes instead of trusting matching size/mtime",
+)
 @click.option(
     "--repo-path",
     type=click.Path(exists=True, path_type=Path),
@@ -55,6 +61,7 @@ def process(
     clear: bool,
     incremental: bool,
     force: bool,
+    paranoid: bool,
     repo_path: Optional[Path],
 ) -> None:
     """Process documents and generate embeddings using Haystack and Ollama."""
@@ -76,6 +83,7 @@ def process(
             repo_root,
             verbose=verbose,
             strict=incremental or repo_path is not None,
+            paranoid=paranoid,
         )
         state = create_state(config, verbose, git_tracker)
         if repo_root:
@@ -150,8 +158,13 @@ def process(
     help="Configuration file path (default: config.yaml)",
 )
 @click.option("--force", is_flag=True, help="Force reprocessing of all files")
+@click.option(
+    "--paranoid",
+    is_flag=True,
+    help="Hash every file when checking for changes instead of trusting matching size/mtime",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
-def sync(repo_path: Optional[Path], config: Optional[Path], force: bool, verbose: bool) -> None:
+def sync(repo_path: Optional[Path], config: Optional[Path], force: bool, paranoid: bool, verbose: bool) -> None:
     """Sync documents from a git repository, processing only new or changed files."""
 
     print("🔮 PrismWeave Document Sync")
@@ -171,6 +184,7 @@ def sync(repo_path: Optional[Path], config: Optional[Path], force: bool, verbose
             repo_root,
             verbose=verbose,
             strict=not force,
+            paranoid=paranoid,
         )
         state = create_state(config, verbose, git_tracker)
         state.write(f"📂 Repository: {repo_root}")
@@ -215,6 +229,82 @@ def sync(repo_path: Optional[Path], config: Optional[Path], force: bool, verbose
         sys.exit(0)
 
 
+@click.command()
+@click.argument("path", type=click.Path(exists=True, file_okay=False, path_type=Path), required=False)
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True, path_type=Path),
+    help="Configuration file path (default: config.yaml)",
+)
+@click.option(
+    "--debounce",
+    type=float,
+    default=DEFAULT_DEBOUNCE_SECONDS,
+    show_default=True,
+    help="Seconds of quiet after a burst of writes before indexing",
+)
+@click.option("--polling", is_flag=True, help="Poll the filesystem instead of using native notifications")
+@click.option(
+    "--initial-sync/--no-initial-sync",
+    default=True,
+    show_default=True,
+    help="Run an incremental pass before watching to catch changes made while stopped",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
+def watch(
+    path: Optional[Path],
+    config: Optional[Path],
+    debounce: float,
+    polling: bool,
+    initial_sync: bool,
+    verbose: bool,
+) -> None:
+    """Watch the documents root and index new or changed files as they appear."""
+
+    print("🔮 PrismWeave Document Watcher")
+    print("=" * 40)
+
+    try:
+        state = create_state(config, verbose)
+        root = (path or Path(state.config.mcp.paths.documents_root)).expanduser().resolve()
+        if not root.is_dir():
+            raise CliError(f"Documents root not found: {root}")
+
+        repo_root = resolve_repository(root, None)
+        state.git_tracker = initialize_git_tracker(repo_root, verbose=verbose, strict=False)
+
+        state.write("🔍 Checking Ollama availability...")
+        ensure_ollama_available(state.config)
+        state.write_verbose("✅ Ollama is running")
+
+        processor = DocumentProcessor(state.config, state.git_tracker)
+        store = EmbeddingStore(state.config, state.git_tracker)
+
+        if initial_sync and state.git_tracker:
+            state.write("🔄 Catching up on changes since the last run\n")
+            process_directory(root, state, processor, store, incremental=True, force=False)
+
+        def handle_batch(batch: WatchBatch) -> None:
+            state.write(f"📥 {len(batch.changed)} changed, {len(batch.deleted)} deleted")
+            for file_path in batch.changed + batch.deleted:
+                state.write_verbose(f"   {file_path.relative_to(root)}")
+            counts = index_watch_batch(batch, processor, store, state.git_tracker)
+            state.write(
+                f"   ✅ {counts['processed']} indexed, {counts['removed']} removed, "
+                f"{counts['skipped']} unchanged, {counts['errors']} failed"
+            )
+
+        watcher = DocumentWatcher(root, handle_batch, debounce_seconds=debounce, force_polling=polling)
+        state.write(f"👀 Watching {root} ({watcher.backend}); press Ctrl+C to stop")
+        watcher.run()
+
+    except CliError as exc:
+        handle_cli_error(exc)
+    except KeyboardInterrupt:  # pragma: no cover - user initiated stop
+        print("\n⏹️  Watcher stopped")
+
+
 @click.command(name="rebuild-db")
 @click.option(
     "--config",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import time
 import traceback
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List
 
@@ -96,11 +97,6 @@ def collect_directory_files(
     if incremental and not state.git_tracker:
         raise CliError("Incremental processing requires a git repository")
 
-    if incremental and state.git_tracker:
-        files = list(state.git_tracker.get_unprocessed_files(file_extensions=set(SUPPORTED_EXTENSIONS)))
-        state.write_verbose(f"📂 Incremental mode: Found {len(files)} unprocessed files")
-        return files
-
     discovered: List[Path] = []
     for extension in SUPPORTED_EXTENSIONS:
         discovered.extend(directory.rglob(f"*{extension}"))
@@ -110,6 +106,46 @@ def collect_directory_files(
     return discovered
 
 
+def apply_incremental_changes(state: CliState, store: EmbeddingStore) -> List[Path]:
+    """Apply deletions and renames since the last processed commit.
+
+    Deleted files lose their chunks and state rows, pure renames have their
+    chunks repointed in place (no Ollama calls). Returns the added/modified
+    files that still need processing.
+    """
+    tracker = state.git_tracker
+    if tracker is None:
+        raise CliError("Incremental processing requires a git repository")
+
+    changes = tracker.get_incremental_changes(file_extensions=set(SUPPORTED_EXTENSIONS))
+    if changes.full_scan:
+        state.write_verbose("📂 Incremental mode: no usable last processed commit, scanning all tracked files")
+    else:
+        state.write_verbose(f"📂 Incremental mode: diffing {changes.base_commit[:8]}..{changes.head_commit[:8]}")
+
+    for old_path in changes.deleted:
+        store.remove_file_documents(old_path, deleted=True)
+    if changes.deleted:
+        tracker.forget_files(changes.deleted)
+        state.write(f"🗑️  Removed {len(changes.deleted)} deleted files from the index")
+
+    files = list(changes.changed)
+    renamed = 0
+    for old_path, new_path in changes.renamed:
+        moved = store.rename_file_documents(old_path, new_path)
+        tracker.rename_processed_file(old_path, new_path)
+        if moved:
+            renamed += 1
+        elif not tracker.is_file_processed(new_path):
+            # Nothing was stored for the old path; treat the new one as added.
+            files.append(new_path)
+    if renamed:
+        state.write(f"🔀 Updated {renamed} renamed files without re-embedding")
+
+    state.write_verbose(f"📂 Incremental mode: Found {len(files)} new or changed files")
+    return files
+
+
 def summarize_processing(
     state: CliState,
     *,
@@ -151,11 +187,15 @@ def process_directory(
     force: bool,
 ) -> bool:
     """Process all supported files in a directory."""
-    files = collect_directory_files(directory, state, incremental=incremental, force=force)
+    if incremental and state.git_tracker:
+        files = apply_incremental_changes(state, store)
+    else:
+        files = collect_directory_files(directory, state, incremental=incremental, force=force)
 
     if not files:
         if incremental:
             state.write("✅ No new or changed files to process")
+            _update_last_processed_commit(state)
             return True
         state.write(f"❌ No supported files found in {directory}")
         state.write(f"   Supported extensions: {', '.join(SUPPORTED_EXTENSIONS)}")
@@ -163,24 +203,48 @@ def process_directory(
 
     success_count = 0
     error_count = 0
+    interrupted = False
     start = time.time()
 
-    use_progress = state.rich is not None and len(files) > 5
-    if use_progress:
-        resources = state.rich
-        assert resources is not None
-        progress = resources.Progress(
-            resources.SpinnerColumn(),
-            resources.TextColumn("[progress.description]{task.description}"),
-            resources.BarColumn(),
-            resources.TaskProgressColumn(),
-            resources.TimeRemainingColumn(),
-            console=resources.console,
-        )
-        with progress as progress_bar:
-            task = progress_bar.add_task("[cyan]Processing documents...", total=len(files))
-            for file_path in files:
-                progress_bar.update(task, description=f"[cyan]Processing: {file_path.name}")
+    # Commit processing state in chunks rather than once per file.
+    batch = state.git_tracker.batch() if state.git_tracker else nullcontext()
+    with batch:
+        use_progress = state.rich is not None and len(files) > 5
+        if use_progress:
+            resources = state.rich
+            assert resources is not None
+            progress = resources.Progress(
+                resources.SpinnerColumn(),
+                resources.TextColumn("[progress.description]{task.description}"),
+                resources.BarColumn(),
+                resources.TaskProgressColumn(),
+                resources.TimeRemainingColumn(),
+                console=resources.console,
+            )
+            with progress as progress_bar:
+                task = progress_bar.add_task("[cyan]Processing documents...", total=len(files))
+                for file_path in files:
+                    progress_bar.update(task, description=f"[cyan]Processing: {file_path.name}")
+                    try:
+                        if process_single_file(
+                            file_path,
+                            state,
+                            processor,
+                            store,
+                            force=force,
+                        ):
+                            success_count += 1
+                        else:
+                            error_count += 1
+                    except KeyboardInterrupt:  # pragma: no cover - user interaction
+                        state.write("\n⏹️  Processing interrupted by user")
+                        interrupted = True
+                        break
+                    finally:
+                        progress_bar.update(task, advance=1)
+        else:
+            for index, file_path in enumerate(files, start=1):
+                state.write(f"[{index}/{len(files)}] Processing: {file_path.name}")
                 try:
                     if process_single_file(
                         file_path,
@@ -194,26 +258,8 @@ def process_directory(
                         error_count += 1
                 except KeyboardInterrupt:  # pragma: no cover - user interaction
                     state.write("\n⏹️  Processing interrupted by user")
+                    interrupted = True
                     break
-                finally:
-                    progress_bar.update(task, advance=1)
-    else:
-        for index, file_path in enumerate(files, start=1):
-            state.write(f"[{index}/{len(files)}] Processing: {file_path.name}")
-            try:
-                if process_single_file(
-                    file_path,
-                    state,
-                    processor,
-                    store,
-                    force=force,
-                ):
-                    success_count += 1
-                else:
-                    error_count += 1
-            except KeyboardInterrupt:  # pragma: no cover - user interaction
-                state.write("\n⏹️  Processing interrupted by user")
-                break
 
     elapsed = time.time() - start
     summarize_processing(
@@ -223,16 +269,31 @@ def process_directory(
         elapsed=elapsed,
     )
 
-    if success_count and state.git_tracker:
-        try:
-            state.git_tracker.update_last_processed_commit()
-            state.write_verbose("   🔄 Updated processing state")
-        except (OSError, RuntimeError) as exc:  # pragma: no cover - external git state
-            state.write(f"   ⚠️  Warning: Failed to update processing state: {exc}")
+    if state.git_tracker:
+        counts = state.git_tracker.check_counts
+        state.write_verbose(
+            f"   🔎 Change checks: {counts['stat']} by size/mtime, {counts['hash']} by content hash, "
+            f"{counts['untracked']} untracked"
+        )
+
+    # Only advance the commit marker after a clean run so files that failed
+    # are picked up again by the next incremental diff.
+    if success_count and not error_count and not interrupted:
+        _update_last_processed_commit(state)
 
     return success_count > 0
 
 
+def _update_last_processed_commit(state: CliState) -> None:
+    if not state.git_tracker:
+        return
+    try:
+        state.git_tracker.update_last_processed_commit()
+        state.write_verbose("   🔄 Updated processing state")
+    except (OSError, RuntimeError) as exc:  # pragma: no cover - external git state
+        state.write(f"   ⚠️  Warning: Failed to update processing state: {exc}")
+
+
 def clear_embeddings(state: CliState, store: EmbeddingStore) -> None:
     """Clear all embeddings from the store."""
     state.write("🗑️  Clearing existing embeddings...")
@@ -146,8 +146,9 @@ def count(config: Optional[Path]) -> None:
         state = create_state(config, verbose=False)
         store = EmbeddingStore(state.config)
 
-        total_documents = store.get_document_count()
-        unique_sources = len(store.get_unique_source_files())
+        collection_stats = store.get_collection_stats()
+        total_documents = collection_stats.total_chunks
+        unique_sources = collection_stats.source_files
 
         state.write("📊 Collection Statistics:")
         state.write(f"   📄 Total document chunks: {total_documents:,}")
@@ -156,9 +157,8 @@ def count(config: Optional[Path]) -> None:
             avg_chunks = total_documents / unique_sources
             state.write(f"   📈 Average chunks per file: {avg_chunks:.1f}")
 
-        verification = store.verify_embeddings()
-        state.write(f"   🗄️  Collection name: {verification.get('collection_name', 'Unknown')}")
-        state.write(f"   💾 Storage path: {verification.get('persist_directory', 'Unknown')}")
+        state.write(f"   🗄️  Collection name: {state.config.collection_name}")
+        state.write(f"   💾 Storage path: {store.persist_directory}")
 
     except CliError as exc:
         handle_cli_error(exc)
@@ -304,9 +304,9 @@ def stats(config: Optional[Path], detailed: bool) -> None:
             state.write(heading)
             state.write("=" * 40)
 
-        total_chunks = store.get_document_count()
-        source_files = store.get_unique_source_files()
-        total_files = len(source_files)
+        collection_stats = store.get_collection_stats()
+        total_chunks = collection_stats.total_chunks
+        total_files = collection_stats.source_files
 
         if total_chunks == 0:
             state.write("\n❌ No documents in collection")
@@ -323,8 +323,7 @@ def stats(config: Optional[Path], detailed: bool) -> None:
             overview.add_row("📁 Source Files", f"{total_files:,}")
             overview.add_row("📈 Avg Chunks/File", f"{avg_chunks:.1f}")
             if detailed:
-                documents = store.list_documents(None)
-                total_content_length = sum(doc["content_length"] for doc in documents)
+                total_content_length = collection_stats.total_content_length
                 if total_content_length:
                     overview.add_row("📏 Total Content", f"{total_content_length:,} chars")
                     overview.add_row(
@@ -339,21 +338,9 @@ def stats(config: Optional[Path], detailed: bool) -> None:
             state.write(f"   📈 Average chunks per file: {avg_chunks:.1f}")
 
         if detailed:
-            documents = store.list_documents(None)
-            file_types = {}
-            tag_frequency = {}
-            total_content = 0
-            for doc in documents:
-                metadata = doc["metadata"]
-                source_file = metadata.get("source_file", "")
-                if source_file:
-                    ext = Path(source_file).suffix or "no extension"
-                    file_types[ext] = file_types.get(ext, 0) + 1
-                total_content += doc["content_length"]
-                tags = metadata.get("tags", "")
-                for tag in (item.strip() for item in tags.split(",")):
-                    if tag:
-                        tag_frequency[tag] = tag_frequency.get(tag, 0) + 1
+            file_types = collection_stats.file_types
+            tag_frequency = collection_stats.tag_frequency
+            total_content = collection_stats.total_content_length
 
             if state.rich and file_types:
                 table = state.rich.Table(title="File Type Distribution", show_header=True)
@@ -384,9 +371,8 @@ def stats(config: Optional[Path], detailed: bool) -> None:
                 state.write(f"\n📏 Total content: {total_content:,} characters")
                 state.write(f"📊 Average chunk size: {total_content / total_chunks:.0f} characters")
 
-        verification = store.verify_embeddings()
-        state.write(f"\nCollection: {verification.get('collection_name', 'Unknown')}")
-        state.write(f"Storage: {verification.get('persist_directory', 'Unknown')}")
+        state.write(f"\nCollection: {state.config.collection_name}")
+        state.write(f"Storage: {store.persist_directory}")
 
     except CliError as exc:
         handle_cli_error(exc)
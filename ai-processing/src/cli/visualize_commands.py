@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import click
 
 from src.cli_support import CliError, create_state
+from src.core.article_index_store import default_article_index_sqlite_path, open_article_index
+from src.core.embedding_neighbors import open_embedding_neighbor_store, update_embedding_neighbors
 from src.core.embedding_store import EmbeddingStore
-from src.core.layout import compute_fallback_layout, compute_layout_from_embeddings, compute_nearest_neighbors
+from src.core.layout import LAYOUT_METHODS, compute_fallback_layout, compute_nearest_neighbors
+from src.core.layout_store import open_layout_store, update_layout
 from src.core.metadata_index import (
     INDEX_RELATIVE_PATH,
     build_metadata_index,
-    load_existing_index,
     save_index,
 )
 
@@ -39,11 +41,26 @@ def visualize() -> None:
     type=click.Path(exists=True, path_type=Path),
     help="Configuration file path (default: config.yaml)",
 )
+@click.option(
+    "--refit-layout",
+    is_flag=True,
+    help="Refit the layout projection on all articles instead of placing only new or changed ones",
+)
+@click.option(
+    "--layout",
+    "layout_method",
+    type=click.Choice(LAYOUT_METHODS),
+    default="auto",
+    show_default=True,
+    help="Projection engine: UMAP if installed else PCA (auto), umap, pca (fast preview), or relaxed PCA",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed output")
 def build_index(
     documents_root: Optional[Path],
     index_path: Optional[Path],
     config: Optional[Path],
+    refit_layout: bool,
+    layout_method: str,
     verbose: bool,
 ) -> None:
     """Rebuild the article metadata index from markdown documents."""
@@ -69,20 +86,29 @@ def build_index(
         state.write(f"⚠️  Skipping embedding/layout step (failed to init store): {exc}")
         store = None
 
-    # Collect an article-level embedding by averaging chunk embeddings per source file.
-    article_embeddings: Dict[str, List[float]] = {}
+    # Collect an article-level embedding by averaging chunk embeddings per source
+    # file, in one streamed scan of the collection.
+    article_embeddings: Dict[str, Any] = {}
     if store is not None:
-        for article in index.values():
-            try:
-                vector = store.get_article_embedding(docs_root / article.path)
-                if vector is not None:
-                    article_embeddings[article.id] = list(vector)
-            except Exception:
-                continue
+        sources = {docs_root / article.path: article.id for article in index.values()}
+        vectors = store.get_article_embeddings(sources)
+        article_embeddings = {
+            article_id: vectors[str(path)] for path, article_id in sources.items() if str(path) in vectors
+        }
 
     if article_embeddings:
         state.write(f"🧠 Found embeddings for {len(article_embeddings)} articles")
-        layout_coords = compute_layout_from_embeddings(article_embeddings)
+        layout_update = update_layout(
+            open_layout_store(target_index), article_embeddings, refit=refit_layout, method=layout_method
+        )
+        layout_coords = layout_update.coords
+        if layout_update.refitted:
+            state.write(f"📐 Fitted layout projection on {len(layout_coords)} articles")
+        else:
+            state.write(
+                f"📐 Layout v{layout_update.version}: placed {len(layout_update.placed)}, "
+                f"removed {len(layout_update.removed)}"
+            )
         # Provide deterministic coordinates for articles missing embeddings.
         fallback_coords = compute_fallback_layout(index.keys())
         fallback_coords.update(layout_coords)
@@ -91,8 +117,20 @@ def build_index(
         state.write("ℹ️  No embeddings found for articles; using fallback layout")
         layout_coords = compute_fallback_layout(index.keys())
 
-    # (3) Compute k-nearest neighbors based on layout coordinates
-    neighbors_map = compute_nearest_neighbors(layout_coords, k=5)
+    # (3) Neighbors: embedding space where vectors exist (incremental, persisted),
+    # 2D layout distance for the rest.
+    neighbors_map: Dict[str, List[str]] = {}
+    if article_embeddings:
+        neighbor_store = open_embedding_neighbor_store(target_index)
+        update = update_embedding_neighbors(neighbor_store, article_embeddings)
+        neighbors_map.update(update.neighbors)
+        state.write(
+            f"🧭 Embedding neighbors v{update.version}: recomputed {len(update.recomputed)}, "
+            f"reused {len(update.neighbors) - len(update.recomputed)}"
+        )
+    if any(article_id not in neighbors_map for article_id in layout_coords):
+        for article_id, neighbors in compute_nearest_neighbors(layout_coords, k=5).items():
+            neighbors_map.setdefault(article_id, neighbors)
 
     # (4) Persist x,y and neighbors back into metadata index
     for article_id, (x, y) in layout_coords.items():
@@ -142,7 +180,9 @@ def print_index(
     docs_root = documents_root or Path(state.config.mcp.paths.documents_root).expanduser().resolve()
     target_index = index_path or (docs_root / INDEX_RELATIVE_PATH)
 
-    index = load_existing_index(target_index)
+    index = {}
+    if target_index.exists() or default_article_index_sqlite_path(target_index).exists():
+        index = open_article_index(target_index).load_all()
     if not index:
         state.write("(no index entries found)")
         return
@@ -152,4 +192,50 @@ def print_index(
         state.write(f"- {article.id} :: {article.title} [{', '.join(article.tags)}]")
 
 
+@visualize.command(name="export-index")
+@click.option(
+    "--documents-root",
+    "documents_root",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Root directory containing markdown documents (default: config.mcp.paths.documents_root)",
+)
+@click.option(
+    "--index-path",
+    type=click.Path(path_type=Path),
+    help="Override path for the index file (JSON)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the JSON export here instead of the index path",
+)
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True, path_type=Path),
+    help="Configuration file path (default: config.yaml)",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show detailed output")
+def export_index(
+    documents_root: Optional[Path],
+    index_path: Optional[Path],
+    output: Optional[Path],
+    config: Optional[Path],
+    verbose: bool,
+) -> None:
+    """Export the SQLite article index to the legacy articles.json format."""
+
+    state = create_state(config, verbose)
+
+    docs_root = documents_root or Path(state.config.mcp.paths.documents_root).expanduser().resolve()
+    target_index = index_path or (docs_root / INDEX_RELATIVE_PATH)
+    if not default_article_index_sqlite_path(target_index).exists():
+        raise CliError(f"Article index not found: {default_article_index_sqlite_path(target_index)}")
+
+    destination = output or target_index
+    count = open_article_index(target_index).export_json(destination)
+    state.write(f"📤 Exported {count} articles to {destination}")
+
+
 __all__ = ["visualize"]
@@ -0,0 +1,561 @@
+"""SQLite-backed storage for the article metadata index.
+
+One row per article replaces the monolithic ``articles.json`` so single
+article updates and deletes touch one row instead of rewriting the file,
+and concurrent writers are serialized by SQLite instead of racing on a
+read-modify-write of the JSON document.
+
+``articles.json`` remains available as an export for compatibility; the
+SQLite file lives next to it (``articles.sqlite``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metadata_index import ArticleMetadata, article_from_mapping, load_existing_index, write_json_index
+
+_COLUMNS = (
+    "id",
+    "path",
+    "title",
+    "topic",
+    "tags_json",
+    "created_at",
+    "updated_at",
+    "word_count",
+    "excerpt",
+    "read_status",
+    "x",
+    "y",
+    "neighbors_json",
+    "file_size",
+)
+
+_SQL_UPSERT_ARTICLE = f"""
+INSERT INTO articles({", ".join(_COLUMNS)})
+VALUES({", ".join("?" for _ in _COLUMNS)})
+ON CONFLICT(id) DO UPDATE SET
+  {", ".join(f"{column}=excluded.{column}" for column in _COLUMNS[1:])};
+"""
+
+_SQL_SELECT_ARTICLES = f"SELECT {', '.join(_COLUMNS)} FROM articles"
+
+# Fields update_fields() may change, mapped to their column names.
+_UPDATABLE_FIELDS = {
+    "path": "path",
+    "title": "title",
+    "topic": "topic",
+    "tags": "tags_json",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "word_count": "word_count",
+    "excerpt": "excerpt",
+    "read_status": "read_status",
+    "x": "x",
+    "y": "y",
+    "neighbors": "neighbors_json",
+    "file_size": "file_size",
+}
+
+
+def _article_to_params(article: ArticleMetadata) -> tuple[Any, ...]:
+    return (
+        article.id,
+        article.path,
+        article.title,
+        article.topic,
+        json.dumps(list(article.tags)),
+        article.created_at_iso,
+        article.updated_at_iso,
+        int(article.word_count),
+        article.excerpt,
+        article.read_status,
+        article.x,
+        article.y,
+        json.dumps(article.neighbors) if article.neighbors is not None else None,
+        article.file_size,
+    )
+
+
+def _field_to_column_value(field: str, value: Any) -> Any:
+    if field == "tags":
+        return json.dumps(list(value or []))
+    if field == "neighbors":
+        return json.dumps(value) if value is not None else None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _row_to_article(row: sqlite3.Row) -> ArticleMetadata:
+    return article_from_mapping(
+        {
+            "id": row["id"],
+            "path": row["path"],
+            "title": row["title"],
+            "topic": row["topic"],
+            "tags": json.loads(row["tags_json"] or "[]"),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "word_count": row["word_count"] or 0,
+            "excerpt": row["excerpt"] or "",
+            "read_status": row["read_status"],
+            "x": row["x"],
+            "y": row["y"],
+            "neighbors": json.loads(row["neighbors_json"]) if row["neighbors_json"] is not None else None,
+            "file_size": row["file_size"],
+        }
+    )
+
+
+@dataclass(frozen=True)
+class ArticleIndexStoreConfig:
+    sqlite_path: Path
+
+
+def default_article_index_sqlite_path(index_path: Path) -> Path:
+    """Return the SQLite path that backs a (legacy) ``articles.json`` path."""
+
+    return Path(index_path).with_suffix(".sqlite")
+
+
+class ArticleIndexStore:
+    """SQLite-backed article metadata index (one row per article)."""
+
+    def __init__(self, config: ArticleIndexStoreConfig):
+        self._path = config.sqlite_path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection per store, shared across threads and serialized by
+        # the lock (as in ProcessingStateStore); the schema is created when
+        # it is opened.
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.initialize()
+
+    @property
+    def sqlite_path(self) -> Path:
+        return self._path
+
+    def connect(self) -> sqlite3.Connection:
+        """Return the store's connection, opening it on first use."""
+        with self._lock:
+            if self._conn is not None and not self._path.exists():
+                # The database was deleted underneath us (e.g. a rebuild); start a fresh one.
+                self.close()
+            if self._conn is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self._path), timeout=30, isolation_level=None, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL;")
+                conn.execute("PRAGMA synchronous=NORMAL;")
+                conn.execute("PRAGMA foreign_keys=ON;")
+                self._create_schema(conn)
+                self._conn = conn
+            return self._conn
+
+    def close(self) -> None:
+        """Close the connection; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                finally:
+                    self._conn = None
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self.connect()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction and bump the index generation on commit.
+
+        BEGIN IMMEDIATE takes the write lock up front so concurrent writers
+        queue (up to the connection timeout) instead of failing mid-update.
+        The generation is only bumped when the transaction changed a row, so
+        no-op updates and deletes leave caches keyed on it valid.
+        """
+
+        with self._lock:
+            conn = self.connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = conn.total_changes
+                yield conn
+                if conn.total_changes != before:
+                    conn.execute(
+                        "INSERT INTO index_meta(key, value) VALUES('generation', '1') "
+                        "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def initialize(self) -> None:
+        """Open the database and create the schema if needed."""
+        self.connect()
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+              id TEXT PRIMARY KEY,
+              path TEXT NOT NULL,
+              title TEXT NOT NULL,
+              topic TEXT NULL,
+              tags_json TEXT NOT NULL,
+              created_at TEXT NOT NULL,
+              updated_at TEXT NOT NULL,
+              word_count INTEGER NOT NULL DEFAULT 0,
+              excerpt TEXT NOT NULL DEFAULT '',
+              read_status TEXT NOT NULL DEFAULT 'unread',
+              x REAL NULL,
+              y REAL NULL,
+              neighbors_json TEXT NULL,
+              file_size INTEGER NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_articles_path ON articles(path);
+            CREATE INDEX IF NOT EXISTS idx_articles_topic ON articles(topic);
+            CREATE INDEX IF NOT EXISTS idx_articles_read_status ON articles(read_status);
+            CREATE INDEX IF NOT EXISTS idx_articles_updated_at ON articles(updated_at);
+
+            -- Tags are denormalized into a child table so tag filters can use an index.
+            CREATE TABLE IF NOT EXISTS article_tags (
+              article_id TEXT NOT NULL,
+              tag TEXT NOT NULL,
+              PRIMARY KEY(article_id, tag),
+              FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_article_tags_tag ON article_tags(tag);
+
+            CREATE TABLE IF NOT EXISTS index_meta (
+              key TEXT PRIMARY KEY,
+              value TEXT NOT NULL
+            );
+            """
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_generation(self) -> int:
+        """Return a counter that increases with every committed write."""
+        with self._read() as conn:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'generation'").fetchone()
+        return int(row["value"]) if row else 0
+
+    def count(self) -> int:
+        with self._read() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        return int(row[0]) if row else 0
+
+    def get(self, article_id: str) -> Optional[ArticleMetadata]:
+        with self._read() as conn:
+            row = conn.execute(f"{_SQL_SELECT_ARTICLES} WHERE id = ?", (article_id,)).fetchone()
+        return _row_to_article(row) if row else None
+
+    def load_all(self) -> Dict[str, ArticleMetadata]:
+        """Return every article keyed by id (the shape of the legacy JSON index)."""
+        return self.snapshot()[1]
+
+    def snapshot(self) -> Tuple[int, Dict[str, ArticleMetadata]]:
+        """Return (generation, articles) read from one consistent transaction."""
+        with self._read() as conn:
+            conn.execute("BEGIN")
+            try:
+                row = conn.execute("SELECT value FROM index_meta WHERE key = 'generation'").fetchone()
+                rows = conn.execute(f"{_SQL_SELECT_ARTICLES} ORDER BY id").fetchall()
+            finally:
+                conn.execute("COMMIT")
+        generation = int(row["value"]) if row else 0
+        return generation, {str(row["id"]): _row_to_article(row) for row in rows}
+
+    def query(
+        self,
+        *,
+        topic: Optional[str] = None,
+        tag: Optional[str] = None,
+        read_status: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> List[ArticleMetadata]:
+        """Return articles matching all given filters, ordered by id."""
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        if topic is not None:
+            clauses.append("topic = ?")
+            params.append(topic)
+        if read_status is not None:
+            clauses.append("read_status = ?")
+            params.append(read_status)
+        if updated_since is not None:
+            clauses.append("updated_at >= ?")
+            params.append(updated_since.isoformat())
+        if tag is not None:
+            clauses.append("id IN (SELECT article_id FROM article_tags WHERE tag = ?)")
+            params.append(tag)
+
+        sql = _SQL_SELECT_ARTICLES
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+
+        with self._read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [_row_to_article(row) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _write_articles(conn: sqlite3.Connection, articles: List[ArticleMetadata]) -> None:
+        conn.executemany(_SQL_UPSERT_ARTICLE, [_article_to_params(article) for article in articles])
+        conn.executemany("DELETE FROM article_tags WHERE article_id = ?", [(article.id,) for article in articles])
+        conn.executemany(
+            "INSERT OR IGNORE INTO article_tags(article_id, tag) VALUES(?, ?)",
+            [(article.id, str(tag)) for article in articles for tag in article.tags],
+        )
+
+    def upsert_many(self, articles: Iterable[ArticleMetadata]) -> int:
+        items = list(articles)
+        if not items:
+            return 0
+        with self._write() as conn:
+            self._write_articles(conn, items)
+        return len(items)
+
+    def upsert(self, article: ArticleMetadata) -> None:
+        self.upsert_many([article])
+
+    def replace_all(self, index: Dict[str, ArticleMetadata]) -> None:
+        """Make the table match ``index`` exactly (rows not in it are removed)."""
+        with self._write() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids(id TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM keep_ids")
+            conn.executemany("INSERT OR IGNORE INTO keep_ids(id) VALUES(?)", [(key,) for key in index])
+            conn.execute("DELETE FROM articles WHERE id NOT IN (SELECT id FROM keep_ids)")
+            self._write_articles(conn, list(index.values()))
+
+    def update_fields(self, article_id: str, **fields: Any) -> bool:
+        """Update selected columns of one article; returns False if it does not exist."""
+
+        unknown = set(fields) - set(_UPDATABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown article fields: {', '.join(sorted(unknown))}")
+        if not fields:
+            return self.get(article_id) is not None
+
+        assignments = ", ".join(f"{_UPDATABLE_FIELDS[name]} = ?" for name in fields)
+        params = [_field_to_column_value(name, value) for name, value in fields.items()]
+
+        with self._write() as conn:
+            cursor = conn.execute(f"UPDATE articles SET {assignments} WHERE id = ?", (*params, article_id))
+            if cursor.rowcount == 0:
+                return False
+            if "tags" in fields:
+                conn.execute("DELETE FROM article_tags WHERE article_id = ?", (article_id,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO article_tags(article_id, tag) VALUES(?, ?)",
+                    [(article_id, str(tag)) for tag in fields["tags"] or []],
+                )
+        return True
+
+    def update_positions(self, positions: Dict[str, Tuple[float, float, List[str]]]) -> int:
+        """Set x/y/neighbors for many articles in one transaction; returns rows updated.
+
+        Only the layout columns are written, so concurrent edits to other
+        fields (read status, tags) are preserved.
+        """
+
+        if not positions:
+            return 0
+        with self._write() as conn:
+            cursor = conn.executemany(
+                "UPDATE articles SET x = ?, y = ?, neighbors_json = ? WHERE id = ?",
+                [
+                    (float(x), float(y), _field_to_column_value("neighbors", neighbors), article_id)
+                    for article_id, (x, y, neighbors) in positions.items()
+                ],
+            )
+        return cursor.rowcount
+
+    def delete(self, article_id: str) -> bool:
+        with self._write() as conn:
+            cursor = conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
+        return cursor.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Legacy JSON compatibility
+    # ------------------------------------------------------------------
+
+    def migrate_from_json(self, json_path: Path) -> int:
+        """Import a legacy ``articles.json``; returns the number of articles imported."""
+        index = load_existing_index(json_path)
+        if index:
+            self.upsert_many(index.values())
+        return len(index)
+
+    def export_json(self, json_path: Path) -> int:
+        """Write the index in the legacy ``articles.json`` format."""
+        index = self.load_all()
+        write_json_index(index, json_path)
+        return len(index)
+
+
+def open_article_index(index_path: Path) -> ArticleIndexStore:
+    """Open the SQLite index backing ``index_path`` (an ``articles.json`` path).
+
+    On first use an existing legacy JSON index is imported.
+    """
+
+    sqlite_path = default_article_index_sqlite_path(index_path)
+    is_new = not sqlite_path.exists()
+    store = ArticleIndexStore(ArticleIndexStoreConfig(sqlite_path=sqlite_path))
+    if is_new and Path(index_path).exists():
+        store.migrate_from_json(index_path)
+    return store
+
+
+class ArticleIndexCache:
+    """Parsed article index held in memory and shared across requests.
+
+    Reads are served from memory. Before each read the cache compares the
+    stat signature of the SQLite file and its WAL with the one it loaded
+    from; a change (e.g. a CLI rebuild) triggers a reload. Writes made
+    through the cache update SQLite and patch the cached entry, so they do
+    not force a reload unless another writer committed in between.
+
+    ``version`` is the store generation of the cached data and can be used
+    as a validator (ETag) for responses derived from it.
+    """
+
+    def __init__(self, store: ArticleIndexStore):
+        self.store = store
+        self._lock = threading.RLock()
+        self._index: Optional[Dict[str, ArticleMetadata]] = None
+        self._version = 0
+        self._signature: Optional[Tuple[Any, ...]] = None
+
+    def _file_signature(self) -> Tuple[Any, ...]:
+        signature: List[Any] = []
+        for path in (self.store.sqlite_path, Path(f"{self.store.sqlite_path}-wal")):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _ensure_loaded(self) -> Dict[str, ArticleMetadata]:
+        signature = self._file_signature()
+        if self._index is None or signature != self._signature:
+            self._version, self._index = self.store.snapshot()
+            self._signature = signature
+        return self._index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._index = None
+            self._signature = None
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return self._version
+
+    def snapshot(self) -> Tuple[int, Dict[str, ArticleMetadata]]:
+        """Return (version, articles). Treat the mapping and its values as read-only."""
+        with self._lock:
+            index = self._ensure_loaded()
+            return self._version, index
+
+    def get(self, article_id: str) -> Optional[ArticleMetadata]:
+        """Return a copy of one article (safe for the caller to modify)."""
+        with self._lock:
+            article = self._ensure_loaded().get(article_id)
+        return article.copy() if article is not None else None
+
+    def _after_write(self, expected_version: int, apply: Any) -> None:
+        # Patch the cache only if no other writer committed since our snapshot.
+        # ``apply`` is None when our write matched no row and so did not bump
+        # the generation. Copy-on-write so readers iterating an earlier
+        # snapshot are unaffected.
+        version = self.store.get_generation()
+        if apply is None and version == expected_version:
+            return
+        if self._index is not None and apply is not None and version == expected_version + 1:
+            index = dict(self._index)
+            apply(index)
+            self._index = index
+            self._version = version
+            self._signature = self._file_signature()
+        else:
+            self._index = None
+            self._signature = None
+
+    def update_fields(self, article_id: str, **fields: Any) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            expected = self._version
+            if not self.store.update_fields(article_id, **fields):
+                self._after_write(expected, None)
+                return False
+
+            def apply(index: Dict[str, ArticleMetadata]) -> None:
+                current = index.get(article_id)
+                if current is not None:
+                    index[article_id] = current.copy(**fields)
+
+            self._after_write(expected, apply)
+            return True
+
+    def update_positions(self, positions: Dict[str, Tuple[float, float, List[str]]]) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            expected = self._version
+            updated = self.store.update_positions(positions)
+
+            def apply(index: Dict[str, ArticleMetadata]) -> None:
+                for article_id, (x, y, neighbors) in positions.items():
+                    current = index.get(article_id)
+                    if current is not None:
+                        index[article_id] = current.copy(x=float(x), y=float(y), neighbors=list(neighbors))
+
+            if positions:
+                self._after_write(expected, apply if updated else None)
+            return updated
+
+    def delete(self, article_id: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            expected = self._version
+            deleted = self.store.delete(article_id)
+            self._after_write(expected, (lambda index: index.pop(article_id, None)) if deleted else None)
+            return deleted
+
+
+__all__ = [
+    "ArticleIndexCache",
+    "ArticleIndexStore",
+    "ArticleIndexStoreConfig",
+    "default_article_index_sqlite_path",
+    "open_article_index",
+]
@@ -0,0 +1,376 @@
+"""Canonical article ids shared by the embedding store, taxonomy and article index.
+
+The subsystems name the same article differently: chunks carry the
+``source_file`` they were read from (usually an absolute path), the taxonomy
+pipeline keys articles by whatever id the chunks had, and the metadata index
+uses the path relative to the documents root. Matching them used to mean
+trying several spellings and resolving paths on the filesystem for every
+article on every run.
+
+The registry records each article once, under its *canonical id* (the
+docs-root-relative POSIX path, or the absolute path for files outside the
+root), together with its relative and absolute path and a content hash.
+Every other spelling seen for it (``source_file`` strings, frontmatter ids,
+pipeline ids) is stored as an alias, so mapping any of them to the canonical
+id is one indexed lookup and paths are resolved only the first time an
+article is registered.
+
+The database (``article_registry.sqlite``) lives in the documents root's
+``.prismweave`` directory, next to ``taxonomy.sqlite``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REGISTRY_RELATIVE_PATH = Path(".prismweave/article_registry.sqlite")
+
+# SQLite's default limit on host parameters is 999; stay well below it.
+_CHUNK_SIZE = 500
+
+
+def default_article_registry_path(documents_root: Path) -> Path:
+    return Path(documents_root) / REGISTRY_RELATIVE_PATH
+
+
+def bytes_content_hash(data: bytes) -> str:
+    """Content hash of raw file bytes, the hash ``GitTracker`` records for processed files."""
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_content_hash(path: Path) -> str:
+    """Content hash of a file (see ``bytes_content_hash``)."""
+
+    return bytes_content_hash(Path(path).read_bytes())
+
+
+@dataclass(frozen=True)
+class ArticleRegistryConfig:
+    sqlite_path: Path
+    documents_root: Path
+
+
+@dataclass(frozen=True)
+class ArticleRef:
+    id: str
+    relative_path: Optional[str]
+    absolute_path: str
+    content_hash: Optional[str] = None
+
+
+class ArticleRegistry:
+    """SQLite-backed mapping of canonical article ids to paths, hashes and aliases."""
+
+    def __init__(self, config: ArticleRegistryConfig):
+        self._path = config.sqlite_path
+        self._root = Path(config.documents_root).expanduser().resolve()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.connect()
+
+    @property
+    def sqlite_path(self) -> Path:
+        return self._path
+
+    @property
+    def documents_root(self) -> Path:
+        return self._root
+
+    def connect(self) -> sqlite3.Connection:
+        """The registry's connection, opened (and the schema created) on first use.
+
+        One connection per registry, shared across threads and serialized by
+        ``_lock``, so registering a file does not pay for a new connection.
+        """
+
+        with self._lock:
+            if self._conn is not None and not self._path.exists():
+                # The database was deleted underneath us; start a fresh one.
+                self.close()
+            if self._conn is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self._path), timeout=30.0, isolation_level=None, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL;")
+                self._initialize(conn)
+                self._conn = conn
+            return self._conn
+
+    def close(self) -> None:
+        """Close the connection; it is reopened on next use."""
+
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                finally:
+                    self._conn = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = self.connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _initialize(conn: sqlite3.Connection) -> None:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS article_registry (
+              id TEXT PRIMARY KEY,
+              relative_path TEXT NULL UNIQUE,
+              absolute_path TEXT NOT NULL UNIQUE,
+              content_hash TEXT NULL,
+              updated_at REAL NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS article_aliases (
+              alias TEXT PRIMARY KEY,
+              article_id TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_article_aliases_article_id ON article_aliases(article_id);
+            """
+        )
+
+    # -- path handling ----------------------------------------------------
+
+    def canonical_paths(self, path: Path | str) -> Tuple[str, Optional[str], str]:
+        """(canonical id, relative path, absolute path) of a file; resolves the path."""
+
+        path = Path(path).expanduser()
+        absolute = (path if path.is_absolute() else self._root / path).resolve()
+        try:
+            relative: Optional[str] = absolute.relative_to(self._root).as_posix()
+        except ValueError:
+            relative = None
+        return relative if relative is not None else str(absolute), relative, str(absolute)
+
+    def _absolute(self, relative_path: str) -> str:
+        # Joined as strings: the relative path came from a scan of the root.
+        return os.path.join(str(self._root), *relative_path.split("/"))
+
+    # -- writes -----------------------------------------------------------
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, ref: ArticleRef, aliases: Iterable[str]) -> None:
+        # Another row may hold either path (e.g. a file registered by its
+        # absolute path before it moved under the root); the new row wins.
+        stale = [
+            row[0]
+            for row in conn.execute(
+                "SELECT id FROM article_registry WHERE id != ? AND (absolute_path = ? OR relative_path = ?)",
+                (ref.id, ref.absolute_path, ref.relative_path),
+            )
+        ]
+        for article_id in stale:
+            conn.execute("UPDATE article_aliases SET article_id = ? WHERE article_id = ?", (ref.id, article_id))
+            conn.execute("DELETE FROM article_registry WHERE id = ?", (article_id,))
+        conn.execute(
+            """
+            INSERT INTO article_registry(id, relative_path, absolute_path, content_hash, updated_at)
+            VALUES(?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+              relative_path=excluded.relative_path,
+              absolute_path=excluded.absolute_path,
+              content_hash=COALESCE(excluded.content_hash, article_registry.content_hash),
+              updated_at=excluded.updated_at;
+            """,
+            (ref.id, ref.relative_path, ref.absolute_path, ref.content_hash, time.time()),
+        )
+        names = {ref.id, ref.absolute_path, *aliases}
+        if ref.relative_path is not None:
+            names.add(ref.relative_path)
+        conn.executemany(
+            "INSERT OR REPLACE INTO article_aliases(alias, article_id) VALUES(?, ?)",
+            [(name, ref.id) for name in names if name],
+        )
+
+    def register(
+        self, path: Path | str, *, content_hash: Optional[str] = None, aliases: Iterable[str] = ()
+    ) -> ArticleRef:
+        """Record a file under its canonical id; ``str(path)`` becomes an alias too.
+
+        A ``content_hash`` of None keeps the hash already stored.
+        """
+
+        article_id = self.register_many([(path, content_hash, aliases)])[0]
+        ref = self.get(article_id)
+        assert ref is not None
+        return ref
+
+    def register_many(self, entries: Iterable[Tuple[Path | str, Optional[str], Iterable[str]]]) -> List[str]:
+        """``register`` for ``(path, content hash, aliases)`` entries in one transaction; returns their ids."""
+
+        ids: List[str] = []
+        with self._transaction() as conn:
+            for path, content_hash, aliases in entries:
+                article_id, relative, absolute = self.canonical_paths(path)
+                ref = ArticleRef(
+                    id=article_id, relative_path=relative, absolute_path=absolute, content_hash=content_hash
+                )
+                self._upsert(conn, ref, [str(path), *aliases])
+                ids.append(article_id)
+        return ids
+
+    def register_relative(self, entries: Iterable[Tuple[str, Optional[str], Iterable[str]]]) -> int:
+        """Record ``(relative path, content hash, aliases)`` entries from a scan of the root.
+
+        No path is resolved; relative paths must already be canonical.
+        Returns the number of entries written.
+        """
+
+        count = 0
+        with self._transaction() as conn:
+            for relative_path, content_hash, aliases in entries:
+                ref = ArticleRef(
+                    id=relative_path,
+                    relative_path=relative_path,
+                    absolute_path=self._absolute(relative_path),
+                    content_hash=content_hash,
+                )
+                self._upsert(conn, ref, aliases)
+                count += 1
+        return count
+
+    def rename(self, old_path: Path | str, new_path: Path | str) -> Optional[ArticleRef]:
+        """Move an article to a new path; its old spellings stay aliases of the new id."""
+
+        old = self.resolve(str(old_path))
+        if old is None:
+            return self.register(new_path)
+        article_id, relative, absolute = self.canonical_paths(new_path)
+        ref = ArticleRef(id=article_id, relative_path=relative, absolute_path=absolute, content_hash=old.content_hash)
+        with self._transaction() as conn:
+            if old.id != article_id:
+                conn.execute("DELETE FROM article_registry WHERE id = ?", (old.id,))
+                conn.execute("UPDATE article_aliases SET article_id = ? WHERE article_id = ?", (article_id, old.id))
+            self._upsert(conn, ref, [str(new_path)])
+        return self.get(article_id)
+
+    def remove(self, key: str) -> bool:
+        """Forget the article any alias ``key`` refers to."""
+
+        with self._transaction() as conn:
+            row = conn.execute("SELECT article_id FROM article_aliases WHERE alias = ?", (str(key),)).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM article_aliases WHERE article_id = ?", (row[0],))
+            conn.execute("DELETE FROM article_registry WHERE id = ?", (row[0],))
+        return True
+
+    def retain_relative(self, relative_paths: Iterable[str], *, suffixes: Optional[Iterable[str]] = None) -> int:
+        """Drop articles under the root whose relative path is not in ``relative_paths``.
+
+        Only paths ending in one of ``suffixes`` are considered (all when
+        None), so a scan of one file type leaves the others registered.
+        Articles outside the root are kept. Returns the number removed.
+        """
+
+        keep = set(relative_paths)
+        scanned = tuple(suffixes) if suffixes is not None else ("",)
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT id, relative_path FROM article_registry WHERE relative_path IS NOT NULL")
+            gone = [row[0] for row in rows if row[1] not in keep and row[1].endswith(scanned)]
+            for start in range(0, len(gone), _CHUNK_SIZE):
+                chunk = gone[start : start + _CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                conn.execute(f"DELETE FROM article_aliases WHERE article_id IN ({placeholders})", chunk)
+                conn.execute(f"DELETE FROM article_registry WHERE id IN ({placeholders})", chunk)
+        return len(gone)
+
+    # -- reads ------------------------------------------------------------
+
+    @staticmethod
+    def _ref(row: sqlite3.Row) -> ArticleRef:
+        return ArticleRef(
+            id=row["id"],
+            relative_path=row["relative_path"],
+            absolute_path=row["absolute_path"],
+            content_hash=row["content_hash"],
+        )
+
+    def get(self, article_id: str) -> Optional[ArticleRef]:
+        with self._lock:
+            conn = self.connect()
+            row = conn.execute("SELECT * FROM article_registry WHERE id = ?", (article_id,)).fetchone()
+        return self._ref(row) if row is not None else None
+
+    def resolve(self, key: str) -> Optional[ArticleRef]:
+        """The article an id, path or alias refers to, or None if unknown."""
+
+        return self.resolve_many([key]).get(key)
+
+    def resolve_many(self, keys: Iterable[str]) -> Dict[str, ArticleRef]:
+        """Map each known id, path or alias in ``keys`` to its article (unknown keys are left out)."""
+
+        wanted = list(dict.fromkeys(str(key) for key in keys))
+        out: Dict[str, ArticleRef] = {}
+        with self._lock:
+            conn = self.connect()
+            for start in range(0, len(wanted), _CHUNK_SIZE):
+                chunk = wanted[start : start + _CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"""
+                    SELECT a.alias, r.*
+                    FROM article_aliases a JOIN article_registry r ON r.id = a.article_id
+                    WHERE a.alias IN ({placeholders})
+                    """,
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    out[row["alias"]] = self._ref(row)
+        return out
+
+    def aliases(self, article_id: str) -> List[str]:
+        """Every spelling recorded for an article, its canonical id included."""
+
+        with self._lock:
+            conn = self.connect()
+            rows = conn.execute(
+                "SELECT alias FROM article_aliases WHERE article_id = ? ORDER BY alias", (article_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_articles(self) -> List[ArticleRef]:
+        with self._lock:
+            conn = self.connect()
+            rows = conn.execute("SELECT * FROM article_registry ORDER BY id").fetchall()
+        return [self._ref(row) for row in rows]
+
+
+def open_article_registry(documents_root: Path) -> ArticleRegistry:
+    """Open the registry that belongs to a documents root."""
+
+    return ArticleRegistry(
+        ArticleRegistryConfig(sqlite_path=default_article_registry_path(documents_root), documents_root=documents_root)
+    )
+
+
+__all__ = [
+    "ArticleRef",
+    "ArticleRegistry",
+    "ArticleRegistryConfig",
+    "REGISTRY_RELATIVE_PATH",
+    "bytes_content_hash",
+    "default_article_registry_path",
+    "file_content_hash",
+    "open_article_registry",
+]
@@ -0,0 +1,398 @@
+"""Incrementally maintained statistics of the embedding collection.
+
+``/documents/stats`` and the ``stats``/``count`` commands used to list every
+chunk and re-aggregate file types and tags on each call. ``EmbeddingStore``
+now records each file it adds, removes or renames here, keeping per-file
+rows plus running totals (chunks, files, content length), per-extension
+chunk counts and per-tag frequencies, so reading the statistics is a few
+small indexed queries regardless of collection size.
+
+The database (``collection_stats.sqlite``) lives inside the Chroma directory,
+so wiping the collection directory also wipes its statistics. Totals are
+kept per collection name, along with a *generation* that every write bumps;
+the API uses it to tell whether cached responses about the collection are
+still current, including after writes from another process (e.g. the CLI).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+# Aggregate kinds in ``stats_counts``.
+_TOTAL = "total"
+_EXTENSION = "extension"
+_TAG = "tag"
+
+NO_EXTENSION = "no extension"
+
+
+def default_collection_stats_path(chroma_db_path: Path) -> Path:
+    """Return the statistics database that belongs to a Chroma directory."""
+
+    return Path(chroma_db_path) / "collection_stats.sqlite"
+
+
+def file_extension(source_file: str) -> str:
+    return Path(source_file).suffix or NO_EXTENSION
+
+
+def split_tags(tags: Any) -> List[str]:
+    """Tags of one chunk; metadata stores them comma-separated."""
+
+    if not tags:
+        return []
+    if isinstance(tags, (list, tuple)):
+        return [str(tag).strip() for tag in tags if str(tag).strip()]
+    return [tag.strip() for tag in str(tags).split(",") if tag.strip()]
+
+
+@dataclass(frozen=True)
+class CollectionStatsConfig:
+    sqlite_path: Path
+
+
+@dataclass
+class FileStats:
+    """Contribution of one source file to the collection totals."""
+
+    chunks: int = 0
+    content_length: int = 0
+    tags: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Tuple[int, Any]]) -> FileStats:
+        """Build from ``(content_length, tags)`` pairs, one per chunk."""
+
+        stats = cls()
+        tag_counts: Counter = Counter()
+        for content_length, tags in chunks:
+            stats.chunks += 1
+            stats.content_length += int(content_length or 0)
+            tag_counts.update(split_tags(tags))
+        stats.tags = dict(tag_counts)
+        return stats
+
+
+@dataclass
+class CollectionStats:
+    total_chunks: int = 0
+    source_files: int = 0
+    total_content_length: int = 0
+    file_types: Dict[str, int] = field(default_factory=dict)
+    tag_frequency: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def average_chunks_per_file(self) -> Optional[float]:
+        return self.total_chunks / self.source_files if self.source_files else None
+
+    def top_tags(self, limit: int = 10) -> List[Tuple[str, int]]:
+        return sorted(self.tag_frequency.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+def summarize_files(files: Mapping[str, FileStats]) -> CollectionStats:
+    """Aggregate per-file statistics in memory (same result as a snapshot)."""
+
+    summary = CollectionStats(source_files=len(files))
+    file_types: Counter = Counter()
+    tags: Counter = Counter()
+    for source_file, stats in files.items():
+        summary.total_chunks += stats.chunks
+        summary.total_content_length += stats.content_length
+        file_types[file_extension(source_file)] += stats.chunks
+        tags.update(stats.tags)
+    summary.file_types = {key: value for key, value in file_types.items() if value > 0}
+    summary.tag_frequency = dict(tags)
+    return summary
+
+
+class CollectionStatsStore:
+    """SQLite-backed per-file rows and aggregate counters."""
+
+    def __init__(self, config: CollectionStatsConfig):
+        self._path = config.sqlite_path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize()
+
+    @property
+    def sqlite_path(self) -> Path:
+        return self._path
+
+    def connect(self) -> sqlite3.Connection:
+        # Rebuilds delete the whole Chroma directory; recreate the schema then.
+        fresh = not self._path.exists()
+        if fresh:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self._path), timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL;")
+        if fresh:
+            self._create_schema(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _initialize(self) -> None:
+        conn = self.connect()
+        try:
+            self._create_schema(conn)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS stats_collections (
+              collection TEXT PRIMARY KEY,
+              built_at REAL NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS stats_files (
+              collection TEXT NOT NULL,
+              source_file TEXT NOT NULL,
+              extension TEXT NOT NULL,
+              chunks INTEGER NOT NULL,
+              content_length INTEGER NOT NULL,
+              tags_json TEXT NOT NULL,
+              PRIMARY KEY(collection, source_file)
+            );
+
+            CREATE TABLE IF NOT EXISTS stats_counts (
+              collection TEXT NOT NULL,
+              kind TEXT NOT NULL,
+              key TEXT NOT NULL,
+              value INTEGER NOT NULL,
+              PRIMARY KEY(collection, kind, key)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS stats_generations (
+              collection TEXT PRIMARY KEY,
+              generation INTEGER NOT NULL
+            );
+            """
+        )
+
+    # -- internal helpers -------------------------------------------------
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, collection: str, kind: str, deltas: Mapping[str, int]) -> None:
+        rows = [(collection, kind, key, int(delta)) for key, delta in deltas.items() if delta]
+        if not rows:
+            return
+        conn.executemany(
+            "INSERT INTO stats_counts(collection, kind, key, value) VALUES(?, ?, ?, ?) "
+            "ON CONFLICT(collection, kind, key) DO UPDATE SET value = value + excluded.value",
+            rows,
+        )
+        conn.executemany(
+            "DELETE FROM stats_counts WHERE collection = ? AND kind = ? AND key = ? AND value <= 0",
+            [row[:3] for row in rows],
+        )
+
+    @staticmethod
+    def _bump_generation(conn: sqlite3.Connection, collection: str) -> None:
+        # A new row starts from the clock so a wiped database never repeats an
+        # earlier generation.
+        conn.execute(
+            "INSERT INTO stats_generations(collection, generation) VALUES(?, ?) "
+            "ON CONFLICT(collection) DO UPDATE SET generation = generation + 1",
+            (collection, time.time_ns() // 1_000_000),
+        )
+
+    def _apply(
+        self, conn: sqlite3.Connection, collection: str, source_file: str, stats: FileStats, sign: int
+    ) -> None:
+        self._bump(
+            conn,
+            collection,
+            _TOTAL,
+            {"chunks": sign * stats.chunks, "content_length": sign * stats.content_length},
+        )
+        self._bump(conn, collection, _EXTENSION, {file_extension(source_file): sign * stats.chunks})
+        self._bump(conn, collection, _TAG, {tag: sign * count for tag, count in stats.tags.items()})
+
+    @staticmethod
+    def _load_file(conn: sqlite3.Connection, collection: str, source_file: str) -> Optional[FileStats]:
+        row = conn.execute(
+            "SELECT chunks, content_length, tags_json FROM stats_files WHERE collection = ? AND source_file = ?",
+            (collection, source_file),
+        ).fetchone()
+        if row is None:
+            return None
+        return FileStats(chunks=row["chunks"], content_length=row["content_length"], tags=json.loads(row["tags_json"]))
+
+    def _store_file(self, conn: sqlite3.Connection, collection: str, source_file: str, stats: FileStats) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO stats_files(collection, source_file, extension, chunks, content_length, tags_json) "
+            "VALUES(?, ?, ?, ?, ?, ?)",
+            (
+                collection,
+                source_file,
+                file_extension(source_file),
+                stats.chunks,
+                stats.content_length,
+                json.dumps(stats.tags, sort_keys=True),
+            ),
+        )
+
+    def _drop_file(self, conn: sqlite3.Connection, collection: str, source_file: str) -> Optional[FileStats]:
+        existing = self._load_file(conn, collection, source_file)
+        if existing is not None:
+            conn.execute(
+                "DELETE FROM stats_files WHERE collection = ? AND source_file = ?", (collection, source_file)
+            )
+            self._apply(conn, collection, source_file, existing, -1)
+            self._bump(conn, collection, _TOTAL, {"files": -1})
+        return existing
+
+    # -- maintenance ------------------------------------------------------
+
+    def record_add(self, collection: str, source_file: str, stats: FileStats) -> None:
+        """Add a file's chunks (on top of any it already has, as the collection does)."""
+
+        with self._transaction() as conn:
+            existing = self._load_file(conn, collection, source_file)
+            if existing is None:
+                self._bump(conn, collection, _TOTAL, {"files": 1})
+                merged = stats
+            else:
+                tags = Counter(existing.tags)
+                tags.update(stats.tags)
+                merged = FileStats(
+                    chunks=existing.chunks + stats.chunks,
+                    content_length=existing.content_length + stats.content_length,
+                    tags=dict(tags),
+                )
+            self._store_file(conn, collection, source_file, merged)
+            self._apply(conn, collection, source_file, stats, +1)
+            self._bump_generation(conn, collection)
+
+    def record_remove(self, collection: str, source_file: str) -> None:
+        with self._transaction() as conn:
+            self._drop_file(conn, collection, source_file)
+            self._bump_generation(conn, collection)
+
+    def record_rename(self, collection: str, old_source_file: str, new_source_file: str) -> None:
+        with self._transaction() as conn:
+            self._bump_generation(conn, collection)
+            moved = self._drop_file(conn, collection, old_source_file)
+            if moved is None:
+                return
+            self._drop_file(conn, collection, new_source_file)
+            self._store_file(conn, collection, new_source_file, moved)
+            self._apply(conn, collection, new_source_file, moved, +1)
+            self._bump(conn, collection, _TOTAL, {"files": 1})
+
+    def replace_all(self, collection: str, files: Mapping[str, FileStats]) -> None:
+        """Rebuild a collection's statistics from scratch (``source_file -> FileStats``)."""
+
+        with self._transaction() as conn:
+            self._clear(conn, collection)
+            for source_file, stats in files.items():
+                self._store_file(conn, collection, source_file, stats)
+                self._apply(conn, collection, source_file, stats, +1)
+            self._bump(conn, collection, _TOTAL, {"files": len(files)})
+            conn.execute(
+                "INSERT OR REPLACE INTO stats_collections(collection, built_at) VALUES(?, ?)",
+                (collection, time.time()),
+            )
+
+    def _clear(self, conn: sqlite3.Connection, collection: str) -> None:
+        for table in ("stats_files", "stats_counts", "stats_collections"):
+            conn.execute(f"DELETE FROM {table} WHERE collection = ?", (collection,))
+        self._bump_generation(conn, collection)
+
+    def clear(self, collection: str) -> None:
+        """Reset a collection to empty (it stays initialized)."""
+
+        self.replace_all(collection, {})
+
+    def invalidate(self, collection: str) -> None:
+        """Forget a collection's statistics so the next read rebuilds them."""
+
+        with self._transaction() as conn:
+            self._clear(conn, collection)
+
+    # -- reads ------------------------------------------------------------
+
+    def snapshot(self, collection: str) -> Optional[CollectionStats]:
+        """Current statistics, or None if they were never built for ``collection``."""
+
+        conn = self.connect()
+        try:
+            if conn.execute("SELECT 1 FROM stats_collections WHERE collection = ?", (collection,)).fetchone() is None:
+                return None
+            counts: Dict[str, Dict[str, int]] = {_TOTAL: {}, _EXTENSION: {}, _TAG: {}}
+            for row in conn.execute("SELECT kind, key, value FROM stats_counts WHERE collection = ?", (collection,)):
+                counts.setdefault(row["kind"], {})[row["key"]] = int(row["value"])
+        finally:
+            conn.close()
+        totals = counts[_TOTAL]
+        return CollectionStats(
+            total_chunks=totals.get("chunks", 0),
+            source_files=totals.get("files", 0),
+            total_content_length=totals.get("content_length", 0),
+            file_types=counts[_EXTENSION],
+            tag_frequency=counts[_TAG],
+        )
+
+    def generation(self, collection: str) -> int:
+        """Counter bumped by every write to ``collection`` (0 if never written)."""
+
+        conn = self.connect()
+        try:
+            row = conn.execute(
+                "SELECT generation FROM stats_generations WHERE collection = ?", (collection,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0]) if row is not None else 0
+
+    def source_files(self, collection: str) -> List[str]:
+        conn = self.connect()
+        try:
+            rows = conn.execute(
+                "SELECT source_file FROM stats_files WHERE collection = ? ORDER BY source_file", (collection,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row[0] for row in rows]
+
+
+def open_collection_stats_store(chroma_db_path: Path) -> CollectionStatsStore:
+    """Open the statistics store that belongs to a Chroma directory."""
+
+    return CollectionStatsStore(CollectionStatsConfig(sqlite_path=default_collection_stats_path(chroma_db_path)))
+
+
+__all__ = [
+    "CollectionStats",
+    "CollectionStatsConfig",
+    "CollectionStatsStore",
+    "FileStats",
+    "NO_EXTENSION",
+    "default_collection_stats_path",
+    "file_extension",
+    "open_collection_stats_store",
+    "split_tags",
+    "summarize_files",
+]
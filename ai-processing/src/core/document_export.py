@@ -0,0 +1,296 @@
+"""Streaming export of the embedding collection (JSON, CSV, NDJSON, Parquet).
+
+``POST /documents/export`` and the ``export`` command share these writers.
+Rows come from ``EmbeddingStore.iter_documents``, which pages through the
+collection, and every format is produced as a generator of ``bytes`` chunks
+(about one page of rows each), so an export of any size runs in constant
+memory: the API streams the chunks to the client, the CLI to a file.
+
+Each row has the chunk id, source file, chunk position, tags and content
+length, plus either a 200-character ``content_preview`` or, with
+``include_content``, the full ``content``; ``include_embeddings`` adds the
+chunk's vector. Parquet needs the optional ``pyarrow`` package.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+EXPORT_FORMATS = ("json", "csv", "ndjson", "parquet")
+
+MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Rows buffered per emitted chunk (and per Parquet row group).
+DEFAULT_PAGE_SIZE = 500
+
+_BASE_FIELDS = ["id", "source_file", "chunk_index", "total_chunks", "tags", "content_length"]
+
+
+@dataclass(frozen=True)
+class ExportOptions:
+    format: str = "json"
+    filter_type: Optional[str] = None
+    include_content: bool = False
+    include_embeddings: bool = False
+    max_docs: Optional[int] = None
+    collection_name: str = ""
+    page_size: int = DEFAULT_PAGE_SIZE
+
+    @property
+    def fieldnames(self) -> List[str]:
+        names = _BASE_FIELDS + ["content" if self.include_content else "content_preview"]
+        return names + ["embedding"] if self.include_embeddings else names
+
+
+@dataclass
+class ExportProgress:
+    """Filled in while an export streams (the total is only known at the end)."""
+
+    rows: int = 0
+    bytes: int = 0
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # type: ignore[import]  # noqa: F401
+        import pyarrow.parquet  # type: ignore[import]  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def check_format(export_format: str) -> None:
+    """Raise if ``export_format`` is unknown or its optional dependency is missing."""
+
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {export_format!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    if export_format == "parquet" and not parquet_available():
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+
+def media_type(export_format: str) -> str:
+    return MEDIA_TYPES[export_format]
+
+
+def export_filename(export_format: str) -> str:
+    return f"prismweave-export.{export_format}"
+
+
+def export_rows(documents: Iterable[Dict[str, Any]], options: ExportOptions) -> Iterator[Dict[str, Any]]:
+    """Filter documents by file type, cap at ``max_docs`` and shape them into rows."""
+
+    suffix = f".{options.filter_type.lstrip('.')}" if options.filter_type else None
+    produced = 0
+    for doc in documents:
+        if options.max_docs is not None and produced >= options.max_docs:
+            return
+        meta = doc.get("metadata") or {}
+        source_file = meta.get("source_file", "Unknown")
+        if suffix is not None and Path(str(source_file)).suffix != suffix:
+            continue
+        row: Dict[str, Any] = {
+            "id": doc["id"],
+            "source_file": source_file,
+            "chunk_index": meta.get("chunk_index"),
+            "total_chunks": meta.get("total_chunks"),
+            "tags": meta.get("tags", ""),
+            "content_length": doc.get("content_length", 0),
+        }
+        if options.include_content:
+            row["content"] = doc.get("content", doc.get("content_preview", ""))
+        else:
+            row["content_preview"] = doc.get("content_preview", "")
+        if options.include_embeddings:
+            row["embedding"] = doc.get("embedding")
+        produced += 1
+        yield row
+
+
+Pages = Iterable[List[Dict[str, Any]]]
+
+
+def _pages(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    page: List[Dict[str, Any]] = []
+    for row in rows:
+        page.append(row)
+        if len(page) >= size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _write_ndjson(pages: Pages, options: ExportOptions, progress: ExportProgress) -> Iterator[bytes]:
+    for page in pages:
+        progress.rows += len(page)
+        yield "".join(_dumps(row) + "\n" for row in page).encode("utf-8")
+
+
+def _write_json(pages: Pages, options: ExportOptions, progress: ExportProgress) -> Iterator[bytes]:
+    # total_documents follows the rows: it is only known once they are written.
+    head = {"export_date": progress.started_at, "collection_name": options.collection_name}
+    yield (_dumps(head)[:-1] + ', "documents": [\n').encode("utf-8")
+    first = True
+    for page in pages:
+        parts = []
+        for row in page:
+            parts.append(("  " if first else ",\n  ") + _dumps(row))
+            first = False
+        progress.rows += len(page)
+        yield "".join(parts).encode("utf-8")
+    yield f'\n], "total_documents": {progress.rows}}}\n'.encode()
+
+
+def _write_csv(pages: Pages, options: ExportOptions, progress: ExportProgress) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=options.fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    for page in pages:
+        for row in page:
+            if options.include_embeddings and row.get("embedding") is not None:
+                row = {**row, "embedding": _dumps(row["embedding"])}
+            writer.writerow({key: "" if value is None else value for key, value in row.items()})
+        progress.rows += len(page)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink:
+    """Write-only file object that hands out what was written since the last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _write_parquet(pages: Pages, options: ExportOptions, progress: ExportProgress) -> Iterator[bytes]:
+    import pyarrow as pa  # type: ignore[import]
+    import pyarrow.parquet as pq  # type: ignore[import]
+
+    columns: List[Any] = [
+        pa.field("id", pa.string()),
+        pa.field("source_file", pa.string()),
+        pa.field("chunk_index", pa.int64()),
+        pa.field("total_chunks", pa.int64()),
+        pa.field("tags", pa.string()),
+        pa.field("content_length", pa.int64()),
+        pa.field("content" if options.include_content else "content_preview", pa.string()),
+    ]
+    if options.include_embeddings:
+        columns.append(pa.field("embedding", pa.list_(pa.float32())))
+    schema = pa.schema(columns)
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for page in pages:
+            writer.write_table(pa.Table.from_pylist(page, schema=schema))
+            progress.rows += len(page)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+_WRITERS = {
+    "json": _write_json,
+    "csv": _write_csv,
+    "ndjson": _write_ndjson,
+    "parquet": _write_parquet,
+}
+
+
+def stream_export(
+    rows: Iterable[Dict[str, Any]], options: ExportOptions, progress: Optional[ExportProgress] = None
+) -> Iterator[bytes]:
+    """Encode rows (from ``export_rows``) as ``options.format``, one chunk per page.
+
+    Raises:
+        ValueError: Unknown format.
+        RuntimeError: Parquet requested but pyarrow is not installed.
+    """
+
+    check_format(options.format)
+    progress = progress if progress is not None else ExportProgress()
+    chunks = _WRITERS[options.format](_pages(rows, max(1, options.page_size)), options, progress)
+    return _counted(chunks, progress)
+
+
+def _counted(chunks: Iterator[bytes], progress: ExportProgress) -> Iterator[bytes]:
+    for chunk in chunks:
+        progress.bytes += len(chunk)
+        yield chunk
+
+
+def open_export(
+    documents: Iterable[Dict[str, Any]], options: ExportOptions, progress: Optional[ExportProgress] = None
+) -> Optional[Iterator[bytes]]:
+    """Stream an export, or return None when no document matches.
+
+    Only the first matching row is read up front, so callers can still
+    report "nothing to export" before committing to a response or file.
+    """
+
+    rows = export_rows(documents, options)
+    first = next(rows, None)
+    if first is None:
+        return None
+    return stream_export(chain([first], rows), options, progress)
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "EXPORT_FORMATS",
+    "ExportOptions",
+    "ExportProgress",
+    "check_format",
+    "export_filename",
+    "export_rows",
+    "media_type",
+    "open_export",
+    "parquet_available",
+    "stream_export",
+]
@@ -0,0 +1,422 @@
+"""Nearest neighbors in embedding space for the visualization map.
+
+Neighbor edges used to come from the projected 2D layout, so semantically
+close articles that UMAP happened to place far apart were never linked, and
+every relayout recomputed all edges. Here neighbors are the top-k cosine
+matches between article vectors, persisted in SQLite (``neighbors.sqlite``
+next to the article index) together with a fingerprint of each vector and a
+version stamp. Updates only recompute rows whose vectors changed or whose
+stored neighbors became stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from collections.abc import Iterable, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_NEIGHBOR_COUNT = 5
+
+# Query rows per matrix product; bounds memory to batch_size * n floats.
+DEFAULT_BATCH_SIZE = 1024
+
+# Below this many articles an approximate index is not worth building.
+APPROXIMATE_MIN_ARTICLES = 20000
+
+Neighbor = Tuple[str, float]
+
+
+def default_embedding_neighbor_sqlite_path(index_path: Path) -> Path:
+    """Return the neighbor database that sits next to an article index path."""
+
+    return Path(index_path).with_name("neighbors.sqlite")
+
+
+def vector_fingerprint(vector: Sequence[float]) -> str:
+    """Stable fingerprint of an embedding (float32 precision)."""
+
+    import numpy as np
+
+    packed = np.asarray(vector, dtype="<f4").tobytes()
+    return hashlib.blake2b(packed, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class EmbeddingNeighborStoreConfig:
+    sqlite_path: Path
+
+
+@dataclass
+class NeighborUpdate:
+    """Result of ``update_embedding_neighbors``."""
+
+    neighbors: Dict[str, List[str]]
+    version: int
+    recomputed: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+
+class EmbeddingNeighborStore:
+    """SQLite-backed article neighbor lists with per-vector fingerprints."""
+
+    def __init__(self, config: EmbeddingNeighborStoreConfig) -> None:
+        self._path = config.sqlite_path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize()
+
+    @property
+    def sqlite_path(self) -> Path:
+        return self._path
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self._path), timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _initialize(self) -> None:
+        conn = self.connect()
+        try:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS neighbor_vectors (
+                  article_id TEXT PRIMARY KEY,
+                  fingerprint TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS article_neighbors (
+                  article_id TEXT NOT NULL,
+                  rank INTEGER NOT NULL,
+                  neighbor_id TEXT NOT NULL,
+                  score REAL NOT NULL,
+                  PRIMARY KEY(article_id, rank)
+                );
+
+                CREATE TABLE IF NOT EXISTS neighbor_meta (
+                  key TEXT PRIMARY KEY,
+                  value TEXT NOT NULL
+                );
+                """
+            )
+        finally:
+            conn.close()
+
+    def _meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM neighbor_meta WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def get_version(self) -> int:
+        """Version stamp; incremented whenever any neighbor list changes."""
+
+        conn = self.connect()
+        try:
+            return int(self._meta(conn, "version") or 0)
+        finally:
+            conn.close()
+
+    def load(self) -> Tuple[int, Optional[int], Dict[str, str], Dict[str, List[Neighbor]]]:
+        """Return (version, k, fingerprints, scored neighbor lists)."""
+
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN")
+            version = int(self._meta(conn, "version") or 0)
+            raw_k = self._meta(conn, "k")
+            fingerprints = dict(conn.execute("SELECT article_id, fingerprint FROM neighbor_vectors").fetchall())
+            neighbors: Dict[str, List[Neighbor]] = {}
+            for article_id, neighbor_id, score in conn.execute(
+                "SELECT article_id, neighbor_id, score FROM article_neighbors ORDER BY article_id, rank"
+            ):
+                neighbors.setdefault(article_id, []).append((neighbor_id, float(score)))
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return version, int(raw_k) if raw_k is not None else None, fingerprints, neighbors
+
+    def load_neighbors(self) -> Dict[str, List[str]]:
+        """Return the stored neighbor ids for every article."""
+
+        _, _, fingerprints, scored = self.load()
+        return {article_id: [n for n, _ in scored.get(article_id, [])] for article_id in fingerprints}
+
+    def save(
+        self,
+        *,
+        k: int,
+        fingerprints: Dict[str, str],
+        neighbors: Dict[str, List[Neighbor]],
+        removed: Iterable[str] = (),
+    ) -> int:
+        """Write changed rows and bump the version stamp; returns the new version."""
+
+        removed = list(removed)
+        with self._transaction() as conn:
+            version = int(self._meta(conn, "version") or 0) + 1
+            conn.executemany("DELETE FROM neighbor_vectors WHERE article_id=?", [(a,) for a in removed])
+            conn.executemany(
+                "DELETE FROM article_neighbors WHERE article_id=?",
+                [(a,) for a in (*removed, *neighbors)],
+            )
+            conn.executemany(
+                "INSERT INTO neighbor_vectors(article_id, fingerprint) VALUES(?, ?) "
+                "ON CONFLICT(article_id) DO UPDATE SET fingerprint=excluded.fingerprint",
+                fingerprints.items(),
+            )
+            conn.executemany(
+                "INSERT INTO article_neighbors(article_id, rank, neighbor_id, score) VALUES(?, ?, ?, ?)",
+                [
+                    (article_id, rank, neighbor_id, score)
+                    for article_id, row in neighbors.items()
+                    for rank, (neighbor_id, score) in enumerate(row)
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO neighbor_meta(key, value) VALUES(?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                [("version", str(version)), ("k", str(k))],
+            )
+        return version
+
+
+def _prepare(embeddings: Dict[str, Sequence[float]]) -> Tuple[List[str], Dict[str, int], np.ndarray]:
+    """Sorted ids, their positions and the row-normalized float32 matrix.
+
+    Vectors whose dimension differs from the most common one are dropped.
+    """
+
+    from collections import Counter
+
+    import numpy as np
+
+    if not embeddings:
+        return [], {}, np.zeros((0, 0), dtype=np.float32)
+    dims = Counter(len(vector) for vector in embeddings.values())
+    dim = dims.most_common(1)[0][0]
+    ids = sorted(article_id for article_id, vector in embeddings.items() if len(vector) == dim)
+    matrix = np.asarray([embeddings[article_id] for article_id in ids], dtype=np.float32).reshape(len(ids), dim)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return ids, {article_id: i for i, article_id in enumerate(ids)}, matrix / norms
+
+
+def _top_k_rows(
+    scores: np.ndarray, columns: np.ndarray, row_offsets: np.ndarray, k: int
+) -> List[List[Tuple[int, float]]]:
+    """Top-k (column, score) per row, ties broken by column index."""
+
+    import numpy as np
+
+    scores = scores.copy()
+    scores[np.arange(len(row_offsets)), row_offsets] = -np.inf  # exclude self
+    take = min(k, scores.shape[1] - 1)
+    if take <= 0:
+        return [[] for _ in row_offsets]
+    part = np.argpartition(-scores, take - 1, axis=1)[:, :take]
+    part_scores = np.take_along_axis(scores, part, axis=1)
+    order = np.lexsort((part, -part_scores), axis=1)
+    part = np.take_along_axis(part, order, axis=1)
+    part_scores = np.take_along_axis(part_scores, order, axis=1)
+    return [
+        [(int(columns[c]), float(s)) for c, s in zip(row_cols, row_scores)]
+        for row_cols, row_scores in zip(part.tolist(), part_scores.tolist())
+    ]
+
+
+def _exact_top_k(matrix: np.ndarray, rows: List[int], k: int, batch_size: int) -> Dict[int, List[Tuple[int, float]]]:
+    import numpy as np
+
+    columns = np.arange(matrix.shape[0])
+    result: Dict[int, List[Tuple[int, float]]] = {}
+    for start in range(0, len(rows), batch_size):
+        batch = np.asarray(rows[start : start + batch_size])
+        scores = matrix[batch] @ matrix.T
+        for row, top in zip(batch.tolist(), _top_k_rows(scores, columns, batch, k)):
+            result[row] = top
+    return result
+
+
+def _approximate_top_k(
+    matrix: np.ndarray, rows: List[int], k: int
+) -> Optional[Dict[int, List[Tuple[int, float]]]]:
+    try:
+        import hnswlib  # type: ignore[import]
+    except ImportError:
+        return None
+
+    import numpy as np
+
+    n, dim = matrix.shape
+    index = hnswlib.Index(space="ip", dim=dim)
+    index.init_index(max_elements=n, ef_construction=200, M=16)
+    index.add_items(matrix, np.arange(n))
+    index.set_ef(max(64, 4 * k))
+    labels, distances = index.knn_query(matrix[rows], k=min(k + 1, n))
+
+    result: Dict[int, List[Tuple[int, float]]] = {}
+    for row, row_labels, row_distances in zip(rows, labels.tolist(), distances.tolist()):
+        pairs = sorted(
+            ((int(label), 1.0 - float(distance)) for label, distance in zip(row_labels, row_distances) if label != row),
+            key=lambda pair: (-pair[1], pair[0]),
+        )
+        result[row] = pairs[:k]
+    return result
+
+
+def compute_embedding_neighbors(
+    embeddings: Dict[str, Sequence[float]],
+    k: int = DEFAULT_NEIGHBOR_COUNT,
+    *,
+    article_ids: Optional[Iterable[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    approximate: bool = False,
+) -> Dict[str, List[Neighbor]]:
+    """Top-k cosine neighbors for ``article_ids`` (default: all) among ``embeddings``.
+
+    Neighbors are ordered by descending similarity, ties broken by article
+    id. With ``approximate=True`` and ``hnswlib`` installed, large inputs use
+    an HNSW index instead of exact batched matrix products.
+    """
+
+    if not embeddings or k <= 0:
+        return {}
+
+    ids, position, matrix = _prepare(embeddings)
+    return _neighbors_for(ids, position, matrix, article_ids, k, batch_size, approximate)
+
+
+def _neighbors_for(
+    ids: List[str],
+    position: Dict[str, int],
+    matrix: np.ndarray,
+    article_ids: Optional[Iterable[str]],
+    k: int,
+    batch_size: int,
+    approximate: bool,
+) -> Dict[str, List[Neighbor]]:
+    wanted = ids if article_ids is None else sorted({a for a in article_ids if a in position})
+    rows = [position[article_id] for article_id in wanted]
+    top: Optional[Dict[int, List[Tuple[int, float]]]] = None
+    if approximate and len(ids) >= APPROXIMATE_MIN_ARTICLES:
+        top = _approximate_top_k(matrix, rows, k)
+    if top is None:
+        top = _exact_top_k(matrix, rows, k, batch_size)
+    return {ids[row]: [(ids[col], score) for col, score in top[row]] for row in rows}
+
+
+def update_embedding_neighbors(
+    store: EmbeddingNeighborStore,
+    embeddings: Dict[str, Sequence[float]],
+    k: int = DEFAULT_NEIGHBOR_COUNT,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    approximate: bool = False,
+) -> NeighborUpdate:
+    """Bring the stored neighbor lists in line with ``embeddings``.
+
+    Articles whose vector fingerprint changed (or that are new) get a full
+    top-k row. Unchanged articles are recomputed only when one of their
+    stored neighbors changed or disappeared; otherwise changed articles are
+    merged into their lists when they now score higher than the k-th
+    neighbor. Results match a full recomputation up to floating-point ties.
+    """
+
+    version, stored_k, stored_fingerprints, stored_neighbors = store.load()
+    ids, position, matrix = _prepare(embeddings)
+    fingerprints = {article_id: vector_fingerprint(embeddings[article_id]) for article_id in ids}
+    removed = set(stored_fingerprints) - set(fingerprints)
+
+    if stored_k != k:
+        changed = set(fingerprints)
+    else:
+        changed = {a for a, fp in fingerprints.items() if stored_fingerprints.get(a) != fp}
+
+    if not changed and not removed:
+        neighbors = {a: [n for n, _ in stored_neighbors.get(a, [])] for a in fingerprints}
+        return NeighborUpdate(neighbors=neighbors, version=version)
+
+    unchanged = set(fingerprints) - changed
+    stale = {a for a in unchanged if any(n in changed or n in removed for n, _ in stored_neighbors.get(a, []))}
+    recompute = changed | stale
+    rows = _neighbors_for(ids, position, matrix, recompute, k, batch_size, approximate) if recompute else {}
+
+    # Changed articles may now outrank the k-th neighbor of untouched rows.
+    merged: Dict[str, List[Neighbor]] = {}
+    clean = sorted(unchanged - stale)
+    if clean and changed:
+        import numpy as np
+
+        clean_rows = np.asarray([position[a] for a in clean])
+        thresholds = np.asarray(
+            [
+                stored_neighbors[a][-1][1] if len(stored_neighbors.get(a, [])) >= k else -np.inf
+                for a in clean
+            ],
+            dtype=np.float64,
+        )
+        changed_ids = sorted(changed)
+        for start in range(0, len(changed_ids), batch_size):
+            batch_ids = changed_ids[start : start + batch_size]
+            batch = np.asarray([position[a] for a in batch_ids])
+            scores = matrix[batch] @ matrix[clean_rows].T
+            for i, j in zip(*np.nonzero(scores >= thresholds[None, :])):
+                target = clean[j]
+                candidates = merged.setdefault(target, list(stored_neighbors.get(target, [])))
+                candidates.append((batch_ids[i], float(scores[i, j])))
+        for candidates in merged.values():
+            candidates.sort(key=lambda pair: (-pair[1], pair[0]))
+            del candidates[k:]
+
+    changed_rows = {**rows, **merged}
+    new_version = store.save(
+        k=k,
+        fingerprints={a: fingerprints[a] for a in changed},
+        neighbors=changed_rows,
+        removed=removed,
+    )
+
+    neighbors = {}
+    for article_id in fingerprints:
+        row = changed_rows.get(article_id, stored_neighbors.get(article_id, []))
+        neighbors[article_id] = [neighbor_id for neighbor_id, _ in row]
+    return NeighborUpdate(neighbors=neighbors, version=new_version, recomputed=recompute, removed=removed)
+
+
+def open_embedding_neighbor_store(index_path: Path) -> EmbeddingNeighborStore:
+    """Open the neighbor store that belongs to an article index."""
+
+    return EmbeddingNeighborStore(
+        EmbeddingNeighborStoreConfig(sqlite_path=default_embedding_neighbor_sqlite_path(index_path))
+    )
+
+
+__all__ = [
+    "DEFAULT_NEIGHBOR_COUNT",
+    "EmbeddingNeighborStore",
+    "EmbeddingNeighborStoreConfig",
+    "NeighborUpdate",
+    "compute_embedding_neighbors",
+    "default_embedding_neighbor_sqlite_path",
+    "open_embedding_neighbor_store",
+    "update_embedding_neighbors",
+    "vector_fingerprint",
+]
@@ -2,20 +2,42 @@
 Embedding store using Haystack's ChromaDB integration
 """
 
+import logging
+import sqlite3
+import time
 import uuid
-from collections.abc import Sequence
+from collections.abc import Hashable, Iterable, Sequence
+from contextlib import suppress
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 # Haystack imports
 from haystack import Document
+from haystack.document_stores.types import DuplicatePolicy
 from haystack_integrations.components.embedders.ollama import OllamaDocumentEmbedder, OllamaTextEmbedder
 from haystack_integrations.components.retrievers.chroma import ChromaEmbeddingRetriever
 from haystack_integrations.document_stores.chroma import ChromaDocumentStore
 
+from src.taxonomy.chroma_io import (
+    ChromaConnection,
+    iter_collection_embeddings,
+    mean_embeddings_by_article,
+    open_persistent_client,
+)
+
+from .article_registry import ArticleRegistry, file_content_hash, open_article_registry
+from .collection_stats import (
+    CollectionStats,
+    CollectionStatsStore,
+    FileStats,
+    open_collection_stats_store,
+    summarize_files,
+)
 from .config import Config
 from .git_tracker import GitTracker
 
+logger = logging.getLogger(__name__)
+
 
 class EmbeddingStore:
     """Store and retrieve document embeddings using ChromaDB via Haystack"""
@@ -41,6 +63,54 @@ class EmbeddingStore:
         # Initialize retriever for semantic search
         self.retriever = ChromaEmbeddingRetriever(document_store=self.document_store)
 
+        self._stats_store: Optional[CollectionStatsStore] = None
+        self._registry: Optional[ArticleRegistry] = None
+        self._registry_checked = False
+
+    @property
+    def stats_store(self) -> CollectionStatsStore:
+        """Aggregate statistics kept up to date by add/remove/rename (opened lazily)."""
+
+        if self._stats_store is None:
+            self._stats_store = open_collection_stats_store(self.persist_directory)
+        return self._stats_store
+
+    def _record_stats(self, action: str, *args: Any) -> None:
+        """Apply a change to the collection statistics; a failure only makes them rebuild later."""
+
+        collection = self.config.collection_name
+        try:
+            getattr(self.stats_store, action)(collection, *args)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Failed to update collection statistics: {e}")
+            with suppress(sqlite3.Error, OSError):
+                self.stats_store.invalidate(collection)
+
+    @property
+    def registry(self) -> Optional[ArticleRegistry]:
+        """Canonical article ids of the documents root, or None without one (opened lazily)."""
+
+        if not self._registry_checked:
+            self._registry_checked = True
+            documents_root = Path(self.config.mcp.paths.documents_root).expanduser()
+            if documents_root.is_dir():
+                try:
+                    self._registry = open_article_registry(documents_root)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"Warning: Article registry unavailable: {e}")
+        return self._registry
+
+    def _record_article(self, update: Callable[[ArticleRegistry], Any]) -> None:
+        """Apply a change to the article registry; a failure only leaves it stale until the next index build."""
+
+        registry = self.registry
+        if registry is None:
+            return
+        try:
+            update(registry)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Failed to update article registry: {e}")
+
     def _clean_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Clean metadata to ensure ChromaDB compatibility.
 
@@ -67,13 +137,17 @@ class EmbeddingStore:
                 cleaned[key] = str(value)
         return cleaned
 
-    def add_document(self, file_path: Path, chunks: List[Document]) -> None:
+    def add_document(
+        self, file_path: Path, chunks: List[Document], timings: Optional[Dict[str, float]] = None
+    ) -> None:
         """
         Add document chunks to the document store with embeddings
 
         Args:
             file_path: Path to the original document file
             chunks: List of Document chunks to add
+            timings: Optional dict that receives the seconds spent in the
+                "embed" and "store" stages
         """
 
         if not chunks:
@@ -100,21 +174,39 @@ class EmbeddingStore:
 
         try:
             # Generate embeddings for chunks
+            started = time.perf_counter()
             embedded_result = self.document_embedder.run(documents=chunks)
             embedded_documents = embedded_result.get("documents", chunks)
+            embedded = time.perf_counter()
 
             # Write documents to store
             self.document_store.write_documents(embedded_documents)
+            if timings is not None:
+                timings["embed"] = embedded - started
+                timings["store"] = time.perf_counter() - embedded
+            self._record_stats(
+                "record_add",
+                str(file_path),
+                FileStats.from_chunks((len(chunk.content or ""), chunk.meta.get("tags")) for chunk in chunks),
+            )
             print(f"Added {len(chunks)} chunks from {file_path.name}")
 
             # Mark file as processed in git tracker if available
+            tracked_hash: Optional[str] = None
             if self.git_tracker:
                 try:
-                    self.git_tracker.mark_file_processed(file_path)
+                    tracked_hash = self.git_tracker.mark_file_processed(file_path)
                     print(f"Marked {file_path.name} as processed in git tracker")
                 except (OSError, ValueError) as e:
                     print(f"Warning: Failed to mark file as processed in git tracker: {e}")
 
+            # The tracker hashed the file already; only hash it here without one.
+            self._record_article(
+                lambda registry: registry.register(
+                    file_path, content_hash=tracked_hash if self.git_tracker else file_content_hash(file_path)
+                )
+            )
+
         except (ConnectionError, TimeoutError) as e:
             raise RuntimeError(f"Failed to connect to embedding service for {file_path}: {e}") from e
         except (ValueError, KeyError) as e:
@@ -233,6 +325,7 @@ class EmbeddingStore:
                 doc_ids = [doc.id for doc in all_docs if doc.id]
                 if doc_ids:
                     self.document_store.delete_documents(doc_ids)
+            self._record_stats("clear")
 
             print("Collection cleared successfully")
 
@@ -247,6 +340,23 @@ class EmbeddingStore:
         except Exception:
             return 0
 
+    def data_generation(self) -> Hashable:
+        """
+        Token that changes whenever the collection is written
+
+        This is the statistics generation, bumped by every add, remove,
+        rename and clear made through this class in any process. Reading it
+        is a single-row lookup, so cached reads never query the collection;
+        only when the statistics database is unreadable does it fall back to
+        the chunk count. Used as a cache key.
+        """
+
+        try:
+            return self.stats_store.generation(self.config.collection_name)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Collection statistics unavailable, keying caches on the chunk count: %s", e)
+            return ("count", self.get_document_count())
+
     def list_documents(self, max_documents: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         List documents in the collection with their metadata
@@ -282,16 +392,55 @@ class EmbeddingStore:
             print(f"Failed to list documents: {e}")
             return []
 
-    def remove_file_documents(self, file_path: Path) -> bool:
+    def iter_documents(self, *, batch_size: int = 500, include_embeddings: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every chunk of the collection, one page of ``batch_size`` at a time
+
+        Unlike ``list_documents`` only one page is held in memory. Each item
+        has ``id``, ``metadata``, ``content``, ``content_length`` and
+        ``content_preview`` (as in ``list_documents``), plus ``embedding``
+        (a list of floats) when ``include_embeddings`` is set.
+
+        Raises:
+            Exception: Chroma errors are propagated; a stream cut short must
+            not look like a complete one.
+        """
+
+        client = open_persistent_client(ChromaConnection(persist_path=self.persist_directory))
+        collection = client.get_collection(name=self.config.collection_name)
+        include = ["metadatas", "documents"] + (["embeddings"] if include_embeddings else [])
+        for page in iter_collection_embeddings(collection, batch_size=batch_size, include=include):
+            metadatas = page.get("metadatas")
+            contents = page.get("documents")
+            embeddings = page.get("embeddings") if include_embeddings else None
+            for index, doc_id in enumerate(page["ids"]):
+                content = (contents[index] if contents is not None else None) or ""
+                item: Dict[str, Any] = {
+                    "id": doc_id,
+                    "metadata": (metadatas[index] if metadatas is not None else None) or {},
+                    "content": content,
+                    "content_length": len(content),
+                    "content_preview": content[:200] + "..." if len(content) > 200 else content,
+                }
+                if include_embeddings:
+                    vector = embeddings[index] if embeddings is not None else None
+                    item["embedding"] = [float(value) for value in vector] if vector is not None else None
+                yield item
+
+    def remove_file_documents(self, file_path: Path, *, deleted: bool = False) -> bool:
         """
         Remove all document chunks for a specific file from the document store
 
         Args:
             file_path: Path to the file whose chunks should be removed
+            deleted: The file itself was deleted; also drop it from the article registry
+                (left False when the chunks are removed only to re-embed the file)
 
         Returns:
             True if documents were found and removed
         """
+        if deleted:
+            self._record_article(lambda registry: registry.remove(str(file_path)))
         try:
             # Find all chunks for this file
             filters = {"field": "meta.source_file", "operator": "==", "value": str(file_path)}
@@ -302,6 +451,7 @@ class EmbeddingStore:
                 doc_ids = [doc.id for doc in matching_docs if doc.id]
                 if doc_ids:
                     self.document_store.delete_documents(doc_ids)
+                    self._record_stats("record_remove", str(file_path))
                     print(f"Removed {len(doc_ids)} chunks for {file_path.name}")
                     return True
             else:
@@ -312,6 +462,46 @@ class EmbeddingStore:
             print(f"Warning: Failed to remove existing chunks for {file_path}: {e}")
             return False
 
+    def rename_file_documents(self, old_path: Path, new_path: Path) -> int:
+        """
+        Repoint all chunks of a renamed file at its new path without re-embedding
+
+        The chunks keep their ids, content and embeddings; only path-derived
+        metadata (source_file, file_path, source, file_name) is rewritten.
+
+        Args:
+            old_path: Path the chunks were stored under
+            new_path: New path of the file
+
+        Returns:
+            Number of chunks updated (0 if none were found)
+        """
+        try:
+            filters = {"field": "meta.source_file", "operator": "==", "value": str(old_path)}
+            matching_docs = self.document_store.filter_documents(filters=filters)
+            if not matching_docs:
+                return 0
+
+            for doc in matching_docs:
+                meta = dict(doc.meta or {})
+                meta["source_file"] = str(new_path)
+                for key in ("file_path", "source"):
+                    if key in meta:
+                        meta[key] = str(new_path)
+                if "file_name" in meta:
+                    meta["file_name"] = new_path.name
+                doc.meta = meta
+
+            self.document_store.write_documents(matching_docs, policy=DuplicatePolicy.OVERWRITE)
+            self._record_stats("record_rename", str(old_path), str(new_path))
+            self._record_article(lambda registry: registry.rename(old_path, new_path))
+            print(f"Renamed {len(matching_docs)} chunks: {old_path.name} -> {new_path.name}")
+            return len(matching_docs)
+
+        except Exception as e:
+            print(f"Warning: Failed to rename chunks for {old_path}: {e}")
+            return 0
+
     def get_file_document_count(self, file_path: Path) -> int:
         """
         Get the number of document chunks for a specific file
@@ -329,6 +519,48 @@ class EmbeddingStore:
         except Exception:
             return 0
 
+    def get_collection_stats(self) -> CollectionStats:
+        """
+        Chunk, file, content-length, file-type and tag totals of the collection
+
+        Served from the aggregate table maintained on every add and remove;
+        it is rebuilt with one scan of the collection when it does not exist
+        yet or its chunk total no longer matches the collection (e.g. after
+        writes by an older version). Needs no embedding service.
+
+        Returns:
+            CollectionStats snapshot
+        """
+
+        collection = self.config.collection_name
+        count = self.get_document_count()
+        try:
+            stats = self.stats_store.snapshot(collection)
+            if stats is not None and stats.total_chunks == count:
+                return stats
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Collection statistics unavailable, scanning collection: {e}")
+
+        chunks_by_file: Dict[str, List[tuple]] = {}
+        try:
+            for doc in self.document_store.filter_documents():
+                meta = doc.meta or {}
+                chunks_by_file.setdefault(str(meta.get("source_file", "")), []).append(
+                    (len(doc.content or ""), meta.get("tags"))
+                )
+        except Exception as e:
+            print(f"Failed to scan collection for statistics: {e}")
+            return CollectionStats()
+        files: Dict[str, FileStats] = {
+            source_file: FileStats.from_chunks(chunks) for source_file, chunks in chunks_by_file.items()
+        }
+
+        try:
+            self.stats_store.replace_all(collection, files)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Failed to store collection statistics: {e}")
+        return summarize_files(files)
+
     def get_unique_source_files(self) -> List[str]:
         """
         Get a list of unique source files in the collection
@@ -352,6 +584,27 @@ class EmbeddingStore:
             print(f"Failed to get source files: {e}")
             return []
 
+    def get_article_embeddings(
+        self, file_paths: Optional[Iterable[Path]] = None, *, batch_size: int = 2048
+    ) -> Dict[str, Any]:
+        """Average chunk embeddings for many articles in one scan of the collection.
+
+        Bulk counterpart of ``get_article_embedding``: instead of one filter
+        query per article, the collection is streamed once. Keys are source
+        file paths (``str(file_path)``); values are float32 NumPy rows of a
+        single matrix. ``file_paths`` limits the result to those files.
+        """
+
+        keys = [str(path) for path in file_paths] if file_paths is not None else None
+        try:
+            client = open_persistent_client(ChromaConnection(persist_path=self.persist_directory))
+            collection = client.get_collection(name=self.config.collection_name)
+            article_keys, matrix = mean_embeddings_by_article(collection, batch_size=batch_size, keys=keys)
+        except Exception:
+            logger.exception("Failed to read article embeddings from %s", self.persist_directory)
+            return {}
+        return dict(zip(article_keys, matrix))
+
     def get_article_embedding(self, file_path: Path) -> Optional[List[float]]:
         """Compute a representative embedding for an article by averaging its chunks.
 
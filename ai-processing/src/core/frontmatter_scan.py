@@ -0,0 +1,139 @@
+"""
+Parallel frontmatter parsing for large markdown scans
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import frontmatter
+
+from .article_registry import bytes_content_hash
+
+logger = logging.getLogger(__name__)
+
+# Files handed to a worker per task; large enough to amortize pickling overhead.
+DEFAULT_CHUNK_SIZE = 64
+
+# Below this many files the pool start-up cost outweighs the parsing work.
+DEFAULT_PARALLEL_THRESHOLD = 256
+
+
+@dataclass
+class FrontmatterRecord:
+    """Parsed frontmatter, body and stat data for one markdown file.
+
+    ``read_error`` is set when the file could not be read (the other fields
+    are then empty). ``parse_error`` is set when the YAML header was invalid;
+    ``metadata`` is then empty and ``content`` holds the raw file text.
+    ``content_hash`` is the hash of the raw file bytes (see
+    ``article_registry.bytes_content_hash``).
+    """
+
+    path: Path
+    metadata: Dict[str, Any]
+    content: str
+    size: int = 0
+    mtime: float = 0.0
+    ctime: float = 0.0
+    read_error: Optional[str] = None
+    parse_error: Optional[str] = None
+    content_hash: Optional[str] = None
+
+
+def parse_frontmatter_file(path: Path) -> FrontmatterRecord:
+    """Read and parse a single markdown file."""
+
+    path = Path(path)
+    try:
+        stat = path.stat()
+        data = path.read_bytes()
+        # Same text as read_text(): decoded with universal newlines.
+        text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    except (OSError, UnicodeDecodeError) as exc:
+        return FrontmatterRecord(path=path, metadata={}, content="", read_error=f"{type(exc).__name__}: {exc}")
+
+    record = FrontmatterRecord(
+        path=path,
+        metadata={},
+        content=text,
+        size=stat.st_size,
+        mtime=stat.st_mtime,
+        ctime=stat.st_ctime,
+        content_hash=bytes_content_hash(data),
+    )
+    try:
+        post = frontmatter.loads(text)
+    except Exception as exc:  # yaml errors are not a single exception type
+        record.parse_error = str(exc)
+        return record
+
+    record.metadata = dict(post.metadata or {})
+    record.content = str(post.content or "")
+    return record
+
+
+def _parse_chunk(paths: List[Path]) -> List[FrontmatterRecord]:
+    return [parse_frontmatter_file(path) for path in paths]
+
+
+def _chunked(paths: List[Path], size: int) -> Iterator[List[Path]]:
+    for start in range(0, len(paths), size):
+        yield paths[start : start + size]
+
+
+def parse_frontmatter_files(
+    paths: Iterable[Path],
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+) -> List[FrontmatterRecord]:
+    """Parse many markdown files, using a process pool for large batches.
+
+    Results are returned in input order. Small batches, ``max_workers=1`` or
+    an unusable process pool fall back to parsing in the calling process.
+    Workers are spawned rather than forked: callers include threaded servers,
+    and a forked child can inherit locks held by other threads.
+
+    Args:
+        paths: Markdown files to parse
+        max_workers: Worker processes (default: CPU count)
+        chunk_size: Files per worker task
+        parallel_threshold: Minimum number of files before a pool is used
+
+    Returns:
+        One FrontmatterRecord per input path
+    """
+
+    path_list = [Path(path) for path in paths]
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = min(workers, -(-len(path_list) // max(1, chunk_size)))
+
+    if workers <= 1 or len(path_list) < parallel_threshold:
+        return _parse_chunk(path_list)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            records: List[FrontmatterRecord] = []
+            for chunk in executor.map(_parse_chunk, _chunked(path_list, max(1, chunk_size))):
+                records.extend(chunk)
+            return records
+    except (OSError, BrokenProcessPool) as exc:
+        logger.warning("Parallel frontmatter parsing unavailable (%s); parsing serially", exc)
+        return _parse_chunk(path_list)
+
+
+__all__ = [
+    "FrontmatterRecord",
+    "parse_frontmatter_file",
+    "parse_frontmatter_files",
+]
@@ -3,11 +3,15 @@ Git integration utilities for tracking document changes and processing state
 """
 
 import hashlib
+import json
 import sqlite3
 import subprocess
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import quote, urlparse, urlunparse
 
 from src.core.processing_state_store import (
@@ -16,20 +20,94 @@ from src.core.processing_state_store import (
     default_processing_state_sqlite_path,
 )
 
+# Decision tiers reported by GitTracker.check_counts:
+#   untracked - no processing state row (or the file is unreadable)
+#   stat      - size and mtime match the stored row; content not read
+#   hash      - size/mtime differed (or paranoid mode) so the content was hashed
+CHECK_TIERS = ("untracked", "stat", "hash")
+
+# Number of buffered mark_file_processed() rows committed per transaction in batch().
+DEFAULT_BATCH_SIZE = 100
+
+# File types counted by get_processing_summary().
+SUMMARY_EXTENSIONS = {".md", ".txt", ".pdf", ".docx", ".html", ".htm"}
+
+# processing_meta key holding the last summary scan, so it survives the process.
+SUMMARY_META_KEY = "summary_cache"
+
+
+@dataclass
+class ChangeSet:
+    """Files to act on during an incremental sync.
+
+    ``changed`` files need (re)processing, ``deleted`` files should have their
+    chunks and state rows removed, and ``renamed`` pairs (old, new) can have
+    their stored chunks repointed without re-embedding. ``full_scan`` is True
+    when no usable base commit existed and the tree was scanned instead.
+    """
+
+    base_commit: Optional[str]
+    head_commit: str
+    changed: List[Path] = field(default_factory=list)
+    deleted: List[Path] = field(default_factory=list)
+    renamed: List[Tuple[Path, Path]] = field(default_factory=list)
+    full_scan: bool = False
+
+    def is_empty(self) -> bool:
+        return not (self.changed or self.deleted or self.renamed)
+
+
+def _parse_name_status(output: str) -> List[Tuple[str, List[str]]]:
+    """Parse ``git diff --name-status -z`` output into (status, paths) entries."""
+
+    fields = output.split("\0")
+    entries: List[Tuple[str, List[str]]] = []
+    i = 0
+    while i < len(fields):
+        status = fields[i]
+        i += 1
+        if not status:
+            continue
+        # Renames and copies carry a similarity score and two paths.
+        path_count = 2 if status[0] in {"R", "C"} else 1
+        paths = fields[i : i + path_count]
+        i += path_count
+        if len(paths) == path_count:
+            entries.append((status, paths))
+    return entries
+
+
+def _format_mtime(mtime: float) -> str:
+    """Format an mtime the same way it is persisted in processed_files.last_modified."""
+    return datetime.fromtimestamp(mtime).isoformat()
+
 
 class GitTracker:
     """Track git changes and document processing state"""
 
-    def __init__(self, repo_path: Path, state_file: Optional[Path] = None):
+    def __init__(self, repo_path: Path, state_file: Optional[Path] = None, *, paranoid: bool = False):
         """
         Initialize GitTracker
 
         Args:
             repo_path: Path to the git repository
             state_file: Path to the processing state SQLite file (default: .prismweave/processing_state.sqlite)
+            paranoid: Always hash file content in is_file_processed, even when size and mtime match
         """
         self.repo_path = Path(repo_path).resolve()
         self.state_file = state_file or default_processing_state_sqlite_path(self.repo_path)
+        self.paranoid = paranoid
+
+        # How many is_file_processed() calls were decided at each tier.
+        self.check_counts: Dict[str, int] = dict.fromkeys(CHECK_TIERS, 0)
+
+        # Rows buffered by batch(); None when writes go straight to SQLite.
+        self._pending: Optional[Dict[str, Dict[str, Any]]] = None
+        self._flush_every = DEFAULT_BATCH_SIZE
+
+        # (cache key, counts) from the last get_processing_summary() scan.
+        self._summary_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, int]]] = None
+        self._index_path: Optional[Path] = None
 
         # Legacy JSON file (migration source only; no longer written).
         self.legacy_state_file = self.repo_path / ".prismweave" / "processing_state.json"
@@ -41,8 +119,7 @@ class GitTracker:
 
         # One-time migration from legacy JSON if present and SQLite has no processed files.
         try:
-            existing = self._state_store.load_state().get("processed_files") or {}
-            if not existing and self.legacy_state_file.exists():
+            if self.legacy_state_file.exists() and self._state_store.count_processed_files() == 0:
                 self._state_store.migrate_from_json(self.legacy_state_file)
         except sqlite3.Error:
             # If the DB is corrupted/unreadable, fall back to empty state.
@@ -147,8 +224,211 @@ class GitTracker:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to get changed files: {e}") from e
 
+    @contextmanager
+    def batch(self, flush_every: int = DEFAULT_BATCH_SIZE) -> Iterator["GitTracker"]:
+        """Buffer processing-state writes and commit them in chunks.
+
+        Inside the block, ``mark_file_processed`` collects rows in memory and
+        writes them with a single ``upsert_many`` transaction every
+        ``flush_every`` files and once more on exit, instead of one commit per
+        file. Nested calls share the outer buffer.
+        """
+
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = {}
+        self._flush_every = max(1, int(flush_every))
+        try:
+            yield self
+        finally:
+            try:
+                self.flush_pending()
+            finally:
+                self._pending = None
+                self._flush_every = DEFAULT_BATCH_SIZE
+
+    def flush_pending(self) -> None:
+        """Write any rows buffered by ``batch()`` to SQLite."""
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = {}
+        try:
+            self._state_store.upsert_many(pending.items())
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to save processing state: {e}") from e
+
+    def _record_processed(self, relative_path: str, file_info: Dict[str, Any]) -> None:
+        if self._pending is not None:
+            self._pending[relative_path] = file_info
+            if len(self._pending) >= self._flush_every:
+                self.flush_pending()
+            return
+
+        try:
+            self._state_store.upsert_processed_file(relative_path, file_info)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to save processing state: {e}") from e
+
+    def _get_processed_file(self, relative_path: str) -> Optional[Dict[str, Any]]:
+        if self._pending and relative_path in self._pending:
+            return self._pending[relative_path]
+        try:
+            return self._state_store.get_processed_file(relative_path)
+        except sqlite3.Error:
+            return None
+
+    def commit_exists(self, commit_hash: str) -> bool:
+        """Return True if ``commit_hash`` names a commit in this repository."""
+        try:
+            subprocess.run(
+                ["git", "cat-file", "-e", f"{commit_hash}^{{commit}}"],
+                cwd=self.repo_path,
+                capture_output=True,
+                check=True,
+            )
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+
+    def get_incremental_changes(self, file_extensions: Optional[Set[str]] = None) -> ChangeSet:
+        """
+        Work out what an incremental sync has to do since the last processed commit
+
+        Uses ``git diff --name-status -M last_processed_commit`` so only files
+        that differ between that commit and the working tree are examined:
+        files touched by new commits as well as uncommitted edits to tracked
+        files (untracked files are not seen). Pure renames (100% similar)
+        are reported separately so their chunks can be repointed; renames with
+        edits become a deletion plus a change. Changed files are further
+        filtered through ``is_file_processed`` so work left over from an
+        earlier run is not redone. Falls back to a full scan when there is no
+        usable base commit.
+
+        Args:
+            file_extensions: Set of file extensions to consider
+
+        Returns:
+            ChangeSet describing files to process, delete and rename
+        """
+        head = self.get_current_commit_hash()
+        base = self.get_last_processed_commit()
+
+        if not base or not self.commit_exists(base):
+            return ChangeSet(
+                base_commit=None,
+                head_commit=head,
+                changed=self.get_unprocessed_files(file_extensions=file_extensions),
+                deleted=self._get_missing_processed_files(),
+                full_scan=True,
+            )
+
+        changes = ChangeSet(base_commit=base, head_commit=head)
+        try:
+            # Against the working tree, not HEAD, so uncommitted edits count too.
+            result = subprocess.run(
+                ["git", "diff", "--name-status", "-M", "-z", "--relative", base],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to diff {base} against the working tree: {e}") from e
+
+        def wanted(path: Path) -> bool:
+            return not file_extensions or path.suffix.lower() in file_extensions
+
+        candidates: List[Path] = []
+        for status, paths in _parse_name_status(result.stdout):
+            kind = status[0]
+            if kind == "D":
+                old = self.repo_path / paths[0]
+                if wanted(old):
+                    changes.deleted.append(old)
+            elif kind == "R":
+                old = self.repo_path / paths[0]
+                new = self.repo_path / paths[1]
+                pure = status[1:] == "100" and old.suffix.lower() == new.suffix.lower()
+                if pure and wanted(old):
+                    changes.renamed.append((old, new))
+                    continue
+                if wanted(old):
+                    changes.deleted.append(old)
+                if wanted(new):
+                    candidates.append(new)
+            else:
+                # A(dded), M(odified), C(opied), T(ype change): process the destination.
+                new = self.repo_path / paths[-1]
+                if wanted(new):
+                    candidates.append(new)
+
+        changes.changed = [path for path in candidates if path.exists() and not self.is_file_processed(path)]
+        return changes
+
+    def _get_missing_processed_files(self) -> List[Path]:
+        """Return processed files whose path no longer exists on disk."""
+        self.flush_pending()
+        try:
+            rows = list(self._state_store.iter_processed_files())
+        except sqlite3.Error:
+            return []
+        return [self.repo_path / path for path, _ in rows if not (self.repo_path / path).exists()]
+
+    def forget_files(self, file_paths: List[Path]) -> int:
+        """
+        Remove processing state rows for files (e.g. after they were deleted)
+
+        Args:
+            file_paths: Absolute paths of files to forget
+
+        Returns:
+            Number of rows removed
+        """
+        relative_paths = []
+        for file_path in file_paths:
+            relative_path = str(Path(file_path).relative_to(self.repo_path))
+            relative_paths.append(relative_path)
+            if self._pending:
+                self._pending.pop(relative_path, None)
+
+        try:
+            return self._state_store.delete_processed_files(relative_paths)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to update processing state: {e}") from e
+
+    def rename_processed_file(self, old_path: Path, new_path: Path) -> bool:
+        """
+        Move a file's processing state to its new path after a rename
+
+        Args:
+            old_path: Previous absolute path
+            new_path: New absolute path
+
+        Returns:
+            True if a state row existed for the old path
+        """
+        self.flush_pending()
+        old_relative = str(Path(old_path).relative_to(self.repo_path))
+        new_relative = str(Path(new_path).relative_to(self.repo_path))
+        try:
+            return self._state_store.rename_processed_file(old_relative, new_relative)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to update processing state: {e}") from e
+
+    def get_last_processed_commit(self) -> Optional[str]:
+        """Return the commit recorded by the last successful run, if any"""
+        try:
+            return self._state_store.get_last_processed_commit()
+        except sqlite3.Error:
+            return None
+
     def load_processing_state(self) -> Dict:
         """Load the processing state from SQLite."""
+        self.flush_pending()
         try:
             return self._state_store.load_state()
         except sqlite3.Error as e:
@@ -159,6 +439,10 @@ class GitTracker:
         """Save the processing state to SQLite."""
         state["last_update"] = datetime.now().isoformat()
 
+        # save_state replaces every row, so buffered writes are superseded.
+        if self._pending is not None:
+            self._pending.clear()
+
         try:
             self._state_store.save_state(state)
         except sqlite3.Error as e:
@@ -181,61 +465,107 @@ class GitTracker:
         except OSError as e:
             raise RuntimeError(f"Failed to read file {file_path}: {e}") from e
 
-    def mark_file_processed(self, file_path: Path, commit_hash: Optional[str] = None) -> None:
+    def mark_file_processed(self, file_path: Path, commit_hash: Optional[str] = None) -> str:
         """
         Mark a file as processed in the state tracking
 
         Args:
             file_path: Path to the processed file
             commit_hash: Git commit hash when file was processed (default: current HEAD)
+
+        Returns:
+            The content hash recorded for the file
         """
         if commit_hash is None:
             commit_hash = self.get_current_commit_hash()
 
         relative_path = str(file_path.relative_to(self.repo_path))
+        # Stat before hashing so a write racing with us leaves a stale mtime
+        # behind and the next check falls through to the hash tier.
+        stat = file_path.stat()
         content_hash = self.get_file_content_hash(file_path)
 
         file_info = {
             "processed_at": datetime.now().isoformat(),
             "commit_hash": commit_hash,
             "content_hash": content_hash,
-            "file_size": file_path.stat().st_size,
-            "last_modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
+            "file_size": stat.st_size,
+            "last_modified": _format_mtime(stat.st_mtime),
         }
 
-        try:
-            self._state_store.upsert_processed_file(relative_path, file_info)
-        except sqlite3.Error as e:
-            raise RuntimeError(f"Failed to save processing state: {e}") from e
+        self._record_processed(relative_path, file_info)
+        return content_hash
 
-    def is_file_processed(self, file_path: Path) -> bool:
+    def is_file_processed(self, file_path: Path, *, paranoid: Optional[bool] = None) -> bool:
         """
         Check if a file has been processed and hasn't changed since
 
+        The check is tiered: when the file's size and mtime match the stored
+        row the file is trusted without reading it. Only when they differ (or
+        in paranoid mode) is the content hashed and compared. If the hash still
+        matches, the stored size/mtime are refreshed so the next check takes
+        the fast path again. Each decision is tallied in ``check_counts``.
+
         Args:
             file_path: Path to check
+            paranoid: Override the tracker-level paranoid setting for this call
 
         Returns:
             True if file has been processed and is unchanged
         """
         relative_path = str(file_path.relative_to(self.repo_path))
 
-        try:
-            file_info = self._state_store.get_processed_file(relative_path)
-        except sqlite3.Error:
-            return False
+        file_info = self._get_processed_file(relative_path)
 
         if not file_info:
+            self.check_counts["untracked"] += 1
             return False
 
-        # Check if file content has changed
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # File might have been deleted or is inaccessible
+            self.check_counts["untracked"] += 1
+            return False
+
+        current_mtime = _format_mtime(stat.st_mtime)
+        stat_matches = file_info.get("file_size") == stat.st_size and file_info.get("last_modified") == current_mtime
+
+        # A file modified in the same second it was processed may have changed
+        # again without its mtime moving (coarse filesystem timestamps), so
+        # such "racy" rows are never trusted on stat alone.
+        processed_at = str(file_info.get("processed_at") or "")
+        racy = processed_at[:19] == current_mtime[:19]
+
+        if stat_matches and not racy and not (self.paranoid if paranoid is None else paranoid):
+            self.check_counts["stat"] += 1
+            return True
+
+        # Size or mtime changed (or paranoid mode): compare content hashes.
+        self.check_counts["hash"] += 1
         try:
             current_content_hash = self.get_file_content_hash(file_path)
-            return current_content_hash == file_info.get("content_hash")
         except RuntimeError:
-            # File might have been deleted or is inaccessible
             return False
 
+        if current_content_hash != file_info.get("content_hash"):
+            return False
+
+        if not stat_matches:
+            # Content is unchanged (e.g. touched or re-checked out); remember
+            # the new size/mtime so later checks stay on the stat tier.
+            with suppress(RuntimeError):
+                self._record_processed(
+                    relative_path,
+                    {**file_info, "file_size": stat.st_size, "last_modified": current_mtime},
+                )
+
+        return True
+
+    def reset_check_counts(self) -> None:
+        """Reset the per-tier is_file_processed() counters."""
+        self.check_counts = dict.fromkeys(CHECK_TIERS, 0)
+
     def get_unprocessed_files(self, file_extensions: Optional[Set[str]] = None) -> List[Path]:
         """
         Get list of files that need processing (new or changed)
@@ -257,32 +587,106 @@ class GitTracker:
 
         return unprocessed_files
 
-    def get_processing_summary(self) -> Dict:
+    def _get_index_mtime(self) -> Optional[int]:
+        """Return the git index mtime in nanoseconds, or None if it has no index yet."""
+        if self._index_path is None:
+            try:
+                result = subprocess.run(
+                    ["git", "rev-parse", "--git-path", "index"],
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+            except subprocess.CalledProcessError:
+                return None
+            self._index_path = self.repo_path / result.stdout.strip()
+        try:
+            return self._index_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _summary_cache_key(self, head_commit: str) -> Tuple[Any, ...]:
+        # last_update is rewritten by every state commit, so it doubles as a
+        # change counter for the processing state (including other processes).
+        return (head_commit, self._get_index_mtime(), self._state_store.get_meta("last_update"))
+
+    def _cached_summary_counts(self, key: Tuple[Any, ...]) -> Optional[Dict[str, int]]:
+        """Counts of the last scan if it was taken at ``key`` (this process or a previous one)."""
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+        try:
+            payload = json.loads(self._state_store.get_meta(SUMMARY_META_KEY) or "null")
+        except (sqlite3.Error, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("key") != list(key):
+            return None
+        counts = payload.get("counts")
+        if not isinstance(counts, dict):
+            return None
+        self._summary_cache = (key, counts)
+        return counts
+
+    def _store_summary_counts(self, key: Tuple[Any, ...], counts: Dict[str, int]) -> None:
+        self._summary_cache = (key, counts)
+        try:
+            self._state_store.set_meta(SUMMARY_META_KEY, json.dumps({"key": list(key), "counts": counts}))
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to store processing summary: {e}")
+
+    def get_processing_summary(self, refresh: bool = False) -> Dict:
         """
         Get a summary of processing state
 
+        Counts come from SQLite; the tracked/unprocessed scan is cached per
+        (HEAD, index mtime, state last_update) in the state database, so a
+        new tracker (e.g. the next CLI run) reuses it too, and it is only
+        redone when one of those changes. Unstaged edits to tracked files are
+        not noticed until the index or HEAD moves; pass ``refresh=True`` to
+        force a rescan.
+
+        Args:
+            refresh: Ignore the cached scan result
+
         Returns:
             Dictionary with processing statistics
         """
-        state = self.load_processing_state()
-
-        # Count supported files
-        supported_extensions = {".md", ".txt", ".pdf", ".docx", ".html", ".htm"}
-        all_files = self.get_changed_files(since_commit=None, file_extensions=supported_extensions)
-        unprocessed_files = self.get_unprocessed_files(file_extensions=supported_extensions)
+        self.flush_pending()
+        try:
+            processed_count = self._state_store.count_processed_files()
+            last_processed_commit = self._state_store.get_last_processed_commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to read processing state SQLite: {e}")
+            processed_count, last_processed_commit = 0, None
+
+        current_commit = self.get_current_commit_hash()
+        key = self._summary_cache_key(current_commit)
+        counts = None if refresh else self._cached_summary_counts(key)
+        cached = counts is not None
+
+        if counts is None:
+            tracked_files = self.get_changed_files(since_commit=None, file_extensions=SUMMARY_EXTENSIONS)
+            unprocessed = sum(1 for file_path in tracked_files if not self.is_file_processed(file_path))
+            counts = {"total_tracked_files": len(tracked_files), "unprocessed_files": unprocessed}
+            # is_file_processed may refresh stale rows, so key on the post-scan state.
+            key = self._summary_cache_key(current_commit)
+            self._store_summary_counts(key, counts)
 
         return {
-            "total_tracked_files": len(all_files),
-            "processed_files": len(state["processed_files"]),
-            "unprocessed_files": len(unprocessed_files),
-            "last_processed_commit": state.get("last_processed_commit"),
-            "current_commit": self.get_current_commit_hash(),
-            "last_update": state.get("last_update"),
+            "total_tracked_files": counts["total_tracked_files"],
+            "processed_files": processed_count,
+            "unprocessed_files": counts["unprocessed_files"],
+            "last_processed_commit": last_processed_commit,
+            "current_commit": current_commit,
+            "last_update": key[2],
             "state_file": str(self.state_file),
+            "cached": cached,
         }
 
     def reset_processing_state(self) -> None:
         """Reset all processing state (marks all files as unprocessed)"""
+        if self._pending is not None:
+            self._pending.clear()
         try:
             self._state_store.set_meta("version", "1.0.0")
             self._state_store.set_last_processed_commit(None)
@@ -292,6 +696,7 @@ class GitTracker:
 
     def update_last_processed_commit(self) -> None:
         """Update the last processed commit to current HEAD"""
+        self.flush_pending()
         try:
             self._state_store.set_last_processed_commit(self.get_current_commit_hash())
         except sqlite3.Error as e:
@@ -0,0 +1,377 @@
+"""Persistent status of background jobs (rebuilds, directory processing).
+
+Long-running endpoints hand their work to a job and return its ID at once.
+Each job row (``jobs.sqlite`` next to the article index) records its state,
+current phase, progress details, result or error and whether cancellation
+was requested, so status survives the request that started it and can be
+polled from ``GET /jobs/{id}``.
+
+Jobs can also append a log of events (for example one per processed file)
+to ``job_events``; ``events(job_id, after=seq)`` reads them in order, which
+is what the progress stream of ``GET /jobs/{id}/events`` tails.
+
+Jobs carry a dedupe key; ``submit`` returns the already queued or running
+job with the same key instead of creating a second one, which merges
+concurrent submissions of the same rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+ACTIVE_STATES = (QUEUED, RUNNING)
+FINAL_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+_COLUMNS = (
+    "id",
+    "kind",
+    "dedupe_key",
+    "status",
+    "phase",
+    "progress_json",
+    "result_json",
+    "error",
+    "cancel_requested",
+    "created_at",
+    "started_at",
+    "finished_at",
+)
+
+
+def default_job_sqlite_path(index_path: Path) -> Path:
+    """Return the job database that sits next to an article index path."""
+
+    return Path(index_path).with_name("jobs.sqlite")
+
+
+@dataclass(frozen=True)
+class JobStoreConfig:
+    sqlite_path: Path
+
+
+@dataclass
+class JobRecord:
+    id: str
+    kind: str
+    dedupe_key: Optional[str]
+    status: str
+    phase: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "phase": self.phase,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+@dataclass
+class JobEvent:
+    seq: int
+    event: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "event": self.event, "time": self.created_at, **self.data}
+
+
+def _row_to_job(row: sqlite3.Row) -> JobRecord:
+    return JobRecord(
+        id=row["id"],
+        kind=row["kind"],
+        dedupe_key=row["dedupe_key"],
+        status=row["status"],
+        phase=row["phase"],
+        progress=json.loads(row["progress_json"]) if row["progress_json"] else {},
+        result=json.loads(row["result_json"]) if row["result_json"] else None,
+        error=row["error"],
+        cancel_requested=bool(row["cancel_requested"]),
+        created_at=float(row["created_at"]),
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+    )
+
+
+class JobStore:
+    """SQLite-backed job table."""
+
+    def __init__(self, config: JobStoreConfig):
+        self._path = config.sqlite_path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize()
+
+    @property
+    def sqlite_path(self) -> Path:
+        return self._path
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self._path), timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL;")
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _initialize(self) -> None:
+        conn = self.connect()
+        try:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                  id TEXT PRIMARY KEY,
+                  kind TEXT NOT NULL,
+                  dedupe_key TEXT,
+                  status TEXT NOT NULL,
+                  phase TEXT,
+                  progress_json TEXT,
+                  result_json TEXT,
+                  error TEXT,
+                  cancel_requested INTEGER NOT NULL DEFAULT 0,
+                  created_at REAL NOT NULL,
+                  started_at REAL,
+                  finished_at REAL
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_jobs_dedupe ON jobs(dedupe_key, status);
+                CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at);
+
+                CREATE TABLE IF NOT EXISTS job_events (
+                  job_id TEXT NOT NULL,
+                  seq INTEGER NOT NULL,
+                  event TEXT NOT NULL,
+                  data_json TEXT,
+                  created_at REAL NOT NULL,
+                  PRIMARY KEY(job_id, seq)
+                ) WITHOUT ROWID;
+                """
+            )
+        finally:
+            conn.close()
+
+    def _fetch(self, conn: sqlite3.Connection, job_id: str) -> Optional[JobRecord]:
+        row = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def submit(self, kind: str, dedupe_key: Optional[str] = None) -> Tuple[JobRecord, bool]:
+        """Create a queued job, or return the active job with the same dedupe key.
+
+        Returns ``(job, created)``.
+        """
+
+        with self._transaction() as conn:
+            if dedupe_key is not None:
+                row = conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE dedupe_key = ? AND status IN (?, ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (dedupe_key, *ACTIVE_STATES),
+                ).fetchone()
+                if row is not None:
+                    return _row_to_job(row), False
+            job = JobRecord(id=uuid.uuid4().hex, kind=kind, dedupe_key=dedupe_key, status=QUEUED, created_at=time.time())
+            conn.execute(
+                "INSERT INTO jobs(id, kind, dedupe_key, status, created_at) VALUES(?, ?, ?, ?, ?)",
+                (job.id, kind, dedupe_key, QUEUED, job.created_at),
+            )
+        return job, True
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        conn = self.connect()
+        try:
+            return self._fetch(conn, job_id)
+        finally:
+            conn.close()
+
+    def list(self, *, limit: int = 50, kind: Optional[str] = None) -> List[JobRecord]:
+        """Most recent jobs first."""
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM jobs"
+        params: List[Any] = []
+        if kind is not None:
+            sql += " WHERE kind = ?"
+            params.append(kind)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(int(limit))
+        conn = self.connect()
+        try:
+            return [_row_to_job(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+    def start(self, job_id: str) -> bool:
+        """Move a queued job to running; False if it was cancelled or is not queued."""
+
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ? AND status = ? AND cancel_requested = 0",
+                (RUNNING, time.time(), job_id, QUEUED),
+            )
+            return cursor.rowcount > 0
+
+    def update_progress(
+        self,
+        job_id: str,
+        phase: Optional[str],
+        progress: Dict[str, Any],
+        events: Sequence[Tuple[str, Dict[str, Any], float]] = (),
+    ) -> None:
+        """Store the current phase/progress and append ``(event, data, time)`` entries."""
+
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET phase = ?, progress_json = ? WHERE id = ?",
+                (phase, json.dumps(progress, default=str), job_id),
+            )
+            if events:
+                last = conn.execute("SELECT MAX(seq) FROM job_events WHERE job_id = ?", (job_id,)).fetchone()[0]
+                start = (last or 0) + 1
+                conn.executemany(
+                    "INSERT INTO job_events(job_id, seq, event, data_json, created_at) VALUES(?, ?, ?, ?, ?)",
+                    [
+                        (job_id, start + offset, event, json.dumps(data, default=str), created_at)
+                        for offset, (event, data, created_at) in enumerate(events)
+                    ],
+                )
+
+    def events(self, job_id: str, *, after: int = 0, limit: int = 500) -> List[JobEvent]:
+        """Events of a job with ``seq > after``, oldest first."""
+
+        conn = self.connect()
+        try:
+            rows = conn.execute(
+                "SELECT seq, event, data_json, created_at FROM job_events "
+                "WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, int(after), int(limit)),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            JobEvent(
+                seq=row["seq"],
+                event=row["event"],
+                data=json.loads(row["data_json"]) if row["data_json"] else {},
+                created_at=float(row["created_at"]),
+            )
+            for row in rows
+        ]
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        *,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        if status not in FINAL_STATES:
+            raise ValueError(f"Not a final job state: {status}")
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result_json = ?, error = ?, finished_at = ? WHERE id = ?",
+                (
+                    status,
+                    json.dumps(result, default=str) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def request_cancel(self, job_id: str) -> Optional[JobRecord]:
+        """Flag a job for cancellation; a job that has not started is cancelled at once."""
+
+        with self._transaction() as conn:
+            job = self._fetch(conn, job_id)
+            if job is None or job.done:
+                return job
+            conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+            if job.status == QUEUED:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ?", (CANCELLED, time.time(), job_id)
+                )
+            return self._fetch(conn, job_id)
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        return bool(row and row[0])
+
+    def fail_interrupted(self) -> int:
+        """Mark jobs left active by a previous process as failed; returns how many."""
+
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?)",
+                (FAILED, "Interrupted by a server restart", time.time(), *ACTIVE_STATES),
+            )
+            return cursor.rowcount
+
+
+def open_job_store(index_path: Path) -> JobStore:
+    """Open the job store that belongs to an article index."""
+
+    return JobStore(JobStoreConfig(sqlite_path=default_job_sqlite_path(index_path)))
+
+
+__all__ = [
+    "ACTIVE_STATES",
+    "CANCELLED",
+    "FAILED",
+    "FINAL_STATES",
+    "JobEvent",
+    "JobRecord",
+    "JobStore",
+    "JobStoreConfig",
+    "QUEUED",
+    "RUNNING",
+    "SUCCEEDED",
+    "default_job_sqlite_path",
+    "open_job_store",
+]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -13,9 +13,228 @@ class ArticleLayoutPoint:
     y: float
 
 
+# Queries resolved per vectorized step of the NumPy grid search; bounds the
+# candidate arrays to roughly chunk * 9 * k entries.
+_GRID_QUERY_CHUNK = 16384
+
+
+def _distance(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    dx = a[0] - b[0]
+    dy = a[1] - b[1]
+    return math.sqrt(dx * dx + dy * dy)
+
+
+def _grid_cell_size(n: int, k: int, span_x: float, span_y: float) -> float:
+    """Cell edge length for a uniform grid holding about ``k`` points per cell."""
+
+    area = span_x * span_y
+    if area > 0:
+        cell = math.sqrt(area * k / n)
+    else:
+        # Collinear (or identical) points: size cells along the populated axis.
+        cell = max(span_x, span_y) * k / n
+    if not cell > 0 or not math.isfinite(cell):
+        cell = 1.0
+    return cell
+
+
+def _knn_grid(points: List[Tuple[float, float]], k: int) -> List[List[int]]:
+    """k-nearest neighbors using a uniform grid (pure Python).
+
+    Each query scans rings of cells outward from its own cell and stops once
+    the k-th best distance is closer than anything an unscanned ring could
+    contain.
+    """
+
+    n = len(points)
+    min_x = min(x for x, _ in points)
+    min_y = min(y for _, y in points)
+    cell = _grid_cell_size(n, k, max(x for x, _ in points) - min_x, max(y for _, y in points) - min_y)
+
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    cell_of: List[Tuple[int, int]] = []
+    for index, (x, y) in enumerate(points):
+        key = (int((x - min_x) / cell), int((y - min_y) / cell))
+        cell_of.append(key)
+        grid.setdefault(key, []).append(index)
+    max_ring = max(max(cx for cx, _ in grid), max(cy for _, cy in grid))
+
+    result: List[List[int]] = []
+    for index, point in enumerate(points):
+        cx, cy = cell_of[index]
+        candidates: List[Tuple[float, int]] = []
+        ring = 0
+        while True:
+            for gx in range(cx - ring, cx + ring + 1):
+                on_edge = gx in (cx - ring, cx + ring)
+                for gy in range(cy - ring, cy + ring + 1) if on_edge else (cy - ring, cy + ring):
+                    members = grid.get((gx, gy))
+                    if members:
+                        for other in members:
+                            if other != index:
+                                candidates.append((_distance(point, points[other]), other))
+            if ring >= max_ring:
+                break
+            if len(candidates) >= k:
+                candidates.sort()
+                del candidates[k:]
+                # Points in ring + 1 are at least ring * cell away; ties keep
+                # scanning so the lower index wins like a full sort would.
+                if candidates[-1][0] < ring * cell:
+                    break
+            ring += 1
+        candidates.sort()
+        result.append([other for _, other in candidates[:k]])
+    return result
+
+
+def _knn_grid_numpy(points: List[Tuple[float, float]], k: int) -> List[List[int]]:
+    """Vectorized version of ``_knn_grid``.
+
+    All pending queries scan a square of ``(2 * ring + 1) ** 2`` cells at once;
+    queries whose k-th distance is not provably final (sparse regions, ties)
+    are retried with a doubled ring.
+    """
+
+    import numpy as np
+
+    coords = np.asarray(points, dtype=np.float64)
+    xs, ys = coords[:, 0], coords[:, 1]
+    n = len(points)
+    min_x, min_y = float(xs.min()), float(ys.min())
+    cell = _grid_cell_size(n, k, float(xs.max()) - min_x, float(ys.max()) - min_y)
+
+    cx = ((xs - min_x) / cell).astype(np.int64)
+    cy = ((ys - min_y) / cell).astype(np.int64)
+    nx, ny = int(cx.max()) + 1, int(cy.max()) + 1
+    cell_ids = cx * ny + cy
+    by_cell = np.argsort(cell_ids, kind="stable")
+    counts = np.bincount(cell_ids, minlength=nx * ny)
+    starts = np.cumsum(counts) - counts
+
+    result = np.empty((n, k), dtype=np.int64)
+    pending = np.arange(n)
+    ring = 1
+    while pending.size:
+        unresolved = []
+        for chunk_start in range(0, pending.size, _GRID_QUERY_CHUNK):
+            queries = pending[chunk_start : chunk_start + _GRID_QUERY_CHUNK]
+            query_parts, candidate_parts = [], []
+            for ox in range(-ring, ring + 1):
+                gx = cx[queries] + ox
+                for oy in range(-ring, ring + 1):
+                    gy = cy[queries] + oy
+                    inside = (gx >= 0) & (gx < nx) & (gy >= 0) & (gy < ny)
+                    cells = gx[inside] * ny + gy[inside]
+                    cell_counts = counts[cells]
+                    total = int(cell_counts.sum())
+                    if not total:
+                        continue
+                    # Expand each (query, cell) pair into one row per cell member.
+                    offsets = np.arange(total) - np.repeat(np.cumsum(cell_counts) - cell_counts, cell_counts)
+                    query_parts.append(np.repeat(queries[inside], cell_counts))
+                    candidate_parts.append(by_cell[np.repeat(starts[cells], cell_counts) + offsets])
+
+            query_of = np.concatenate(query_parts) if query_parts else np.empty(0, dtype=np.int64)
+            candidate = np.concatenate(candidate_parts) if candidate_parts else np.empty(0, dtype=np.int64)
+            keep = candidate != query_of
+            query_of, candidate = query_of[keep], candidate[keep]
+            dx = xs[query_of] - xs[candidate]
+            dy = ys[query_of] - ys[candidate]
+            distance = np.sqrt(dx * dx + dy * dy)
+
+            # Group by query; within a query order by (distance, index).
+            order = np.lexsort((candidate, distance, query_of))
+            query_of, candidate, distance = query_of[order], candidate[order], distance[order]
+            group_queries, group_starts, group_sizes = np.unique(query_of, return_index=True, return_counts=True)
+            rank = np.arange(query_of.size) - np.repeat(group_starts, group_sizes)
+
+            found = np.zeros(queries.size, dtype=np.int64)
+            kth_distance = np.full(queries.size, np.inf)
+            position = np.searchsorted(queries, group_queries)
+            found[position] = group_sizes
+            enough = group_sizes >= k
+            kth_distance[position[enough]] = distance[group_starts[enough] + k - 1]
+
+            covers_grid = ring >= max(nx, ny)
+            resolved = (found >= k) & ((kth_distance < ring * cell) | covers_grid)
+            top = rank < k
+            top &= resolved[np.searchsorted(queries, query_of)]
+            result[query_of[top], rank[top]] = candidate[top]
+            unresolved.append(queries[~resolved])
+        pending = np.concatenate(unresolved)
+        ring *= 2
+    return result.tolist()
+
+
+def _knn_kdtree(points: List[Tuple[float, float]], k: int) -> List[List[int]]:
+    """k-nearest neighbors via scipy's cKDTree.
+
+    The tree does not promise any order among equidistant points, so each
+    row is re-sorted by (distance, index), and rows where the k-th and
+    (k+1)-th neighbors tie are re-resolved exactly with a radius query.
+    """
+
+    import numpy as np
+    from scipy.spatial import cKDTree  # type: ignore[import]
+
+    coords = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    tree = cKDTree(coords)
+    query_k = min(k + 2, n)
+    _, indices = tree.query(coords, k=query_k)
+
+    is_self = indices == np.arange(n)[:, None]
+    has_self = is_self.any(axis=1)
+    # Drop the query point itself (or, in rows full of exact duplicates that
+    # crowded it out, the last column; those rows are redone below).
+    is_self[~has_self, -1] = True
+    neighbors = indices[~is_self].reshape(n, query_k - 1)
+
+    dx = coords[:, 0][:, None] - coords[neighbors, 0]
+    dy = coords[:, 1][:, None] - coords[neighbors, 1]
+    distances = np.sqrt(dx * dx + dy * dy)
+    order = np.lexsort((neighbors, distances), axis=1)
+    neighbors = np.take_along_axis(neighbors, order, axis=1)
+    distances = np.take_along_axis(distances, order, axis=1)
+
+    ambiguous = ~has_self
+    if neighbors.shape[1] > k:
+        ambiguous |= distances[:, k - 1] == distances[:, k]
+    result = neighbors[:, :k].tolist()
+
+    for index in np.flatnonzero(ambiguous).tolist():
+        # Pad the radius so rounding in the tree's own distance cannot drop a tie.
+        radius = float(distances[index, k - 1])
+        nearby = tree.query_ball_point(coords[index], r=radius * (1 + 1e-9) + 1e-12)
+        candidates = sorted((_distance(points[index], points[other]), other) for other in nearby if other != index)
+        result[index] = [other for _, other in candidates[:k]]
+    return result
+
+
+def _knn_indices(points: List[Tuple[float, float]], k: int) -> List[List[int]]:
+    try:
+        import scipy.spatial  # type: ignore[import]  # noqa: F401
+
+        return _knn_kdtree(points, k)
+    except ImportError:
+        pass
+    try:
+        import numpy  # noqa: F401
+
+        return _knn_grid_numpy(points, k)
+    except ImportError:
+        return _knn_grid(points, k)
+
+
 def compute_nearest_neighbors(layout_coords: Dict[str, Tuple[float, float]], k: int = 5) -> Dict[str, List[str]]:
     """Compute k-nearest neighbors for each article based on 2D layout coordinates.
 
+    Neighbors are ordered by Euclidean distance, ties broken by the order of
+    ``layout_coords``. Uses scipy's KD-tree when available and a uniform grid
+    index otherwise (vectorized with NumPy when installed); all paths return
+    the same lists as comparing every pair.
+
     Args:
         layout_coords: Mapping of article_id to (x, y) coordinates
         k: Number of nearest neighbors to compute
@@ -26,29 +245,17 @@ def compute_nearest_neighbors(layout_coords: Dict[str, Tuple[float, float]], k:
     if not layout_coords or k <= 0:
         return {}
 
-    neighbors: Dict[str, List[str]] = {}
     article_ids = list(layout_coords.keys())
+    points = [(float(x), float(y)) for x, y in (layout_coords[article_id] for article_id in article_ids)]
+    k = min(k, len(article_ids) - 1)
+    if k == 0:
+        return {article_id: [] for article_id in article_ids}
 
-    for article_id in article_ids:
-        x1, y1 = layout_coords[article_id]
-
-        # Calculate distances to all other articles
-        distances: List[Tuple[str, float]] = []
-        for other_id in article_ids:
-            if other_id == article_id:
-                continue
-            x2, y2 = layout_coords[other_id]
-            dx = x1 - x2
-            dy = y1 - y2
-            distance = math.sqrt(dx * dx + dy * dy)
-            distances.append((other_id, distance))
-
-        # Sort by distance and take k nearest
-        distances.sort(key=lambda x: x[1])
-        nearest = [neighbor_id for neighbor_id, _ in distances[:k]]
-        neighbors[article_id] = nearest
-
-    return neighbors
+    neighbor_indices = _knn_indices(points, k)
+    return {
+        article_id: [article_ids[other] for other in neighbor_indices[index]]
+        for index, article_id in enumerate(article_ids)
+    }
 
 
 def _fallback_grid_layout(article_ids: Iterable[str]) -> Dict[str, Tuple[float, float]]:
@@ -83,41 +290,94 @@ def compute_fallback_layout(article_ids: Iterable[str]) -> Dict[str, Tuple[float
     return _fallback_grid_layout(article_ids)
 
 
-def compute_layout_from_embeddings(embeddings: Dict[str, List[float]]) -> Dict[str, Tuple[float, float]]:
-    """Project high-dimensional embeddings into 2D coordinates.
+# Layout engines accepted by ``fit_layout_projector``: ``auto`` uses UMAP when
+# installed and PCA otherwise, ``pca`` is the quick preview, ``relaxed`` adds
+# a force-relaxation pass on top of PCA.
+LAYOUT_METHODS = ("auto", "umap", "pca", "relaxed")
+
 
-    This function is structured to allow plugging in a more advanced
-    projector (e.g. UMAP) later. For now it falls back to a simple grid
-    layout when the number of points is small or no optional dependency
-    is available.
+def _fit_numpy_projection(
+    embeddings: Dict[str, Sequence[float]], *, relax: bool
+) -> Tuple[Optional[Any], Dict[str, Tuple[float, float]]]:
+    # NumPy ships with chromadb but is not a declared dependency.
+    try:
+        import numpy as np
+
+        from .projection import fit_projection
+    except ImportError:
+        return None, _fallback_grid_layout(embeddings.keys())
+
+    ids = list(embeddings.keys())
+    try:
+        projector, coords_array = fit_projection([embeddings[i] for i in ids], relax=relax)
+    except (ValueError, np.linalg.LinAlgError) as e:
+        import logging
+
+        logging.getLogger(__name__).warning(f"PCA layout failed, using grid fallback: {e}")
+        return None, _fallback_grid_layout(ids)
+    return projector, {doc_id: (float(x), float(y)) for doc_id, (x, y) in zip(ids, coords_array)}
+
+
+def fit_layout_projector(
+    embeddings: Dict[str, Sequence[float]],
+    *,
+    method: str = "auto",
+) -> Tuple[Optional[Any], Dict[str, Tuple[float, float]]]:
+    """Fit a 2D projector on ``embeddings``.
+
+    Returns the fitted projector (an object with ``transform(vectors)``, or
+    None when the coordinates cannot be reproduced for new articles) and the
+    coordinates of every input article. ``method`` is one of
+    ``LAYOUT_METHODS``; without UMAP, ``auto`` and ``umap`` use PCA, and
+    without NumPy everything degrades to the grid fallback.
     """
 
+    if method not in LAYOUT_METHODS:
+        raise ValueError(f"Unknown layout method {method!r}; expected one of {', '.join(LAYOUT_METHODS)}")
     if not embeddings:
-        return {}
+        return None, {}
 
-    # Lazy import so UMAP remains an optional dependency.
-    try:  # pragma: no cover - exercised only when umap-learn is installed
-        import umap  # type: ignore[import]
+    if method in ("auto", "umap"):
+        # Lazy import so UMAP remains an optional dependency.
+        try:  # pragma: no cover - exercised only when umap-learn is installed
+            import umap  # type: ignore[import]
 
-        ids = list(embeddings.keys())
-        vectors = [embeddings[i] for i in ids]
-        reducer = umap.UMAP(n_components=2, random_state=42)
-        coords_array = reducer.fit_transform(vectors)
-        return {doc_id: (float(x), float(y)) for doc_id, (x, y) in zip(ids, coords_array)}
-    except ImportError:
-        # UMAP not available, use grid fallback
-        return _fallback_grid_layout(embeddings.keys())
-    except (ValueError, RuntimeError) as e:
-        # UMAP computation failed, use grid fallback
-        import logging
+            ids = list(embeddings.keys())
+            vectors = [embeddings[i] for i in ids]
+            reducer = umap.UMAP(n_components=2, random_state=42)
+            coords_array = reducer.fit_transform(vectors)
+            return reducer, {doc_id: (float(x), float(y)) for doc_id, (x, y) in zip(ids, coords_array)}
+        except ImportError:
+            # UMAP not available, use PCA
+            pass
+        except (ValueError, RuntimeError) as e:
+            # UMAP computation failed (e.g. too few points), use PCA
+            import logging
+
+            logging.getLogger(__name__).warning(f"UMAP layout failed, using PCA: {e}")
+
+    return _fit_numpy_projection(embeddings, relax=method == "relaxed")
+
+
+def compute_layout_from_embeddings(
+    embeddings: Dict[str, Sequence[float]], *, method: str = "auto"
+) -> Dict[str, Tuple[float, float]]:
+    """Project high-dimensional embeddings into 2D coordinates.
+
+    Uses UMAP when installed and a NumPy PCA projection otherwise (or when
+    ``method="pca"`` asks for a quick preview). See ``fit_layout_projector``
+    to keep the fitted projector, and ``layout_store.update_layout`` to place
+    new articles without refitting.
+    """
 
-        logging.getLogger(__name__).warning(f"UMAP layout failed, using grid fallback: {e}")
-        return _fallback_grid_layout(embeddings.keys())
+    return fit_layout_projector(embeddings, method=method)[1]
 
 
 __all__ = [
+    "LAYOUT_METHODS",
     "ArticleLayoutPoint",
     "compute_fallback_layout",
     "compute_layout_from_embeddings",
     "compute_nearest_neighbors",
+    "fit_layout_projector",
 ]
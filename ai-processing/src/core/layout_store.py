@@ -0,0 +1,407 @@
+"""Persisted 2D layout with out-of-sample placement.
+
+Fitting the projection (UMAP ``fit_transform``) over the whole library takes
+minutes and reshuffles the map, so it should not run whenever one article is
+added. ``update_layout`` keeps the coordinates (``layout.sqlite`` next to the
+article index) together with the fitted projector and only places new or
+changed articles: with the projector's ``transform`` when it has one,
+otherwise by interpolating the positions of their nearest neighbors in
+embedding space. A full refit happens on request or once the share of
+articles placed out of sample since the last fit passes a threshold.
+
+The store sits inside the (user-synced) documents tree, so nothing is
+unpickled from it: a PCA projector is saved as its two arrays
+(``layout.projector.npz``, loaded with ``allow_pickle=False``), while a UMAP
+reducer is only kept in memory. A process that needs a UMAP transform it no
+longer holds refits instead.
+
+The store also records a fingerprint of the whole (article_id, embedding
+fingerprint) set it was last brought up to date with, so an unchanged
+library is recognised without diffing every point, and ``load_coords``
+gives readers the stored positions without computing anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .embedding_neighbors import vector_fingerprint
+from .layout import fit_layout_projector
+
+logger = logging.getLogger(__name__)
+
+# Refit once this fraction of the fitted set has been placed or removed since.
+DEFAULT_DRIFT_THRESHOLD = 0.2
+
+# How the last fitted projector was kept (``projector`` in layout_meta).
+PROJECTOR_NONE = "none"
+PROJECTOR_FILE = "file"
+PROJECTOR_MEMORY = "memory"
+
+# Neighbors averaged when interpolating a position.
+DEFAULT_INTERPOLATION_NEIGHBORS = 5
+
+Coords = Tuple[float, float]
+
+
+def embedding_set_fingerprint(fingerprints: Dict[str, str]) -> str:
+    """Fingerprint of a set of (article_id, embedding fingerprint) pairs."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for article_id in sorted(fingerprints):
+        digest.update(article_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(fingerprints[article_id].encode("ascii"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def default_layout_sqlite_path(index_path: Path) -> Path:
+    """Return the layout database that sits next to an article index path."""
+
+    return Path(index_path).with_name("layout.sqlite")
+
+
+@dataclass(frozen=True)
+class LayoutStoreConfig:
+    sqlite_path: Path
+
+
+@dataclass
+class LayoutUpdate:
+    """Result of ``update_layout``."""
+
+    coords: Dict[str, Coords]
+    version: int
+    refitted: bool = False
+    placed: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+
+class LayoutStore:
+    """SQLite-backed layout coordinates plus the projector that produced them."""
+
+    def __init__(self, config: LayoutStoreConfig):
+        self._path = config.sqlite_path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._projector_cache: Optional[Tuple[Tuple[int, int], Any]] = None
+        # A projector that cannot be stored safely (e.g. UMAP), for this process only.
+        self._memory_projector: Optional[Any] = None
+        self._initialize()
+
+    @property
+    def sqlite_path(self) -> Path:
+        return self._path
+
+    @property
+    def projector_path(self) -> Path:
+        return self._path.with_suffix(".projector.npz")
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self._path), timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _initialize(self) -> None:
+        conn = self.connect()
+        try:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS layout_points (
+                  article_id TEXT PRIMARY KEY,
+                  fingerprint TEXT NOT NULL,
+                  x REAL NOT NULL,
+                  y REAL NOT NULL,
+                  placement TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS layout_meta (
+                  key TEXT PRIMARY KEY,
+                  value TEXT NOT NULL
+                );
+                """
+            )
+        finally:
+            conn.close()
+
+    def load(self) -> Tuple[Dict[str, str], Dict[str, Tuple[str, float, float, str]]]:
+        """Return (meta, points) where points map article_id -> (fingerprint, x, y, placement)."""
+
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN")
+            meta = dict(conn.execute("SELECT key, value FROM layout_meta").fetchall())
+            points = {
+                row[0]: (row[1], float(row[2]), float(row[3]), row[4])
+                for row in conn.execute("SELECT article_id, fingerprint, x, y, placement FROM layout_points")
+            }
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return meta, points
+
+    def get_version(self) -> int:
+        meta, _ = self.load()
+        return int(meta.get("version", 0))
+
+    def load_coords(self) -> Dict[str, Coords]:
+        """Return the stored coordinates without touching embeddings."""
+
+        _, points = self.load()
+        return {article_id: (x, y) for article_id, (_, x, y, _) in points.items()}
+
+    def save(
+        self,
+        *,
+        points: Dict[str, Tuple[str, float, float, str]],
+        removed: Sequence[str] = (),
+        meta: Dict[str, str],
+        replace_all: bool = False,
+    ) -> int:
+        """Write points and meta in one transaction; returns the new version."""
+
+        with self._transaction() as conn:
+            row = conn.execute("SELECT value FROM layout_meta WHERE key='version'").fetchone()
+            version = int(row[0]) + 1 if row else 1
+            if replace_all:
+                conn.execute("DELETE FROM layout_points")
+            conn.executemany("DELETE FROM layout_points WHERE article_id=?", [(a,) for a in removed])
+            conn.executemany(
+                "INSERT INTO layout_points(article_id, fingerprint, x, y, placement) VALUES(?, ?, ?, ?, ?) "
+                "ON CONFLICT(article_id) DO UPDATE SET fingerprint=excluded.fingerprint, "
+                "x=excluded.x, y=excluded.y, placement=excluded.placement",
+                [(a, fp, x, y, how) for a, (fp, x, y, how) in points.items()],
+            )
+            conn.executemany(
+                "INSERT INTO layout_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                [*meta.items(), ("version", str(version))],
+            )
+        return version
+
+    def load_projector(self) -> Optional[Any]:
+        """Return the fitted projector, or None (a stored one is cached until the file changes)."""
+
+        if self._memory_projector is not None:
+            return self._memory_projector
+        try:
+            stat = self.projector_path.stat()
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._projector_cache and self._projector_cache[0] == signature:
+            return self._projector_cache[1]
+        try:
+            import numpy as np
+
+            from .projection import PCAProjector
+
+            with np.load(self.projector_path, allow_pickle=False) as arrays:
+                projector = PCAProjector(arrays["mean"], arrays["components"])
+        except (ImportError, OSError, KeyError, ValueError) as exc:
+            logger.warning("Ignoring unreadable layout projector %s: %s", self.projector_path, exc)
+            return None
+        self._projector_cache = (signature, projector)
+        return projector
+
+    def save_projector(self, projector: Optional[Any]) -> str:
+        """Keep the fitted projector; returns how (one of the ``PROJECTOR_*`` values).
+
+        A PCA projector is written to ``projector_path``; any other projector
+        is held in memory only. None removes the stored one.
+        """
+
+        self._projector_cache = None
+        self._memory_projector = None
+        self.projector_path.unlink(missing_ok=True)
+        if projector is None:
+            return PROJECTOR_NONE
+        try:
+            import numpy as np
+
+            from .projection import PCAProjector
+        except ImportError:
+            self._memory_projector = projector
+            return PROJECTOR_MEMORY
+        if not isinstance(projector, PCAProjector):
+            self._memory_projector = projector
+            return PROJECTOR_MEMORY
+        tmp_path = self.projector_path.with_name(self.projector_path.stem + ".tmp.npz")
+        with tmp_path.open("wb") as handle:
+            np.savez(handle, mean=projector.mean, components=projector.components)
+        os.replace(tmp_path, self.projector_path)
+        return PROJECTOR_FILE
+
+
+def open_layout_store(index_path: Path) -> LayoutStore:
+    """Open the layout store that belongs to an article index."""
+
+    return LayoutStore(LayoutStoreConfig(sqlite_path=default_layout_sqlite_path(index_path)))
+
+
+def interpolate_positions(
+    embeddings: Dict[str, Sequence[float]],
+    anchors: Dict[str, Coords],
+    article_ids: Sequence[str],
+    *,
+    k: int = DEFAULT_INTERPOLATION_NEIGHBORS,
+) -> Dict[str, Coords]:
+    """Place ``article_ids`` at the similarity-weighted mean of their nearest anchors.
+
+    Anchors are articles that already have coordinates; similarity is cosine
+    between embeddings. Articles with no positively similar anchor land on
+    the anchors' centroid.
+    """
+
+    import numpy as np
+
+    anchor_ids = [a for a in anchors if a in embeddings]
+    if not anchor_ids or not article_ids:
+        return {}
+
+    def normalized(ids: Sequence[str]):
+        matrix = np.asarray([embeddings[a] for a in ids], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    anchor_matrix = normalized(anchor_ids)
+    anchor_xy = np.asarray([anchors[a] for a in anchor_ids], dtype=np.float64)
+    centroid = anchor_xy.mean(axis=0)
+    take = min(k, len(anchor_ids))
+
+    placed: Dict[str, Coords] = {}
+    scores = normalized(article_ids) @ anchor_matrix.T
+    nearest = np.argpartition(-scores, take - 1, axis=1)[:, :take]
+    for row, article_id in enumerate(article_ids):
+        weights = np.clip(scores[row, nearest[row]], 0.0, None).astype(np.float64)
+        if weights.sum() <= 0:
+            x, y = centroid
+        else:
+            x, y = (anchor_xy[nearest[row]] * weights[:, None]).sum(axis=0) / weights.sum()
+        placed[article_id] = (float(x), float(y))
+    return placed
+
+
+def _place(
+    projector: Optional[Any],
+    embeddings: Dict[str, Sequence[float]],
+    anchors: Dict[str, Coords],
+    article_ids: List[str],
+) -> Tuple[Dict[str, Coords], str]:
+    if projector is not None and hasattr(projector, "transform"):
+        try:
+            projected = projector.transform([embeddings[a] for a in article_ids])
+            return {a: (float(x), float(y)) for a, (x, y) in zip(article_ids, projected)}, "transform"
+        except Exception as exc:
+            logger.warning("Projector transform failed, interpolating instead: %s", exc)
+    return interpolate_positions(embeddings, anchors, article_ids), "interpolate"
+
+
+def update_layout(
+    store: LayoutStore,
+    embeddings: Dict[str, Sequence[float]],
+    *,
+    refit: bool = False,
+    drift_threshold: float = DEFAULT_DRIFT_THRESHOLD,
+    method: str = "auto",
+) -> LayoutUpdate:
+    """Bring the persisted layout in line with ``embeddings``.
+
+    Unchanged articles keep their coordinates. New or changed articles are
+    placed out of sample. The projector is refitted on all articles when
+    ``refit`` is set, when nothing has been fitted yet, when ``method`` (see
+    ``layout.LAYOUT_METHODS``) differs from the one used for the last fit, or
+    when the articles placed or removed since the last fit would exceed
+    ``drift_threshold`` of the fitted set.
+    """
+
+    meta, points = store.load()
+    fingerprints = {article_id: vector_fingerprint(vector) for article_id, vector in embeddings.items()}
+    set_fingerprint = embedding_set_fingerprint(fingerprints)
+    if not refit and meta.get("set_fingerprint") == set_fingerprint and meta.get("method", "auto") == method:
+        # Same articles, same vectors: the stored layout is current.
+        coords = {a: (points[a][1], points[a][2]) for a in fingerprints if a in points}
+        if len(coords) == len(fingerprints):
+            return LayoutUpdate(coords=coords, version=int(meta.get("version", 0)))
+
+    removed = set(points) - set(fingerprints)
+    changed = sorted(a for a, fp in fingerprints.items() if a not in points or points[a][0] != fp)
+
+    fitted_count = int(meta.get("fitted_count", 0))
+    drifted = int(meta.get("placed_since_fit", 0)) + len(changed) + len(removed)
+    anchors = {a: (x, y) for a, (fp, x, y, _) in points.items() if a in fingerprints and a not in changed}
+    needs_fit = (
+        refit
+        or not fitted_count
+        or meta.get("method", "auto") != method
+        or not anchors
+        or drifted > drift_threshold * fitted_count
+        # The fitted UMAP reducer lived in another process; refit rather than interpolate.
+        or (bool(changed) and meta.get("projector") == PROJECTOR_MEMORY and store.load_projector() is None)
+    )
+
+    if not needs_fit and not changed and not removed:
+        coords = {a: (points[a][1], points[a][2]) for a in fingerprints}
+        return LayoutUpdate(coords=coords, version=int(meta.get("version", 0)))
+
+    if needs_fit:
+        projector, fitted = fit_layout_projector(dict(embeddings), method=method)
+        kept = store.save_projector(projector)
+        version = store.save(
+            points={a: (fingerprints[a], x, y, "fit") for a, (x, y) in fitted.items()},
+            meta={
+                "projector": kept,
+                "fitted_count": str(len(fitted)),
+                "placed_since_fit": "0",
+                "fitted_at": str(time.time()),
+                "method": method,
+                "set_fingerprint": set_fingerprint,
+            },
+            replace_all=True,
+        )
+        return LayoutUpdate(coords=fitted, version=version, refitted=True, placed=set(changed), removed=removed)
+
+    placed, how = _place(store.load_projector(), embeddings, anchors, changed) if changed else ({}, "")
+    version = store.save(
+        points={a: (fingerprints[a], x, y, how) for a, (x, y) in placed.items()},
+        removed=sorted(removed),
+        meta={"placed_since_fit": str(drifted), "set_fingerprint": set_fingerprint},
+    )
+    coords = {**anchors, **placed}
+    return LayoutUpdate(coords=coords, version=version, placed=set(placed), removed=removed)
+
+
+__all__ = [
+    "DEFAULT_DRIFT_THRESHOLD",
+    "LayoutStore",
+    "LayoutStoreConfig",
+    "LayoutUpdate",
+    "default_layout_sqlite_path",
+    "embedding_set_fingerprint",
+    "interpolate_positions",
+    "open_layout_store",
+    "update_layout",
+]
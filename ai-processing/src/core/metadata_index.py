@@ -1,24 +1,37 @@
 from __future__ import annotations
 
+import os
+import sqlite3
 import sys
 from collections.abc import Iterable
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import frontmatter
+from .frontmatter_scan import FrontmatterRecord, parse_frontmatter_file, parse_frontmatter_files
 
 INDEX_RELATIVE_PATH = Path(".prismweave/index/articles.json")
 
+Timestamp = Union[datetime, str]
 
-@dataclass
+
+def _decode_timestamp(value: Timestamp) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class ArticleMetadata:
     """Lightweight metadata representation for a markdown article.
 
     This model is intentionally simple and decoupled from the rest of the
     processing pipeline so it can be used by both the CLI and future API
     layers.
+
+    Instances are slotted to keep large indexes small in memory. Timestamps
+    may be passed as ISO 8601 strings; they are only decoded into
+    ``datetime`` objects the first time they are read (see
+    ``_lazy_timestamp``).
     """
 
     id: str
@@ -34,6 +47,35 @@ class ArticleMetadata:
     x: Optional[float] = None
     y: Optional[float] = None
     neighbors: Optional[List[str]] = None
+    file_size: Optional[int] = None
+
+    def decode_timestamps(self) -> None:
+        """Decode both timestamps now instead of on first read; raises if either is malformed."""
+        for raw in (_RAW_CREATED_AT, _RAW_UPDATED_AT):
+            raw.__set__(self, _decode_timestamp(raw.__get__(self)))
+
+    @property
+    def created_at_iso(self) -> str:
+        """``created_at`` as ISO 8601, without decoding it if still undecoded."""
+        return _timestamp_iso(_RAW_CREATED_AT.__get__(self))
+
+    @property
+    def updated_at_iso(self) -> str:
+        """``updated_at`` as ISO 8601, without decoding it if still undecoded."""
+        return _timestamp_iso(_RAW_UPDATED_AT.__get__(self))
+
+    def copy(self, **changes: Any) -> ArticleMetadata:
+        """Return a shallow copy with ``changes`` applied (``dataclasses.replace``)."""
+        return replace(self, **changes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-ready dict; timestamps are ISO 8601 strings."""
+        data: Dict[str, Any] = {item.name: getattr(self, item.name) for item in fields(self)}
+        data["tags"] = list(self.tags)
+        data["neighbors"] = list(self.neighbors) if self.neighbors is not None else None
+        data["created_at"] = self.created_at_iso
+        data["updated_at"] = self.updated_at_iso
+        return data
 
     @classmethod
     def from_markdown_file(
@@ -52,28 +94,50 @@ class ArticleMetadata:
         if not file_path.exists():
             raise FileNotFoundError(file_path)
 
+        return cls.from_frontmatter_record(
+            parse_frontmatter_file(file_path),
+            documents_root=documents_root,
+            existing=existing,
+        )
+
+    @classmethod
+    def from_frontmatter_record(
+        cls,
+        record: FrontmatterRecord,
+        *,
+        documents_root: Path,
+        existing: Optional[ArticleMetadata] = None,
+    ) -> ArticleMetadata:
+        """Create an ArticleMetadata instance from an already parsed file.
+
+        Raises FileNotFoundError if the file vanished before it was read and
+        ValueError if it could not be read or its frontmatter is invalid.
+        """
+
+        file_path = record.path
+        if record.read_error:
+            if not file_path.exists():
+                raise FileNotFoundError(file_path)
+            raise ValueError(f"Failed to read {file_path}: {record.read_error}")
+
         documents_root = documents_root.expanduser().resolve()
         try:
             relative_path = file_path.resolve().relative_to(documents_root).as_posix()
         except Exception as exc:
             raise ValueError(f"File is not under documents root: {file_path} (root={documents_root}): {exc}") from exc
 
-        text = file_path.read_text(encoding="utf-8")
-        try:
-            post = frontmatter.loads(text)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            raise ValueError(f"Failed to parse frontmatter in {file_path}: {exc}") from exc
+        if record.parse_error:
+            raise ValueError(f"Failed to parse frontmatter in {file_path}: {record.parse_error}")
 
-        body = str(post.content or "").strip()
+        body = record.content.strip()
         words = body.split()
         word_count = len(words)
         excerpt = _build_excerpt(body)
 
-        stat = file_path.stat()
-        created_at = datetime.fromtimestamp(stat.st_ctime)
-        updated_at = datetime.fromtimestamp(stat.st_mtime)
+        created_at = datetime.fromtimestamp(record.ctime)
+        updated_at = datetime.fromtimestamp(record.mtime)
 
-        meta = post.metadata or {}
+        meta = record.metadata
         title = str(meta.get("title") or file_path.stem)
         topic = meta.get("topic")
         raw_tags = meta.get("tags")
@@ -100,8 +164,37 @@ class ArticleMetadata:
             word_count=word_count,
             excerpt=excerpt,
             read_status=read_status,
+            file_size=record.size,
         )
 
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        """Return True if ``stat`` has the size and mtime this entry was parsed from."""
+        return self.file_size == stat.st_size and self.updated_at == datetime.fromtimestamp(stat.st_mtime)
+
+
+def _timestamp_iso(value: Timestamp) -> str:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _lazy_timestamp(raw: Any) -> property:
+    # Wrap the dataclass slot so ISO strings are decoded on first read and the
+    # decoded value is stored back in the slot.
+    def get(self: ArticleMetadata) -> datetime:
+        value = raw.__get__(self)
+        if not isinstance(value, datetime):
+            value = _decode_timestamp(value)
+            raw.__set__(self, value)
+        return value
+
+    return property(get, raw.__set__)
+
+
+# Slot descriptors holding the raw (possibly undecoded) timestamps.
+_RAW_CREATED_AT: Any = ArticleMetadata.__dict__["created_at"]
+_RAW_UPDATED_AT: Any = ArticleMetadata.__dict__["updated_at"]
+ArticleMetadata.created_at = _lazy_timestamp(_RAW_CREATED_AT)  # type: ignore[misc,assignment]
+ArticleMetadata.updated_at = _lazy_timestamp(_RAW_UPDATED_AT)  # type: ignore[misc,assignment]
+
 
 def _build_excerpt(body: str, max_words: int = 60) -> str:
     if not body:
@@ -139,89 +232,187 @@ def load_existing_index(index_path: Path) -> Dict[str, ArticleMetadata]:
     index: Dict[str, ArticleMetadata] = {}
     for key, value in raw.items():
         try:
-            created_at = datetime.fromisoformat(value["created_at"])
-            updated_at = datetime.fromisoformat(value["updated_at"])
-            index[key] = ArticleMetadata(
-                id=value["id"],
-                path=value["path"],
-                title=value["title"],
-                topic=value.get("topic"),
-                tags=list(value.get("tags") or []),
-                created_at=created_at,
-                updated_at=updated_at,
-                word_count=int(value.get("word_count", 0)),
-                excerpt=value.get("excerpt", ""),
-                read_status=value.get("read_status", "unread"),
-                x=value.get("x"),
-                y=value.get("y"),
-                neighbors=value.get("neighbors"),
-            )
+            article = article_from_mapping(value)
+            # Legacy files are only read for migration; validate eagerly so
+            # malformed entries are skipped here rather than failing later.
+            article.decode_timestamps()
+            index[key] = article
         except Exception:
             continue
     return index
 
 
+def article_from_mapping(value: Dict[str, Any]) -> ArticleMetadata:
+    """Build an ArticleMetadata from a serialized (``to_dict``-shaped) mapping.
+
+    This is the fast path used when loading whole indexes: timestamps are
+    kept as ISO strings until first read, and strings that repeat across
+    articles are interned so large indexes share one copy of them: topics,
+    tags and read status, and the ids that other articles list as neighbors.
+    """
+
+    topic = value.get("topic")
+    neighbors = value.get("neighbors")
+    return ArticleMetadata(
+        id=sys.intern(value["id"]),
+        path=sys.intern(value["path"]),
+        title=value["title"],
+        topic=sys.intern(topic) if topic is not None else None,
+        tags=list(map(sys.intern, value.get("tags") or ())),
+        created_at=value["created_at"],
+        updated_at=value["updated_at"],
+        word_count=int(value.get("word_count", 0)),
+        excerpt=value.get("excerpt", ""),
+        read_status=sys.intern(value.get("read_status") or "unread"),
+        x=value.get("x"),
+        y=value.get("y"),
+        neighbors=list(map(sys.intern, neighbors)) if neighbors is not None else None,
+        file_size=value.get("file_size"),
+    )
+
+
 def save_index(index: Dict[str, ArticleMetadata], index_path: Path) -> None:
-    """Persist the index to disk as JSON.
+    """Persist the whole index.
+
+    The SQLite index next to ``index_path`` is replaced with ``index`` and
+    ``index_path`` receives the legacy JSON snapshot. Single-article changes
+    should go through ``ArticleIndexStore`` instead of rewriting everything.
+    """
+
+    from .article_index_store import open_article_index
+
+    open_article_index(index_path).replace_all(index)
+    write_json_index(index, index_path)
+
+
+def write_json_index(index: Dict[str, ArticleMetadata], index_path: Path) -> None:
+    """Write the index to disk in the legacy JSON format.
 
     Dates are stored using ISO 8601 for portability.
     """
 
     import json
 
-    serializable: Dict[str, Dict[str, object]] = {}
-    for key, article in index.items():
-        data = asdict(article)
-        data["created_at"] = article.created_at.isoformat()
-        data["updated_at"] = article.updated_at.isoformat()
-        serializable[key] = data
+    serializable = {key: article.to_dict() for key, article in index.items()}
 
     index_path.parent.mkdir(parents=True, exist_ok=True)
     index_path.write_text(json.dumps(serializable, indent=2, sort_keys=True), encoding="utf-8")
 
 
-def build_metadata_index(documents_root: Path, index_path: Optional[Path] = None) -> Dict[str, ArticleMetadata]:
+def build_metadata_index(
+    documents_root: Path,
+    index_path: Optional[Path] = None,
+    *,
+    max_workers: Optional[int] = None,
+) -> Dict[str, ArticleMetadata]:
     """Scan the documents tree and rebuild the metadata index.
 
     The function adds new documents, updates changed ones and removes
-    entries whose files no longer exist.
+    entries whose files no longer exist. Entries whose file size and mtime
+    match the existing index are reused without re-reading the file, and the
+    index is only rewritten when something changed. New and changed files
+    are parsed in parallel (see ``parse_frontmatter_files``).
+
+    The SQLite index next to ``index_path`` is authoritative; ``index_path``
+    itself receives a legacy JSON snapshot of the result. The article
+    registry of ``documents_root`` is kept in step (see
+    ``_sync_article_registry``).
     """
 
     if not documents_root.exists():
         raise FileNotFoundError(documents_root)
 
+    from .article_index_store import open_article_index
+
     index_path = index_path or (documents_root / INDEX_RELATIVE_PATH)
 
-    existing_index = load_existing_index(index_path)
-    updated_index: Dict[str, ArticleMetadata] = {}
+    existing_index = open_article_index(index_path).load_all()
+    existing_by_path = {article.path: article for article in existing_index.values()}
 
     documents_root = documents_root.expanduser().resolve()
     markdown_files: Iterable[Path] = documents_root.rglob("*.md")
+    # rglob yields paths under documents_root, so slicing the string prefix is
+    # equivalent to relative_to() and much cheaper on large trees.
+    prefix_len = len(str(documents_root).rstrip(os.sep)) + 1
 
+    # (file, previous entry, reusable) in scan order; only non-reusable files are parsed.
+    scanned: List[Tuple[Path, Optional[ArticleMetadata], bool]] = []
     for md_file in markdown_files:
+        previous = existing_by_path.get(str(md_file)[prefix_len:].replace(os.sep, "/"))
         try:
-            relative_path = md_file.resolve().relative_to(documents_root).as_posix()
-            previous = existing_index.get(relative_path)
-            article = ArticleMetadata.from_markdown_file(
-                md_file,
+            reusable = previous is not None and previous.matches_stat(md_file.stat())
+        except FileNotFoundError:
+            continue
+        scanned.append((md_file, previous, reusable))
+
+    to_parse = [md_file for md_file, _, reusable in scanned if not reusable]
+    records = {record.path: record for record in parse_frontmatter_files(to_parse, max_workers=max_workers)}
+
+    updated_index: Dict[str, ArticleMetadata] = {}
+    content_hashes: Dict[str, Optional[str]] = {}
+    for md_file, previous, reusable in scanned:
+        if reusable and previous is not None:
+            updated_index[previous.id] = previous
+            continue
+        try:
+            article = ArticleMetadata.from_frontmatter_record(
+                records[md_file],
                 documents_root=documents_root,
                 existing=previous,
             )
             updated_index[article.id] = article
+            content_hashes[article.path] = records[md_file].content_hash
         except FileNotFoundError:
             continue
         except ValueError as exc:
             print(f"[metadata-index] {exc}", file=sys.stderr)
             raise
 
-    save_index(updated_index, index_path)
+    changed = bool(to_parse) or updated_index.keys() != existing_index.keys()
+    if changed or not index_path.exists():
+        save_index(updated_index, index_path)
+    _sync_article_registry(documents_root, updated_index, content_hashes, changed=changed)
     return updated_index
 
 
+def _sync_article_registry(
+    documents_root: Path,
+    articles: Dict[str, ArticleMetadata],
+    content_hashes: Dict[str, Optional[str]],
+    *,
+    changed: bool,
+) -> None:
+    """Mirror a scan into the article registry without resolving any path.
+
+    Parsed (new or changed) articles are registered with their content hash
+    and frontmatter id as an alias, markdown articles that disappeared are
+    dropped; other files (registered by the embedding store) are left alone. A
+    failure only leaves the registry behind until the next build.
+    """
+
+    from .article_registry import default_article_registry_path, open_article_registry
+
+    fresh = not default_article_registry_path(documents_root).exists()
+    if not changed and not fresh:
+        return
+    try:
+        registry = open_article_registry(documents_root)
+        registry.register_relative(
+            (article.path, content_hashes.get(article.path), [article.id])
+            for article in articles.values()
+            if fresh or article.path in content_hashes
+        )
+        registry.retain_relative((article.path for article in articles.values()), suffixes=(".md",))
+    except (sqlite3.Error, OSError) as exc:
+        print(f"[metadata-index] Failed to update article registry: {exc}", file=sys.stderr)
+
+
 __all__ = [
     "ArticleMetadata",
     "INDEX_RELATIVE_PATH",
+    "article_from_mapping",
     "build_metadata_index",
     "load_existing_index",
     "save_index",
+    "write_json_index",
 ]
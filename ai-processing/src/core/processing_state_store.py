@@ -16,13 +16,20 @@ The store preserves the logical JSON shape used by older code:
 }
 
 But callers should prefer the incremental APIs (upsert/get) for performance.
+
+Each store keeps a single long-lived connection. Statements use fixed SQL
+text so sqlite3's statement cache reuses the prepared statements, and writes
+can be grouped with ``transaction()`` / ``upsert_many()`` so large runs commit
+in a handful of transactions instead of one per file.
 """
 
 from __future__ import annotations
 
 import json
 import sqlite3
-from collections.abc import Iterable
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -30,6 +37,39 @@ from typing import Any
 
 DEFAULT_VERSION = "1.0.0"
 
+_PROCESSED_FILE_COLUMNS = ("processed_at", "commit_hash", "content_hash", "file_size", "last_modified")
+
+_SQL_GET_META = "SELECT value FROM processing_meta WHERE key = ?"
+_SQL_SET_META = (
+    "INSERT INTO processing_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value"
+)
+_SQL_DELETE_META = "DELETE FROM processing_meta WHERE key = ?"
+_SQL_GET_FILE = """
+    SELECT path, processed_at, commit_hash, content_hash, file_size, last_modified
+    FROM processed_files
+    WHERE path = ?
+"""
+_SQL_UPSERT_FILE = """
+    INSERT INTO processed_files(
+        path, processed_at, commit_hash, content_hash, file_size, last_modified
+    ) VALUES(?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        processed_at=excluded.processed_at,
+        commit_hash=excluded.commit_hash,
+        content_hash=excluded.content_hash,
+        file_size=excluded.file_size,
+        last_modified=excluded.last_modified
+"""
+_SQL_ITER_FILES = "SELECT path, processed_at, commit_hash, content_hash, file_size, last_modified FROM processed_files"
+
+
+def _row_to_info(row: sqlite3.Row) -> dict[str, Any]:
+    return {column: row[column] for column in _PROCESSED_FILE_COLUMNS}
+
+
+def _info_to_params(relative_path: str, info: dict[str, Any]) -> tuple[Any, ...]:
+    return (str(relative_path), *(info.get(column) for column in _PROCESSED_FILE_COLUMNS))
+
 
 def default_processing_state_sqlite_path(repo_path: Path) -> Path:
     return Path(repo_path) / ".prismweave" / "processing_state.sqlite"
@@ -45,23 +85,81 @@ class ProcessingStateStore:
         self.config = config
         self.sqlite_path = Path(config.sqlite_path)
         self.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_schema()
 
-    def _connect(self) -> sqlite3.Connection:
-        created = not self.sqlite_path.exists()
-        conn = sqlite3.connect(self.sqlite_path)
-        conn.row_factory = sqlite3.Row
-        if created:
-            self._init_schema_on_connection(conn)
-        return conn
+        # One connection per store, shared across threads and serialized by
+        # the lock. The lock is re-entrant so a transaction() block can call
+        # the regular helpers.
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._tx_depth = 0
+        self._touch_pending = False
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is not None and self._tx_depth == 0 and not self.sqlite_path.exists():
+                # The DB file was deleted underneath us (e.g. during a rebuild);
+                # drop the handle to the unlinked file and start a fresh one.
+                self.close()
+
+            if self._conn is None:
+                self.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.sqlite_path, check_same_thread=False, isolation_level=None)
+                conn.row_factory = sqlite3.Row
+                self._init_schema_on_connection(conn)
+                self._conn = conn
+
+            return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection; it is reopened lazily on next use."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                finally:
+                    self._conn = None
+                    self._tx_depth = 0
+                    self._touch_pending = False
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group writes into a single unit of work.
+
+        Everything executed inside the block is committed once on exit, or
+        rolled back if the block raises. Nested calls join the outer unit of
+        work. ``last_update`` is written once, at the final commit.
+        """
 
-    def _init_schema(self) -> None:
-        with sqlite3.connect(self.sqlite_path) as conn:
-            conn.row_factory = sqlite3.Row
-            self._init_schema_on_connection(conn)
+        with self._lock:
+            conn = self._connection()
+            outermost = self._tx_depth == 0
+            if outermost:
+                conn.execute("BEGIN IMMEDIATE")
+            self._tx_depth += 1
+            try:
+                yield conn
+            except BaseException:
+                self._tx_depth -= 1
+                if outermost:
+                    self._touch_pending = False
+                    conn.execute("ROLLBACK")
+                raise
+            self._tx_depth -= 1
+            if outermost:
+                try:
+                    if self._touch_pending:
+                        conn.execute(_SQL_SET_META, ("last_update", datetime.now().isoformat()))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                finally:
+                    self._touch_pending = False
 
     def _init_schema_on_connection(self, conn: sqlite3.Connection) -> None:
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS processing_meta (
@@ -85,27 +183,26 @@ class ProcessingStateStore:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_processed_files_commit_hash ON processed_files(commit_hash)")
 
         # Ensure default version is present.
-        row = conn.execute("SELECT value FROM processing_meta WHERE key = ?", ("version",)).fetchone()
-        if not row:
-            conn.execute(
-                "INSERT OR IGNORE INTO processing_meta(key, value) VALUES(?, ?)",
-                ("version", DEFAULT_VERSION),
-            )
+        conn.execute(
+            "INSERT OR IGNORE INTO processing_meta(key, value) VALUES(?, ?)",
+            ("version", DEFAULT_VERSION),
+        )
 
     def get_meta(self, key: str) -> str | None:
-        with self._connect() as conn:
-            row = conn.execute("SELECT value FROM processing_meta WHERE key = ?", (key,)).fetchone()
+        with self._lock:
+            row = self._connection().execute(_SQL_GET_META, (key,)).fetchone()
             return str(row[0]) if row else None
 
     def set_meta(self, key: str, value: str | None) -> None:
-        with self._connect() as conn:
+        with self.transaction() as conn:
             if value is None:
-                conn.execute("DELETE FROM processing_meta WHERE key = ?", (key,))
+                conn.execute(_SQL_DELETE_META, (key,))
             else:
-                conn.execute(
-                    "INSERT INTO processing_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-                    (key, value),
-                )
+                conn.execute(_SQL_SET_META, (key, value))
+
+    def _mark_touched(self) -> None:
+        """Schedule a last_update write for the current transaction's commit."""
+        self._touch_pending = True
 
     def touch_last_update(self, timestamp: str | None = None) -> None:
         self.set_meta("last_update", timestamp or datetime.now().isoformat())
@@ -114,79 +211,75 @@ class ProcessingStateStore:
         return self.get_meta("last_processed_commit")
 
     def set_last_processed_commit(self, commit_hash: str | None) -> None:
-        self.set_meta("last_processed_commit", commit_hash)
-        self.touch_last_update()
+        with self.transaction():
+            self.set_meta("last_processed_commit", commit_hash)
+            self._mark_touched()
 
     def get_processed_file(self, relative_path: str) -> dict[str, Any] | None:
-        with self._connect() as conn:
-            row = conn.execute(
-                """
-                SELECT path, processed_at, commit_hash, content_hash, file_size, last_modified
-                FROM processed_files
-                WHERE path = ?
-                """,
-                (relative_path,),
-            ).fetchone()
+        with self._lock:
+            row = self._connection().execute(_SQL_GET_FILE, (relative_path,)).fetchone()
 
         if not row:
             return None
 
-        return {
-            "processed_at": row["processed_at"],
-            "commit_hash": row["commit_hash"],
-            "content_hash": row["content_hash"],
-            "file_size": row["file_size"],
-            "last_modified": row["last_modified"],
-        }
+        return _row_to_info(row)
 
     def upsert_processed_file(self, relative_path: str, info: dict[str, Any]) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO processed_files(
-                    path, processed_at, commit_hash, content_hash, file_size, last_modified
-                ) VALUES(?, ?, ?, ?, ?, ?)
-                ON CONFLICT(path) DO UPDATE SET
-                    processed_at=excluded.processed_at,
-                    commit_hash=excluded.commit_hash,
-                    content_hash=excluded.content_hash,
-                    file_size=excluded.file_size,
-                    last_modified=excluded.last_modified
-                """,
-                (
-                    relative_path,
-                    info.get("processed_at"),
-                    info.get("commit_hash"),
-                    info.get("content_hash"),
-                    info.get("file_size"),
-                    info.get("last_modified"),
-                ),
-            )
+        with self.transaction() as conn:
+            conn.execute(_SQL_UPSERT_FILE, _info_to_params(relative_path, info))
+            self._mark_touched()
+
+    def upsert_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Insert or update many processed-file rows in one transaction.
 
-        self.touch_last_update()
+        Returns the number of rows written.
+        """
+
+        rows = [_info_to_params(path, info) for path, info in items if isinstance(info, dict)]
+        if not rows:
+            return 0
+
+        with self.transaction() as conn:
+            conn.executemany(_SQL_UPSERT_FILE, rows)
+            self._mark_touched()
+        return len(rows)
+
+    def delete_processed_files(self, relative_paths: Iterable[str]) -> int:
+        """Remove processed-file rows; returns the number of rows deleted."""
+        paths = [(str(path),) for path in relative_paths]
+        if not paths:
+            return 0
+
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany("DELETE FROM processed_files WHERE path = ?", paths)
+            deleted = conn.total_changes - before
+            self._mark_touched()
+        return deleted
+
+    def rename_processed_file(self, old_path: str, new_path: str) -> bool:
+        """Move a processed-file row to a new path, replacing any row already there."""
+        with self.transaction() as conn:
+            cursor = conn.execute("UPDATE OR REPLACE processed_files SET path = ? WHERE path = ?", (new_path, old_path))
+            self._mark_touched()
+        return cursor.rowcount > 0
+
+    def count_processed_files(self) -> int:
+        with self._lock:
+            row = self._connection().execute("SELECT COUNT(*) FROM processed_files").fetchone()
+        return int(row[0]) if row else 0
 
     def iter_processed_files(self) -> Iterable[tuple[str, dict[str, Any]]]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT path, processed_at, commit_hash, content_hash, file_size, last_modified FROM processed_files"
-            ).fetchall()
+        with self._lock:
+            rows = self._connection().execute(_SQL_ITER_FILES).fetchall()
 
         for row in rows:
-            yield (
-                str(row["path"]),
-                {
-                    "processed_at": row["processed_at"],
-                    "commit_hash": row["commit_hash"],
-                    "content_hash": row["content_hash"],
-                    "file_size": row["file_size"],
-                    "last_modified": row["last_modified"],
-                },
-            )
+            yield (str(row["path"]), _row_to_info(row))
 
     def clear_processed_files(self) -> None:
-        with self._connect() as conn:
+        with self.transaction() as conn:
             conn.execute("DELETE FROM processed_files")
-        self.touch_last_update()
+            self._mark_touched()
 
     def load_state(self) -> dict[str, Any]:
         version = self.get_meta("version") or DEFAULT_VERSION
@@ -208,52 +301,28 @@ class ProcessingStateStore:
         last_processed_commit = state.get("last_processed_commit")
         last_update = state.get("last_update")
 
-        with self._connect() as conn:
-            conn.execute(
-                "INSERT INTO processing_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-                ("version", version),
-            )
+        with self.transaction() as conn:
+            conn.execute(_SQL_SET_META, ("version", version))
             if last_processed_commit is None:
-                conn.execute("DELETE FROM processing_meta WHERE key = ?", ("last_processed_commit",))
+                conn.execute(_SQL_DELETE_META, ("last_processed_commit",))
             else:
-                conn.execute(
-                    "INSERT INTO processing_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-                    ("last_processed_commit", str(last_processed_commit)),
-                )
+                conn.execute(_SQL_SET_META, ("last_processed_commit", str(last_processed_commit)))
 
             # Replace all processed files (used mainly for tests/migration).
             conn.execute("DELETE FROM processed_files")
             processed_files = state.get("processed_files") or {}
             if isinstance(processed_files, dict):
-                rows = []
-                for path, info in processed_files.items():
-                    if not isinstance(info, dict):
-                        continue
-                    rows.append(
-                        (
-                            str(path),
-                            info.get("processed_at"),
-                            info.get("commit_hash"),
-                            info.get("content_hash"),
-                            info.get("file_size"),
-                            info.get("last_modified"),
-                        )
-                    )
+                rows = [
+                    _info_to_params(str(path), info) for path, info in processed_files.items() if isinstance(info, dict)
+                ]
                 if rows:
-                    conn.executemany(
-                        """
-                        INSERT INTO processed_files(
-                            path, processed_at, commit_hash, content_hash, file_size, last_modified
-                        ) VALUES(?, ?, ?, ?, ?, ?)
-                        """,
-                        rows,
-                    )
-
-        # Preserve provided last_update if supplied, else update now.
-        if last_update:
-            self.set_meta("last_update", str(last_update))
-        else:
-            self.touch_last_update()
+                    conn.executemany(_SQL_UPSERT_FILE, rows)
+
+            # Preserve provided last_update if supplied, else update now.
+            if last_update:
+                conn.execute(_SQL_SET_META, ("last_update", str(last_update)))
+            else:
+                self._mark_touched()
 
     def migrate_from_json(self, json_path: Path) -> bool:
         """Import the legacy JSON file into this SQLite DB.
@@ -0,0 +1,185 @@
+"""NumPy-only 2D projection of article embeddings.
+
+Used for the map when ``umap-learn`` is not installed, and as a quick preview
+layout when it is. ``fit_pca`` finds the principal components with a
+randomized SVD, which only needs a handful of passes over the ``n x d``
+embedding matrix; ``relax_layout`` optionally refines the 2D positions with
+a few rounds of sampled stress minimization against distances in a
+higher-dimensional PCA space, so structure beyond the first two components
+still shows up as separation on the map.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Components kept as the distance reference for ``relax_layout``.
+DEFAULT_REFERENCE_COMPONENTS = 16
+
+# Extra random directions and power iterations used by the randomized SVD.
+_OVERSAMPLE = 10
+_POWER_ITERATIONS = 4
+
+# Relaxation schedule: iterations and random partners per point per iteration.
+DEFAULT_RELAX_ITERATIONS = 30
+DEFAULT_RELAX_SAMPLES = 8
+
+
+class PCAProjector:
+    """Linear projection onto the leading principal components.
+
+    Just two arrays (``layout_store`` saves them with ``np.savez``), and
+    exposes ``transform`` so new articles can be placed without refitting.
+    """
+
+    __slots__ = ("mean", "components")
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray):
+        self.mean = mean
+        self.components = components
+
+    def transform(self, vectors: Any) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix[None, :]
+        return (matrix - self.mean) @ self.components.T
+
+    def __getstate__(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.mean, self.components
+
+    def __setstate__(self, state: Tuple[np.ndarray, np.ndarray]) -> None:
+        self.mean, self.components = state
+
+
+def randomized_svd(
+    matrix: np.ndarray, rank: int, *, seed: int = 0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Truncated SVD ``U[:, :rank], S[:rank], Vt[:rank]`` of a centered matrix.
+
+    Halko, Martinsson & Tropp's range finder: sketch the column space with a
+    Gaussian test matrix, sharpen it with power iterations (re-orthonormalized
+    each round), then take the exact SVD of the small projected matrix.
+    Signs are fixed so the largest loading of each component is positive,
+    which keeps layouts stable across refits.
+    """
+
+    n, d = matrix.shape
+    rank = max(1, min(rank, n, d))
+    width = min(rank + _OVERSAMPLE, n, d)
+    rng = np.random.default_rng(seed)
+
+    basis, _ = np.linalg.qr(matrix @ rng.standard_normal((d, width)).astype(matrix.dtype))
+    for _ in range(_POWER_ITERATIONS):
+        basis, _ = np.linalg.qr(matrix.T @ basis)
+        basis, _ = np.linalg.qr(matrix @ basis)
+
+    u_small, singular, vt = np.linalg.svd(basis.T @ matrix, full_matrices=False)
+    u = basis @ u_small[:, :rank]
+    singular, vt = singular[:rank], vt[:rank]
+
+    signs = np.sign(vt[np.arange(rank), np.abs(vt).argmax(axis=1)])
+    signs[signs == 0] = 1
+    return u * signs, singular, vt * signs[:, None]
+
+
+def fit_pca(
+    matrix: np.ndarray, *, n_components: int = 2, seed: int = 0
+) -> Tuple[PCAProjector, np.ndarray]:
+    """Fit a PCA projector; returns it with the ``n x n_components`` scores."""
+
+    matrix = np.asarray(matrix, dtype=np.float32)
+    mean = matrix.mean(axis=0)
+    centered = matrix - mean
+    _, _, vt = randomized_svd(centered, n_components, seed=seed)
+
+    components = np.zeros((n_components, matrix.shape[1]), dtype=np.float32)
+    components[: vt.shape[0]] = vt
+    # Project explicitly (rather than U * S) so fitted coordinates match transform().
+    return PCAProjector(mean, components), centered @ components.T
+
+
+def relax_layout(
+    coords: np.ndarray,
+    reference: np.ndarray,
+    *,
+    iterations: int = DEFAULT_RELAX_ITERATIONS,
+    samples: int = DEFAULT_RELAX_SAMPLES,
+    seed: int = 0,
+) -> np.ndarray:
+    """Move 2D ``coords`` so pairwise distances better match ``reference``.
+
+    Each iteration pairs every point with ``samples`` random partners and
+    moves it along each pair by the difference between the target and the
+    current distance, with a linearly decaying step. As in Sammon mapping,
+    pairs are weighted by the inverse of their target distance so local
+    neighborhoods win over far-away pairs. Cost is
+    ``O(iterations * n * samples)``.
+    """
+
+    n = coords.shape[0]
+    if n < 3:
+        return coords
+    rng = np.random.default_rng(seed)
+    layout = coords.astype(np.float32, copy=True)
+    reference = np.asarray(reference, dtype=np.float32)
+    samples = min(samples, n - 1)
+    rows = np.arange(n)[:, None]
+
+    # Express target distances in layout units.
+    probe = rng.integers(0, n, size=(min(n, 2048), 2))
+    layout_scale = float(np.linalg.norm(layout[probe[:, 0]] - layout[probe[:, 1]], axis=1).mean())
+    reference_scale = float(np.linalg.norm(reference[probe[:, 0]] - reference[probe[:, 1]], axis=1).mean())
+    if not (layout_scale > 0 and reference_scale > 0):
+        return coords
+    reference = reference * (layout_scale / reference_scale)
+    # Caps the weight of near-duplicate pairs.
+    min_target = 0.1 * layout_scale
+
+    for step in range(iterations):
+        rate = 0.5 * (1.0 - step / iterations)
+        partners = rng.integers(0, n - 1, size=(n, samples))
+        partners += partners >= rows  # never pair a point with itself
+
+        target = np.linalg.norm(reference[:, None, :] - reference[partners], axis=2)
+        delta = layout[:, None, :] - layout[partners]
+        current = np.linalg.norm(delta, axis=2)
+        np.maximum(current, 1e-9, out=current)
+        weight = (target - current) / current * (layout_scale / np.maximum(target, min_target))
+        layout += rate * (weight[:, :, None] * delta).mean(axis=1)
+    return layout
+
+
+def fit_projection(
+    vectors: Sequence[Sequence[float]],
+    *,
+    relax: bool = False,
+    seed: int = 0,
+) -> Tuple[Optional[PCAProjector], np.ndarray]:
+    """Project ``vectors`` to 2D with PCA, optionally relaxed.
+
+    Returns ``(projector, coords)``. The projector is only returned for plain
+    PCA: relaxed coordinates are no longer a linear function of the
+    embeddings, so new articles should be placed by interpolation instead.
+    """
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError("Embeddings must all have the same dimension")
+    if not relax:
+        return fit_pca(matrix, seed=seed)
+
+    _, scores = fit_pca(matrix, n_components=min(DEFAULT_REFERENCE_COMPONENTS, *matrix.shape), seed=seed)
+    coords = np.zeros((matrix.shape[0], 2), dtype=np.float32)
+    coords[:, : min(2, scores.shape[1])] = scores[:, :2]
+    return None, relax_layout(coords, scores, seed=seed)
+
+
+__all__ = [
+    "PCAProjector",
+    "fit_pca",
+    "fit_projection",
+    "randomized_svd",
+    "relax_layout",
+]
@@ -0,0 +1,262 @@
+"""
+Filesystem watcher that feeds changed documents into incremental indexing
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .document_processor import DocumentProcessor
+    from .embedding_store import EmbeddingStore
+    from .git_tracker import GitTracker
+
+try:
+    import watchfiles  # type: ignore[import]
+
+    _WATCHFILES_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency (installed with uvicorn[standard])
+    watchfiles = None  # type: ignore
+    _WATCHFILES_AVAILABLE = False
+
+logger = logging.getLogger("prismweave.watcher")
+
+DEFAULT_WATCH_EXTENSIONS = (".md", ".txt", ".pdf", ".docx", ".html", ".htm")
+
+# Quiet period after the last event before a batch is emitted.
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+
+# Upper bound on how long a continuous burst of writes can delay a batch.
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+
+
+@dataclass
+class WatchBatch:
+    """Debounced set of document changes under the watched root."""
+
+    changed: List[Path] = field(default_factory=list)
+    deleted: List[Path] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.changed or self.deleted)
+
+
+def _batch_from_paths(paths: Iterable[Path]) -> WatchBatch:
+    # Decide from the final on-disk state so create+delete or delete+recreate
+    # bursts collapse into a single action per path.
+    batch = WatchBatch()
+    for path in sorted(set(paths)):
+        if path.is_file():
+            batch.changed.append(path)
+        elif not path.exists():
+            batch.deleted.append(path)
+    return batch
+
+
+class DocumentWatcher:
+    """Watch a documents root and report debounced batches of changed files.
+
+    Uses native notifications (inotify on Linux) through ``watchfiles`` when
+    available and falls back to periodically stat-ing the tree otherwise.
+    Hidden directories such as ``.git`` and ``.prismweave`` are ignored.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        on_batch: Callable[[WatchBatch], None],
+        *,
+        extensions: Iterable[str] = DEFAULT_WATCH_EXTENSIONS,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        force_polling: bool = False,
+    ):
+        """
+        Initialize DocumentWatcher
+
+        Args:
+            root: Directory to watch recursively
+            on_batch: Called with each debounced WatchBatch (on the watcher thread)
+            extensions: File suffixes to report
+            debounce_seconds: Quiet period that ends a burst of writes
+            max_delay_seconds: Longest a continuous burst can hold back a batch
+            poll_interval: Seconds between scans in polling mode
+            force_polling: Skip native notifications and always poll
+        """
+        self.root = Path(root).expanduser().resolve()
+        self.on_batch = on_batch
+        self.extensions = {ext.lower() for ext in extensions}
+        self.debounce_seconds = max(0.0, float(debounce_seconds))
+        self.max_delay_seconds = max(self.debounce_seconds, float(max_delay_seconds))
+        self.poll_interval = max(0.05, float(poll_interval))
+        self.force_polling = force_polling or not _WATCHFILES_AVAILABLE
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> str:
+        """Return "native" or "polling" depending on how changes are detected."""
+        return "polling" if self.force_polling else "native"
+
+    def is_relevant(self, path: Path) -> bool:
+        """Return True for supported documents outside hidden directories."""
+        try:
+            relative = Path(path).relative_to(self.root)
+        except ValueError:
+            return False
+        if any(part.startswith(".") for part in relative.parts):
+            return False
+        return relative.suffix.lower() in self.extensions
+
+    def start(self) -> threading.Thread:
+        """Run the watcher on a daemon thread and return it."""
+        if self._thread and self._thread.is_alive():
+            return self._thread
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name="prismweave-watcher", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Signal the watcher to stop and wait for the thread to exit."""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def run(self) -> None:
+        """Block and dispatch batches until stop() is called."""
+        if not self.force_polling:
+            try:
+                self._run_native()
+                return
+            except OSError as exc:
+                # e.g. inotify watch limit reached or unsupported filesystem
+                logger.warning("Native file watching unavailable (%s); falling back to polling", exc)
+                self.force_polling = True
+        self._run_polling()
+
+    def _dispatch(self, paths: Iterable[Path]) -> None:
+        batch = _batch_from_paths(paths)
+        if batch.is_empty():
+            return
+        try:
+            self.on_batch(batch)
+        except Exception:  # keep watching even if one batch fails
+            logger.exception("Failed to handle watch batch")
+
+    def _run_native(self) -> None:
+        assert watchfiles is not None
+
+        def watch_filter(_change: object, path: str) -> bool:
+            return self.is_relevant(Path(path))
+
+        # watchfiles waits ``step`` ms of quiet after the first change, up to
+        # ``debounce`` ms in total, before yielding the grouped changes.
+        for changes in watchfiles.watch(
+            self.root,
+            watch_filter=watch_filter,
+            debounce=int(self.max_delay_seconds * 1000),
+            step=max(1, int(self.debounce_seconds * 1000)),
+            stop_event=self._stop_event,
+            rust_timeout=int(self.poll_interval * 1000),
+            yield_on_timeout=False,
+        ):
+            self._dispatch(Path(path) for _, path in changes)
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            for name in filenames:
+                if name.startswith(".") or Path(name).suffix.lower() not in self.extensions:
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _run_polling(self) -> None:
+        previous = self._snapshot()
+        pending: Set[Path] = set()
+        first_change = last_change = 0.0
+
+        while not self._stop_event.wait(self.poll_interval):
+            current = self._snapshot()
+            changed = {path for path, sig in current.items() if previous.get(path) != sig}
+            changed.update(path for path in previous if path not in current)
+            previous = current
+
+            now = time.monotonic()
+            if changed:
+                if not pending:
+                    first_change = now
+                pending |= changed
+                last_change = now
+
+            if pending and (
+                now - last_change >= self.debounce_seconds or now - first_change >= self.max_delay_seconds
+            ):
+                batch_paths, pending = pending, set()
+                self._dispatch(batch_paths)
+
+
+def index_watch_batch(
+    batch: WatchBatch,
+    processor: DocumentProcessor,
+    store: EmbeddingStore,
+    git_tracker: Optional[GitTracker] = None,
+) -> Dict[str, int]:
+    """Apply a WatchBatch to the embedding store.
+
+    Deleted files lose their chunks and processing-state rows. Changed files
+    that the tracker already considers processed are skipped; the rest are
+    re-chunked and embedded. Returns counts for processed, removed, skipped
+    and errors.
+    """
+
+    counts = {"processed": 0, "removed": 0, "skipped": 0, "errors": 0}
+
+    for path in batch.deleted:
+        if store.remove_file_documents(path, deleted=True):
+            counts["removed"] += 1
+    if git_tracker and batch.deleted:
+        tracked = [path for path in batch.deleted if path.is_relative_to(git_tracker.repo_path)]
+        git_tracker.forget_files(tracked)
+
+    with git_tracker.batch() if git_tracker else nullcontext():
+        for path in batch.changed:
+            if git_tracker and path.is_relative_to(git_tracker.repo_path) and git_tracker.is_file_processed(path):
+                counts["skipped"] += 1
+                continue
+            try:
+                if store.get_file_document_count(path) > 0:
+                    store.remove_file_documents(path)
+                chunks = processor.process_document(path)
+                if not chunks:
+                    logger.warning("No chunks generated for %s", path)
+                    counts["errors"] += 1
+                    continue
+                store.add_document(path, chunks)
+                counts["processed"] += 1
+            except (OSError, ValueError, RuntimeError) as exc:
+                logger.error("Error indexing %s: %s", path, exc)
+                counts["errors"] += 1
+
+    return counts
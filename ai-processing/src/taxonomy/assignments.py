@@ -113,6 +113,7 @@ def run_article_tag_assignment(
             assignments.append(ArticleTagAssignment(article_id=article.id, tag_id=tag_id, confidence=float(confidence)))
 
     store.upsert_article_tag_assignments(assignments)
+    store.rebuild_article_taxonomy_view(documents_root)
 
     return {
         "articles": len(articles),
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import chromadb
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -54,6 +55,77 @@ def extract_article_key(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
     return None
 
 
+def mean_embeddings_by_article(
+    collection: Any,
+    *,
+    batch_size: int = 2048,
+    keys: Optional[Iterable[str]] = None,
+) -> Tuple[List[str], np.ndarray]:
+    """Average chunk embeddings per article in one streamed scan.
+
+    Unlike ``group_embeddings_by_article`` no chunk vectors are kept: each
+    page is folded into a running per-article sum (float64) and count, so
+    memory is one row per article. ``keys`` restricts the result to those
+    article keys. Returns the article keys and a float32 matrix whose row
+    ``i`` is the mean embedding of ``keys[i]``.
+    """
+
+    wanted = set(keys) if keys is not None else None
+    rows: Dict[str, int] = {}
+    sums: Optional[np.ndarray] = None
+    counts = np.zeros(0, dtype=np.int64)
+
+    for page in iter_collection_embeddings(collection, batch_size=batch_size, include=["embeddings", "metadatas"]):
+        raw_embeddings = page.get("embeddings")
+        raw_metadatas = page.get("metadatas")
+        if raw_embeddings is None or raw_metadatas is None:
+            continue
+
+        page_keys: List[str] = []
+        positions: List[int] = []
+        for position, metadata in enumerate(raw_metadatas):
+            article_key = extract_article_key(metadata)
+            if not article_key or (wanted is not None and article_key not in wanted):
+                continue
+            page_keys.append(article_key)
+            positions.append(position)
+        if not positions:
+            continue
+
+        try:
+            vectors = np.asarray(raw_embeddings, dtype=np.float64)[positions]
+        except (TypeError, ValueError):
+            continue  # missing or ragged embeddings on this page
+        if vectors.ndim != 2 or (sums is not None and vectors.shape[1] != sums.shape[1]):
+            continue
+
+        # Rows are only handed out for pages that are actually folded in.
+        targets = [rows.setdefault(article_key, len(rows)) for article_key in page_keys]
+
+        if sums is None or len(rows) > sums.shape[0]:
+            capacity = max(len(rows), 2 * (sums.shape[0] if sums is not None else 0), 64)
+            grown = np.zeros((capacity, vectors.shape[1]), dtype=np.float64)
+            grown_counts = np.zeros(capacity, dtype=np.int64)
+            if sums is not None:
+                grown[: sums.shape[0]] = sums
+                grown_counts[: counts.shape[0]] = counts
+            sums, counts = grown, grown_counts
+
+        # Sum each article's chunks on this page, then fold into the totals.
+        target_array = np.asarray(targets)
+        order = np.argsort(target_array, kind="stable")
+        unique, starts = np.unique(target_array[order], return_index=True)
+        sums[unique] += np.add.reduceat(vectors[order], starts, axis=0)
+        counts[unique] += np.diff(np.append(starts, len(order)))
+
+    article_keys = [key for key, row in sorted(rows.items(), key=lambda item: item[1]) if counts[row]]
+    if sums is None or not article_keys:
+        return [], np.zeros((0, 0), dtype=np.float32)
+    used = np.asarray([rows[key] for key in article_keys])
+    means = (sums[used] / counts[used, None]).astype(np.float32)
+    return article_keys, means
+
+
 def group_embeddings_by_article(
     collection: Any,
     *,
@@ -51,3 +51,26 @@ class ArticleTagAssignment(BaseModel):
     article_id: str
     tag_id: str
     confidence: float
+
+
+class ArticleTaxonomyTag(BaseModel):
+    id: str
+    name: str
+    confidence: float
+
+
+class ArticleTaxonomy(BaseModel):
+    """One row of the materialized ``article_taxonomy_view``.
+
+    Everything the API shows about an article's taxonomy, resolved from
+    cluster membership, the cluster→category map and tag assignments.
+    """
+
+    article_id: str
+    absolute_path: Optional[str] = None
+    cluster_id: Optional[str] = None
+    category_id: Optional[str] = None
+    category_name: Optional[str] = None
+    subcategory_id: Optional[str] = None
+    subcategory_name: Optional[str] = None
+    tags: List[ArticleTaxonomyTag] = Field(default_factory=list)
@@ -136,6 +136,7 @@ def tag_new_article(
         )
 
     store.upsert_article_tag_assignments(assignments)
+    store.upsert_article_taxonomy_view_row(str(article_path), documents_root)
 
     return {
         "article_id": str(article_path),
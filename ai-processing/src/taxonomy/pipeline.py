@@ -44,6 +44,7 @@ def run_clustering_pipeline(
     store.initialize()
     store.upsert_articles(articles)
     store.upsert_clusters(clusters)
+    store.rebuild_article_taxonomy_view(documents_root)
 
     return {
         "articles": len(articles),
@@ -66,6 +66,7 @@ def run_cluster_proposals(
         )
 
     store.upsert_cluster_proposals(proposals)
+    store.rebuild_article_taxonomy_view(documents_root)
 
     return {
         "clusters": len(clusters),
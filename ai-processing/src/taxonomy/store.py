@@ -3,10 +3,21 @@ from __future__ import annotations
 import json
 import sqlite3
 from collections.abc import Iterable
+from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 
-from .models import Article, ArticleTagAssignment, Cluster, Tag, TaxonomyCategory
+from src.core.article_registry import ArticleRef, ArticleRegistry, open_article_registry
+
+from .models import (
+    Article,
+    ArticleTagAssignment,
+    ArticleTaxonomy,
+    ArticleTaxonomyTag,
+    Cluster,
+    Tag,
+    TaxonomyCategory,
+)
 
 
 @dataclass(frozen=True)
@@ -117,6 +128,27 @@ class TaxonomyStore:
                   tags_json TEXT NOT NULL,
                   updated_at TEXT NOT NULL DEFAULT (datetime('now'))
                 );
+
+                -- Denormalized per-article taxonomy, rebuilt at the end of every
+                -- pipeline stage (see rebuild_article_taxonomy_view). Keyed by the
+                -- canonical article id: docs-root-relative when the pipeline id is
+                -- an absolute path under the documents root.
+                CREATE TABLE IF NOT EXISTS article_taxonomy_view (
+                  article_id TEXT PRIMARY KEY,
+                  absolute_path TEXT NULL,
+                  cluster_id TEXT NULL,
+                  category_id TEXT NULL,
+                  category_name TEXT NULL,
+                  subcategory_id TEXT NULL,
+                  subcategory_name TEXT NULL,
+                  tags_json TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS article_taxonomy_view_state (
+                  id INTEGER PRIMARY KEY CHECK (id = 1),
+                  documents_root TEXT NULL,
+                  built_at TEXT NOT NULL DEFAULT (datetime('now'))
+                );
                 """
             )
 
@@ -484,6 +516,222 @@ class TaxonomyStore:
 
         return out
 
+    @staticmethod
+    def _canonical_article_id(raw_id: str, root: Path | None) -> tuple[str, str | None]:
+        """(canonical id, absolute path) of a pipeline article id."""
+
+        path = Path(raw_id)
+        if root is None:
+            return raw_id, str(path) if path.is_absolute() else None
+        try:
+            absolute = path.resolve() if path.is_absolute() else (root / path).resolve()
+        except (OSError, RuntimeError):
+            return raw_id, None
+        try:
+            return absolute.relative_to(root).as_posix(), str(absolute)
+        except ValueError:
+            return raw_id, str(absolute)
+
+    def rebuild_article_taxonomy_view(self, documents_root: Path | None = None) -> int:
+        """Recompute ``article_taxonomy_view`` from the normalized tables.
+
+        Resolves cluster membership, category names and tag assignments once
+        per article, so readers need a single lookup. Pipeline ids are mapped
+        to canonical article ids through the article registry of
+        ``documents_root`` (ids under it become their relative path); ids the
+        registry does not know yet are resolved on the filesystem once and
+        registered. When both forms exist, the relative one's data wins.
+        Returns the number of rows.
+        """
+
+        root, registry = _view_registry(documents_root)
+        with self.connect() as conn:
+            cluster_rows = conn.execute("SELECT article_id, cluster_id FROM cluster_articles").fetchall()
+            assignment_rows = conn.execute(
+                """
+                SELECT article_id, tag_id, confidence
+                FROM article_tag_assignments
+                ORDER BY article_id ASC, confidence DESC, tag_id ASC
+                """
+            ).fetchall()
+            rows, unregistered = self._article_taxonomy_rows(conn, root, registry, cluster_rows, assignment_rows)
+
+            conn.execute("DELETE FROM article_taxonomy_view")
+            self._insert_article_taxonomy_rows(conn, rows)
+            conn.execute(
+                """
+                INSERT INTO article_taxonomy_view_state(id, documents_root, built_at)
+                VALUES(1, ?, datetime('now'))
+                ON CONFLICT(id) DO UPDATE SET
+                  documents_root=excluded.documents_root,
+                  built_at=excluded.built_at;
+                """,
+                (str(root) if root is not None else None,),
+            )
+        _register_articles(registry, unregistered)
+        return len(rows)
+
+    def upsert_article_taxonomy_view_row(self, article_id: str, documents_root: Path | None = None) -> int:
+        """Recompute the ``article_taxonomy_view`` row of a single article.
+
+        For updates that touch one article (tagging a new one); the batch
+        stages rebuild the whole view. Only rows stored under a spelling of
+        ``article_id`` (its canonical id, paths and registry aliases) are
+        read. Falls back to a full rebuild when the view was not built for
+        ``documents_root``. Returns the number of rows written.
+        """
+
+        root, registry = _view_registry(documents_root)
+        with self.connect() as conn:
+            state = conn.execute("SELECT documents_root FROM article_taxonomy_view_state WHERE id = 1").fetchone()
+        if state is None or state["documents_root"] != (str(root) if root is not None else None):
+            return self.rebuild_article_taxonomy_view(documents_root)
+
+        ref = _resolve_registered(registry, [article_id]).get(article_id)
+        if ref is not None:
+            canonical_id = ref.id
+            names = {article_id, ref.id, ref.absolute_path, *_registered_aliases(registry, ref.id)}
+            if ref.relative_path is not None:
+                names.add(ref.relative_path)
+        else:
+            canonical_id, absolute = self._canonical_article_id(article_id, root)
+            names = {article_id, canonical_id}
+            if absolute is not None:
+                names.add(absolute)
+
+        spellings = sorted(names)
+        placeholders = ",".join("?" for _ in spellings)
+        with self.connect() as conn:
+            cluster_rows = conn.execute(
+                f"SELECT article_id, cluster_id FROM cluster_articles WHERE article_id IN ({placeholders})",
+                spellings,
+            ).fetchall()
+            assignment_rows = conn.execute(
+                f"""
+                SELECT article_id, tag_id, confidence
+                FROM article_tag_assignments
+                WHERE article_id IN ({placeholders})
+                ORDER BY article_id ASC, confidence DESC, tag_id ASC
+                """,
+                spellings,
+            ).fetchall()
+            rows, unregistered = self._article_taxonomy_rows(conn, root, registry, cluster_rows, assignment_rows)
+            rows = [row for row in rows if row[0] == canonical_id]
+
+            conn.execute("DELETE FROM article_taxonomy_view WHERE article_id = ?", (canonical_id,))
+            self._insert_article_taxonomy_rows(conn, rows)
+        _register_articles(registry, unregistered)
+        return len(rows)
+
+    def _article_taxonomy_rows(
+        self,
+        conn: sqlite3.Connection,
+        root: Path | None,
+        registry: ArticleRegistry | None,
+        cluster_rows: list[sqlite3.Row],
+        assignment_rows: list[sqlite3.Row],
+    ) -> tuple[list[tuple], dict[str, str]]:
+        """View rows for the given cluster and tag rows, plus the raw ids still to register."""
+
+        cluster_map = {
+            row["cluster_id"]: (row["category_id"], row["subcategory_id"])
+            for row in conn.execute("SELECT cluster_id, category_id, subcategory_id FROM cluster_category_map")
+        }
+        category_names = {row["id"]: row["name"] for row in conn.execute("SELECT id, name FROM taxonomy_categories")}
+        tag_names = {row["id"]: row["name"] for row in conn.execute("SELECT id, name FROM tags")}
+
+        # Per canonical id: {raw id: cluster} and {raw id: tags}. A raw id
+        # equal to the canonical one is preferred over its absolute alias.
+        absolute_paths: dict[str, str | None] = {}
+        clusters: dict[str, dict[str, str]] = {}
+        tags: dict[str, dict[str, list[ArticleTaxonomyTag]]] = {}
+        canonical_cache: dict[str, str] = {}
+        raw_ids = {row["article_id"] for row in cluster_rows} | {row["article_id"] for row in assignment_rows}
+        known = _resolve_registered(registry, raw_ids)
+        unregistered: dict[str, str] = {}
+
+        def canonical(raw_id: str) -> str:
+            cached = canonical_cache.get(raw_id)
+            if cached is None:
+                ref = known.get(raw_id)
+                if ref is not None:
+                    cached, absolute = ref.id, ref.absolute_path
+                else:
+                    cached, absolute = self._canonical_article_id(raw_id, root)
+                    if absolute is not None:
+                        unregistered[raw_id] = absolute
+                canonical_cache[raw_id] = cached
+                if absolute_paths.get(cached) is None:
+                    absolute_paths[cached] = absolute
+            return cached
+
+        for row in cluster_rows:
+            clusters.setdefault(canonical(row["article_id"]), {})[row["article_id"]] = row["cluster_id"]
+        for row in assignment_rows:
+            tag_id = row["tag_id"]
+            tag = ArticleTaxonomyTag(id=tag_id, name=tag_names.get(tag_id, tag_id), confidence=float(row["confidence"]))
+            tags.setdefault(canonical(row["article_id"]), {}).setdefault(row["article_id"], []).append(tag)
+
+        def preferred(values: dict, article_id: str):
+            if not values:
+                return None
+            return values.get(article_id) or next(iter(values.values()))
+
+        rows = []
+        for article_id in sorted(set(clusters) | set(tags)):
+            cluster_id = preferred(clusters.get(article_id, {}), article_id)
+            category_id, subcategory_id = cluster_map.get(cluster_id, (None, None)) if cluster_id else (None, None)
+            article_tags = preferred(tags.get(article_id, {}), article_id) or []
+            rows.append(
+                (
+                    article_id,
+                    absolute_paths.get(article_id),
+                    cluster_id,
+                    category_id,
+                    category_names.get(category_id) if category_id else None,
+                    subcategory_id,
+                    category_names.get(subcategory_id) if subcategory_id else None,
+                    json.dumps([tag.model_dump() for tag in article_tags]),
+                )
+            )
+        return rows, unregistered
+
+    @staticmethod
+    def _insert_article_taxonomy_rows(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+        conn.executemany(
+            """
+            INSERT INTO article_taxonomy_view(
+              article_id, absolute_path, cluster_id, category_id, category_name,
+              subcategory_id, subcategory_name, tags_json
+            )
+            VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    def article_taxonomy_view_built(self) -> bool:
+        with self.connect() as conn:
+            return conn.execute("SELECT 1 FROM article_taxonomy_view_state WHERE id = 1").fetchone() is not None
+
+    def list_article_taxonomy(self) -> list[ArticleTaxonomy]:
+        """All rows of ``article_taxonomy_view``."""
+
+        with self.connect() as conn:
+            rows = conn.execute("SELECT * FROM article_taxonomy_view ORDER BY article_id").fetchall()
+        return [
+            ArticleTaxonomy(
+                article_id=row["article_id"],
+                absolute_path=row["absolute_path"],
+                cluster_id=row["cluster_id"],
+                category_id=row["category_id"],
+                category_name=row["category_name"],
+                subcategory_id=row["subcategory_id"],
+                subcategory_name=row["subcategory_name"],
+                tags=[ArticleTaxonomyTag(**tag) for tag in json.loads(row["tags_json"])],
+            )
+            for row in rows
+        ]
+
     def set_manual_override(self, article_id: str, override: dict[str, object]) -> None:
         payload = json.dumps(override, sort_keys=True)
         with self.connect() as conn:
@@ -512,5 +760,49 @@ class TaxonomyStore:
             return None
 
 
+def _view_registry(documents_root: Path | None) -> tuple[Path | None, ArticleRegistry | None]:
+    """Resolved documents root and its article registry, either None when unavailable."""
+
+    if documents_root is None:
+        return None, None
+    try:
+        root = Path(documents_root).resolve()
+    except (OSError, RuntimeError):
+        return None, None
+    try:
+        return root, open_article_registry(root)
+    except (sqlite3.Error, OSError):
+        return root, None
+
+
+def _registered_aliases(registry: ArticleRegistry | None, article_id: str) -> list[str]:
+    if registry is None:
+        return []
+    try:
+        return registry.aliases(article_id)
+    except sqlite3.Error:
+        return []
+
+
+def _resolve_registered(registry: ArticleRegistry | None, raw_ids: Iterable[str]) -> dict[str, ArticleRef]:
+    if registry is None:
+        return {}
+    try:
+        return registry.resolve_many(raw_ids)
+    except sqlite3.Error:
+        return {}
+
+
+def _register_articles(registry: ArticleRegistry | None, absolute_by_raw_id: dict[str, str]) -> None:
+    """Register existing files the registry did not know, keeping the pipeline id as an alias."""
+
+    if registry is None or not absolute_by_raw_id:
+        return
+    with suppress(sqlite3.Error, OSError):
+        registry.register_many(
+            (absolute, None, [raw_id]) for raw_id, absolute in absolute_by_raw_id.items() if Path(absolute).is_file()
+        )
+
+
 def default_taxonomy_sqlite_path(documents_root: Path) -> Path:
     return documents_root / ".prismweave" / "taxonomy.sqlite"
@@ -132,6 +132,7 @@ def run_taxonomy_normalize_and_store(
 
     for cluster_id, (category_id, subcategory_id) in sorted(result.cluster_category_map.items()):
         store.map_cluster_to_category(cluster_id, category_id, subcategory_id)
+    store.rebuild_article_taxonomy_view(documents_root)
 
     return {
         "categories": len(result.categories),
@@ -0,0 +1,243 @@
+"""Tests for GET /articles paging, filtering, projection and conditional requests."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from starlette.testclient import TestClient
+
+from src.api.response_cache import bump_data_generation, get_response_cache
+from src.core.article_index_store import ArticleIndexStore, ArticleIndexStoreConfig, default_article_index_sqlite_path
+from src.core.layout_store import LayoutStore, LayoutStoreConfig, default_layout_sqlite_path
+from src.core.metadata_index import ArticleMetadata
+from src.taxonomy.models import Cluster, TaxonomyCategory
+from src.taxonomy.store import TaxonomyStore, TaxonomyStoreConfig, default_taxonomy_sqlite_path
+
+
+def _article(article_id: str, **overrides) -> ArticleMetadata:
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    values = {
+        "id": article_id,
+        "path": article_id,
+        "title": article_id.upper(),
+        "topic": None,
+        "tags": [],
+        "created_at": now,
+        "updated_at": now,
+        "word_count": 10,
+        "excerpt": "Excerpt",
+        "read_status": "unread",
+        "x": 0.0,
+        "y": 0.0,
+        "neighbors": [],
+    }
+    values.update(overrides)
+    return ArticleMetadata(**values)
+
+
+@pytest.fixture()
+def articles_client(tmp_path: Path, monkeypatch):
+    import src.api  # noqa: F401  (src.api re-exports the FastAPI instance as "app")
+
+    app_module = sys.modules["src.api.app"]
+    docs_root = tmp_path / "docs"
+    docs_root.mkdir()
+    index_path = tmp_path / "index" / "articles.json"
+
+    store = ArticleIndexStore(ArticleIndexStoreConfig(sqlite_path=default_article_index_sqlite_path(index_path)))
+    store.upsert_many(
+        [
+            _article("a.md", topic="ai", tags=["python"]),
+            _article("b.md", topic="ai", read_status="read"),
+            _article("c.md", topic="web", tags=["python"]),
+            _article("d.md", topic="ai", tags=["python"]),
+        ]
+    )
+
+    monkeypatch.setattr(app_module, "_initialize_state", lambda: None)
+    monkeypatch.setattr(app_module, "documents_root", docs_root)
+    monkeypatch.setattr(app_module, "index_path", index_path)
+    monkeypatch.setattr(app_module, "legacy_index_path", None)
+    monkeypatch.setattr(app_module, "index_path_is_override", True)
+    monkeypatch.setattr(app_module, "_index_cache", None)
+    monkeypatch.setattr(app_module, "_legacy_export_thread", None)
+    monkeypatch.setattr(app_module, "_taxonomy_view_cache", None)
+    get_response_cache().clear()
+
+    with TestClient(app_module.app) as client:
+        yield client, store
+
+
+def test_list_articles_pages_with_cursor(articles_client) -> None:
+    client, _ = articles_client
+
+    first = client.get("/articles", params={"limit": 2, "fields": "title"})
+    assert first.status_code == 200
+    assert first.json() == [{"id": "a.md", "title": "A.MD"}, {"id": "b.md", "title": "B.MD"}]
+    assert first.headers["X-Total-Count"] == "4"
+
+    second = client.get("/articles", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert [item["id"] for item in second.json()] == ["c.md", "d.md"]
+    assert "X-Next-Cursor" not in second.headers
+
+    assert client.get("/articles", params={"cursor": "%%%"}).status_code == 400
+    assert client.get("/articles", params={"fields": "nope"}).status_code == 400
+
+
+def test_list_articles_filters(articles_client) -> None:
+    client, _ = articles_client
+
+    response = client.get("/articles", params={"topic": "ai", "tag": "python", "read_status": "unread"})
+
+    assert [item["id"] for item in response.json()] == ["a.md", "d.md"]
+    assert response.headers["X-Total-Count"] == "2"
+    assert client.get("/articles", params={"category": "anything"}).json() == []
+
+
+def test_list_articles_conditional_get(articles_client) -> None:
+    client, store = articles_client
+
+    response = client.get("/articles")
+    etag = response.headers["ETag"]
+    assert len(response.json()) == 4
+
+    cached = client.get("/articles", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    # Different query, different representation.
+    assert client.get("/articles", params={"topic": "ai"}, headers={"If-None-Match": etag}).status_code == 200
+
+    store.update_fields("a.md", read_status="read")
+    refreshed = client.get("/articles", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_list_articles_etag_survives_restarts(articles_client) -> None:
+    client, _ = articles_client
+    app_module = sys.modules["src.api.app"]
+
+    etag = client.get("/articles").headers["ETag"]
+    # Process-local state (the response-cache generation, the in-memory
+    # index) is gone after a restart; the persisted index is not.
+    bump_data_generation()
+    app_module._index_cache = None
+    get_response_cache().clear()
+
+    assert client.get("/articles", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_list_articles_are_enriched_from_the_taxonomy_view(articles_client) -> None:
+    client, _ = articles_client
+    docs_root = sys.modules["src.api.app"].documents_root
+    taxonomy = TaxonomyStore(TaxonomyStoreConfig(sqlite_path=default_taxonomy_sqlite_path(docs_root)))
+    taxonomy.initialize()
+    taxonomy.upsert_categories([TaxonomyCategory(id="cat:ml", name="Machine Learning", description="")])
+    taxonomy.upsert_clusters(
+        [Cluster(id="cluster:1", article_ids=[str((docs_root / "b.md").resolve())], centroid_embedding=[0.0])]
+    )
+    taxonomy.map_cluster_to_category("cluster:1", "cat:ml", None)
+    # Written without a view (as by an older pipeline): the API builds it once.
+    assert not taxonomy.article_taxonomy_view_built()
+
+    response = client.get("/articles", params={"category": "machine learning"})
+    assert [item["id"] for item in response.json()] == ["b.md"]
+    assert response.json()[0]["taxonomy_category_id"] == "cat:ml"
+    assert taxonomy.article_taxonomy_view_built()
+
+
+def test_list_articles_repeats_are_served_from_the_response_cache(articles_client) -> None:
+    client, _ = articles_client
+
+    first = client.get("/articles", params={"limit": 2})
+    again = client.get("/articles", params={"limit": 2})
+    assert again.json() == first.json()
+    assert again.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    assert get_response_cache().metrics()["endpoints"]["articles"]["hits"] == 1
+
+    # A write through the API invalidates the cached page.
+    (sys.modules["src.api.app"].documents_root / "a.md").write_text("---\ntitle: A\n---\nBody\n", encoding="utf-8")
+    assert client.put("/articles/a.md", json={"title": "Renamed"}).status_code == 200
+    assert client.get("/articles", params={"limit": 2}).json()[0]["title"] == "Renamed"
+
+
+def test_list_articles_serves_stored_layout_and_refreshes_in_background(articles_client, monkeypatch) -> None:
+    client, store = articles_client
+    app_module = sys.modules["src.api.app"]
+    for article_id in ("a.md", "b.md"):
+        store.update_fields(article_id, x=None, y=None, neighbors=None)
+
+    layout = LayoutStore(LayoutStoreConfig(sqlite_path=default_layout_sqlite_path(store.sqlite_path)))
+    layout.save(points={"a.md": ("fp", 7.0, 8.0, "fit")}, meta={})
+
+    request_thread = threading.get_ident()
+    refreshed = threading.Event()
+
+    def fake_apply(index, docs_root, **kwargs):
+        assert threading.get_ident() != request_thread
+        for article in index.values():
+            article.x, article.y, article.neighbors = 1.0, 2.0, ["c.md"]
+        refreshed.set()
+        return len(index)
+
+    monkeypatch.setattr(app_module, "_apply_layout_to_index", fake_apply)
+
+    first = client.get("/articles", params={"fields": "x,y"})
+    by_id = {item["id"]: (item["x"], item["y"]) for item in first.json()}
+    assert by_id["a.md"] == (7.0, 8.0)
+    assert by_id["b.md"] is not None and None not in by_id["b.md"]
+
+    assert refreshed.wait(5)
+    thread = app_module._layout_refresh_thread
+    if thread is not None:
+        thread.join(5)
+    second = client.get("/articles", params={"fields": "x,y"})
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert {(item["x"], item["y"]) for item in second.json()} == {(1.0, 2.0)}
+
+
+def test_delete_article_removes_file_chunks_and_index_row(articles_client, monkeypatch) -> None:
+    client, store = articles_client
+    app_module = sys.modules["src.api.app"]
+    article_path = app_module.documents_root / "a.md"
+    article_path.write_text("A", encoding="utf-8")
+    removed = []
+
+    class FakeEmbeddingStore:
+        def __init__(self, config, git_tracker=None):
+            pass
+
+        def remove_file_documents(self, file_path, **kwargs):
+            removed.append((file_path, kwargs))
+            return True
+
+    monkeypatch.setattr(app_module, "EmbeddingStore", FakeEmbeddingStore)
+
+    assert client.delete("/articles/a.md").status_code == 204
+    assert not article_path.exists()
+    assert removed == [(article_path, {"deleted": True})]
+    assert store.get("a.md") is None
+    assert client.delete("/articles/a.md").status_code == 404
+
+
+def test_update_article_refreshes_legacy_json_index(articles_client) -> None:
+    client, store = articles_client
+    app_module = sys.modules["src.api.app"]
+    (app_module.documents_root / "a.md").write_text("---\ntitle: A\n---\nBody\n", encoding="utf-8")
+
+    response = client.put("/articles/a.md", json={"title": "Renamed", "read_status": "read"})
+    assert response.status_code == 200
+
+    thread = app_module._legacy_export_thread
+    if thread is not None:
+        thread.join(5)
+    exported = json.loads(app_module.index_path.read_text(encoding="utf-8"))
+    assert exported["a.md"]["title"] == "Renamed"
+    assert exported["a.md"]["read_status"] == "read"
+    assert sorted(exported) == ["a.md", "b.md", "c.md", "d.md"]
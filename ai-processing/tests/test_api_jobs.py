@@ -0,0 +1,116 @@
+"""Long-running endpoints run as background jobs polled via /jobs/{id}."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.jobs import JobManager, configure_job_manager, get_job_manager
+from src.core.job_store import JobStore, JobStoreConfig
+
+
+@pytest.fixture()
+def manager(tmp_path: Path):
+    manager = JobManager(JobStore(JobStoreConfig(sqlite_path=tmp_path / "jobs.sqlite")))
+    yield manager
+    manager.shutdown()
+
+
+def test_job_reports_progress_and_result(manager: JobManager) -> None:
+    def work(ctx):
+        ctx.progress("counting", done=1)
+        return {"count": 3}
+
+    job, created = manager.submit("count", {"n": 3}, work)
+    assert created
+    done = manager.wait(job.id, timeout=5)
+    assert done.status == "succeeded"
+    assert done.phase == "counting" and done.progress == {"done": 1}
+    assert done.result == {"count": 3}
+
+
+def test_running_job_stops_at_next_checkpoint_when_cancelled(manager: JobManager) -> None:
+    started = threading.Event()
+    steps = []
+
+    def work(ctx):
+        started.set()
+        while len(steps) < 500:
+            ctx.check_cancelled()
+            steps.append(1)
+            time.sleep(0.01)
+        return {}
+
+    job, _ = manager.submit("loop", {}, work)
+    assert started.wait(5)
+    manager.cancel(job.id)
+    done = manager.wait(job.id, timeout=5)
+    assert done.status == "cancelled"
+    assert len(steps) < 500
+
+
+def test_failures_are_recorded(manager: JobManager) -> None:
+    def work(ctx):
+        raise RuntimeError("boom")
+
+    job, _ = manager.submit("fail", {}, work)
+    done = manager.wait(job.id, timeout=5)
+    assert done.status == "failed" and done.error == "boom"
+
+
+def test_process_directory_runs_as_a_job(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for name in ("a.md", "b.md"):
+        (docs / name).write_text(f"# {name}\n", encoding="utf-8")
+    store = MagicMock()
+    store.get_file_document_count.return_value = 0
+    processor = MagicMock()
+    processor.process_document.return_value = [MagicMock(content="chunk")]
+    config = MagicMock()
+    config.mcp.paths.documents_root = str(docs)
+
+    configure_job_manager(tmp_path / "jobs.sqlite")
+    try:
+        with (
+            patch("src.api.routers.processing.get_config", return_value=config),
+            patch("src.api.routers.processing.get_embedding_store", return_value=store),
+            patch("src.api.routers.processing.get_document_processor", return_value=processor),
+        ):
+            from src.api.app import app
+
+            client = TestClient(app)
+            response = client.post("/processing/directory", json={"path": str(docs), "force": True})
+            assert response.status_code == 202
+            job_id = response.json()["id"]
+            assert response.headers["Location"] == f"/jobs/{job_id}"
+
+            get_job_manager().wait(job_id, timeout=5)
+            job = client.get(f"/jobs/{job_id}").json()
+            assert job["status"] == "succeeded"
+            assert job["result"]["files_processed"] == 2
+            assert job["result"]["results"] == []
+            assert set(job["result"]["stage_seconds"]) == {"convert", "embed", "store"}
+            assert job["progress"]["files_total"] == 2
+
+            lines = client.get(f"/jobs/{job_id}/events", params={"format": "ndjson"}).text.splitlines()
+            events = [json.loads(line) for line in lines]
+            assert [e["event"] for e in events if e.get("file") == "a.md"] == ["converted", "embedded", "stored"]
+            assert all("seconds" in e for e in events[:-1])
+            assert events[-1]["event"] == "job" and events[-1]["status"] == "succeeded"
+
+            sse = client.get(f"/jobs/{job_id}/events", headers={"Last-Event-ID": "5"})
+            assert sse.headers["content-type"].startswith("text/event-stream")
+            assert sse.text.startswith("id: 6\nevent: stored\n")
+            assert client.get("/jobs/unknown/events").status_code == 404
+            assert client.get("/jobs").json()[0]["id"] == job_id
+            assert client.get("/jobs/unknown").status_code == 404
+            assert client.post("/jobs/unknown/cancel").status_code == 404
+    finally:
+        configure_job_manager(None)
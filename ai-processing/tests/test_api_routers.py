@@ -7,6 +7,7 @@ the tests run in isolation and don't require external services.
 
 from __future__ import annotations
 
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -14,6 +15,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from starlette.testclient import TestClient
 
+from src.core.collection_stats import CollectionStats
 from src.core.config import Config
 
 # ---------------------------------------------------------------------------
@@ -23,14 +25,20 @@ from src.core.config import Config
 
 @pytest.fixture(autouse=True)
 def _reset_deps():
-    """Reset the singleton caches in src.api.deps between tests."""
+    """Reset the singleton caches in src.api.deps (and cached responses) between tests."""
     import src.api.deps as deps_mod
+    from src.api.response_cache import get_response_cache
 
     deps_mod._config = None
+    deps_mod._git_tracker = None
+    deps_mod._git_tracker_checked = False
     deps_mod._store = None
     deps_mod._processor = None
+    get_response_cache().clear()
     yield
     deps_mod._config = None
+    deps_mod._git_tracker = None
+    deps_mod._git_tracker_checked = False
     deps_mod._store = None
     deps_mod._processor = None
 
@@ -49,6 +57,7 @@ def mock_store():
     store.list_documents.return_value = []
     store.get_document_count.return_value = 0
     store.get_unique_source_files.return_value = []
+    store.get_collection_stats.return_value = CollectionStats()
     store.verify_embeddings.return_value = {
         "status": "success",
         "collection_name": "test",
@@ -217,16 +226,31 @@ class TestDocumentsRouter:
         assert "total_chunks" in data
         assert "collection_name" in data
 
+    def test_count_is_served_from_cache_until_the_collection_changes(self, client: TestClient, mock_store):
+        mock_store.data_generation.return_value = (1, 0)
+        first = client.get("/documents/count")
+        assert client.get("/documents/count").json() == first.json()
+        assert mock_store.get_collection_stats.call_count == 1
+
+        assert client.get("/documents/count", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+        mock_store.data_generation.return_value = (2, 3)
+        mock_store.get_collection_stats.return_value = CollectionStats(total_chunks=3, source_files=1)
+        changed = client.get("/documents/count", headers={"If-None-Match": first.headers["ETag"]})
+        assert changed.status_code == 200
+        assert changed.json()["total_chunks"] == 3
+
     def test_export_empty_returns_404(self, client: TestClient):
         resp = client.post("/documents/export", json={"format": "json"})
         assert resp.status_code == 404
 
     def test_export_json(self, client: TestClient, mock_store):
-        mock_store.list_documents.return_value = [
+        mock_store.iter_documents.return_value = [
             {
                 "id": "chunk-1",
                 "metadata": {"source_file": "test.md", "chunk_index": 0, "total_chunks": 1, "tags": ""},
-                "content_length": 100,
+                "content": "hello",
+                "content_length": 5,
                 "content_preview": "hello",
             }
         ]
@@ -235,11 +259,12 @@ class TestDocumentsRouter:
         assert "application/json" in resp.headers["content-type"]
 
     def test_export_csv(self, client: TestClient, mock_store):
-        mock_store.list_documents.return_value = [
+        mock_store.iter_documents.return_value = [
             {
                 "id": "chunk-1",
                 "metadata": {"source_file": "test.md", "chunk_index": 0, "total_chunks": 1, "tags": ""},
-                "content_length": 100,
+                "content": "hello",
+                "content_length": 5,
                 "content_preview": "hello",
             }
         ]
@@ -247,6 +272,31 @@ class TestDocumentsRouter:
         assert resp.status_code == 200
         assert "text/csv" in resp.headers["content-type"]
 
+    def test_export_ndjson_with_content_and_embeddings(self, client: TestClient, mock_store):
+        mock_store.iter_documents.return_value = [
+            {
+                "id": f"chunk-{i}",
+                "metadata": {"source_file": f"doc-{i}.md" if i % 2 else f"doc-{i}.txt"},
+                "content": f"text {i}",
+                "content_length": 6,
+                "content_preview": f"text {i}",
+                "embedding": [0.5, float(i)],
+            }
+            for i in range(5)
+        ]
+        resp = client.post(
+            "/documents/export",
+            json={"format": "ndjson", "filter_type": "md", "include_content": True, "include_embeddings": True},
+        )
+        assert resp.status_code == 200
+        assert "application/x-ndjson" in resp.headers["content-type"]
+        mock_store.iter_documents.assert_called_once_with(include_embeddings=True)
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert [(row["id"], row["content"], row["embedding"]) for row in rows] == [
+            ("chunk-1", "text 1", [0.5, 1.0]),
+            ("chunk-3", "text 3", [0.5, 3.0]),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Processing router
@@ -329,6 +379,12 @@ class TestHealthRouter:
         assert data["available"] is True
         assert data["host"] == "http://localhost:11434"
 
+    def test_metrics_report_response_cache_hit_ratio(self, client: TestClient):
+        client.get("/documents/stats")
+        client.get("/documents/stats")
+        cache = client.get("/metrics").json()["response_cache"]
+        assert cache["endpoints"]["documents.stats"] == {"hits": 1, "misses": 1, "not_modified": 0, "hit_ratio": 0.5}
+
 
 # ---------------------------------------------------------------------------
 # Taxonomy router
@@ -456,3 +512,23 @@ class TestOpenAPISchema:
     def test_redoc_reachable(self, client: TestClient):
         resp = client.get("/redoc")
         assert resp.status_code == 200
+
+
+class TestSharedDependencies:
+    def test_store_and_processor_share_one_git_tracker(self, tmp_path, mock_config):
+        import src.api.deps as deps_mod
+
+        (tmp_path / ".git").mkdir()
+        mock_config.mcp.paths.documents_root = str(tmp_path)
+        with (
+            patch("src.api.deps.get_config", return_value=mock_config),
+            patch("src.api.deps.GitTracker") as tracker_cls,
+            patch("src.api.deps.EmbeddingStore") as store_cls,
+            patch("src.api.deps.DocumentProcessor") as processor_cls,
+        ):
+            deps_mod.get_embedding_store()
+            deps_mod.get_document_processor()
+
+        tracker_cls.assert_called_once_with(tmp_path.resolve())
+        store_cls.assert_called_once_with(mock_config, tracker_cls.return_value)
+        processor_cls.assert_called_once_with(mock_config, tracker_cls.return_value)
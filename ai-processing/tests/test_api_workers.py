@@ -0,0 +1,99 @@
+"""Blocking endpoint work runs on bounded worker lanes, off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.api.jobs import configure_job_manager, get_job_manager
+from src.api.workers import LaneLimits, WorkerLane, shutdown_workers
+from src.core.article_index_store import ArticleIndexStore, ArticleIndexStoreConfig, default_article_index_sqlite_path
+
+
+@pytest.fixture()
+def api(tmp_path: Path, monkeypatch):
+    import src.api  # noqa: F401  (src.api re-exports the FastAPI instance as "app")
+
+    app_module = sys.modules["src.api.app"]
+    docs_root = tmp_path / "docs"
+    docs_root.mkdir()
+    index_path = tmp_path / "index" / "articles.json"
+    ArticleIndexStore(ArticleIndexStoreConfig(sqlite_path=default_article_index_sqlite_path(index_path)))
+
+    monkeypatch.setattr(app_module, "documents_root", docs_root)
+    monkeypatch.setattr(app_module, "index_path", index_path)
+    monkeypatch.setattr(app_module, "legacy_index_path", None)
+    monkeypatch.setattr(app_module, "index_path_is_override", True)
+    monkeypatch.setattr(app_module, "_index_cache", None)
+    configure_job_manager(tmp_path / "jobs.sqlite")
+    yield app_module
+    shutdown_workers()
+    configure_job_manager(None)
+
+
+def test_health_and_articles_stay_responsive_during_a_rebuild(api, monkeypatch) -> None:
+    release = threading.Event()
+
+    def slow_build(docs_root, index_path):
+        release.wait(10)
+        return {}
+
+    monkeypatch.setattr(api, "build_metadata_index", slow_build)
+    monkeypatch.setattr(api, "save_index", lambda index, path: None)
+
+    async def scenario() -> None:
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            submitted = await client.post("/visualization/rebuild")
+            assert submitted.status_code == 202
+            job_id = submitted.json()["id"]
+            await asyncio.sleep(0.2)
+
+            for path in ("/health", "/articles"):
+                started = time.perf_counter()
+                response = await client.get(path)
+                assert response.status_code == 200
+                assert time.perf_counter() - started < 1.0
+            assert (await client.get(f"/jobs/{job_id}")).json()["status"] == "running"
+
+            # An identical rebuild while one runs joins it instead of starting another.
+            again = await client.post("/visualization/rebuild")
+            assert again.status_code == 202
+            assert again.json()["id"] == job_id
+            assert again.json()["deduplicated"] is True
+
+            release.set()
+            job = get_job_manager().wait(job_id, timeout=5)
+            assert job.status == "succeeded"
+            assert job.result["article_count"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_lane_bounds_in_flight_and_queued_calls() -> None:
+    lane = WorkerLane("test", LaneLimits(workers=1, queue=1))
+    gate = threading.Event()
+
+    async def scenario() -> list:
+        first = asyncio.ensure_future(lane.run(gate.wait, 5))
+        second = asyncio.ensure_future(lane.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+        assert lane.in_flight == 2
+        with pytest.raises(HTTPException) as rejected:
+            await lane.run(lambda: "rejected")
+        assert rejected.value.status_code == 429
+        gate.set()
+        return await asyncio.gather(first, second)
+
+    try:
+        assert asyncio.run(scenario()) == [True, "queued"]
+        assert lane.in_flight == 0
+    finally:
+        lane.shutdown()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from src.core.article_index_store import (
+    ArticleIndexCache,
+    ArticleIndexStore,
+    ArticleIndexStoreConfig,
+    default_article_index_sqlite_path,
+    open_article_index,
+)
+from src.core.metadata_index import ArticleMetadata, write_json_index
+
+
+def _article(article_id: str, **overrides) -> ArticleMetadata:
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    values = {
+        "id": article_id,
+        "path": article_id,
+        "title": article_id.upper(),
+        "topic": None,
+        "tags": [],
+        "created_at": now,
+        "updated_at": now,
+        "word_count": 10,
+        "excerpt": "Excerpt",
+        "read_status": "unread",
+    }
+    values.update(overrides)
+    return ArticleMetadata(**values)
+
+
+def _store(tmp_path: Path) -> ArticleIndexStore:
+    return ArticleIndexStore(ArticleIndexStoreConfig(sqlite_path=tmp_path / "articles.sqlite"))
+
+
+def test_round_trip_and_query_by_indexed_columns(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.upsert_many(
+        [
+            _article("a.md", topic="ai", tags=["ml", "python"], neighbors=["b.md"], x=1.0, y=2.0, file_size=42),
+            _article("b.md", topic="ai", tags=["python"], read_status="read"),
+            _article("c.md", topic="web", tags=["css"], updated_at=datetime(2024, 6, 1)),
+        ]
+    )
+
+    restored = store.get("a.md")
+    assert restored is not None
+    assert restored.tags == ["ml", "python"]
+    assert restored.neighbors == ["b.md"]
+    assert (restored.x, restored.y, restored.file_size) == (1.0, 2.0, 42)
+
+    assert store.count() == 3
+    assert [a.id for a in store.query(topic="ai")] == ["a.md", "b.md"]
+    assert [a.id for a in store.query(tag="python", read_status="unread")] == ["a.md"]
+    assert [a.id for a in store.query(updated_since=datetime(2024, 5, 15))] == ["c.md"]
+
+
+def test_update_fields_and_delete_touch_single_rows(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.upsert_many([_article("a.md", tags=["old"]), _article("b.md")])
+    generation = store.get_generation()
+
+    assert store.update_fields("a.md", read_status="read", tags=["new"]) is True
+    assert store.update_fields("missing.md", read_status="read") is False
+    assert store.delete("b.md") is True
+    assert store.delete("b.md") is False
+
+    updated = store.get("a.md")
+    assert updated is not None
+    assert updated.read_status == "read"
+    assert updated.title == "A.MD"
+    assert [a.id for a in store.query(tag="new")] == ["a.md"]
+    assert store.query(tag="old") == []
+    assert list(store.load_all()) == ["a.md"]
+    assert store.get_generation() > generation
+
+
+def test_writes_that_match_no_row_keep_the_generation(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.upsert(_article("a.md"))
+    generation = store.get_generation()
+
+    assert store.update_fields("missing.md", read_status="read") is False
+    assert store.delete("missing.md") is False
+    assert store.update_positions({"missing.md": (1.0, 2.0, [])}) == 0
+
+    assert store.get_generation() == generation
+
+
+def test_store_reuses_one_connection(tmp_path: Path, monkeypatch) -> None:
+    store = _store(tmp_path)
+
+    def fail_connect(*args, **kwargs):
+        raise AssertionError("store opened a second connection")
+
+    monkeypatch.setattr(sqlite3, "connect", fail_connect)
+    store.upsert(_article("a.md"))
+    assert store.update_fields("a.md", read_status="read") is True
+    assert store.get("a.md").read_status == "read"
+    assert store.count() == 1
+
+
+def test_replace_all_drops_missing_rows(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.upsert_many([_article("a.md"), _article("b.md", tags=["x"])])
+
+    store.replace_all({"a.md": _article("a.md", title="Renamed")})
+
+    assert list(store.load_all()) == ["a.md"]
+    assert store.load_all()["a.md"].title == "Renamed"
+    assert store.query(tag="x") == []
+
+
+def test_open_article_index_migrates_and_exports_legacy_json(tmp_path: Path) -> None:
+    json_path = tmp_path / "index" / "articles.json"
+    write_json_index({"a.md": _article("a.md", read_status="read")}, json_path)
+
+    store = open_article_index(json_path)
+
+    assert default_article_index_sqlite_path(json_path).exists()
+    assert store.get("a.md").read_status == "read"
+
+    store.update_fields("a.md", read_status="unread")
+    export_path = tmp_path / "export.json"
+    assert store.export_json(export_path) == 1
+    assert json.loads(export_path.read_text(encoding="utf-8"))["a.md"]["read_status"] == "unread"
+
+
+def test_concurrent_row_updates_are_not_lost(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    ids = [f"doc{i}.md" for i in range(8)]
+    store.upsert_many(_article(article_id) for article_id in ids)
+
+    def mark_read(article_id: str) -> None:
+        _store(tmp_path).update_fields(article_id, read_status="read")
+
+    threads = [threading.Thread(target=mark_read, args=(article_id,)) for article_id in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {a.read_status for a in store.load_all().values()} == {"read"}
+
+
+def test_cache_serves_reads_from_memory_until_the_file_changes(tmp_path: Path, monkeypatch) -> None:
+    store = _store(tmp_path)
+    store.upsert_many([_article("a.md"), _article("b.md")])
+    cache = ArticleIndexCache(store)
+
+    loads = []
+    original_snapshot = store.snapshot
+
+    def counting_snapshot():
+        loads.append(1)
+        return original_snapshot()
+
+    monkeypatch.setattr(store, "snapshot", counting_snapshot)
+
+    version, index = cache.snapshot()
+    assert sorted(index) == ["a.md", "b.md"]
+    assert cache.get("a.md").title == "A.MD"
+    assert cache.snapshot()[0] == version
+    assert len(loads) == 1
+
+    # A write from another process/store instance is picked up on the next read.
+    _store(tmp_path).upsert(_article("c.md"))
+    new_version, index = cache.snapshot()
+    assert sorted(index) == ["a.md", "b.md", "c.md"]
+    assert new_version > version
+    assert len(loads) == 2
+
+
+def test_cache_writes_patch_memory_without_reloading(tmp_path: Path, monkeypatch) -> None:
+    store = _store(tmp_path)
+    store.upsert_many([_article("a.md"), _article("b.md")])
+    cache = ArticleIndexCache(store)
+    version, before = cache.snapshot()
+
+    loads = []
+    original_snapshot = store.snapshot
+    monkeypatch.setattr(store, "snapshot", lambda: loads.append(1) or original_snapshot())
+
+    assert cache.update_fields("a.md", read_status="read") is True
+    assert cache.delete("b.md") is True
+    # Writes that match no row leave the generation and the cache alone.
+    assert cache.delete("b.md") is False
+    assert cache.update_fields("missing.md", read_status="read") is False
+
+    new_version, after = cache.snapshot()
+    assert loads == []
+    assert new_version == version + 2
+    assert sorted(after) == ["a.md"]
+    assert after["a.md"].read_status == "read"
+    # Earlier snapshots are not mutated by later writes.
+    assert sorted(before) == ["a.md", "b.md"]
+    assert before["a.md"].read_status == "unread"
+    assert store.get("a.md").read_status == "read"
@@ -0,0 +1,121 @@
+"""Canonical article ids shared by the embedding store, taxonomy and article index."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from pathlib import Path
+
+from src.core.article_registry import (
+    default_article_registry_path,
+    file_content_hash,
+    open_article_registry,
+)
+from src.core.frontmatter_scan import parse_frontmatter_file
+from src.core.metadata_index import build_metadata_index
+
+
+def test_registry_lives_next_to_the_taxonomy_database(tmp_path: Path) -> None:
+    assert default_article_registry_path(tmp_path) == tmp_path / ".prismweave" / "article_registry.sqlite"
+
+
+def test_scan_and_file_hashes_agree_on_raw_bytes(tmp_path: Path) -> None:
+    crlf, lf = tmp_path / "crlf.md", tmp_path / "lf.md"
+    crlf.write_bytes(b"# Title\r\nbody\rmore\n")
+    lf.write_bytes(b"# Title\nbody\nmore\n")
+
+    record = parse_frontmatter_file(crlf)
+    assert record.content == parse_frontmatter_file(lf).content
+    assert record.content_hash == file_content_hash(crlf) == hashlib.sha256(crlf.read_bytes()).hexdigest()
+    # An edit that only changes line endings changes the hash.
+    assert file_content_hash(crlf) != file_content_hash(lf)
+
+
+def test_register_maps_every_spelling_to_the_relative_id(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    (docs / "sub").mkdir(parents=True)
+    note = docs / "sub" / "a.md"
+    note.write_text("hello", encoding="utf-8")
+    registry = open_article_registry(docs)
+
+    ref = registry.register(note, content_hash="h1", aliases=["custom-id"])
+    assert (ref.id, ref.relative_path, ref.absolute_path) == ("sub/a.md", "sub/a.md", str(note.resolve()))
+
+    resolved = registry.resolve_many([str(note), "sub/a.md", "custom-id", "unknown"])
+    assert {key: value.id for key, value in resolved.items()} == {
+        str(note): "sub/a.md",
+        "sub/a.md": "sub/a.md",
+        "custom-id": "sub/a.md",
+    }
+    # Re-registering without a hash keeps the stored one.
+    assert registry.register(note).content_hash == "h1"
+
+    outside = tmp_path / "b.md"
+    outside.write_text("x", encoding="utf-8")
+    assert registry.register(outside).id == str(outside.resolve())
+
+
+def test_rename_and_remove_follow_the_article(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    registry = open_article_registry(docs)
+    registry.register(docs / "old.md", content_hash="h")
+
+    moved = registry.rename(docs / "old.md", docs / "new.md")
+    assert moved is not None and (moved.id, moved.content_hash) == ("new.md", "h")
+    # The old spelling stays an alias of the moved article.
+    assert registry.resolve("old.md").id == "new.md"
+    assert [ref.id for ref in registry.list_articles()] == ["new.md"]
+
+    assert registry.remove(str(docs / "new.md"))
+    assert registry.resolve("old.md") is None
+    assert registry.list_articles() == []
+
+
+def test_metadata_index_keeps_the_registry_in_step(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("---\nid: alpha\n---\nbody a\n", encoding="utf-8")
+    (docs / "b.md").write_text("body b\n", encoding="utf-8")
+
+    build_metadata_index(docs)
+    registry = open_article_registry(docs)
+    refs = {ref.id: ref for ref in registry.list_articles()}
+    assert set(refs) == {"a.md", "b.md"}
+    assert refs["a.md"].absolute_path == str((docs / "a.md").resolve())
+    assert refs["a.md"].content_hash == file_content_hash(docs / "a.md")
+    assert registry.resolve("alpha").id == "a.md"
+
+    (docs / "b.md").unlink()
+    build_metadata_index(docs)
+    assert [ref.id for ref in registry.list_articles()] == ["a.md"]
+
+
+def test_metadata_index_leaves_other_file_types_registered(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("body a\n", encoding="utf-8")
+    (docs / "paper.pdf").write_bytes(b"%PDF-1.4")
+    registry = open_article_registry(docs)
+    registry.register(docs / "paper.pdf", content_hash="h", aliases=["paper-id"])
+
+    build_metadata_index(docs)
+    (docs / "a.md").write_text("body a, edited\n", encoding="utf-8")
+    build_metadata_index(docs)
+
+    assert [ref.id for ref in registry.list_articles()] == ["a.md", "paper.pdf"]
+    assert registry.resolve("paper-id").id == "paper.pdf"
+
+
+def test_registry_reuses_one_connection(tmp_path: Path, monkeypatch) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    registry = open_article_registry(docs)
+
+    def no_connect(*args, **kwargs):
+        raise AssertionError("opened a new connection")
+
+    monkeypatch.setattr(sqlite3, "connect", no_connect)
+    registry.register(docs / "a.md", content_hash="h")
+    assert registry.resolve("a.md").content_hash == "h"
+    assert registry.remove("a.md")
@@ -0,0 +1,86 @@
+"""Aggregate collection statistics maintained per added/removed/renamed file."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.core.collection_stats import (
+    CollectionStats,
+    FileStats,
+    default_collection_stats_path,
+    open_collection_stats_store,
+    summarize_files,
+)
+
+
+def _stats(*chunks) -> FileStats:
+    return FileStats.from_chunks(chunks)
+
+
+def test_file_stats_count_chunks_length_and_tags() -> None:
+    stats = _stats((10, "ai, ml"), (5, "ai"), (0, None))
+    assert stats.chunks == 3
+    assert stats.content_length == 15
+    assert stats.tags == {"ai": 2, "ml": 1}
+
+
+def test_store_lives_in_the_chroma_directory(tmp_path: Path) -> None:
+    assert default_collection_stats_path(tmp_path / "chroma") == tmp_path / "chroma" / "collection_stats.sqlite"
+
+
+def test_add_remove_and_rename_keep_totals_in_step(tmp_path: Path) -> None:
+    store = open_collection_stats_store(tmp_path)
+    assert store.snapshot("docs") is None
+
+    store.replace_all("docs", {})
+    store.record_add("docs", "/d/a.md", _stats((10, "ai"), (20, "ai, ml")))
+    store.record_add("docs", "/d/b.pdf", _stats((5, "")))
+    # Adding more chunks for a file accumulates, like the collection does.
+    store.record_add("docs", "/d/a.md", _stats((1, "ml")))
+
+    snap = store.snapshot("docs")
+    assert (snap.total_chunks, snap.source_files, snap.total_content_length) == (4, 2, 36)
+    assert snap.file_types == {".md": 3, ".pdf": 1}
+    assert snap.tag_frequency == {"ai": 2, "ml": 2}
+
+    store.record_rename("docs", "/d/a.md", "/d/a.txt")
+    snap = store.snapshot("docs")
+    assert snap.file_types == {".txt": 3, ".pdf": 1}
+    assert snap.source_files == 2
+
+    store.record_remove("docs", "/d/a.txt")
+    snap = store.snapshot("docs")
+    assert (snap.total_chunks, snap.source_files, snap.total_content_length) == (1, 1, 5)
+    assert snap.file_types == {".pdf": 1}
+    assert snap.tag_frequency == {}
+    assert store.source_files("docs") == ["/d/b.pdf"]
+
+    store.record_remove("docs", "/d/missing.md")
+    assert store.snapshot("docs").total_chunks == 1
+
+
+def test_replace_all_matches_in_memory_summary_and_is_per_collection(tmp_path: Path) -> None:
+    store = open_collection_stats_store(tmp_path)
+    files = {"/d/a.md": _stats((3, "x, y"), (4, "x")), "/d/README": _stats((2, None))}
+    store.replace_all("one", files)
+    store.replace_all("two", {})
+
+    assert store.snapshot("one") == summarize_files(files)
+    assert store.snapshot("one").file_types == {".md": 2, "no extension": 1}
+    assert store.snapshot("two") == CollectionStats()
+
+    store.invalidate("one")
+    assert store.snapshot("one") is None
+    assert store.snapshot("two") is not None
+
+
+def test_store_recovers_when_its_directory_is_wiped(tmp_path: Path) -> None:
+    store = open_collection_stats_store(tmp_path / "chroma")
+    store.replace_all("docs", {"/d/a.md": _stats((1, None))})
+    for path in (tmp_path / "chroma").iterdir():
+        path.unlink()
+    (tmp_path / "chroma").rmdir()
+
+    assert store.snapshot("docs") is None
+    store.replace_all("docs", {})
+    assert store.snapshot("docs").total_chunks == 0
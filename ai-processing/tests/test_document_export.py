@@ -0,0 +1,93 @@
+"""Streaming document export writers (JSON, CSV, NDJSON, Parquet)."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+
+from src.core.document_export import ExportOptions, ExportProgress, check_format, open_export, parquet_available
+
+
+def _docs(count: int, suffix: str = ".md"):
+    for i in range(count):
+        yield {
+            "id": f"c{i}",
+            "metadata": {"source_file": f"/docs/a{i}{suffix}", "chunk_index": 0, "total_chunks": 1, "tags": "ai"},
+            "content": f"content {i}",
+            "content_length": 9,
+            "content_preview": f"content {i}",
+            "embedding": [float(i), 0.25],
+        }
+
+
+def _export(documents, **options) -> tuple[list[bytes], ExportProgress]:
+    progress = ExportProgress()
+    chunks = open_export(documents, ExportOptions(**options), progress)
+    assert chunks is not None
+    return list(chunks), progress
+
+
+def test_json_is_one_document_written_page_by_page() -> None:
+    chunks, progress = _export(_docs(5), format="json", collection_name="docs", page_size=2)
+
+    # Header, three pages of rows, footer.
+    assert len(chunks) == 5
+    document = json.loads(b"".join(chunks))
+    assert document["collection_name"] == "docs"
+    assert document["total_documents"] == 5
+    assert [row["id"] for row in document["documents"]] == ["c0", "c1", "c2", "c3", "c4"]
+    assert "content" not in document["documents"][0]
+    assert progress.rows == 5
+    assert progress.bytes == sum(len(chunk) for chunk in chunks)
+
+
+def test_ndjson_filters_caps_and_includes_content_and_embeddings() -> None:
+    documents = list(_docs(3)) + list(_docs(3, suffix=".txt"))
+    chunks, progress = _export(
+        documents, format="ndjson", filter_type="txt", max_docs=2, include_content=True, include_embeddings=True
+    )
+
+    rows = [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+    assert [row["source_file"] for row in rows] == ["/docs/a0.txt", "/docs/a1.txt"]
+    assert rows[1]["content"] == "content 1"
+    assert rows[1]["embedding"] == [1.0, 0.25]
+    assert progress.rows == 2
+
+
+def test_csv_has_header_once_and_json_encoded_embeddings() -> None:
+    chunks, _ = _export(_docs(3), format="csv", include_embeddings=True, page_size=1)
+
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert [row["id"] for row in rows] == ["c0", "c1", "c2"]
+    assert json.loads(rows[2]["embedding"]) == [2.0, 0.25]
+    assert rows[0]["content_preview"] == "content 0"
+
+
+def test_nothing_to_export_is_reported_before_streaming() -> None:
+    assert open_export(_docs(3), ExportOptions(format="csv", filter_type="pdf")) is None
+    assert open_export([], ExportOptions()) is None
+
+
+def test_unknown_format_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        check_format("xml")
+
+
+@pytest.mark.skipif(parquet_available(), reason="pyarrow is installed")
+def test_parquet_without_pyarrow_is_rejected() -> None:
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        check_format("parquet")
+
+
+def test_parquet_round_trips_rows() -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    chunks, _ = _export(_docs(5), format="parquet", include_embeddings=True, page_size=2)
+
+    table = pq.read_table(io.BytesIO(b"".join(chunks)))
+    assert table.num_rows == 5
+    assert table.column("id").to_pylist() == ["c0", "c1", "c2", "c3", "c4"]
+    assert table.column("embedding").to_pylist()[1] == [1.0, 0.25]
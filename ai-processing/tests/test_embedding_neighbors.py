@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from src.core.embedding_neighbors import (
+    EmbeddingNeighborStore,
+    EmbeddingNeighborStoreConfig,
+    compute_embedding_neighbors,
+    update_embedding_neighbors,
+)
+
+
+def _store(tmp_path: Path, name: str = "neighbors.sqlite") -> EmbeddingNeighborStore:
+    return EmbeddingNeighborStore(EmbeddingNeighborStoreConfig(sqlite_path=tmp_path / name))
+
+
+def _random_embeddings(count: int, dim: int = 16, seed: int = 5) -> dict[str, list[float]]:
+    rng = random.Random(seed)
+    return {f"doc-{i:03d}.md": [rng.gauss(0, 1) for _ in range(dim)] for i in range(count)}
+
+
+def test_compute_embedding_neighbors_orders_by_cosine_similarity() -> None:
+    embeddings = {
+        "a": [1.0, 0.0],
+        "b": [0.9, 0.1],
+        "c": [0.0, 1.0],
+        "d": [-1.0, 0.0],
+    }
+
+    neighbors = compute_embedding_neighbors(embeddings, k=2, batch_size=2)
+
+    assert [n for n, _ in neighbors["a"]] == ["b", "c"]
+    assert [n for n, _ in neighbors["d"]] == ["c", "b"]
+    assert neighbors["a"][0][1] > neighbors["a"][1][1]
+    assert set(compute_embedding_neighbors(embeddings, k=1, article_ids=["c"])) == {"c"}
+
+
+def test_update_embedding_neighbors_recomputes_only_changed_rows(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    embeddings = _random_embeddings(60)
+
+    first = update_embedding_neighbors(store, embeddings, k=4)
+    assert len(first.recomputed) == 60
+    assert update_embedding_neighbors(store, embeddings, k=4).version == first.version
+
+    rng = random.Random(11)
+    embeddings["doc-003.md"] = [rng.gauss(0, 1) for _ in range(16)]
+    embeddings["doc-new.md"] = list(embeddings["doc-010.md"])
+    del embeddings["doc-020.md"]
+
+    second = update_embedding_neighbors(store, embeddings, k=4)
+
+    expected = {
+        article_id: [n for n, _ in row]
+        for article_id, row in compute_embedding_neighbors(embeddings, k=4).items()
+    }
+    assert second.neighbors == expected
+    assert store.load_neighbors() == expected
+    assert second.version == first.version + 1
+    assert second.removed == {"doc-020.md"}
+    assert {"doc-003.md", "doc-new.md"} <= second.recomputed
+    assert len(second.recomputed) < len(embeddings)
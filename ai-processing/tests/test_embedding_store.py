@@ -15,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from haystack import Document
 
+from src.core.article_registry import file_content_hash
 from src.core.config import Config
 from src.core.embedding_store import EmbeddingStore
 
@@ -47,7 +48,7 @@ class TestEmbeddingStoreInitialization:
             persist_dir = Path(temp_dir) / "new_chroma_db"
             config.chroma_db_path = str(persist_dir)
 
-            store = EmbeddingStore(config)
+            EmbeddingStore(config)
 
             assert persist_dir.exists()
             assert persist_dir.is_dir()
@@ -313,6 +314,46 @@ class TestFileOperations:
             result = store.remove_file_documents(test_file)
             assert result == False  # No documents found to remove
 
+    def test_rename_file_documents_keeps_embeddings(self):
+        """Test renaming repoints chunk metadata without touching embeddings"""
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config.chroma_db_path = temp_dir
+            old_file = Path(temp_dir) / "old.md"
+            new_file = Path(temp_dir) / "sub" / "new.md"
+
+            store = EmbeddingStore(config)
+            store.document_store.write_documents(
+                [
+                    Document(
+                        content=f"chunk {i}",
+                        embedding=[float(i), 1.0, 0.0],
+                        meta={"source_file": str(old_file), "file_name": "old.md", "chunk_index": i},
+                    )
+                    for i in range(2)
+                ]
+            )
+
+            renamed = store.rename_file_documents(old_file, new_file)
+
+            assert renamed == 2
+            assert store.get_file_document_count(old_file) == 0
+            assert store.get_file_document_count(new_file) == 2
+            assert store.get_document_count() == 2
+            assert store.get_article_embedding(new_file) == [0.5, 1.0, 0.0]
+
+    def test_rename_file_documents_nonexistent(self):
+        """Test renaming a file with no stored chunks"""
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config.chroma_db_path = temp_dir
+
+            store = EmbeddingStore(config)
+
+            assert store.rename_file_documents(Path(temp_dir) / "a.md", Path(temp_dir) / "b.md") == 0
+
 
 class TestArticleEmbedding:
     """Tests for article-level embedding aggregation."""
@@ -327,6 +368,178 @@ class TestArticleEmbedding:
             embedding = store.get_article_embedding(Path(temp_dir) / "missing.md")
             assert embedding is None
 
+    def test_get_article_embeddings_matches_per_article_means(self):
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config.chroma_db_path = temp_dir
+            store = EmbeddingStore(config)
+            files = [Path(temp_dir) / f"doc{i}.md" for i in range(3)]
+            store.document_store.write_documents(
+                [
+                    Document(
+                        content=f"chunk {i}-{j}",
+                        embedding=[float(i), float(j), 1.0],
+                        meta={"source_file": str(path), "chunk_index": j},
+                    )
+                    for i, path in enumerate(files)
+                    for j in range(i + 1)
+                ]
+            )
+
+            # Small pages so chunks of one article span several of them.
+            vectors = store.get_article_embeddings(files[1:] + [Path(temp_dir) / "missing.md"], batch_size=2)
+
+            assert sorted(vectors) == sorted(str(path) for path in files[1:])
+            for path in files[1:]:
+                assert list(vectors[str(path)]) == pytest.approx(store.get_article_embedding(path))
+            assert set(store.get_article_embeddings()) == {str(path) for path in files}
+
+
+
+class TestCollectionStatistics:
+    """Statistics come from the aggregate table, not from scanning the collection"""
+
+    @staticmethod
+    def _embed(documents):
+        for document in documents:
+            document.embedding = [1.0, 0.0, 0.0]
+        return {"documents": documents}
+
+    def test_stats_are_maintained_on_add_remove_and_rename(self):
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config.chroma_db_path = temp_dir
+            store = EmbeddingStore(config)
+            store.document_embedder = MagicMock()
+            store.document_embedder.run.side_effect = self._embed
+            first, second = Path(temp_dir) / "a.md", Path(temp_dir) / "b.txt"
+
+            # Chunks written before the statistics existed are picked up by one scan.
+            store.document_store.write_documents(
+                [Document(content="legacy", embedding=[0.0, 1.0, 0.0], meta={"source_file": str(first), "tags": "old"})]
+            )
+            assert store.get_collection_stats().total_chunks == 1
+
+            store.add_document(second, [Document(content="hello", meta={"tags": ["ai", "ml"]})])
+            with (
+                patch.object(store.document_store, "filter_documents", side_effect=AssertionError("scanned")),
+                patch.object(store, "verify_embeddings", side_effect=AssertionError("ollama")),
+            ):
+                stats = store.get_collection_stats()
+            assert (stats.total_chunks, stats.source_files, stats.total_content_length) == (2, 2, 11)
+            assert stats.file_types == {".md": 1, ".txt": 1}
+            assert stats.tag_frequency == {"old": 1, "ai": 1, "ml": 1}
+
+            store.rename_file_documents(second, Path(temp_dir) / "b.md")
+            assert store.get_collection_stats().file_types == {".md": 2}
+
+            store.remove_file_documents(first)
+            stats = store.get_collection_stats()
+            assert (stats.total_chunks, stats.source_files) == (1, 1)
+            assert stats.tag_frequency == {"ai": 1, "ml": 1}
+
+
+    def test_data_generation_reads_the_statistics_counter(self):
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config.chroma_db_path = temp_dir
+            store = EmbeddingStore(config)
+            store.document_embedder = MagicMock()
+            store.document_embedder.run.side_effect = self._embed
+            note = Path(temp_dir) / "a.md"
+
+            with patch.object(store, "get_document_count", side_effect=AssertionError("counted")):
+                before = store.data_generation()
+                store.add_document(note, [Document(content="hello")])
+                added = store.data_generation()
+                store.remove_file_documents(note)
+                removed = store.data_generation()
+
+            assert len({before, added, removed}) == 3
+            assert removed == store.data_generation()
+
+    def test_article_registry_follows_add_rename_and_remove(self):
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            docs = Path(temp_dir) / "docs"
+            docs.mkdir()
+            config.chroma_db_path = str(Path(temp_dir) / "chroma")
+            config.mcp.paths.documents_root = str(docs)
+            store = EmbeddingStore(config)
+            store.document_embedder = MagicMock()
+            store.document_embedder.run.side_effect = self._embed
+            note = docs / "a.md"
+            note.write_text("hello", encoding="utf-8")
+
+            store.add_document(note, [Document(content="hello")])
+            ref = store.registry.resolve(str(note))
+            assert (ref.id, ref.content_hash) == ("a.md", file_content_hash(note))
+
+            note.rename(docs / "b.md")
+            store.rename_file_documents(note, docs / "b.md")
+            assert store.registry.resolve(str(note)).id == "b.md"
+
+            # Dropping chunks to re-embed the file keeps it registered.
+            store.remove_file_documents(docs / "b.md")
+            assert store.registry.resolve("b.md") is not None
+
+            (docs / "b.md").unlink()
+            store.remove_file_documents(docs / "b.md", deleted=True)
+            assert store.registry.list_articles() == []
+
+    def test_article_registry_reuses_the_git_tracker_hash(self):
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            docs = Path(temp_dir) / "docs"
+            docs.mkdir()
+            config.chroma_db_path = str(Path(temp_dir) / "chroma")
+            config.mcp.paths.documents_root = str(docs)
+            tracker = MagicMock()
+            tracker.mark_file_processed.return_value = "tracked-hash"
+            store = EmbeddingStore(config, tracker)
+            store.document_embedder = MagicMock()
+            store.document_embedder.run.side_effect = self._embed
+            note = docs / "a.md"
+            note.write_text("hello", encoding="utf-8")
+
+            with patch("src.core.embedding_store.file_content_hash", side_effect=AssertionError("rehashed")):
+                store.add_document(note, [Document(content="hello")])
+
+            tracker.mark_file_processed.assert_called_once_with(note)
+            assert store.registry.resolve("a.md").content_hash == "tracked-hash"
+
+
+class TestIterDocuments:
+    """Exports page through the collection instead of loading it at once"""
+
+    def test_pages_through_all_chunks_with_content_and_embeddings(self):
+        config = Config()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config.chroma_db_path = temp_dir
+            store = EmbeddingStore(config)
+            store.document_store.write_documents(
+                [
+                    Document(content="x" * (i * 150), embedding=[float(i), 0.0, 1.0], meta={"source_file": f"{i}.md"})
+                    for i in range(1, 6)
+                ]
+            )
+
+            items = list(store.iter_documents(batch_size=2, include_embeddings=True))
+            assert len(items) == 5
+            longest = max(items, key=lambda item: item["content_length"])
+            assert longest["content_length"] == 750
+            assert len(longest["content"]) == 750
+            assert longest["content_preview"] == "x" * 200 + "..."
+            assert longest["embedding"] == [5.0, 0.0, 1.0]
+            assert longest["metadata"]["source_file"] == "5.md"
+            assert "embedding" not in next(store.iter_documents())
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.core.frontmatter_scan import parse_frontmatter_file, parse_frontmatter_files
+
+
+def _write_docs(root: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = root / f"doc{i}.md"
+        path.write_text(f"---\ntitle: Doc {i}\ntags: [t{i}]\n---\n\nBody {i}\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_parse_frontmatter_file_reads_metadata_body_and_stat(tmp_path: Path) -> None:
+    (path,) = _write_docs(tmp_path, 1)
+
+    record = parse_frontmatter_file(path)
+
+    assert record.metadata == {"title": "Doc 0", "tags": ["t0"]}
+    assert record.content.strip() == "Body 0"
+    assert record.size == path.stat().st_size
+    assert record.mtime == path.stat().st_mtime
+    assert record.read_error is None
+    assert record.parse_error is None
+
+
+def test_parse_frontmatter_file_reports_errors(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.md"
+    broken.write_text("---\ntitle: [unclosed\n---\n\nBody\n", encoding="utf-8")
+
+    record = parse_frontmatter_file(broken)
+    missing = parse_frontmatter_file(tmp_path / "missing.md")
+
+    assert record.parse_error
+    assert record.metadata == {}
+    assert "Body" in record.content
+    assert missing.read_error and missing.read_error.startswith("FileNotFoundError")
+
+
+def test_parallel_parse_matches_serial_order(tmp_path: Path) -> None:
+    paths = _write_docs(tmp_path, 9)
+
+    serial = parse_frontmatter_files(paths, max_workers=1)
+    parallel = parse_frontmatter_files(paths, max_workers=2, chunk_size=2, parallel_threshold=0)
+
+    assert [record.path for record in parallel] == paths
+    assert [record.metadata for record in parallel] == [record.metadata for record in serial]
+    assert [record.content for record in parallel] == [record.content for record in serial]
+
+
+def test_parallel_parse_spawns_workers(tmp_path: Path, monkeypatch) -> None:
+    # Forking a threaded process (the API server) can deadlock the children.
+    from src.core import frontmatter_scan
+
+    contexts = []
+    real_executor = frontmatter_scan.ProcessPoolExecutor
+
+    def recording_executor(*args, **kwargs):
+        contexts.append(kwargs.get("mp_context"))
+        return real_executor(*args, **kwargs)
+
+    monkeypatch.setattr(frontmatter_scan, "ProcessPoolExecutor", recording_executor)
+    parse_frontmatter_files(_write_docs(tmp_path, 4), max_workers=2, chunk_size=2, parallel_threshold=0)
+
+    assert [context.get_start_method() for context in contexts] == ["spawn"]
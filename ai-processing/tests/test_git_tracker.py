@@ -3,6 +3,7 @@ Tests for GitTracker - Git integration and incremental processing
 """
 
 import json
+import os
 import subprocess
 import sys
 import tempfile
@@ -52,7 +53,7 @@ class TestGitTrackerInitialization:
 
     def test_tracker_creates_state_directory(self, git_repo):
         """Test that GitTracker creates .prismweave directory"""
-        tracker = GitTracker(git_repo)
+        GitTracker(git_repo)
 
         state_dir = git_repo / ".prismweave"
         assert state_dir.exists()
@@ -263,6 +264,202 @@ class TestProcessingState:
         assert tracker.is_file_processed(test_file) == False
 
 
+class TestTieredChangeDetection:
+    """Test the stat()-based fast path in is_file_processed"""
+
+    @staticmethod
+    def _age(path: Path, seconds: int = 60) -> None:
+        """Push the file mtime into the past so it is not considered racy."""
+        past = datetime.now().timestamp() - seconds
+        os.utime(path, (past, past))
+
+    def test_unchanged_file_decided_by_stat(self, git_repo, monkeypatch):
+        """Matching size and mtime should not read the file"""
+        tracker = GitTracker(git_repo)
+
+        test_file = git_repo / "test.md"
+        test_file.write_text("Test content")
+        self._age(test_file)
+        tracker.mark_file_processed(test_file)
+
+        def fail_hash(_path):
+            raise AssertionError("content should not be hashed")
+
+        monkeypatch.setattr(tracker, "get_file_content_hash", fail_hash)
+
+        assert tracker.is_file_processed(test_file) is True
+        assert tracker.check_counts == {"untracked": 0, "stat": 1, "hash": 0}
+
+    def test_touched_file_falls_back_to_hash_and_refreshes_stat(self, git_repo):
+        """A new mtime with identical content is hashed once, then trusted"""
+        tracker = GitTracker(git_repo)
+
+        test_file = git_repo / "test.md"
+        test_file.write_text("Test content")
+        self._age(test_file, seconds=120)
+        tracker.mark_file_processed(test_file)
+
+        self._age(test_file, seconds=60)
+
+        assert tracker.is_file_processed(test_file) is True
+        assert tracker.check_counts["hash"] == 1
+
+        assert tracker.is_file_processed(test_file) is True
+        assert tracker.check_counts["stat"] == 1
+        assert tracker.check_counts["hash"] == 1
+
+    def test_paranoid_mode_always_hashes(self, git_repo):
+        """Paranoid mode ignores matching size/mtime"""
+        tracker = GitTracker(git_repo, paranoid=True)
+
+        test_file = git_repo / "test.md"
+        test_file.write_text("Test content")
+        self._age(test_file)
+        tracker.mark_file_processed(test_file)
+
+        assert tracker.is_file_processed(test_file) is True
+        assert tracker.is_file_processed(test_file, paranoid=False) is True
+        assert tracker.check_counts == {"untracked": 0, "stat": 1, "hash": 1}
+
+    def test_untracked_file_counted(self, git_repo):
+        """Files without a state row are counted as untracked"""
+        tracker = GitTracker(git_repo)
+
+        test_file = git_repo / "new.md"
+        test_file.write_text("New")
+
+        assert tracker.is_file_processed(test_file) is False
+        assert tracker.check_counts["untracked"] == 1
+
+        tracker.reset_check_counts()
+        assert tracker.check_counts == {"untracked": 0, "stat": 0, "hash": 0}
+
+
+class TestBatchedState:
+    """Test batched processing-state writes"""
+
+    def test_batch_buffers_and_flushes_on_exit(self, git_repo):
+        """mark_file_processed inside batch() commits once the block exits"""
+        tracker = GitTracker(git_repo)
+
+        files = []
+        for i in range(5):
+            path = git_repo / f"doc{i}.md"
+            path.write_text(f"Doc {i}")
+            files.append(path)
+
+        with tracker.batch(flush_every=3):
+            for path in files:
+                tracker.mark_file_processed(path)
+            # First chunk of 3 is already committed; the rest is buffered but visible.
+            assert tracker._state_store.count_processed_files() == 3
+            assert all(tracker.is_file_processed(path) for path in files)
+
+        assert tracker._state_store.count_processed_files() == 5
+        # A fresh tracker sees every row.
+        assert len(GitTracker(git_repo).load_processing_state()["processed_files"]) == 5
+
+    def test_update_last_processed_commit_flushes_batch(self, git_repo):
+        """Updating the commit marker writes buffered rows first"""
+        tracker = GitTracker(git_repo)
+
+        test_file = git_repo / "test.md"
+        test_file.write_text("Test")
+
+        with tracker.batch():
+            tracker.mark_file_processed(test_file)
+            tracker.update_last_processed_commit()
+            assert tracker._state_store.count_processed_files() == 1
+
+
+class TestIncrementalChanges:
+    """Test diff-driven change detection since the last processed commit"""
+
+    @staticmethod
+    def _commit(repo: Path, message: str) -> None:
+        subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", message], cwd=repo, check=True, capture_output=True)
+
+    def test_falls_back_to_full_scan_without_base_commit(self, git_repo):
+        """Without a last processed commit every unprocessed file is returned"""
+        tracker = GitTracker(git_repo)
+
+        changes = tracker.get_incremental_changes(file_extensions={".md"})
+
+        assert changes.full_scan is True
+        assert git_repo / "README.md" in changes.changed
+
+    def test_reports_adds_modifies_deletes_and_renames(self, git_repo):
+        """Diff output is split into changed, deleted and renamed files"""
+        tracker = GitTracker(git_repo)
+
+        (git_repo / "keep.md").write_text("Keep me around")
+        (git_repo / "gone.md").write_text("Delete me soon")
+        (git_repo / "move.md").write_text("Same content after the move")
+        self._commit(git_repo, "Add docs")
+        for name in ("README.md", "keep.md", "gone.md", "move.md"):
+            tracker.mark_file_processed(git_repo / name)
+        tracker.update_last_processed_commit()
+
+        (git_repo / "keep.md").write_text("Keep me around, edited")
+        (git_repo / "gone.md").unlink()
+        (git_repo / "moved").mkdir()
+        (git_repo / "move.md").rename(git_repo / "moved" / "move.md")
+        (git_repo / "new.md").write_text("Brand new")
+        (git_repo / "image.png").write_text("not a document")
+        self._commit(git_repo, "Change docs")
+
+        changes = tracker.get_incremental_changes(file_extensions={".md"})
+
+        assert changes.full_scan is False
+        assert sorted(p.name for p in changes.changed) == ["keep.md", "new.md"]
+        assert changes.deleted == [git_repo.resolve() / "gone.md"]
+        assert changes.renamed == [(git_repo.resolve() / "move.md", git_repo.resolve() / "moved" / "move.md")]
+
+    def test_no_changes_when_head_is_last_processed(self, git_repo):
+        """An up-to-date marker yields an empty change set"""
+        tracker = GitTracker(git_repo)
+        tracker.update_last_processed_commit()
+
+        changes = tracker.get_incremental_changes()
+
+        assert changes.is_empty()
+
+    def test_reports_uncommitted_edits_to_tracked_files(self, git_repo):
+        """Working-tree edits are picked up even when HEAD is the last processed commit"""
+        tracker = GitTracker(git_repo)
+        tracker.mark_file_processed(git_repo / "README.md")
+        tracker.update_last_processed_commit()
+
+        (git_repo / "README.md").write_text("Edited but not committed")
+        (git_repo / "untracked.md").write_text("Not added to git")
+
+        changes = tracker.get_incremental_changes(file_extensions={".md"})
+
+        assert changes.full_scan is False
+        assert changes.changed == [git_repo.resolve() / "README.md"]
+
+    def test_forget_and_rename_processed_files(self, git_repo):
+        """State rows follow deletions and renames"""
+        tracker = GitTracker(git_repo)
+
+        first = git_repo / "first.md"
+        second = git_repo / "second.md"
+        first.write_text("First")
+        second.write_text("Second")
+        tracker.mark_file_processed(first)
+        tracker.mark_file_processed(second)
+
+        assert tracker.forget_files([first]) == 1
+        renamed = git_repo / "renamed.md"
+        second.rename(renamed)
+        assert tracker.rename_processed_file(second, renamed) is True
+
+        processed = tracker.load_processing_state()["processed_files"]
+        assert sorted(processed) == ["renamed.md"]
+        assert tracker.is_file_processed(renamed) is True
+
+
 class TestUnprocessedFiles:
     """Test finding unprocessed files"""
 
@@ -328,6 +525,59 @@ class TestProcessingSummary:
         assert summary["processed_files"] == 1
         assert summary["unprocessed_files"] > 0
 
+    def test_processing_summary_is_cached_until_state_changes(self, git_repo, monkeypatch):
+        """Repeated summaries reuse the scan until HEAD, the index or the state changes"""
+        tracker = GitTracker(git_repo)
+        doc = git_repo / "doc.md"
+        doc.write_text("Doc")
+        subprocess.run(["git", "add", "."], cwd=git_repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add doc"], cwd=git_repo, check=True, capture_output=True)
+
+        scans = []
+        original = tracker.get_changed_files
+
+        def counting_get_changed_files(*args, **kwargs):
+            scans.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(tracker, "get_changed_files", counting_get_changed_files)
+
+        first = tracker.get_processing_summary()
+        second = tracker.get_processing_summary()
+
+        assert len(scans) == 1
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["unprocessed_files"] == first["unprocessed_files"]
+
+        tracker.mark_file_processed(doc)
+        third = tracker.get_processing_summary()
+
+        assert len(scans) == 2
+        assert third["processed_files"] == 1
+        assert third["unprocessed_files"] == first["unprocessed_files"] - 1
+
+        tracker.get_processing_summary(refresh=True)
+        assert len(scans) == 3
+
+    def test_processing_summary_cache_survives_a_new_tracker(self, git_repo, monkeypatch):
+        """A later process (new tracker) reuses the stored scan while nothing changed"""
+        (git_repo / "doc.md").write_text("Doc")
+        subprocess.run(["git", "add", "."], cwd=git_repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add doc"], cwd=git_repo, check=True, capture_output=True)
+        first = GitTracker(git_repo).get_processing_summary()
+
+        tracker = GitTracker(git_repo)
+
+        def rescan(*args, **kwargs):
+            raise AssertionError("rescanned")
+
+        monkeypatch.setattr(tracker, "get_changed_files", rescan)
+        second = tracker.get_processing_summary()
+
+        assert second["cached"] is True
+        assert second["unprocessed_files"] == first["unprocessed_files"]
+
     def test_reset_processing_state(self, git_repo):
         """Test resetting processing state"""
         tracker = GitTracker(git_repo)
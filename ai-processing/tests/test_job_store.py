@@ -0,0 +1,111 @@
+"""Job status persistence, dedupe of active jobs and cancellation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.core.job_store import (
+    CANCELLED,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    JobStore,
+    default_job_sqlite_path,
+    open_job_store,
+)
+
+
+def _store(tmp_path: Path) -> JobStore:
+    return open_job_store(tmp_path / "index" / "articles.json")
+
+
+def test_default_path_sits_next_to_the_index(tmp_path: Path) -> None:
+    assert default_job_sqlite_path(tmp_path / "articles.json") == tmp_path / "jobs.sqlite"
+
+
+def test_submit_dedupes_active_jobs_only(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    first, created = store.submit("rebuild", "rebuild:a")
+    assert created and first.status == QUEUED
+
+    same, created = store.submit("rebuild", "rebuild:a")
+    assert not created and same.id == first.id
+    other, created = store.submit("rebuild", "rebuild:b")
+    assert created and other.id != first.id
+
+    assert store.start(first.id)
+    assert store.submit("rebuild", "rebuild:a")[0].id == first.id
+    store.finish(first.id, SUCCEEDED, result={"articles": 3})
+
+    again, created = store.submit("rebuild", "rebuild:a")
+    assert created and again.id != first.id
+    done = store.get(first.id)
+    assert done.status == SUCCEEDED and done.result == {"articles": 3} and done.finished_at is not None
+
+
+def test_progress_and_listing(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    job, _ = store.submit("processing.directory", "p")
+    store.start(job.id)
+    store.update_progress(job.id, "processing", {"files_done": 2, "files_total": 5})
+
+    loaded = store.get(job.id)
+    assert loaded.status == RUNNING
+    assert loaded.phase == "processing"
+    assert loaded.progress == {"files_done": 2, "files_total": 5}
+    assert [j.id for j in store.list(kind="processing.directory")] == [job.id]
+    assert store.list(kind="rebuild") == []
+    assert store.get("missing") is None
+
+
+def test_cancel_queued_job_never_starts(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    job, _ = store.submit("rebuild", "k")
+
+    cancelled = store.request_cancel(job.id)
+    assert cancelled.status == CANCELLED and cancelled.cancel_requested
+    assert not store.start(job.id)
+    # A cancelled job no longer absorbs new submissions.
+    assert store.submit("rebuild", "k")[1]
+
+
+def test_cancel_running_job_sets_flag(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    job, _ = store.submit("rebuild", "k")
+    store.start(job.id)
+
+    assert store.request_cancel(job.id).status == RUNNING
+    assert store.is_cancel_requested(job.id)
+
+
+def test_reopening_fails_jobs_left_active(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    running, _ = store.submit("rebuild", "a")
+    store.start(running.id)
+    queued, _ = store.submit("rebuild", "b")
+    finished, _ = store.submit("rebuild", "c")
+    store.start(finished.id)
+    store.finish(finished.id, SUCCEEDED)
+
+    assert _store(tmp_path).fail_interrupted() == 2
+    assert store.get(running.id).status == FAILED
+    assert store.get(queued.id).status == FAILED
+    assert store.get(finished.id).status == SUCCEEDED
+
+
+def test_events_are_numbered_per_job_and_read_after_a_cursor(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    job, _ = store.submit("processing.directory", "p")
+    other, _ = store.submit("processing.directory", "q")
+    store.update_progress(job.id, "processing", {}, [("converted", {"file": "a.md"}, 1.0)])
+    store.update_progress(other.id, "processing", {}, [("skipped", {"file": "z.md"}, 1.0)])
+    store.update_progress(
+        job.id, "processing", {}, [("embedded", {"file": "a.md"}, 2.0), ("stored", {"file": "a.md"}, 3.0)]
+    )
+
+    events = store.events(job.id)
+    assert [(e.seq, e.event) for e in events] == [(1, "converted"), (2, "embedded"), (3, "stored")]
+    assert [e.seq for e in store.events(job.id, after=1, limit=1)] == [2]
+    assert events[2].to_dict() == {"seq": 3, "event": "stored", "time": 3.0, "file": "a.md"}
+    assert [e.event for e in store.events(other.id)] == ["skipped"]
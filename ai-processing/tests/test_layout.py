@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import math
+import random
+
+import pytest
+
+from src.core import layout
 from src.core.layout import compute_layout_from_embeddings, compute_nearest_neighbors
 
 
@@ -79,3 +85,67 @@ def test_compute_nearest_neighbors_handles_zero_k() -> None:
 
     neighbors = compute_nearest_neighbors(layout_coords, k=0)
     assert neighbors == {}
+
+
+def _brute_force_neighbors(coords: dict[str, tuple[float, float]], k: int) -> dict[str, list[str]]:
+    result = {}
+    for article_id, (x1, y1) in coords.items():
+        distances = [
+            (math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2), other_id)
+            for other_id, (x2, y2) in coords.items()
+            if other_id != article_id
+        ]
+        distances.sort(key=lambda item: item[0])
+        result[article_id] = [other_id for _, other_id in distances[:k]]
+    return result
+
+
+def test_spatial_index_matches_pairwise_neighbors_including_ties() -> None:
+    rng = random.Random(3)
+    points = [(rng.random() * 10, rng.random() * 3) for _ in range(400)]
+    # Integer points produce many equidistant neighbors and exact duplicates.
+    points += [(float(rng.randint(0, 4)), float(rng.randint(0, 2))) for _ in range(120)]
+    points += [(float(i), 5.0) for i in range(30)]
+    coords = {f"doc-{i}": point for i, point in enumerate(points)}
+    ids = list(coords)
+
+    expected = _brute_force_neighbors(coords, 5)
+
+    assert compute_nearest_neighbors(coords, k=5) == expected
+    grid = layout._knn_grid(list(coords.values()), 5)
+    assert {ids[i]: [ids[j] for j in row] for i, row in enumerate(grid)} == expected
+
+
+def _two_topic_embeddings() -> dict[str, list[float]]:
+    rng = random.Random(11)
+    embeddings = {}
+    for topic, offset in (("ml", 0), ("web", 8)):
+        for i in range(30):
+            vector = [rng.gauss(0.0, 0.1) for _ in range(16)]
+            vector[offset] += 1.0
+            embeddings[f"{topic}-{i}"] = vector
+    return embeddings
+
+
+def test_pca_layout_separates_topics_and_transforms_new_articles() -> None:
+    embeddings = _two_topic_embeddings()
+
+    projector, coords = layout.fit_layout_projector(embeddings, method="pca")
+
+    neighbors = compute_nearest_neighbors(coords, k=5)
+    assert all(n.split("-")[0] == a.split("-")[0] for a, ns in neighbors.items() for n in ns)
+    assert projector is not None
+    x, y = projector.transform([embeddings["ml-0"]])[0]
+    assert (x, y) == pytest.approx(coords["ml-0"], abs=1e-4)
+
+
+def test_relaxed_layout_keeps_topics_apart_without_a_projector() -> None:
+    embeddings = _two_topic_embeddings()
+
+    projector, coords = layout.fit_layout_projector(embeddings, method="relaxed")
+
+    assert projector is None
+    neighbors = compute_nearest_neighbors(coords, k=5)
+    assert all(n.split("-")[0] == a.split("-")[0] for a, ns in neighbors.items() for n in ns)
+    with pytest.raises(ValueError):
+        layout.fit_layout_projector(embeddings, method="tsne")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import src.core.layout_store as layout_store
+from src.core.layout_store import LayoutStore, LayoutStoreConfig, update_layout
+
+
+class _ShiftProjector:
+    """Stand-in for a fitted UMAP reducer."""
+
+    def transform(self, vectors):
+        return [(v[0] + 100.0, v[1]) for v in vectors]
+
+
+def _fake_fit(embeddings, method="auto"):
+    return _ShiftProjector(), {a: (float(v[0]), float(v[1])) for a, v in embeddings.items()}
+
+
+def _fit_without_projector(embeddings, method="auto"):
+    return None, {a: (float(v[0]), float(v[1])) for a, v in embeddings.items()}
+
+
+def _store(tmp_path: Path) -> LayoutStore:
+    return LayoutStore(LayoutStoreConfig(sqlite_path=tmp_path / "layout.sqlite"))
+
+
+def _embeddings(count: int) -> dict[str, list[float]]:
+    return {f"doc-{i}": [1.0, float(i), 0.5] for i in range(count)}
+
+
+def test_update_layout_fits_once_then_reuses_positions(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    embeddings = _embeddings(10)
+
+    first = update_layout(store, embeddings)
+    second = update_layout(store, embeddings)
+
+    assert first.refitted is True
+    assert set(first.coords) == set(embeddings)
+    assert second.refitted is False
+    assert second.version == first.version
+    assert second.coords == first.coords
+
+
+def test_update_layout_interpolates_new_articles_without_refitting(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(layout_store, "fit_layout_projector", _fit_without_projector)
+    store = _store(tmp_path)
+    embeddings = {"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [-1.0, 0.0], "d": [0.0, -1.0], "e": [0.7, 0.7]}
+    fitted = update_layout(store, embeddings).coords
+
+    embeddings["new"] = [1.0, 0.01]
+    update = update_layout(store, embeddings)
+
+    assert update.refitted is False
+    assert update.placed == {"new"}
+    assert {a: update.coords[a] for a in fitted} == fitted
+    # Placed between its most similar anchors ("a", then "e"), away from "c".
+    x, y = update.coords["new"]
+    assert 0.7 < x <= 1.0 and 0.0 <= y < 0.7
+
+
+def test_update_layout_uses_projector_transform_and_refits_on_drift(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(layout_store, "fit_layout_projector", _fake_fit)
+    store = _store(tmp_path)
+    embeddings = _embeddings(10)
+    update_layout(store, embeddings)
+
+    embeddings["doc-new"] = [5.0, 6.0, 0.0]
+    placed = update_layout(store, embeddings, drift_threshold=0.5)
+    assert placed.refitted is False
+    assert placed.coords["doc-new"] == (105.0, 6.0)
+
+    for i in range(5):
+        embeddings[f"doc-extra-{i}"] = [float(i), 1.0, 0.0]
+    drifted = update_layout(store, embeddings, drift_threshold=0.5)
+    assert drifted.refitted is True
+    assert drifted.coords["doc-new"] == (5.0, 6.0)
+
+    assert update_layout(store, embeddings, refit=True).refitted is True
+
+
+def test_update_layout_refits_when_the_layout_method_changes(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    embeddings = _embeddings(10)
+    update_layout(store, embeddings, method="pca")
+
+    assert update_layout(store, embeddings, method="pca").refitted is False
+    assert update_layout(store, embeddings, method="relaxed").refitted is True
+
+
+def test_pca_projector_is_stored_as_arrays_and_reloaded_by_a_new_store(tmp_path: Path) -> None:
+    embeddings = _embeddings(10)
+    update_layout(_store(tmp_path), embeddings, method="pca")
+    assert (tmp_path / "layout.projector.npz").exists()
+
+    store = _store(tmp_path)
+    projector = store.load_projector()
+    assert projector is not None and hasattr(projector, "transform")
+    embeddings["doc-new"] = [1.0, 4.5, 0.5]
+    update = update_layout(store, embeddings, method="pca", drift_threshold=0.5)
+    assert update.refitted is False
+    assert update.placed == {"doc-new"}
+
+
+def test_memory_only_projector_is_refitted_in_a_new_process(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(layout_store, "fit_layout_projector", _fake_fit)
+    embeddings = _embeddings(10)
+    update_layout(_store(tmp_path), embeddings)
+    assert not (tmp_path / "layout.projector.npz").exists()
+
+    # A later process has no reducer to transform with, so it refits.
+    embeddings["doc-new"] = [5.0, 6.0, 0.0]
+    update = update_layout(_store(tmp_path), embeddings, drift_threshold=0.5)
+    assert update.refitted is True
+    assert update.coords["doc-new"] == (5.0, 6.0)
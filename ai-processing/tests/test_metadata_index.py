@@ -5,7 +5,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict
 
-from src.core.metadata_index import ArticleMetadata, build_metadata_index, load_existing_index, save_index
+from src.core.metadata_index import (
+    ArticleMetadata,
+    article_from_mapping,
+    build_metadata_index,
+    load_existing_index,
+    save_index,
+)
 
 
 def test_article_metadata_from_markdown_preserves_basic_fields(tmp_path: Path) -> None:
@@ -114,3 +120,72 @@ def test_save_and_load_round_trip(tmp_path: Path) -> None:
     restored = loaded[article.id]
     assert restored.title == article.title
     assert restored.tags == article.tags
+
+
+def test_build_metadata_index_reuses_unchanged_entries(tmp_path: Path, monkeypatch) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    keep = docs / "keep.md"
+    keep.write_text("# Keep\n\nUnchanged body.", encoding="utf-8")
+    edit = docs / "edit.md"
+    edit.write_text("# Edit\n\nOriginal body.", encoding="utf-8")
+    gone = docs / "gone.md"
+    gone.write_text("# Gone\n\nSoon deleted.", encoding="utf-8")
+    index_path = docs / ".prismweave" / "index" / "articles.json"
+
+    first = build_metadata_index(docs, index_path)
+    assert first["keep.md"].file_size == keep.stat().st_size
+
+    parsed = []
+    original = ArticleMetadata.from_frontmatter_record.__func__
+
+    def counting_from_frontmatter_record(cls, record, **kwargs):
+        parsed.append(record.path.name)
+        return original(cls, record, **kwargs)
+
+    monkeypatch.setattr(ArticleMetadata, "from_frontmatter_record", classmethod(counting_from_frontmatter_record))
+
+    # No-op rebuild parses nothing and leaves the index file untouched.
+    saved_mtime = index_path.stat().st_mtime_ns
+    build_metadata_index(docs, index_path)
+    assert parsed == []
+    assert index_path.stat().st_mtime_ns == saved_mtime
+
+    edit.write_text("# Edit\n\nA longer, edited body.", encoding="utf-8")
+    gone.unlink()
+
+    rebuilt = build_metadata_index(docs, index_path)
+
+    assert parsed == ["edit.md"]
+    assert sorted(rebuilt) == ["edit.md", "keep.md"]
+    assert rebuilt["edit.md"].file_size == edit.stat().st_size
+    assert sorted(load_existing_index(index_path)) == ["edit.md", "keep.md"]
+
+
+def test_article_from_mapping_decodes_timestamps_lazily_and_shares_strings() -> None:
+    stamp = "2024-05-01T12:30:00"
+    record = {
+        "id": "notes/a.md",
+        "path": "notes/a.md",
+        "title": "A",
+        "topic": "ai",
+        "tags": ["python"],
+        "created_at": stamp,
+        "updated_at": stamp,
+        "excerpt": "",
+        "read_status": "unread",
+        "neighbors": ["".join(["notes/", "b.md"])],
+    }
+    first = article_from_mapping(json.loads(json.dumps(record)))
+    second = article_from_mapping(dict(json.loads(json.dumps(record)), id="notes/b.md", path="notes/b.md"))
+
+    assert not hasattr(first, "__dict__")
+    assert first.created_at_iso == stamp
+    assert first.created_at == datetime(2024, 5, 1, 12, 30)
+    assert first.to_dict()["created_at"] == stamp
+    assert first.tags[0] is second.tags[0]
+    assert first.neighbors[0] is second.id
+
+    clone = first.copy(read_status="read")
+    assert clone.read_status == "read" and first.read_status == "unread"
+    assert clone.copy(read_status="unread") == first
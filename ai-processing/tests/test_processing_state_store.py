@@ -24,3 +24,46 @@ def test_processing_state_store_recreates_schema_if_file_deleted(tmp_path: Path)
 
     assert sqlite_path.exists()
     assert store.get_last_processed_commit() == "deadbeef"
+
+
+def test_processing_state_store_upsert_many_writes_all_rows(tmp_path: Path) -> None:
+    store = ProcessingStateStore(ProcessingStateStoreConfig(sqlite_path=tmp_path / "state.sqlite"))
+
+    written = store.upsert_many(
+        (f"docs/{i}.md", {"content_hash": f"h{i}", "file_size": i, "commit_hash": "c1"}) for i in range(50)
+    )
+
+    assert written == 50
+    assert store.count_processed_files() == 50
+    assert store.get_processed_file("docs/7.md")["content_hash"] == "h7"
+    assert store.get_meta("last_update") is not None
+
+
+def test_processing_state_store_transaction_rolls_back_on_error(tmp_path: Path) -> None:
+    store = ProcessingStateStore(ProcessingStateStoreConfig(sqlite_path=tmp_path / "state.sqlite"))
+    store.upsert_processed_file("kept.md", {"content_hash": "a"})
+
+    try:
+        with store.transaction():
+            store.upsert_processed_file("lost.md", {"content_hash": "b"})
+            store.set_last_processed_commit("cafebabe")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert store.get_processed_file("kept.md") is not None
+    assert store.get_processed_file("lost.md") is None
+    assert store.get_last_processed_commit() is None
+
+
+def test_processing_state_store_reuses_single_connection(tmp_path: Path) -> None:
+    store = ProcessingStateStore(ProcessingStateStoreConfig(sqlite_path=tmp_path / "state.sqlite"))
+    conn = store._connection()
+
+    with store.transaction():
+        for i in range(10):
+            store.upsert_processed_file(f"{i}.md", {"content_hash": str(i)})
+    store.get_processed_file("3.md")
+
+    assert store._connection() is conn
+    assert store.count_processed_files() == 10
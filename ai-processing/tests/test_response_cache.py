@@ -0,0 +1,112 @@
+"""Shared response cache: keys, ETags, precompressed bodies and invalidation."""
+
+from __future__ import annotations
+
+import gzip
+
+import pytest
+from fastapi import FastAPI, Request
+from starlette.testclient import TestClient
+
+from src.api.response_cache import (
+    ResponseCache,
+    bump_data_generation,
+    bumps_generation,
+    cached_json,
+    data_generation,
+    get_response_cache,
+)
+from src.core.collection_stats import FileStats, open_collection_stats_store
+
+
+def test_lru_evicts_least_recently_used_within_byte_budget() -> None:
+    cache = ResponseCache(max_bytes=25, precompress=False)
+    cache.put("e", "a", b"x" * 10)
+    cache.put("e", "b", b"x" * 10)
+    assert cache.get("e", "a") is not None  # "b" is now the oldest
+    cache.put("e", "c", b"x" * 10)
+
+    assert cache.get("e", "b") is None
+    assert cache.get("e", "a") is not None
+    metrics = cache.metrics()
+    assert (metrics["entries"], metrics["bytes"], metrics["evictions"]) == (2, 20, 1)
+    assert metrics["endpoints"]["e"]["hits"] == 2
+
+
+def test_disabled_cache_still_builds_entries_but_keeps_none() -> None:
+    cache = ResponseCache(max_bytes=0)
+    entry = cache.put("e", "a", b"x" * 2048)
+    assert gzip.decompress(entry.gzip_body) == entry.body
+    assert cache.get("e", "a") is None
+    assert cache.metrics()["entries"] == 0
+
+
+def test_generation_decorator_bumps_even_on_failure() -> None:
+    @bumps_generation
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    before = data_generation()
+    with pytest.raises(RuntimeError):
+        fail()
+    assert data_generation() == before + 1
+
+
+def _app(builds: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    def items(request: Request, size: int = 10):
+        def build():
+            builds.append(size)
+            return {"items": ["item"] * size}
+
+        return cached_json(request, "items", size, build)
+
+    return app
+
+
+def test_cached_json_serves_hits_304s_and_gzip() -> None:
+    get_response_cache().clear()
+    builds: list = []
+    client = TestClient(_app(builds))
+
+    first = client.get("/items", params={"size": 500}, headers={"Accept-Encoding": "gzip"})
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert len(first.json()["items"]) == 500
+
+    plain = client.get("/items", params={"size": 500}, headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.json() == first.json()
+    assert builds == [500]
+
+    not_modified = client.get("/items", params={"size": 500}, headers={"If-None-Match": first.headers["ETag"]})
+    assert not_modified.status_code == 304
+
+    bump_data_generation()
+    changed = client.get("/items", params={"size": 500}, headers={"If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != first.headers["ETag"]
+    assert builds == [500, 500]
+
+    stats = get_response_cache().metrics()["endpoints"]["items"]
+    assert stats == {"hits": 1, "misses": 2, "not_modified": 1, "hit_ratio": 0.5}
+
+
+def test_collection_generation_advances_on_every_write(tmp_path) -> None:
+    store = open_collection_stats_store(tmp_path)
+    assert store.generation("docs") == 0
+
+    store.replace_all("docs", {})
+    seen = [store.generation("docs")]
+    store.record_add("docs", "/d/a.md", FileStats(chunks=1))
+    seen.append(store.generation("docs"))
+    store.record_rename("docs", "/d/a.md", "/d/b.md")
+    seen.append(store.generation("docs"))
+    store.record_remove("docs", "/d/b.md")
+    seen.append(store.generation("docs"))
+    store.invalidate("docs")
+    seen.append(store.generation("docs"))
+
+    assert seen == sorted(set(seen))
+    assert store.snapshot("docs") is None
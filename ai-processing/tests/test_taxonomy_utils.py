@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from src.core.article_registry import open_article_registry
+from src.taxonomy.chroma_io import mean_embeddings_by_article
 from src.taxonomy.ids import stable_cluster_id
-from src.taxonomy.models import ArticleTagAssignment, Tag, TaxonomyCategory
+from src.taxonomy.models import ArticleTagAssignment, Cluster, Tag, TaxonomyCategory
 from src.taxonomy.normalize import canonicalize_normalized_name, normalize_name
 from src.taxonomy.store import TaxonomyStore, TaxonomyStoreConfig
 
@@ -61,3 +63,126 @@ def test_taxonomy_store_roundtrip(tmp_path: Path) -> None:
     assignments = store.get_article_tags("a1")
     assert assignments[0].tag_id == "tag:llm"
     assert assignments[0].confidence == 0.9
+
+
+def test_article_taxonomy_view_resolves_ids_categories_and_tags(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    store = TaxonomyStore(TaxonomyStoreConfig(sqlite_path=tmp_path / "taxonomy.sqlite"))
+    store.initialize()
+    assert not store.article_taxonomy_view_built()
+
+    store.upsert_categories(
+        [
+            TaxonomyCategory(id="cat:tech", name="Tech", description="Tech"),
+            TaxonomyCategory(id="cat:tech/ai", name="AI", description="AI", parent_id="cat:tech", level=1),
+        ]
+    )
+    store.upsert_tags([Tag(id="tag:llm", name="LLM", normalized_name="llm", description="LLM")])
+    absolute = str((docs / "a.md").resolve())
+    store.upsert_clusters([Cluster(id="cluster:1", article_ids=[absolute], centroid_embedding=[0.0])])
+    store.map_cluster_to_category("cluster:1", "cat:tech", "cat:tech/ai")
+    store.upsert_article_tag_assignments(
+        [
+            ArticleTagAssignment(article_id=absolute, tag_id="tag:llm", confidence=0.4),
+            # The relative id's assignments win over the absolute alias.
+            ArticleTagAssignment(article_id="a.md", tag_id="tag:llm", confidence=0.9),
+            ArticleTagAssignment(article_id="/elsewhere/b.md", tag_id="tag:gone", confidence=0.5),
+        ]
+    )
+
+    assert store.rebuild_article_taxonomy_view(docs) == 2
+    assert store.article_taxonomy_view_built()
+    rows = {row.article_id: row for row in store.list_article_taxonomy()}
+
+    assert set(rows) == {"a.md", "/elsewhere/b.md"}
+    a = rows["a.md"]
+    assert a.absolute_path == absolute
+    assert (a.cluster_id, a.category_name, a.subcategory_name) == ("cluster:1", "Tech", "AI")
+    assert [(tag.name, tag.confidence) for tag in a.tags] == [("LLM", 0.9)]
+    # Unknown tag ids keep their id as the name.
+    assert [tag.name for tag in rows["/elsewhere/b.md"].tags] == ["tag:gone"]
+
+
+
+def test_article_taxonomy_view_maps_ids_through_the_article_registry(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("a", encoding="utf-8")
+    registry = open_article_registry(docs)
+    registry.register(docs / "a.md", aliases=["/mnt/old-root/a.md"])
+    store = TaxonomyStore(TaxonomyStoreConfig(sqlite_path=tmp_path / "taxonomy.sqlite"))
+    store.initialize()
+    (docs / "b.md").write_text("b", encoding="utf-8")
+    store.upsert_tags([Tag(id="tag:x", name="X", normalized_name="x", description="X")])
+    store.upsert_article_tag_assignments(
+        [
+            # A spelling only the registry knows, and a file it has not seen yet.
+            ArticleTagAssignment(article_id="/mnt/old-root/a.md", tag_id="tag:x", confidence=0.5),
+            ArticleTagAssignment(article_id=str(docs / "b.md"), tag_id="tag:x", confidence=0.5),
+        ]
+    )
+
+    store.rebuild_article_taxonomy_view(docs)
+
+    assert [row.article_id for row in store.list_article_taxonomy()] == ["a.md", "b.md"]
+    assert registry.resolve(str(docs / "b.md")).id == "b.md"
+
+
+def test_article_taxonomy_view_row_upsert_touches_one_article(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for name in ("a.md", "b.md"):
+        (docs / name).write_text(name, encoding="utf-8")
+    store = TaxonomyStore(TaxonomyStoreConfig(sqlite_path=tmp_path / "taxonomy.sqlite"))
+    store.initialize()
+    store.upsert_tags([Tag(id="tag:x", name="X", normalized_name="x", description="X")])
+    a_path, b_path = str((docs / "a.md").resolve()), str((docs / "b.md").resolve())
+    store.upsert_article_tag_assignments([ArticleTagAssignment(article_id=a_path, tag_id="tag:x", confidence=0.5)])
+
+    # Before the first rebuild the view is built in full.
+    assert store.upsert_article_taxonomy_view_row(a_path, docs) == 1
+    assert store.article_taxonomy_view_built()
+
+    # Rows of other articles are left as they are, even when stale.
+    store.upsert_article_tag_assignments(
+        [
+            ArticleTagAssignment(article_id=a_path, tag_id="tag:x", confidence=0.7),
+            ArticleTagAssignment(article_id=b_path, tag_id="tag:x", confidence=0.9),
+        ]
+    )
+    assert store.upsert_article_taxonomy_view_row(b_path, docs) == 1
+    rows = {row.article_id: row for row in store.list_article_taxonomy()}
+    assert set(rows) == {"a.md", "b.md"}
+    assert rows["a.md"].tags[0].confidence == 0.5
+    assert (rows["b.md"].absolute_path, rows["b.md"].tags[0].confidence) == (b_path, 0.9)
+
+    # Any spelling of the article finds its row.
+    assert store.upsert_article_taxonomy_view_row("a.md", docs) == 1
+    assert {row.article_id: row.tags[0].confidence for row in store.list_article_taxonomy()} == {
+        "a.md": 0.7,
+        "b.md": 0.9,
+    }
+
+
+def test_mean_embeddings_skip_pages_without_leaking_rows() -> None:
+    skipped = [f"b{i}" for i in range(100)]
+
+    class PagedCollection:
+        by_offset = {
+            0: {"ids": ["1", "2"], "embeddings": [[1.0, 0.0], [3.0, 0.0]], "metadatas": [{"source_file": "a"}] * 2},
+            # Dimension mismatch: the whole page is skipped, so its articles get no rows.
+            2: {
+                "ids": skipped,
+                "embeddings": [[1.0, 2.0, 3.0]] * len(skipped),
+                "metadatas": [{"source_file": key} for key in skipped],
+            },
+        }
+
+        def get(self, limit, offset, include):
+            return self.by_offset.get(offset, {"ids": []})
+
+    keys, matrix = mean_embeddings_by_article(PagedCollection())
+
+    assert keys == ["a"]
+    assert matrix.tolist() == [[2.0, 0.0]]
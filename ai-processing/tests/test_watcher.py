@@ -0,0 +1,117 @@
+"""
+Tests for DocumentWatcher - debounced filesystem watching and batch indexing
+"""
+
+import queue
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.core.watcher import DocumentWatcher, WatchBatch, index_watch_batch
+
+
+def _next_batch(batches: "queue.Queue[WatchBatch]", timeout: float = 5.0) -> WatchBatch:
+    try:
+        return batches.get(timeout=timeout)
+    except queue.Empty:  # pragma: no cover - only reached on failure
+        pytest.fail("Watcher did not report a batch in time")
+
+
+class TestDocumentWatcher:
+    """Test change detection and debouncing"""
+
+    def test_is_relevant_filters_hidden_dirs_and_extensions(self, tmp_path):
+        """Only supported documents outside hidden directories are reported"""
+        watcher = DocumentWatcher(tmp_path, lambda batch: None)
+
+        assert watcher.is_relevant(tmp_path / "notes" / "a.md") is True
+        assert watcher.is_relevant(tmp_path / "image.png") is False
+        assert watcher.is_relevant(tmp_path / ".git" / "HEAD.md") is False
+        assert watcher.is_relevant(tmp_path / ".prismweave" / "index" / "a.md") is False
+        assert watcher.is_relevant(Path("/elsewhere/a.md")) is False
+
+    @pytest.mark.parametrize("force_polling", [True, False])
+    def test_reports_debounced_changes_and_deletions(self, tmp_path, force_polling):
+        """A burst of writes arrives as one batch; deletions are reported separately"""
+        existing = tmp_path / "old.md"
+        existing.write_text("old")
+        batches: queue.Queue[WatchBatch] = queue.Queue()
+        watcher = DocumentWatcher(
+            tmp_path,
+            batches.put,
+            debounce_seconds=0.3,
+            poll_interval=0.05,
+            force_polling=force_polling,
+        )
+        watcher.start()
+        try:
+            if not force_polling:
+                # Give the native watcher a moment to register.
+                time.sleep(0.3)
+
+            new_file = tmp_path / "sub" / "new.md"
+            new_file.parent.mkdir()
+            for i in range(3):
+                new_file.write_text(f"draft {i}")
+            (tmp_path / "ignored.png").write_text("nope")
+
+            batch = _next_batch(batches)
+            assert batch.changed == [new_file]
+            assert batch.deleted == []
+
+            existing.unlink()
+            batch = _next_batch(batches)
+            assert batch.changed == []
+            assert batch.deleted == [existing]
+        finally:
+            watcher.stop()
+
+
+class TestIndexWatchBatch:
+    """Test feeding batches into the embedding store"""
+
+    def test_indexes_changes_and_removes_deletions(self, tmp_path):
+        """Changed files are re-embedded and deleted files lose their chunks"""
+        changed = tmp_path / "changed.md"
+        changed.write_text("content")
+        deleted = tmp_path / "deleted.md"
+
+        processor = Mock()
+        processor.process_document.return_value = ["chunk"]
+        store = Mock()
+        store.get_file_document_count.return_value = 2
+        store.remove_file_documents.return_value = True
+
+        counts = index_watch_batch(WatchBatch(changed=[changed], deleted=[deleted]), processor, store)
+
+        assert counts == {"processed": 1, "removed": 1, "skipped": 0, "errors": 0}
+        store.add_document.assert_called_once_with(changed, ["chunk"])
+        removed = [(call.args[0], call.kwargs) for call in store.remove_file_documents.call_args_list]
+        assert removed == [(deleted, {"deleted": True}), (changed, {})]
+
+    def test_skips_files_the_tracker_already_processed(self, tmp_path):
+        """Unchanged files are not re-embedded when a tracker is available"""
+        unchanged = tmp_path / "same.md"
+        unchanged.write_text("content")
+        empty = tmp_path / "empty.md"
+        empty.write_text("")
+
+        tracker = MagicMock()
+        tracker.repo_path = tmp_path
+        tracker.is_file_processed.side_effect = lambda path: path == unchanged
+        processor = Mock()
+        processor.process_document.return_value = []
+        store = Mock()
+        store.get_file_document_count.return_value = 0
+
+        counts = index_watch_batch(WatchBatch(changed=[unchanged, empty]), processor, store, tracker)
+
+        assert counts == {"processed": 0, "removed": 0, "skipped": 1, "errors": 1}
+        processor.process_document.assert_called_once_with(empty)
+        store.add_document.assert_not_called()